@@ -25,12 +25,13 @@ import numpy as np  # type: ignore
 from pyNastran.utils import object_attributes, print_bad_path
 from pyNastran.utils.log import get_logger2, write_error
 from pyNastran.bdf.utils import (
-    _parse_pynastran_header, to_fields, parse_executive_control_deck, parse_patran_syntax)
+    _parse_pynastran_header, to_fields, to_stripped_fields, parse_executive_control_deck,
+    parse_patran_syntax)
 
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16, print_field_16
 
-from pyNastran.bdf.cards.base_card import _format_comment
+from pyNastran.bdf.cards.base_card import _format_comment, get_card_state
 from pyNastran.bdf.cards.utils import wipe_empty_fields
 
 #from pyNastran.bdf.write_path import write_include
@@ -145,13 +146,26 @@ from pyNastran.bdf.bdf_interface.write_mesh import WriteMesh
 from pyNastran.bdf.bdf_interface.uncross_reference import UnXrefMesh
 from pyNastran.bdf.errors import (CrossReferenceError, DuplicateIDsError,
                                   CardParseSyntaxError, UnsupportedCard)
+from pyNastran.bdf.bdf_interface.fast_cards import (
+    FAST_CARD_NAMES, parse_fast_cards, build_fast_card)
+from pyNastran.bdf.bdf_interface.bdf_cache import (
+    get_cache_filename, get_cache_settings, read_bdf_cache, write_bdf_cache)
+from pyNastran.bdf.bdf_interface.bdf_parallel import (
+    split_bulk_data_lines, starts_with_continuation, split_trailing_comment,
+    get_worker_settings, parse_include_task, parse_includes_parallel)
+from pyNastran.bdf.bdf_interface.include_tracking import (
+    get_card_id_lengths, track_include_cards, remove_include_cards, remove_empty_lists,
+    update_card, get_include_state, restore_include_state)
+from pyNastran.bdf.bdf_interface.lazy_cards import (
+    get_lazy_card_names, add_lazy_card, build_lazy_slot, hide_lazy_slots)
 from pyNastran.bdf.bdf_interface.pybdf import (
     BDFInputPy, _clean_comment, _clean_comment_bulk, EXECUTIVE_CASE_SPACES)
 
 def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
              skip_cards=None, read_cards=None,
-             encoding=None, log=None, debug=True, mode='msc'):
-    # type: (Union[str, None], bool, bool, bool, Union[List[str], None], Union[str, None], Union[SimpleLogger, None], Optional[bool], str) -> BDF
+             encoding=None, log=None, debug=True, mode='msc', fast_parse=False,
+             nworkers=1, cache=False, track_includes=False, lazy=False):
+    # type: (Union[str, None], bool, bool, bool, Union[List[str], None], Union[str, None], Union[SimpleLogger, None], Optional[bool], str, Union[bool, str], int, Union[bool, str], bool, bool) -> BDF
     """
     Creates the BDF object
 
@@ -169,8 +183,10 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
         settings the logging object has
     validate : bool; default=True
         runs various checks on the BDF
-    xref :  bool; default=True
+    xref :  bool / str; default=True
         should the bdf be cross referenced
+        'arrays' : the node and property indices of the elements are
+                   stored in model.xref_arrays instead
     punch : bool; default=False
         indicates whether the file is a punch file
     skip_cards : List[str]; default=None
@@ -184,6 +200,21 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    fast_parse : bool / str; default=False
+        parse the high-volume cards (e.g., GRID, CQUAD4) with the
+        vectorized parser (see ``BDF.read_bdf``)
+    nworkers : int; default=1
+        the number of processes used to parse the bulk data INCLUDE
+        files (see ``BDF.read_bdf``)
+    cache : bool / str; default=False
+        store the parsed model in a cache file, which is read instead
+        of the deck until the deck changes (see ``BDF.read_bdf``)
+    track_includes : bool; default=False
+        record the cards of each bulk data INCLUDE file, so a file can
+        be read again with ``BDF.update_include``
+    lazy : bool; default=False
+        store the aero, optimization, DMIG, table, and thermal cards as
+        card lines, which are built on first access (see ``BDF.read_bdf``)
 
     Returns
     -------
@@ -219,7 +250,9 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
     elif read_cards:
         model.set_cards(read_cards)
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
-                   xref=xref, punch=punch, read_includes=True, encoding=encoding)
+                   xref=xref, punch=punch, read_includes=True, encoding=encoding,
+                   fast_parse=fast_parse, nworkers=nworkers, cache=cache,
+                   track_includes=track_includes, lazy=lazy)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -338,6 +371,33 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         # flag that allows for OpenMDAO-style optimization syntax to be used
         self._is_dynamic_syntax = False
 
+        # parse the high-volume cards with the vectorized parser
+        # (see read_bdf); {card_name : {field_name : ndarray}}
+        self._fast_parse = False
+        self.card_arrays = {}
+
+        # the array-based cross-reference (see cross_reference_arrays)
+        self.xref_arrays = None
+
+        # is the model cross-referenced
+        self._xref = False
+
+        # the cards of each bulk data INCLUDE file (see read_bdf);
+        # {include_filename : {card_type : ids}}
+        self._track_includes = False
+        self.include_cards = {}
+        self._include_info = {}
+
+        # the aero, optimization, DMIG, table, and thermal cards are built
+        # on first access (see read_bdf);
+        # {slot_name : (slot, [(card_name, comment, card_lines)])}
+        self._lazy = False
+        self._lazy_cards = {}
+        # the slots whose cards are being built; {slot_name : slot}
+        self._lazy_building = {}
+        self._lazy_validate = False
+        self._lazy_xref_slots = set([])
+
         # lines that were rejected b/c they were for a card that isnt supported
         self.reject_lines = []  # type: List[List[str]]
 
@@ -638,6 +698,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             del state['_card_parser_prepare']
         return state
 
+    def __getattr__(self, name):
+        """builds the cards of a lazy slot on first access (see ``read_bdf``)"""
+        # __dict__ is used, so an unpickled object doesn't recurse
+        lazy_cards = self.__dict__.get('_lazy_cards')
+        if lazy_cards and name in lazy_cards or name in self.__dict__.get('_lazy_building', ()):
+            return build_lazy_slot(self, name)
+        raise AttributeError('%r object has no attribute %r' % (
+            self.__class__.__name__, name))
+
     def saves(self, unxref=True):
         """Saves a pickled string"""
         if unxref:
@@ -673,7 +742,12 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         #import types
         with open(obj_filename, 'rb') as obj_file:
             obj = load(obj_file)
+        self._load_attributes(obj)
+        self.log.debug('done loading!')
 
+    def _load_attributes(self, obj):
+        # type: (BDF) -> None
+        """copies the attributes of an unpickled BDF (see ``load``)"""
         # these are properties, functions, etc.
         keys_to_skip = [
             'case_control_deck',
@@ -688,9 +762,14 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             '_card_parser', '_card_parser_b', '_card_parser_prepare',
             'wtmass',
         ]
+        # the lazy slots aren't built
+        lazy_cards = obj.__dict__.get('_lazy_cards', {})
         for key in object_attributes(self, mode="all", keys_to_skip=keys_to_skip):
             if key.startswith('__') and key.endswith('__'):
                 continue
+            if key in lazy_cards:
+                self.__dict__.pop(key, None)
+                continue
 
             val = getattr(obj, key)
             #print(key)
@@ -703,7 +782,6 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                 raise
 
         self.case_control_deck = CaseControlDeck(self.case_control_lines, log=self.log)
-        self.log.debug('done loading!')
 
     def replace_cards(self, replace_model):
         """
@@ -818,6 +896,17 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
     def validate(self):
         # type : (None) -> None
         """runs some checks on the input data beyond just type checking"""
+        if self._lazy_cards:
+            # the lazy cards are validated when they're built
+            self._lazy_validate = True
+            with hide_lazy_slots(self):
+                self._validate_cards()
+        else:
+            self._validate_cards()
+
+    def _validate_cards(self):
+        # type : (None) -> None
+        """validates the cards (see ``validate``)"""
         def _print_card(card):
             try:
                 return card.write_card(size=8)
@@ -1129,7 +1218,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         self.include_dir = obj.include_dir
 
     def read_bdf(self, bdf_filename=None,
-                 validate=True, xref=True, punch=False, read_includes=True, encoding=None):
+                 validate=True, xref=True, punch=False, read_includes=True, encoding=None,
+                 fast_parse=False, nworkers=1, cache=False, track_includes=False,
+                 lazy=False):
         """
         Read method for the bdf files
 
@@ -1139,14 +1230,69 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
             the input bdf (default=None; popup a dialog)
         validate : bool; default=True
             runs various checks on the BDF
-        xref :  bool; default=True
+        xref :  bool / str; default=True
             should the bdf be cross referenced
+            'arrays' : the node and property indices of the elements are
+                       stored in model.xref_arrays instead
+                       (see ``BDF.cross_reference_arrays``)
         punch : bool; default=False
             indicates whether the file is a punch file
         read_includes : bool; default=True
             indicates whether INCLUDE files should be read
         encoding : str; default=None -> system default
             the unicode encoding
+        fast_parse : bool / str; default=False
+            parse the small field GRID, CQUAD4, CTRIA3, CTETRA, CPENTA,
+            CHEXA, CBAR, CBUSH, RBE2, CONM2, FORCE, PLOAD4, and SPC1
+            cards in bulk with the vectorized parser
+            (see ``pyNastran.bdf.bdf_interface.fast_cards``)
+            False : use the standard parser
+            True : the cards are built from the parsed arrays
+            'arrays' : the cards aren't built; the arrays are stored in
+                       model.card_arrays[card_name][field_name]
+            Cards that can't be parsed in bulk (e.g., large field, an
+            invalid field) are read with the standard parser.
+        nworkers : int; default=1
+            the number of processes used to read and parse the bulk data
+            INCLUDE files (1 for serial)
+            Each INCLUDE file is read and tokenized by a separate
+            process and the cards are built by this process in the order
+            of the deck, so duplicate ids and card counts are handled the
+            same as the serial reader.  This is experimental; it's only
+            faster for a few large INCLUDE files with fast_parse=True on
+            a machine with multiple cores (see
+            ``bdf/test/benchmark_parallel_includes.py``).  The serial
+            reader is used for fast_parse='arrays', dumplines, the
+            dynamic syntax, and without concurrent.futures (Python 3 or
+            the futures package).
+        cache : bool / str; default=False
+            store the parsed model in a cache file
+            (see ``pyNastran.bdf.bdf_interface.bdf_cache``)
+            False : don't use a cache
+            True : use bdf_filename + '.cache'
+            str : the name of the cache file
+            The cache is used as long as the read settings are the same
+            and the main BDF and its INCLUDE files haven't changed (the
+            size, modification time, and sha1 hash are checked).
+            Otherwise, the deck is parsed and the cache is rewritten.
+        track_includes : bool; default=False
+            record the cards of each bulk data INCLUDE file in
+            model.include_cards[include_filename][card_type], so a file
+            that was edited can be read again with ``update_include``
+            The INCLUDE files are parsed separately (see nworkers), so
+            the cards of an INCLUDE that starts with a continuation line
+            aren't tracked.  The nested INCLUDEs are part of the file
+            that includes them.
+        lazy : bool; default=False
+            store the aero, optimization, DMIG, table, and thermal cards
+            as the card lines that were read
+            (see ``pyNastran.bdf.bdf_interface.lazy_cards``)
+            The cards of a slot (e.g., model.caeros) are built on the
+            first access of the slot and are validated and
+            cross-referenced then.  write_bdf writes the card lines of
+            the slots that haven't been accessed.  The cards of the
+            INCLUDE files that are parsed by the workers (see nworkers
+            and track_includes) are built.
 
         .. code-block:: python
 
@@ -1165,12 +1311,38 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
           etc.
 
         """
+        assert fast_parse in [True, False, 'arrays'], 'fast_parse=%r' % fast_parse
+        self._fast_parse = fast_parse
+        self._track_includes = track_includes
+        self._lazy = lazy
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
         self.log.debug('---starting BDF.read_bdf of %s---' % self.bdf_filename)
+
+        cache_filename = None
+        if cache:
+            # the header of the main BDF is part of its signature, so the
+            # cache is checked first
+            cache_filename = get_cache_filename(self.bdf_filename, cache)
+        if cache_filename is not None:
+            cache_settings = get_cache_settings(
+                self, self.punch, read_includes, self._encoding, fast_parse)
+            if self._read_bdf_cache(cache_filename, cache_settings, validate):
+                self.cross_reference(xref=xref)
+                self._xref = bool(xref) and xref != 'arrays'
+                self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
+                return
+
         self._parse_primary_file_header(bdf_filename)
 
         obj = BDFInputPy(self.read_includes, self.dumplines, self._encoding,
                          log=self.log, debug=self.debug)
+        if ((nworkers > 1 or track_includes) and self.read_includes and not self.dumplines and
+                not self._is_dynamic_syntax and self._fast_parse != 'arrays'):
+            # the bulk data INCLUDEs are read by the workers
+            obj.bulk_includes = []
+        elif track_includes:
+            self.log.warning('the INCLUDE files are not tracked for read_includes=False, '
+                             "dumplines, the dynamic syntax, and fast_parse='arrays'")
         out = obj._get_lines(bdf_filename, punch=self.punch)
         system_lines, executive_control_lines, case_control_lines, bulk_data_lines = out
         self._set_pybdf_attributes(obj)
@@ -1188,7 +1360,24 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
 
         cards_list = []
         cards_dict = {}
-        if self._is_cards_dict:
+        card_count = {}
+        if obj.bulk_includes and not self._is_cards_dict:
+            if not self._parse_bulk_data_parallel(bulk_data_lines, obj.bulk_includes, nworkers):
+                # an INCLUDE continues a card from another file (or has
+                # an ECHOON), so the deck is read in serial
+                self.log.debug('reading the INCLUDE files in serial')
+                if track_includes:
+                    self.log.warning('the INCLUDE files are not tracked because an INCLUDE '
+                                     'starts with a continuation line or the deck has an ECHOON')
+                    self.include_cards = {}
+                    self._include_info = {}
+                self.active_filenames = []
+                obj = BDFInputPy(self.read_includes, self.dumplines, self._encoding,
+                                 log=self.log, debug=self.debug)
+                bulk_data_lines = obj._get_lines(bdf_filename, punch=self.punch)[3]
+                self._set_pybdf_attributes(obj)
+                cards_list, cards_dict, card_count = self.get_bdf_cards(bulk_data_lines)
+        elif self._is_cards_dict:
             cards_dict, card_count = self.get_bdf_cards_dict(bulk_data_lines)
             #if 0:
                 #with open('dump.bdf', 'w') as bdf_file_obj:
@@ -1221,11 +1410,34 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         if validate:
             self.validate()
 
+        if cache_filename is not None:
+            write_bdf_cache(cache_filename, self, cache_settings, validate)
+
         self.cross_reference(xref=xref)
-        self._xref = xref
+        self._xref = bool(xref) and xref != 'arrays'
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
+    def _read_bdf_cache(self, cache_filename, cache_settings, validate):
+        # type: (str, Dict[str, Any], bool) -> bool
+        """
+        Loads the parsed model from a cache file
+
+        Returns
+        -------
+        is_loaded : bool
+            False if the cache is missing or out of date
+
+        """
+        model, is_validated = read_bdf_cache(cache_filename, cache_settings, self.log)
+        if model is None:
+            return False
+
+        self._load_attributes(model)
+        if validate and not is_validated:
+            self.validate()
+        return True
+
     def _read_bdf_helper(self, bdf_filename, encoding, punch, read_includes):
         """creates the file loading if bdf_filename is None"""
         #self.set_error_storage(nparse_errors=None, stop_on_parsing_error=True,
@@ -1811,6 +2023,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
         if card_name in ['DEQATN', 'PBRSECT', 'PBMSECT']:
             card_obj = card_lines
             card = card_lines
+        elif not is_list and not has_none and not self._is_dynamic_syntax:
+            # the card lines from the reader
+            card = to_stripped_fields(card_lines, card_name)
+            card_obj = BDFCard(card, has_none=False)
         else:
             if is_list:
                 fields = card_lines
@@ -3764,18 +3980,364 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMesh, UnXrefMesh):
                         self.add_card(card_lines, card_name, comment=comment,
                                       is_list=False, has_none=False)
         if cards_list:
+            fast_rows, add_functions = self._parse_fast_cards(cards_list, unused_card_count)
+            lazy_card_names = get_lazy_card_names(self, unused_card_count)
+
             # this is the block that actually runs
-            for card in cards_list:
+            for card, fast_row in zip(cards_list, fast_rows):
                 card_name, comment, card_lines = card
-                if card_name is None:
-                    msg = 'card_name = %r\n' % card_name
-                    msg += 'card_lines = %s' % card_lines
-                    raise RuntimeError(msg)
-                if self.is_reject(card_name):
-                    self.reject_card_lines(card_name, card_lines, comment)
+                if fast_row is not None and self._add_fast_card(
+                        card_name, fast_row, add_functions, comment):
+                    continue
+                if card_name in lazy_card_names:
+                    add_lazy_card(self, card_name, comment, card_lines)
+                    continue
+                self._add_card_lines(card_name, card_lines, comment)
+
+    def _add_card_lines(self, card_name, card_lines, comment=''):
+        """adds a card from the lines that were found by ``get_bdf_cards``"""
+        if card_name is None:
+            msg = 'card_name = %r\n' % card_name
+            msg += 'card_lines = %s' % card_lines
+            raise RuntimeError(msg)
+        if self.is_reject(card_name):
+            self.reject_card_lines(card_name, card_lines, comment)
+        else:
+            self.add_card(card_lines, card_name, comment=comment,
+                          is_list=False, has_none=False)
+
+    def _parse_fast_cards(self, cards_list, card_count):
+        """
+        Parses the high-volume cards (e.g., GRID, CQUAD4) with the
+        vectorized parser
+
+        Returns
+        -------
+        fast_rows : List[(row, nfields) / None]
+            the parsed card data; None for the cards that are read by
+            ``add_card`` (see ``fast_cards.parse_fast_cards``)
+        add_functions : Dict[card_name] = function
+            the functions that add the cards to the model
+
+        """
+        if not self._fast_parse or self._is_dynamic_syntax or 'ECHOON' in card_count:
+            return [None] * len(cards_list), {}
+
+        card_names = FAST_CARD_NAMES.intersection(self.cards_to_read)
+        if self.baror is not None:
+            # the defaults are set by the BAROR
+            card_names.discard('CBAR')
+        fast_rows, card_arrays = parse_fast_cards(cards_list, card_names)
+        if self._fast_parse == 'arrays':
+            self.card_arrays.update(card_arrays)
+
+        add_functions = {
+            card_name : self._card_parser[card_name][1]
+            for card_name in card_names if card_name in self._card_parser}
+        for card_name in ['CBAR', 'CTETRA', 'CPENTA', 'CHEXA']:
+            add_functions[card_name] = self._add_element_object
+        return fast_rows, add_functions
+
+    def _add_fast_card(self, card_name, fast_row, add_functions, comment=''):
+        """
+        Adds a card from the vectorized parser
+
+        Returns
+        -------
+        is_added : bool
+            False if the card must be read by ``add_card`` (e.g., a
+            duplicate node), so the error is handled the same way
+
+        """
+        if self._fast_parse != 'arrays':
+            row, nfields = fast_row
+            try:
+                card = build_fast_card(card_name, row, nfields, comment=comment)
+                add_functions[card_name](card)
+            except (SyntaxError, AssertionError, KeyError, ValueError):
+                return False
+        self.increase_card_count(card_name)
+        return True
+
+    def _parse_bulk_data_parallel(self, bulk_data_lines, bulk_includes, nworkers):
+        """
+        Parses the bulk data, where the INCLUDE files are parsed by
+        separate processes
+
+        Parameters
+        ----------
+        bulk_data_lines : List[str]
+            the bulk data lines of the main deck, where the INCLUDEs are
+            BULK_INCLUDE_LINEs
+        bulk_includes : List[(bdf_filename, include_comment)]
+            the INCLUDE files (see ``BDFInputPy.bulk_includes``)
+        nworkers : int
+            the number of processes
+
+        Returns
+        -------
+        is_parsed : bool
+            False if the deck must be read in serial (e.g., an INCLUDE
+            starts with a continuation line); no cards were added
+
+        """
+        main_lines = split_bulk_data_lines(bulk_data_lines)
+        include_results = parse_includes_parallel(self, bulk_includes, nworkers)
+
+        # the nested INCLUDEs follow the file that includes them
+        include_filenames = {
+            os.path.join(self.include_dir, bdf_filename) : result['active_filenames']
+            for (bdf_filename, unused_comment), result in zip(bulk_includes, include_results)}
+        active_filenames = []
+        for bdf_filename in self.active_filenames:
+            active_filenames.append(bdf_filename)
+            active_filenames += include_filenames.get(bdf_filename, [])
+        for i, bdf_filename in enumerate(active_filenames):
+            if bdf_filename in active_filenames[:i]:
+                msg = 'bdf_filename=%s is already active.\nactive_filenames=%s' % (
+                    bdf_filename, active_filenames[:i])
+                raise RuntimeError(msg)
+        self.active_filenames = active_filenames
+
+        # the groups of cards in the order of the deck up to the ENDDATA
+        groups = []
+        is_enddata = False
+        for i, lines in enumerate(main_lines):
+            if i > 0 and starts_with_continuation(lines):
+                return False
+            lines, trailing_comment = split_trailing_comment(lines)
+            cards_list, cards_dict, card_count = self.get_bdf_cards(lines)
+            groups.append((False, cards_list, cards_dict, card_count, trailing_comment))
+            is_enddata = 'ENDDATA' in self.card_count
+            if is_enddata or i == len(include_results):
+                break
+
+            result = include_results[i]
+            if result['is_continuation']:
+                return False
+            groups.append((True, result['entries'], result['cards_dict'],
+                           result['card_count'], result['trailing_comment']))
+            if result['is_enddata']:
+                self.card_count['ENDDATA'] = 1
+                is_enddata = True
+                break
+
+        if any('ECHOON' in group[3] for group in groups):
+            return False
+        self._set_trailing_comments(groups, is_enddata)
+
+        # the dictionary cards (e.g., BAROR) are parsed first
+        cards_dict = defaultdict(list)
+        for unused_is_include, unused_cards, cards_dicti, unused_card_count, unused_comment in groups:
+            for card_name, cards in iteritems(cards_dicti):
+                cards_dict[card_name] += cards
+        self._parse_cards([], cards_dict, {})
+
+        add_functions = self._get_add_functions()
+        iinclude = 0
+        for is_include, cards, unused_cards_dict, card_count, unused_comment in groups:
+            if not is_include:
+                self._parse_cards(cards, {}, card_count)
+                continue
+
+            if self._track_includes:
+                lengths = get_card_id_lengths(self)
+            self._add_card_entries(cards, add_functions)
+            if self._track_includes:
+                bdf_filename, include_comment = bulk_includes[iinclude]
+                include_filename = os.path.abspath(os.path.join(self.include_dir, bdf_filename))
+                include_info = (bdf_filename, include_comment,
+                                include_results[iinclude]['active_filenames'])
+                track_include_cards(self, include_filename, lengths, include_info)
+            iinclude += 1
+        return True
+
+    @staticmethod
+    def _set_trailing_comments(groups, is_enddata):
+        """
+        Adds the comment lines at the end of a group of cards (e.g., an
+        INCLUDE file) to the next card, which is how the serial reader
+        handles the comment lines before an INCLUDE
+        """
+        comment = ''
+        last_cards = None
+        for is_include, cards, unused_cards_dict, unused_card_count, trailing_comment in groups:
+            if cards and comment:
+                _prepend_card_comment(cards, 0, comment, is_include)
+                comment = ''
+            if cards:
+                last_cards = (cards, is_include)
+            comment += trailing_comment
+
+        # the comment lines at the end of the deck are added to the last
+        # card (the comment lines before an ENDDATA are skipped)
+        if comment and last_cards and not is_enddata:
+            cards, is_include = last_cards
+            _prepend_card_comment(cards, -1, comment, is_include)
+
+    def _get_add_functions(self):
+        """
+        Gets the functions that add the card objects of
+        ``_add_card_entries`` to the model
+        """
+        add_functions = {
+            card_name : add_card_function
+            for card_name, (unused_class, add_card_function) in iteritems(self._card_parser)}
+        for card_name in ['CBAR', 'CTETRA', 'CPENTA', 'CHEXA']:
+            add_functions[card_name] = self._add_element_object
+        return add_functions
+
+    def update_include(self, bdf_filename):
+        # type: (str) -> None
+        """
+        Reads a bulk data INCLUDE file again after it was edited (e.g.,
+        the properties or DESVARs in an optimization loop), so the rest
+        of the deck isn't parsed again
+
+        The cards of the file are removed and the file is parsed.  A
+        card that's still in the file (same class and id) is updated in
+        place, so the cards that reference it (e.g., the elements of a
+        PSHELL) don't need to be cross-referenced again.  If the model
+        is cross-referenced, only the cards of the file are
+        cross-referenced, unless a card was removed or changed class,
+        which cross-references the model again.  If a card of the file
+        can't be added (e.g., a bad field) or cross-referenced (e.g., a
+        missing material), the model is restored and the error is
+        raised, so the update can be tried again.
+
+        Parameters
+        ----------
+        bdf_filename : str
+            the INCLUDE file (an absolute path or relative to the
+            include_dir); the model must be read with track_includes=True
+
+        .. code-block:: python
+
+          >>> model = read_bdf(bdf_filename, track_includes=True)
+          >>> # edit properties.inc
+          >>> model.update_include('properties.inc')
+
+        """
+        include_filename = os.path.abspath(os.path.join(self.include_dir, bdf_filename))
+        if include_filename not in self.include_cards:
+            msg = '%r is not a tracked INCLUDE file; tracked files=%s' % (
+                include_filename, sorted(self.include_cards))
+            raise RuntimeError(msg)
+        bdf_filename, include_comment, nested_filenames = self._include_info[include_filename][:3]
+        self.log.debug('updating %s' % include_filename)
+
+        # the file is parsed before the cards are removed, so the model
+        # isn't changed if the file can't be parsed in bulk
+        active_filename = os.path.join(self.include_dir, bdf_filename)
+        active_filenames = [filename for filename in self.active_filenames
+                            if filename != active_filename and filename not in nested_filenames]
+        result = parse_include_task(bdf_filename, include_comment, active_filenames,
+                                    get_worker_settings(self))
+        if result['is_continuation'] or 'ECHOON' in result['card_count']:
+            msg = ('%r starts with a continuation line or has an ECHOON, '
+                   'so it must be read with read_bdf' % include_filename)
+            raise RuntimeError(msg)
+
+        # a card can still fail when it's added (e.g., a bad field) or
+        # cross-referenced (e.g., a missing material), so the model is
+        # restored in that case
+        card_types = set(self.include_cards[include_filename])
+        card_types.update(result['card_count'])
+        card_types.update(result['cards_dict'])
+        state = get_include_state(self, include_filename, card_types)
+        card_states = []
+        is_uncross_referenced = False
+        try:
+            self.active_filenames[:] = [filename for filename in self.active_filenames
+                                        if filename not in nested_filenames]
+            iactive = self.active_filenames.index(active_filename) + 1
+            self.active_filenames[iactive:iactive] = result['active_filenames']
+
+            cards_old, list_keys = remove_include_cards(self, include_filename)
+            lengths = get_card_id_lengths(self)
+            self._parse_cards([], result['cards_dict'], {})
+            self._add_card_entries(result['entries'], self._get_add_functions())
+            self.pop_parse_errors()
+            is_tracked = track_include_cards(
+                self, include_filename, lengths,
+                (bdf_filename, include_comment, result['active_filenames']))
+
+            # the cards that are still in the file are updated in place
+            is_xref_model = not is_tracked
+            cards = []
+            for card_type, ids in iteritems(self.include_cards.get(include_filename, {})):
+                slot_name = self._type_to_slot_map[card_type]
+                slot = getattr(self, slot_name)
+                if not isinstance(slot, dict):
+                    continue
+                for key in ids:
+                    card = slot[key]
+                    if isinstance(card, list):
+                        continue
+                    card_old = cards_old.pop((slot_name, key), None)
+                    if card_old is not None and card_old.__class__ is card.__class__:
+                        card_states.append((card_old, get_card_state(card_old)))
+                        update_card(card_old, card)
+                        slot[key] = card = card_old
+                    elif card_old is not None:
+                        is_xref_model = True
+                    cards.append(card)
+            if is_tracked:
+                cards += [card for unused_slot_name, unused_key, card
+                          in self._include_info[include_filename][-1]]
+
+            # a removed card may be referenced by another card
+            if cards_old or remove_empty_lists(self, list_keys):
+                is_xref_model = True
+
+            if self._xref:
+                if is_xref_model:
+                    is_uncross_referenced = True
+                    self.uncross_reference()
+                    self.cross_reference()
                 else:
-                    self.add_card(card_lines, card_name, comment=comment,
-                                  is_list=False, has_none=False)
+                    self._cross_reference_cards(cards)
+        except Exception:
+            restore_include_state(self, state, card_states)
+            if is_uncross_referenced:
+                # the rest of the model was uncross-referenced
+                self.uncross_reference()
+                self.cross_reference()
+            raise
+
+    def _add_card_entries(self, entries, add_functions):
+        """
+        Adds the cards that were parsed by a worker
+
+        Parameters
+        ----------
+        entries : List[(card_name, comment, entry_type, value)]
+            the parsed cards (see ``bdf_parallel.get_card_entries``)
+        add_functions : Dict[card_name] = function
+            the functions that add the card objects to the model
+
+        """
+        for card_name, comment, entry_type, value in entries:
+            if entry_type == 'lines':
+                self._add_card_lines(card_name, value, comment)
+                continue
+
+            self.increase_card_count(card_name)
+            if entry_type == 'fields':
+                card_obj = BDFCard(value, has_none=False)
+                self._add_card_helper(card_obj, card_name, card_name, comment)
+                continue
+
+            try:
+                row, nfields = value
+                card = build_fast_card(card_name, row, nfields, comment=comment)
+                add_functions[card_name](card)
+            except (SyntaxError, AssertionError, KeyError, ValueError) as exception:
+                self._iparse_errors += 1
+                var = traceback.format_exception_only(type(exception), exception)
+                self._stored_parse_errors.append((card_name, var))
+                if self._iparse_errors > self._nparse_errors:
+                    self.pop_parse_errors()
 
     def _parse_dynamic_syntax(self, key):
         """
@@ -4255,6 +4817,18 @@ class BDF(BDF_):
         return newone
 
 
+def _prepend_card_comment(cards, i, comment, is_include):
+    """
+    Prepends a comment to a card from ``get_bdf_cards`` or an entry
+    from ``bdf_parallel.get_card_entries``
+    """
+    if is_include:
+        card_name, card_comment, entry_type, value = cards[i]
+        card_comment = (comment + card_comment).rstrip()
+        cards[i] = (card_name, card_comment, entry_type, value)
+    else:
+        cards[i][1] = (comment + cards[i][1]).rstrip()
+
 def _prep_comment(comment):
     return comment.rstrip()
     #print('comment = %r' % comment)
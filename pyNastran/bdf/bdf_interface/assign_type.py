@@ -2,8 +2,10 @@
 Parses Nastran fields
 """
 from __future__ import print_function
-from typing import Union, Optional
+import re
+from typing import Union, Optional, List
 from six import string_types
+import numpy as np
 from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
 from pyNastran.utils import integer_types, integer_float_types, float_types
 
@@ -349,29 +351,81 @@ def double(card, ifield, fieldname):
     except ValueError:
         # 1D+3, 1D-3, 1-3
         try:
-            svalue = svalue.upper()
-            if 'D' in svalue:
-                # 1.0D+3, 1.0D-3
-                svalue2 = svalue.replace('D', 'E')
-                return float(svalue2)
-
-            # 1.0+3, 1.0-3
-            sign = ''
-            if svalue[0] in ('+', '-'):
-                sign = svalue[0]
-                svalue = svalue[1:]
-            if '+' in svalue:
-                svalue = sign + svalue.replace('+', 'E+')
-            elif '-' in svalue:
-                svalue = sign + svalue.replace('-', 'E-')
-
-            value = float(svalue)
+            value = _nastran_float(svalue)
         except ValueError:
             dtype = _get_dtype(svalue)
             raise SyntaxError('%s = %r (field #%s) on card must be a float (not %s).\n'
                               'card=%s' % (fieldname, svalue, ifield, dtype, card))
     return value
 
+#: the sign of an exponent without the E (e.g., 1.0-3, but not -1.0)
+_EXPONENT_SIGN = re.compile(r'(?<=[0-9.])([+-])')
+
+#: a block of normalized floats (one per line); a float
+#: has a dot or an exponent, so an integer isn't read as a float
+_FLOAT_BLOCK = re.compile(
+    r'(?:[+-]?(?:\d+\.\d*|\.\d+|\d+(?=E))(?:E[+-]?\d+)?\n)*\Z')
+
+def _nastran_float(svalue):
+    # type: (str) -> float
+    """
+    Converts a Nastran float (e.g., 1.0-3, 1.0D+3, -1.0+3) to a float
+
+    Raises
+    ------
+    ValueError : svalue isn't a float
+    """
+    svalue = svalue.upper()
+    if 'D' in svalue:
+        # 1.0D+3, 1.0D-3
+        return float(svalue.replace('D', 'E'))
+
+    # 1.0+3, 1.0-3
+    sign = ''
+    if svalue[0] in ('+', '-'):
+        sign = svalue[0]
+        svalue = svalue[1:]
+    if '+' in svalue:
+        svalue = sign + svalue.replace('+', 'E+')
+    elif '-' in svalue:
+        svalue = sign + svalue.replace('-', 'E-')
+    return float(svalue)
+
+def parse_nastran_floats(svalues):
+    # type: (List[str]) -> Optional[np.ndarray]
+    """
+    Converts a block of Nastran floats (e.g., 1.0, 1.0-3, 1.0D+3) to an
+    array in one pass
+
+    Parameters
+    ----------
+    svalues : List[str]
+        the stripped fields (e.g., from a BDFCard)
+
+    Returns
+    -------
+    values : (n, ) float64 ndarray / None
+        the floats; None if a field isn't a float (e.g., a blank, an
+        integer, a string), so the fields must be converted one at a
+        time (e.g., with ``double``)
+
+    .. code-block:: python
+
+      >>> parse_nastran_floats(['1.0', '-2.5-3', '3.D+2'])
+      array([ 1.0e+00, -2.5e-03,  3.0e+02])
+      >>> parse_nastran_floats(['1.0', '2'])
+      None
+
+    """
+    if not all(isinstance(svalue, string_types) for svalue in svalues):
+        return None
+    # 1.0-3, 1.0D-3, 1.0d-3 -> 1.0E-3
+    block = '\n'.join(svalues).upper().replace('D', 'E') + '\n'
+    block = _EXPONENT_SIGN.sub(r'E\1', block)
+    if block.count('\n') != len(svalues) or not _FLOAT_BLOCK.match(block):
+        return None
+    return np.array(block.split(), dtype='float64')
+
 def double_or_blank(card, ifield, fieldname, default=None):
     # type: (BDFCard, int, str, Optional[Union[float]]) -> Optional[Union[float]]
     """
@@ -935,54 +989,14 @@ def interpret_value(value_raw, card=''):
         # word
         return value_in
 
-    val0 = value_in[0]
-    if val0 in ('+', '-'):
-        # truncate the sign for now
-        value_left = value_in[1:]
-    else:
-        # inplied positive value
-        val0 = '+'
-        value_left = value_in
-
-    if val0 == '-':
-        factor = -1.
-    elif val0 == '+' or val0.isdigit():
-        factor = 1.
-    else:
-        msg = ('the only 2 cases for a float/scientific are +/- for v0...'
-               'value_raw=%r val0=%r card=%s' % (value_raw, val0, card))
-        raise SyntaxError(msg)
-
-    # dont include the 1st character, find the exponent
-    val_minus = value_in.find('-', 1)
-    val_plus = value_in.find('+', 1)
-    if val_minus > 0:
-        sline = value_left.split('-')
-        exp_factor = -1.
-    elif val_plus > 0:
-        sline = value_left.split('+')
-        exp_factor = 1.
-    else:
-        msg = ("I thought this was in scientific notation, but i can't find "
-               "the exponent sign...value_raw=%r fname, =%r "
-               "card=%s\nYou also might have mixed tabs/spaces/commas."
-               % (value_raw, value_left, card))
-        raise SyntaxError(msg)
-
-    if sline[0][-1] == 'D':
-        sline[0] = sline[0][:-1]
-
     try:
-        sci0 = factor * float(sline[0])
-        sci1 = exp_factor * int(sline[1])
+        # scientific (e.g., 1.0-3, 1.0D+3)
+        value = _nastran_float(value_in)
     except ValueError:
-        msg = "vm=%s vp=%s value_raw=%r sline=%s" % (val_minus, val_plus, value_raw, sline)
-        raise SyntaxError('cannot parse sline[0] into a float and sline[1] '
-                          'into an integer\n%s\nYou HAVE mixed '
-                          'tabs/spaces/commas!  Fix it!' % msg)
-
-    value = sci0 * 10 ** sci1
-    # scientific
+        msg = ("I thought this was in scientific notation, but i can't parse it..."
+               "value_raw=%r value_in=%r card=%s\n"
+               "You also might have mixed tabs/spaces/commas." % (value_raw, value_in, card))
+        raise SyntaxError(msg)
     return value
 
 
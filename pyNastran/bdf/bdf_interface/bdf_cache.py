@@ -0,0 +1,372 @@
+"""
+Defines:
+ - get_cache_filename(bdf_filename, cache)
+ - get_cache_settings(model, punch, read_includes, encoding, fast_parse)
+ - get_file_signature(filename)
+ - is_file_changed(filename, signature)
+ - read_bdf_cache(cache_filename, settings, log)
+ - write_bdf_cache(cache_filename, model, settings, validated)
+
+For BDF.read_bdf(..., cache=True), the parsed (not cross-referenced)
+model is stored in a cache file next to the BDF.  The cache is used by
+the next read as long as the main BDF and its INCLUDE files haven't
+changed, so the deck doesn't need to be parsed again.
+
+The cache file has 3 pickles:
+ 1. the header, which has the cache version, the read settings and the
+    signature (size, mtime, sha1) of every file that was read.  The
+    header is checked before the rest of the cache is read.
+ 2. the card tables.  The cards of the same class with the same
+    attributes are stored as columns (e.g., the GRID nids are an int
+    array and the xyz values are an (n, 3) float array).
+ 3. the BDF object, where the cards are references to the rows of the
+    card tables (a pickle persistent_id).
+
+"""
+from __future__ import print_function
+import os
+import hashlib
+from io import BytesIO
+from pickle import Pickler, Unpickler, HIGHEST_PROTOCOL
+from six import string_types, integer_types, text_type
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.cards.base_card import BaseCard, get_card_state, set_card_state
+
+#: change this when the cache format or the BDF/card attributes change,
+#: so old caches are ignored
+CACHE_VERSION = 1
+
+#: the size of the blocks that are hashed
+_BLOCK_SIZE = 1024 * 1024
+
+#: the values that can be stored in a card table
+_SCALAR_TYPES = set([type(None), bool, float, str, text_type, np.float64, np.int32, np.int64] +
+                    list(integer_types))
+
+# the column types of the card tables
+_LIST, _INT, _FLOAT, _BOOL, _ARRAY, _INT_LIST, _FLOAT_LIST = range(7)
+
+
+def get_cache_filename(bdf_filename, cache):
+    """
+    Gets the name of the cache file
+
+    Parameters
+    ----------
+    bdf_filename : str / file
+        the main BDF
+    cache : bool / str
+        True : the cache is bdf_filename + '.cache'
+        str : the name of the cache file
+
+    Returns
+    -------
+    cache_filename : str / None
+        the cache file (None for a StringIO)
+
+    """
+    if not isinstance(bdf_filename, string_types):
+        return None
+    if isinstance(cache, string_types):
+        return cache
+    return bdf_filename + '.cache'
+
+
+def get_cache_settings(model, punch, read_includes, encoding, fast_parse):
+    """
+    Gets the read settings that change the parsed model, so a cache that
+    was written with different settings isn't used
+    """
+    settings = {
+        'cache_version' : CACHE_VERSION,
+        'version' : pyNastran.__version__,
+        'nastran_format' : model._nastran_format,
+        'punch' : punch,
+        'read_includes' : read_includes,
+        'encoding' : encoding,
+        'cards_to_read' : sorted(model.cards_to_read),
+        'dict_of_vars' : (sorted(model.dict_of_vars.items())
+                          if model._is_dynamic_syntax else None),
+        'fast_parse_arrays' : fast_parse == 'arrays',
+        'track_includes' : model._track_includes,
+        'lazy' : model._lazy,
+    }
+    return settings
+
+
+def get_file_signature(filename):
+    """
+    Gets the signature of a file
+
+    Returns
+    -------
+    signature : (size, mtime, sha1)
+        size : int
+            the size of the file in bytes
+        mtime : float
+            the modification time
+        sha1 : str
+            the hash of the file
+
+    """
+    stat = os.stat(filename)
+    sha1 = hashlib.sha1()
+    with open(filename, 'rb') as bdf_file:
+        block = bdf_file.read(_BLOCK_SIZE)
+        while block:
+            sha1.update(block)
+            block = bdf_file.read(_BLOCK_SIZE)
+    return stat.st_size, stat.st_mtime, sha1.hexdigest()
+
+
+def is_file_changed(filename, signature):
+    """
+    Has a file changed since the signature was made?
+
+    The file is only hashed when the size is the same, but the
+    modification time has changed (e.g., the file was saved again).
+    """
+    size, mtime, sha1 = signature
+    if not os.path.isfile(filename):
+        return True
+    stat = os.stat(filename)
+    if stat.st_size != size:
+        return True
+    if stat.st_mtime == mtime:
+        return False
+    return get_file_signature(filename)[2] != sha1
+
+
+def read_bdf_cache(cache_filename, settings, log):
+    """
+    Reads a cache file
+
+    Parameters
+    ----------
+    cache_filename : str
+        the cache file
+    settings : dict
+        the read settings (see ``get_cache_settings``)
+    log : logger
+        the logger
+
+    Returns
+    -------
+    model : BDF / None
+        the cached model (None if the cache is missing or out of date)
+    validated : bool
+        was the cached model validated
+
+    """
+    if not os.path.exists(cache_filename):
+        return None, False
+
+    with open(cache_filename, 'rb') as cache_file:
+        try:
+            header = Unpickler(cache_file).load()
+        except Exception:
+            log.warning('cache_filename=%r is invalid' % cache_filename)
+            return None, False
+
+        if not isinstance(header, dict) or header.get('settings') != settings:
+            log.debug('the cache settings have changed; cache_filename=%r' % cache_filename)
+            return None, False
+        for filename, signature in header['files']:
+            if is_file_changed(filename, signature):
+                log.debug('%r has changed; cache_filename=%r' % (filename, cache_filename))
+                return None, False
+
+        card_tables = Unpickler(cache_file).load()
+        cards = _build_cards(card_tables, header['ncards'])
+        unpickler = Unpickler(cache_file)
+        unpickler.persistent_load = cards.__getitem__
+        model = unpickler.load()
+    log.debug('read cache_filename=%r' % cache_filename)
+    return model, header['validated']
+
+
+def write_bdf_cache(cache_filename, model, settings, validated):
+    """
+    Writes a cache file
+
+    Parameters
+    ----------
+    cache_filename : str
+        the cache file
+    model : BDF
+        the parsed model (not cross-referenced)
+    settings : dict
+        the read settings (see ``get_cache_settings``)
+    validated : bool
+        was the model validated
+
+    """
+    # the cards are removed from the model pickle and stored in the tables
+    model_file = BytesIO()
+    pickler = _CardPickler(model_file, HIGHEST_PROTOCOL)
+    pickler.dump(model)
+
+    filenames = []
+    for filename in model.active_filenames:
+        filename = os.path.abspath(filename)
+        if filename not in filenames:
+            filenames.append(filename)
+
+    header = {
+        'settings' : settings,
+        'files' : [(filename, get_file_signature(filename)) for filename in filenames],
+        'ncards' : len(pickler.cards),
+        'validated' : validated,
+    }
+
+    # the cache is written to a temporary file, so an interrupted write
+    # doesn't leave a partial cache
+    cache_filename_temp = cache_filename + '.temp'
+    with open(cache_filename_temp, 'wb') as cache_file:
+        Pickler(cache_file, HIGHEST_PROTOCOL).dump(header)
+        Pickler(cache_file, HIGHEST_PROTOCOL).dump(_get_card_tables(pickler.cards))
+        cache_file.write(model_file.getvalue())
+    if os.path.exists(cache_filename):
+        os.remove(cache_filename)
+    os.rename(cache_filename_temp, cache_filename)
+    model.log.debug('wrote cache_filename=%r' % cache_filename)
+
+
+class _CardPickler(Pickler):
+    """
+    Pickles the BDF without the cards that can be stored in a card table
+    (the cards are replaced by their index in ``cards``)
+    """
+    def __init__(self, model_file, protocol):
+        Pickler.__init__(self, model_file, protocol)
+        self.cards = []
+        self._card_ids = {}
+
+    def persistent_id(self, obj):
+        if not isinstance(obj, BaseCard):
+            return None
+        card_id = id(obj)
+        if card_id in self._card_ids:
+            return self._card_ids[card_id]
+
+        for value in get_card_state(obj).values():
+            if not _is_plain(value):
+                # e.g., a card with a nested list
+                return None
+        icard = len(self.cards)
+        self._card_ids[card_id] = icard
+        self.cards.append(obj)
+        return icard
+
+
+def _is_plain(value):
+    """
+    Can the value be stored in a card table without pickling it
+    (e.g., a value that doesn't reference another object)?
+    """
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return True
+    elif value_type is list:
+        for valuei in value:
+            if type(valuei) not in _SCALAR_TYPES:
+                return False
+        return True
+    elif value_type is np.ndarray:
+        return value.dtype.kind in 'biuf'
+    return False
+
+
+def _get_card_tables(cards):
+    """
+    Groups the cards by class and attributes and stores the attributes
+    as columns
+
+    Returns
+    -------
+    card_tables : List[(card_class, names, icards, columns)]
+        card_class : type
+            the class of the cards (e.g., GRID)
+        names : List[str]
+            the names of the attributes
+        icards : (ncards, ) int ndarray
+            the index of the cards (see ``_CardPickler.cards``)
+        columns : List[(column_type, values)]
+            the values of the attributes
+
+    """
+    groups = {}
+    states = [get_card_state(card) for card in cards]
+    for icard, (card, state) in enumerate(zip(cards, states)):
+        key = (card.__class__, tuple(state))
+        if key in groups:
+            groups[key].append(icard)
+        else:
+            groups[key] = [icard]
+
+    card_tables = []
+    for (card_class, names), icards in groups.items():
+        columns = []
+        for name in names:
+            values = [states[icard][name] for icard in icards]
+            columns.append(_get_column(values))
+        card_tables.append((card_class, names, np.array(icards), columns))
+    return card_tables
+
+
+def _get_column(values):
+    """stores the values of an attribute as an array if possible"""
+    value_types = set(type(value) for value in values)
+    if len(value_types) != 1:
+        return _LIST, values
+    value_type = value_types.pop()
+
+    try:
+        if value_type is int:
+            return _INT, np.array(values, dtype='int64')
+        elif value_type is float:
+            return _FLOAT, np.array(values, dtype='float64')
+        elif value_type is bool:
+            return _BOOL, np.array(values, dtype='bool')
+        elif value_type is np.ndarray:
+            if (values[0].ndim and
+                    len(set((value.shape, value.dtype) for value in values)) == 1):
+                return _ARRAY, np.array(values)
+        elif value_type is list:
+            nvalues = set(len(value) for value in values)
+            valuei_types = set(type(valuei) for value in values for valuei in value)
+            if len(nvalues) == 1 and valuei_types == set([int]):
+                return _INT_LIST, np.array(values, dtype='int64')
+            elif len(nvalues) == 1 and valuei_types == set([float]):
+                return _FLOAT_LIST, np.array(values, dtype='float64')
+    except OverflowError:
+        # an integer that's too big for an int64
+        pass
+    return _LIST, values
+
+
+def _get_column_values(column_type, values):
+    """gets the values of an attribute from a column"""
+    if column_type == _LIST:
+        return values
+    elif column_type == _ARRAY:
+        # the rows share the memory of the column
+        return list(values)
+    return values.tolist()
+
+
+def _build_cards(card_tables, ncards):
+    """creates the cards from the card tables"""
+    cards = [None] * ncards
+    for card_class, names, icards, columns in card_tables:
+        columns = [_get_column_values(column_type, values)
+                   for column_type, values in columns]
+        new = card_class.__new__
+        for icard, values in zip(icards.tolist(), zip(*columns)):
+            card = new(card_class)
+            set_card_state(card, zip(names, values))
+            cards[icard] = card
+    return cards
@@ -0,0 +1,309 @@
+"""
+Defines:
+ - split_bulk_data_lines(bulk_data_lines)
+ - starts_with_continuation(lines)
+ - split_trailing_comment(lines)
+ - get_worker_settings(model)
+ - create_worker_model(settings)
+ - get_card_entries(model, cards_list, card_count)
+ - parse_include_task(bdf_filename, include_comment, active_filenames, settings)
+ - parse_includes_parallel(model, bulk_includes, nworkers)
+
+For BDF.read_bdf(..., nworkers=2), the bulk data INCLUDE files aren't
+merged into the main deck.  Each INCLUDE file is read, tokenized, and
+parsed into lists of field values by a separate process.  The card
+objects are built from the values by the main BDF in the order they're
+in the deck, so duplicate ids, card counts, and parsing errors are handled
+the same way as the serial reader.  Pickling the card objects is slower
+than building them, so they aren't built by the workers.
+
+"""
+from __future__ import print_function
+import os
+try:
+    from concurrent.futures import ProcessPoolExecutor
+    IS_CONCURRENT = True
+except ImportError:  # pragma: no cover
+    # Python 2 without the futures backport
+    IS_CONCURRENT = False
+
+from pyNastran.utils.log import get_logger
+from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy, BULK_INCLUDE_LINE, _clean_comment
+from pyNastran.bdf.bdf_interface.fast_cards import (
+    FAST_CARD_NAMES, parse_fast_cards, build_fast_card)
+
+
+def split_bulk_data_lines(bulk_data_lines):
+    """
+    Splits the bulk data lines at the INCLUDEs that were replaced by
+    BULK_INCLUDE_LINE
+
+    Returns
+    -------
+    main_lines : List[List[str]]
+        the lines of the main deck before/between/after the INCLUDEs
+        (nincludes + 1 groups)
+
+    """
+    main_lines = [[]]
+    for line in bulk_data_lines:
+        if line.rstrip() == BULK_INCLUDE_LINE:
+            main_lines.append([])
+        else:
+            main_lines[-1].append(line)
+    return main_lines
+
+
+def starts_with_continuation(lines):
+    """
+    Does the first card line (not a blank/comment line) continue a card
+    from a previous file (e.g., ``+       1.0``)?
+
+    The card name is found the same way as ``BDF.get_bdf_cards``.
+    """
+    for line in lines:
+        line = line.split('$', 1)[0]
+        card_name = line.split(',', 1)[0].split('\t', 1)[0][:8].rstrip().upper()
+        if card_name and card_name[0] not in ['+', '*']:
+            return False
+        elif line.rstrip():
+            return True
+    return False
+
+
+def split_trailing_comment(lines):
+    """
+    Splits the comment lines at the end of the lines, which are part of
+    the comment of the next card (see ``BDF.get_bdf_cards``)
+
+    Returns
+    -------
+    lines : List[str]
+        the lines without the trailing comment lines
+    comment : str
+        the trailing comment
+
+    """
+    i = len(lines)
+    while i > 0 and not lines[i - 1].split('$', 1)[0].rstrip():
+        i -= 1
+
+    comment = ''
+    for line in lines[i:]:
+        if '$' in line:
+            commenti = _clean_comment(line.split('$', 1)[1])
+            if commenti:
+                comment += commenti + '\n'
+    return lines[:i], comment
+
+
+def get_worker_settings(model):
+    """
+    Gets the BDF settings that are needed to parse an INCLUDE file
+    with a separate BDF object (see ``create_worker_model``)
+    """
+    settings = {
+        'nastran_format' : model._nastran_format,
+        'cards_to_read' : model.cards_to_read,
+        'fast_parse' : model._fast_parse,
+        'encoding' : model._encoding,
+        'include_dir' : model.include_dir,
+        'punch' : model.punch,
+    }
+    return settings
+
+
+def create_worker_model(settings):
+    """creates a BDF object with the settings of ``get_worker_settings``"""
+    # the BDF class imports this module
+    from pyNastran.bdf.bdf import BDF
+
+    model = BDF(debug=False, log=get_logger(log=None, level='warning'))
+    getattr(model, 'set_as_%s' % settings['nastran_format'])()
+    model.cards_to_read = settings['cards_to_read']
+    model._fast_parse = settings['fast_parse']
+    model._encoding = settings['encoding']
+    model.include_dir = settings['include_dir']
+    model.punch = settings['punch']
+    return model
+
+
+def get_card_entries(model, cards_list, card_count):
+    """
+    Parses the cards into the fields that are added to the main BDF
+
+    The card objects are built by the main BDF, so only lists of values
+    are sent back by a worker, which are much faster to pickle than the
+    card objects.
+
+    Parameters
+    ----------
+    model : BDF
+        the worker BDF (see ``create_worker_model``)
+    cards_list : List[(card_name, comment, card_lines)]
+        the cards (see ``BDF.get_bdf_cards``)
+    card_count : Dict[card_name] = int
+        the number of each card
+
+    Returns
+    -------
+    entries : List[(card_name, comment, entry_type, value)]
+        entry_type : str
+            'row' : value is the (row, nfields) of ``parse_fast_cards``,
+                    which is built with ``build_fast_card``
+            'fields' : value is the list of fields of the BDFCard
+            'lines' : value is the card_lines for a card that's parsed by
+                      the main BDF (e.g., a rejected card, a parsing error)
+
+    """
+    fast_rows = [None] * len(cards_list)
+    if model._fast_parse and 'ECHOON' not in card_count:
+        # the CBAR defaults depend on the BAROR
+        card_names = FAST_CARD_NAMES.intersection(model.cards_to_read)
+        card_names.discard('CBAR')
+        fast_rows = parse_fast_cards(cards_list, card_names)[0]
+
+    entries = []
+    for (card_name, comment, card_lines), fast_row in zip(cards_list, fast_rows):
+        if fast_row is not None:
+            row, nfields = fast_row
+            try:
+                # a card that can't be built is read with add_card
+                build_fast_card(card_name, row, nfields)
+                entries.append((card_name, comment, 'row', fast_row))
+                continue
+            except (SyntaxError, AssertionError, KeyError, ValueError):
+                pass
+
+        if card_name is None or model.is_reject(card_name) or 'ECHOON' in card_count:
+            entries.append((card_name, comment, 'lines', card_lines))
+            continue
+
+        if card_name not in model._card_parser and card_name not in model._card_parser_prepare:
+            entries.append((card_name, comment, 'lines', card_lines))
+            continue
+
+        try:
+            card_obj = model.create_card_object(
+                list(card_lines), card_name, is_list=False, has_none=False)[0]
+        except Exception:
+            # the error is raised/stored by the main BDF
+            entries.append((card_name, comment, 'lines', card_lines))
+            continue
+        entries.append((card_name, comment, 'fields', card_obj.card))
+    return entries
+
+
+def parse_include_task(bdf_filename, include_comment, active_filenames, settings):
+    """
+    Reads and parses the bulk data of an INCLUDE file (e.g., by a worker)
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the INCLUDE file (relative to the include_dir)
+    include_comment : str
+        the comment that's added before the lines of the file
+    active_filenames : List[str]
+        the files that have been opened by the main BDF
+    settings : dict
+        the BDF settings (see ``get_worker_settings``)
+
+    Returns
+    -------
+    results : dict
+        entries : List[(card_name, comment, entry_type, value)]
+            the parsed cards (see ``get_card_entries``)
+        cards_dict : Dict[card_name] = List[(comment, card_lines)]
+            the cards that are parsed before the other cards (e.g., BAROR)
+        card_count : Dict[card_name] = int
+            the number of each card
+        is_enddata : bool
+            was an ENDDATA found
+        is_continuation : bool
+            does the file start with a continuation line
+        trailing_comment : str
+            the comment lines at the end of the file
+        active_filenames : List[str]
+            the nested INCLUDE files that were opened
+
+    """
+    model = create_worker_model(settings)
+    obj = BDFInputPy(True, False, settings['encoding'], log=model.log, debug=False)
+    obj.include_dir = settings['include_dir']
+    obj.active_filenames = list(active_filenames)
+    nactive = len(active_filenames)
+
+    # the nested INCLUDEs are read by this worker
+    lines = obj._read_include_lines(bdf_filename)
+    lines = obj._lines_to_deck_lines(lines)
+    is_continuation = starts_with_continuation(lines)
+
+    # match the lines of BDFInputPy._lines_to_decks
+    lines = [include_comment] + lines
+    if not settings['punch']:
+        lines = [line.rstrip() for line in lines]
+    lines, trailing_comment = split_trailing_comment(lines)
+
+    cards_list, cards_dict, card_count = model.get_bdf_cards(lines)
+    return {
+        'entries' : get_card_entries(model, cards_list, card_count),
+        'cards_dict' : dict(cards_dict),
+        'card_count' : dict(card_count),
+        'is_enddata' : 'ENDDATA' in model.card_count,
+        'is_continuation' : is_continuation,
+        'trailing_comment' : trailing_comment,
+        'active_filenames' : obj.active_filenames[nactive + 1:],
+    }
+
+
+def parse_includes_parallel(model, bulk_includes, nworkers):
+    """
+    Parses the bulk data INCLUDE files with a process pool
+
+    Parameters
+    ----------
+    model : BDF
+        the main BDF
+    bulk_includes : List[(bdf_filename, include_comment)]
+        the INCLUDE files (see ``BDFInputPy.bulk_includes``)
+    nworkers : int
+        the number of processes (1 to parse the files in this process)
+
+    Returns
+    -------
+    results : List[dict]
+        the parsed INCLUDE files (see ``parse_include_task``)
+
+    """
+    settings = get_worker_settings(model)
+    if nworkers > 1 and not IS_CONCURRENT:  # pragma: no cover
+        model.log.warning('nworkers=%s requires concurrent.futures (Python 3 or the '
+                          'futures package); the INCLUDE files are read serially' % nworkers)
+        nworkers = 1
+    if nworkers == 1:
+        # e.g., read_bdf(..., track_includes=True)
+        results = []
+        for bdf_filename, include_comment in bulk_includes:
+            include_filename = os.path.join(model.include_dir, bdf_filename)
+            active_filenames = [filename for filename in model.active_filenames
+                                if filename != include_filename]
+            results.append(parse_include_task(
+                bdf_filename, include_comment, active_filenames, settings))
+        return results
+
+    nworkers = min(nworkers, len(bulk_includes))
+    model.log.debug('reading %i INCLUDE files with %i workers' % (
+        len(bulk_includes), nworkers))
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        futures = []
+        for bdf_filename, include_comment in bulk_includes:
+            # the file was added to the active files by BDFInputPy
+            include_filename = os.path.join(model.include_dir, bdf_filename)
+            active_filenames = [filename for filename in model.active_filenames
+                                if filename != include_filename]
+            futures.append(executor.submit(
+                parse_include_task, bdf_filename, include_comment,
+                active_filenames, settings))
+        results = [future.result() for future in futures]
+    return results
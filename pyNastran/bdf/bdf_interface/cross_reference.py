@@ -64,12 +64,21 @@ around the idea of cross-referencing, so it's recommended that you use it.
 
 from __future__ import print_function
 from collections import defaultdict
+import threading
 import traceback
 from typing import List, Dict, Any
 from six import iteritems, itervalues
 
 from numpy import zeros, argsort, arange, array_equal
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.lazy_cards import (
+    AERO_XREF_SLOT_NAMES, OPTIMIZATION_XREF_SLOT_NAMES, defer_cross_reference)
+from pyNastran.bdf.bdf_interface.cross_reference_arrays import cross_reference_arrays
+from pyNastran.bdf.bdf_interface.xref_schedule import run_xref_stages
+
+# the stages of cross_reference(..., nworkers=2) store their errors at the
+# same time
+_XREF_ERROR_LOCK = threading.Lock()
 
 class XrefMesh(BDFAttributes):
     """
@@ -85,6 +94,22 @@ class XrefMesh(BDFAttributes):
         self._stop_on_xref_error = True
         self._stored_xref_errors = []
 
+        # the time of each cross-referencing stage; {stage_name : seconds}
+        self.xref_timings = {}
+
+    def _store_xref_error(self, card, error):
+        """
+        Stores the cross-reference error of a card and raises the
+        errors if there are too many; called in the except block
+        """
+        var = traceback.format_exception_only(type(error), error)
+        with _XREF_ERROR_LOCK:
+            self._ixref_errors += 1
+            self._stored_xref_errors.append((card, var))
+            is_pop = self._ixref_errors > self._nxref_errors
+        if is_pop:
+            self.pop_xref_errors()
+
     # def geom_check(self):
         # """
         # Performs various geometry checks
@@ -105,15 +130,19 @@ class XrefMesh(BDFAttributes):
                         xref_constraints=True,
                         xref_aero=True,
                         xref_sets=True,
-                        xref_optimization=True):
-        # type: (bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool) -> None
+                        xref_optimization=True,
+                        nworkers=1):
+        # type: (bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, int) -> None
         """
         Links up all the cards to the cards they reference
 
         Parameters
         ----------
-        xref : bool; default=True
+        xref : bool / str; default=True
            cross references the model
+           'arrays' : the elements aren't linked to the node and property
+                      objects; the indices are stored in model.xref_arrays
+                      (see ``cross_reference_arrays``)
         xref_nodes : bool; default=True
            set cross referencing of nodes/coords
         xref_element : bool; default=True
@@ -132,6 +161,12 @@ class XrefMesh(BDFAttributes):
             set cross referencing of CAERO/SPLINEs
         xref_sets : bool; default=True
             set cross referencing of SETx
+        nworkers : int; default=1
+            the number of threads that cross-reference the independent
+            card groups (e.g., the properties and the constraints) at
+            the same time (see ``xref_schedule.XREF_DEPENDENCIES``);
+            the groups are pure Python, so more threads aren't faster
+            The time of each group is stored in model.xref_timings.
 
         To only cross-reference nodes:
 
@@ -148,34 +183,105 @@ class XrefMesh(BDFAttributes):
         """
         if not xref:
             return
+        if xref == 'arrays':
+            self.cross_reference_arrays()
+            return
         self.log.debug("Cross Referencing...")
+        stages = []
         if xref_nodes:
-            self._cross_reference_nodes()
-            self._cross_reference_coordinates()
+            stages.append(('nodes', self._cross_reference_nodes))
+            stages.append(('coordinates', self._cross_reference_coordinates))
 
         if xref_elements:
-            self._cross_reference_elements()
+            stages.append(('elements', self._cross_reference_elements))
         if xref_properties:
-            self._cross_reference_properties()
+            stages.append(('properties', self._cross_reference_properties))
         if xref_masses:
-            self._cross_reference_masses()
+            stages.append(('masses', self._cross_reference_masses))
         if xref_materials:
-            self._cross_reference_materials()
+            stages.append(('materials', self._cross_reference_materials))
 
-        if xref_aero:
-            self._cross_reference_aero()
+        # the lazy aero/optimization cards are cross-referenced when
+        # they're built
+        if xref_aero and not defer_cross_reference(self, AERO_XREF_SLOT_NAMES):
+            stages.append(('aero', self._cross_reference_aero))
         if xref_constraints:
-            self._cross_reference_constraints()
+            stages.append(('constraints', self._cross_reference_constraints))
         if xref_loads:
-            self._cross_reference_loads()
+            stages.append(('loads', self._cross_reference_loads))
         if xref_sets:
-            self._cross_reference_sets()
-        if xref_optimization:
-            self._cross_reference_optimization()
+            stages.append(('sets', self._cross_reference_sets))
+        if xref_optimization and not defer_cross_reference(self, OPTIMIZATION_XREF_SLOT_NAMES):
+            stages.append(('optimization', self._cross_reference_optimization))
         if xref_nodes_with_elements:
-            self._cross_reference_nodes_with_elements()
+            stages.append(('nodes_with_elements', self._cross_reference_nodes_with_elements))
+        self.xref_timings = run_xref_stages(stages, nworkers=nworkers, log=self.log)
         #self.case_control_deck.cross_reference(self)
         self.pop_xref_errors()
+        self._xref = True
+
+    def cross_reference_arrays(self, idtype='int32', fdtype='float64'):
+        """
+        Builds the node and property indices of every element type with
+        ``np.searchsorted`` instead of linking the card objects
+
+        Parameters
+        ----------
+        idtype : str; default='int32'
+            the type of the ids and indices
+        fdtype : str; default='float64'
+            the type of the node positions
+
+        Returns
+        -------
+        xref_arrays : XrefArrays
+            the arrays, which are also stored in model.xref_arrays
+            (see ``pyNastran.bdf.bdf_interface.cross_reference_arrays``)
+
+        The missing nodes and properties of all the elements are
+        reported in a single CrossReferenceError.
+
+        .. code-block:: python
+
+          model = read_bdf(bdf_filename, xref=False, fast_parse='arrays')
+          xref_arrays = model.cross_reference_arrays()
+          area = xref_arrays.Area('CQUAD4')
+        """
+        self.log.debug("Cross Referencing the arrays...")
+        self.xref_arrays = cross_reference_arrays(self, idtype=idtype, fdtype=fdtype)
+        return self.xref_arrays
+
+    def _cross_reference_cards(self, cards):
+        # type: (List[Any]) -> None
+        """
+        Links up some of the cards (e.g., the cards of an INCLUDE file
+        that was read again by ``update_include``)
+        """
+        is_mesh = False
+        coords = []
+        for card in cards:
+            slot_name = self._type_to_slot_map.get(card.type)
+            if slot_name in ['nodes', 'elements']:
+                is_mesh = True
+            elif slot_name == 'coords':
+                coords.append(card)
+
+            if not hasattr(card, 'cross_reference'):
+                # e.g., a DESVAR
+                continue
+            try:
+                if card.type == 'GRID':
+                    card.cross_reference(self, self.grdset)
+                else:
+                    card.cross_reference(self)
+            except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
+                self._store_xref_error(card, error)
+
+        for coord in coords:
+            coord.setup()
+        if is_mesh:
+            self._cross_reference_nodes_with_elements()
+        self.pop_xref_errors()
 
     def _cross_reference_constraints(self):
         # type: () -> None
@@ -333,31 +439,19 @@ class XrefMesh(BDFAttributes):
             try:
                 elem.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((elem, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(elem, error)
 
         for elem in itervalues(self.rigid_elements):
             try:
                 elem.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((elem, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(elem, error)
 
         for elem in itervalues(self.plotels):
             try:
                 elem.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((elem, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(elem, error)
 
     def _cross_reference_nodes_with_elements(self):
         # type: () -> None
@@ -391,21 +485,13 @@ class XrefMesh(BDFAttributes):
             try:
                 mass.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((mass, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(mass, error)
 
         for prop in itervalues(self.properties_mass):
             try:
                 prop.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((prop, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(prop, error)
 
     def _cross_reference_properties(self):
         # type: () -> None
@@ -416,11 +502,7 @@ class XrefMesh(BDFAttributes):
             try:
                 prop.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((prop, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(prop, error)
 
     def _cross_reference_materials(self):
         # type: () -> None
@@ -432,21 +514,13 @@ class XrefMesh(BDFAttributes):
             try:
                 mat.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((mat, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(mat, error)
 
         for mat in itervalues(self.creep_materials):  # CREEP
             try:
                 mat.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((mat, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(mat, error)
 
         # CREEP - depends on MAT1
         data = [self.MATS1, self.MATS3, self.MATS8,
@@ -457,11 +531,7 @@ class XrefMesh(BDFAttributes):
                 try:
                     mat.cross_reference(self)
                 except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                    self._ixref_errors += 1
-                    var = traceback.format_exception_only(type(error), error)
-                    self._stored_xref_errors.append((mat, var))
-                    if self._ixref_errors > self._nxref_errors:
-                        self.pop_xref_errors()
+                    self._store_xref_error(mat, error)
 
     def _cross_reference_loads(self):
         # type: () -> None
@@ -473,22 +543,14 @@ class XrefMesh(BDFAttributes):
                 try:
                     load_combination.cross_reference(self)
                 except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                    self._ixref_errors += 1
-                    var = traceback.format_exception_only(type(error), error)
-                    self._stored_xref_errors.append((load_combination, var))
-                    if self._ixref_errors > self._nxref_errors:
-                        self.pop_xref_errors()
+                    self._store_xref_error(load_combination, error)
 
         for (unused_lid, loads) in iteritems(self.loads):
             for load in loads:
                 try:
                     load.cross_reference(self)
                 except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                    self._ixref_errors += 1
-                    var = traceback.format_exception_only(type(error), error)
-                    self._stored_xref_errors.append((load, var))
-                    if self._ixref_errors > self._nxref_errors:
-                        self.pop_xref_errors()
+                    self._store_xref_error(load, error)
 
         for (unused_lid, sid) in iteritems(self.dloads):
             for load in sid:
@@ -496,11 +558,7 @@ class XrefMesh(BDFAttributes):
                 try:
                     load.cross_reference(self)
                 except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
-                    self._ixref_errors += 1
-                    var = traceback.format_exception_only(type(error), error)
-                    self._stored_xref_errors.append((load, var))
-                    if self._ixref_errors > self._nxref_errors:
-                        self.pop_xref_errors()
+                    self._store_xref_error(load, error)
 
         for (unused_lid, sid) in iteritems(self.dload_entries):
             for load in sid:
@@ -509,44 +567,28 @@ class XrefMesh(BDFAttributes):
                     load.cross_reference(self)
                 except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
                     #raise
-                    self._ixref_errors += 1
-                    var = traceback.format_exception_only(type(error), error)
-                    self._stored_xref_errors.append((load, var))
-                    if self._ixref_errors > self._nxref_errors:
-                        self.pop_xref_errors()
+                    self._store_xref_error(load, error)
 
         for unused_key, darea in iteritems(self.dareas):
             try:
                 darea.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
                 #raise
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((load, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(load, error)
 
         for unused_key, tic in iteritems(self.tics):
             try:
                 tic.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
                 #raise
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((load, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(load, error)
 
         for unused_key, dphase in iteritems(self.dphases):
             try:
                 dphase.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
                 #raise
-                self._ixref_errors += 1
-                var = traceback.format_exception_only(type(error), error)
-                self._stored_xref_errors.append((dphase, var))
-                if self._ixref_errors > self._nxref_errors:
-                    self.pop_xref_errors()
+                self._store_xref_error(dphase, error)
 
     def _cross_reference_sets(self):
         # type: () -> None
@@ -0,0 +1,415 @@
+"""
+Defines:
+ - ElementArrays
+ - XrefArrays
+ - cross_reference_arrays(model, idtype='int32', fdtype='float64')
+
+For BDF.read_bdf(..., xref='arrays'), the elements aren't linked to the
+node and property objects.  Instead, the node and property ids of each
+element type are mapped to indices with ``np.searchsorted``, so the
+geometry of every element of a type (e.g., the CQUAD4 areas) is
+calculated from the node positions in a few array operations.
+
+.. code-block:: python
+
+  >>> model = read_bdf(bdf_filename, xref='arrays')
+  >>> xref_arrays = model.xref_arrays
+  >>> quads = xref_arrays.elements['CQUAD4']
+  >>> quads.eids
+  [1, 2, 3]
+  >>> xref_arrays.Area('CQUAD4')
+  [1., 1., 2.]
+
+The elements that were read with read_bdf(..., fast_parse='arrays') are
+included, so a model can be read and cross-referenced without creating
+the GRID and element objects.
+
+"""
+from __future__ import print_function
+import re
+from six import iteritems
+import numpy as np
+
+from pyNastran.bdf.errors import CrossReferenceError
+from pyNastran.bdf.bdf_interface.fast_cards import CARD_FIELDS
+
+#: the number of corner nodes used to calculate the centroid
+NCORNER_NODES = {
+    'CROD' : 2, 'CONROD' : 2, 'CTUBE' : 2, 'CBAR' : 2, 'CBEAM' : 2,
+    'CTRIA3' : 3, 'CTRIA6' : 3, 'CTRIAR' : 3,
+    'CPLSTN3' : 3, 'CPLSTN6' : 3, 'CPLSTS3' : 3,
+    'CQUAD4' : 4, 'CQUAD8' : 4, 'CQUADR' : 4, 'CQUAD' : 4, 'CSHEAR' : 4,
+    'CPLSTN4' : 4, 'CPLSTN8' : 4,
+    'CTETRA' : 4, 'CPENTA' : 6, 'CHEXA' : 8, 'CPYRAM' : 5,
+}
+#: the shells with an area and a normal
+TRI_TYPES = set(['CTRIA3', 'CTRIA6', 'CTRIAR', 'CPLSTN3', 'CPLSTN6', 'CPLSTS3'])
+QUAD_TYPES = set(['CQUAD4', 'CQUAD8', 'CQUADR', 'CQUAD', 'CSHEAR', 'CPLSTN4', 'CPLSTN8'])
+#: the elements with a property that isn't in model.properties (e.g., PHBDY)
+NO_PROPERTY_TYPES = set(['CHBDYE', 'CHBDYG', 'CHBDYP'])
+
+_NODE_FIELD = re.compile(r'^(n\d+|ga|gb)$')
+
+
+class ElementArrays(object):
+    """
+    The ids and the cross-reference indices of the elements of a type
+
+    Attributes
+    ----------
+    etype : str
+        the element type (e.g., CQUAD4)
+    eids : (nelements, ) int ndarray
+        the sorted element ids
+    pids : (nelements, ) int ndarray / None
+        the property ids (None for a CHBDYx); an element without a
+        property has a pid <= 0 (e.g., CONROD, CELAS2)
+    nids : (nelements, nnodes) int ndarray
+        the node ids (0 for a blank node, e.g., the midside nodes of
+        a CTETRA4 in a model with CTETRA10s)
+    inodes : (nelements, nnodes) int ndarray
+        the index of each node in ``XrefArrays.nids`` (-1 for a blank
+        or missing node)
+    iproperties : (nelements, ) int ndarray / None
+        the index of each property in ``XrefArrays.property_ids``
+        (-1 for an element without a property or a missing property)
+
+    """
+    def __init__(self, etype, eids, pids, nids, inodes, iproperties):
+        self.etype = etype
+        self.eids = eids
+        self.pids = pids
+        self.nids = nids
+        self.inodes = inodes
+        self.iproperties = iproperties
+
+    def __len__(self):
+        return len(self.eids)
+
+    def __repr__(self):
+        return 'ElementArrays(etype=%r, nelements=%s, nnodes=%s)' % (
+            self.etype, len(self.eids), self.nids.shape[1])
+
+
+class XrefArrays(object):
+    """
+    The array-based cross-reference of the elements of a model
+    (see ``cross_reference_arrays``)
+
+    Attributes
+    ----------
+    nids : (nnodes, ) int ndarray
+        the sorted GRID/SPOINT/EPOINT ids
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the positions of the nodes in the global frame
+    property_ids : (nproperties, ) int ndarray
+        the sorted property ids
+    elements : Dict[etype] = ElementArrays
+        the elements of each type
+    missing_nodes : Dict[etype] = (eids, nids)
+        the elements that reference a node that doesn't exist
+    missing_properties : Dict[etype] = (eids, pids)
+        the elements that reference a property that doesn't exist
+
+    """
+    def __init__(self, nids, xyz_cid0, property_ids, elements,
+                 missing_nodes, missing_properties):
+        self.nids = nids
+        self.xyz_cid0 = xyz_cid0
+        self.property_ids = property_ids
+        self.elements = elements
+        self.missing_nodes = missing_nodes
+        self.missing_properties = missing_properties
+
+    def __repr__(self):
+        return 'XrefArrays(nnodes=%s, nproperties=%s, etypes=%s)' % (
+            len(self.nids), len(self.property_ids), sorted(self.elements))
+
+    def get_element_xyz(self, etype, nnodes=None):
+        """
+        Gets the node positions of the elements of a type
+
+        Parameters
+        ----------
+        etype : str
+            the element type (e.g., CQUAD4)
+        nnodes : int; default=None -> all
+            the number of nodes to get (e.g., 4 for the corners of a CQUAD8)
+
+        Returns
+        -------
+        xyz : (nelements, nnodes, 3) float ndarray
+            the positions in the global frame (NaN for a blank node)
+
+        """
+        inodes = self.elements[etype].inodes[:, :nnodes]
+        xyz = self.xyz_cid0[inodes]
+        xyz[inodes < 0] = np.nan
+        return xyz
+
+    def Centroid(self, etype):
+        """
+        Gets the centroids of the elements of a type, which is the
+        average of the corner nodes (see the ``Centroid`` method of
+        the element)
+
+        Returns
+        -------
+        centroid : (nelements, 3) float ndarray
+            the centroids in the global frame
+
+        """
+        if etype not in NCORNER_NODES:
+            raise NotImplementedError('Centroid is not supported for etype=%r' % etype)
+        xyz = self.get_element_xyz(etype, NCORNER_NODES[etype])
+        if etype == 'CPYRAM':
+            return (xyz[:, :4, :].mean(axis=1) + xyz[:, 4, :]) / 2.
+        return xyz.mean(axis=1)
+
+    def _get_normal_vector(self, etype):
+        """gets the normal vector, which has a length of 2 * area"""
+        if etype in TRI_TYPES:
+            xyz = self.get_element_xyz(etype, 3)
+            return np.cross(xyz[:, 0, :] - xyz[:, 1, :], xyz[:, 0, :] - xyz[:, 2, :])
+        elif etype in QUAD_TYPES:
+            xyz = self.get_element_xyz(etype, 4)
+            return np.cross(xyz[:, 0, :] - xyz[:, 2, :], xyz[:, 1, :] - xyz[:, 3, :])
+        raise NotImplementedError('Area/Normal is not supported for etype=%r' % etype)
+
+    def Area(self, etype):
+        """
+        Gets the areas of the shell elements of a type
+
+        Returns
+        -------
+        area : (nelements, ) float ndarray
+            the areas
+
+        """
+        return 0.5 * np.linalg.norm(self._get_normal_vector(etype), axis=1)
+
+    def Normal(self, etype):
+        """
+        Gets the unit normals of the shell elements of a type
+
+        Returns
+        -------
+        normal : (nelements, 3) float ndarray
+            the unit normals in the global frame
+
+        """
+        vector = self._get_normal_vector(etype)
+        return vector / np.linalg.norm(vector, axis=1)[:, np.newaxis]
+
+    def AreaCentroidNormal(self, etype):
+        """
+        Gets the area, centroid, and unit normal of the shell
+        elements of a type
+
+        Returns
+        -------
+        area : (nelements, ) float ndarray
+            the areas
+        centroid : (nelements, 3) float ndarray
+            the centroids in the global frame
+        normal : (nelements, 3) float ndarray
+            the unit normals in the global frame
+
+        """
+        vector = self._get_normal_vector(etype)
+        length = np.linalg.norm(vector, axis=1)
+        return 0.5 * length, self.Centroid(etype), vector / length[:, np.newaxis]
+
+
+def _get_node_xyz(model, idtype, fdtype):
+    """
+    Gets the node ids and the node positions in the global frame for
+    the GRID/SPOINT/EPOINT objects and the GRID arrays
+    """
+    nids = []
+    cps = []
+    xyz_cp = []
+    if model.nodes or model.spoints or model.epoints:
+        unused_icd_transform, unused_icp_transform, xyz_cpi, nid_cp_cd = (
+            model.get_displacement_index_xyz_cp_cd(
+                fdtype=fdtype, idtype=idtype, sort_ids=False))
+        nids.append(nid_cp_cd[:, 0])
+        cps.append(nid_cp_cd[:, 1])
+        xyz_cp.append(xyz_cpi)
+
+    if 'GRID' in model.card_arrays:
+        grids = model.card_arrays['GRID']
+        nids.append(grids['nid'].astype(idtype))
+        cps.append(grids['cp'].astype(idtype))
+        xyz_cp.append(np.column_stack([grids['x1'], grids['x2'], grids['x3']]).astype(fdtype))
+
+    if not nids:
+        return np.zeros(0, dtype=idtype), np.zeros((0, 3), dtype=fdtype)
+    nids = np.hstack(nids)
+    cps = np.hstack(cps)
+    xyz_cp = np.vstack(xyz_cp)
+    isort = np.argsort(nids, kind='mergesort')
+    nids = nids[isort]
+    cps = cps[isort]
+    xyz_cp = xyz_cp[isort, :]
+
+    ucps = np.unique(cps)
+    if len(ucps) == 1 and ucps[0] in [0, -1]:
+        return nids, xyz_cp
+    icp_transform = {cp : np.where(cps == cp)[0] for cp in ucps if cp != -1}
+    xyz_cid0 = model.transform_xyzcp_to_xyz_cid(
+        xyz_cp, nids, icp_transform, cid=0, in_place=False)
+    return nids, xyz_cid0
+
+
+def _get_element_ids(model, idtype):
+    """
+    Gets the element ids, property ids, and node ids of each element
+    type from the element objects and the element arrays
+
+    Returns
+    -------
+    element_ids : Dict[etype] = List[(eids, pids, nids)]
+        the ids of the objects and the arrays; pids is None for an
+        element type in NO_PROPERTY_TYPES
+    """
+    element_ids = {}
+    for etype, eids in iteritems(model._type_to_id_map):
+        if model._type_to_slot_map.get(etype) != 'elements' or not eids:
+            continue
+        elements = [model.elements[eid] for eid in eids]
+        nids = []
+        for elem in elements:
+            nodes = getattr(elem, 'nodes', None)
+            if nodes is None:
+                nodes = elem.node_ids
+            nids.append([nid if nid else 0 for nid in nodes])
+        nnodes = max(len(nidsi) for nidsi in nids)
+        nid_array = np.zeros((len(nids), nnodes), dtype=idtype)
+        for i, nidsi in enumerate(nids):
+            nid_array[i, :len(nidsi)] = nidsi
+
+        pids = None
+        if etype not in NO_PROPERTY_TYPES:
+            pids = np.array([elem.pid for elem in elements], dtype=idtype)
+        element_ids[etype] = [(np.array(eids, dtype=idtype), pids, nid_array)]
+
+    for etype, arrays in iteritems(model.card_arrays):
+        if model._type_to_slot_map.get(etype) != 'elements':
+            continue
+        node_fields = [name for name, unused_field_type, unused_default in CARD_FIELDS[etype]
+                       if isinstance(name, str) and _NODE_FIELD.match(name)]
+        nids = np.column_stack([arrays[name] for name in node_fields]).astype(idtype)
+        element_ids.setdefault(etype, []).append(
+            (arrays['eid'].astype(idtype), arrays['pid'].astype(idtype), nids))
+    return element_ids
+
+
+def _stack_ids(ids, idtype):
+    """stacks the ids of the element objects and the element arrays"""
+    if len(ids) == 1:
+        return ids[0]
+    eids = np.hstack([eidsi for eidsi, unused_pids, unused_nids in ids])
+    pids = None
+    if all(pidsi is not None for unused_eids, pidsi, unused_nids in ids):
+        pids = np.hstack([pidsi for unused_eids, pidsi, unused_nids in ids])
+    nnodes = max(nidsi.shape[1] for unused_eids, unused_pids, nidsi in ids)
+    nids = np.zeros((len(eids), nnodes), dtype=idtype)
+    i0 = 0
+    for unused_eids, unused_pids, nidsi in ids:
+        nids[i0:i0 + nidsi.shape[0], :nidsi.shape[1]] = nidsi
+        i0 += nidsi.shape[0]
+    return eids, pids, nids
+
+
+def _searchsorted(sorted_ids, ids):
+    """
+    Gets the index of each id in a sorted array
+
+    Returns
+    -------
+    index : int ndarray
+        the index of each id (-1 if the id doesn't exist)
+    """
+    index = np.searchsorted(sorted_ids, ids)
+    index[index == len(sorted_ids)] = 0
+    if len(sorted_ids):
+        is_found = sorted_ids[index] == ids
+    else:
+        is_found = np.zeros(ids.shape, dtype='bool')
+    return np.where(is_found, index, -1)
+
+
+def cross_reference_arrays(model, idtype='int32', fdtype='float64'):
+    """
+    Builds the node and property indices of every element type
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    idtype : str; default='int32'
+        the type of the ids and indices
+    fdtype : str; default='float64'
+        the type of the node positions
+
+    Returns
+    -------
+    xref_arrays : XrefArrays
+        the arrays
+
+    Raises
+    ------
+    CrossReferenceError
+        the missing nodes and properties of all the element types if
+        ``model._stop_on_xref_error`` is set; otherwise, the errors
+        are logged
+
+    """
+    nids, xyz_cid0 = _get_node_xyz(model, idtype, fdtype)
+    property_ids = np.array(sorted(model.properties), dtype=idtype)
+
+    elements = {}
+    missing_nodes = {}
+    missing_properties = {}
+    for etype, ids in sorted(iteritems(_get_element_ids(model, idtype))):
+        eids, pids, element_nids = _stack_ids(ids, idtype)
+        isort = np.argsort(eids, kind='mergesort')
+        eids = eids[isort]
+        element_nids = element_nids[isort, :]
+
+        inodes = _searchsorted(nids, element_nids)
+        is_missing = (inodes == -1) & (element_nids != 0)
+        if is_missing.any():
+            ielement, inode = np.where(is_missing)
+            missing_nodes[etype] = (eids[ielement], element_nids[ielement, inode])
+
+        iproperties = None
+        if pids is not None:
+            pids = pids[isort]
+            iproperties = _searchsorted(property_ids, pids)
+            is_missing = (iproperties == -1) & (pids > 0)
+            if is_missing.any():
+                missing_properties[etype] = (eids[is_missing], pids[is_missing])
+        elements[etype] = ElementArrays(etype, eids, pids, element_nids, inodes, iproperties)
+
+    xref_arrays = XrefArrays(nids, xyz_cid0, property_ids, elements,
+                             missing_nodes, missing_properties)
+    _pop_missing_errors(model, missing_nodes, missing_properties)
+    return xref_arrays
+
+
+def _pop_missing_errors(model, missing_nodes, missing_properties):
+    """raises an error with all the missing nodes and properties"""
+    if not missing_nodes and not missing_properties:
+        return
+    msg = 'There are cross-reference errors.\n\n'
+    for etype, (eids, nids) in sorted(iteritems(missing_nodes)):
+        msg += '%s: missing node_ids=%s\n  element_ids=%s\n' % (
+            etype, np.unique(nids).tolist(), np.unique(eids).tolist())
+    for etype, (eids, pids) in sorted(iteritems(missing_properties)):
+        msg += '%s: missing property_ids=%s\n  element_ids=%s\n' % (
+            etype, np.unique(pids).tolist(), eids.tolist())
+    if model._stop_on_xref_error:
+        raise CrossReferenceError(msg.rstrip())
+    model.log.warning(msg.rstrip())
@@ -0,0 +1,741 @@
+# coding: utf-8
+"""
+Defines:
+ - FAST_CARD_NAMES
+ - is_fast_card(card_lines)
+ - parse_fast_cards(cards_list, card_names)
+ - build_fast_card(card_name, row, nfields, comment='')
+
+The vectorized bulk data parser for ``BDF.read_bdf(..., fast_parse=True)``.
+
+The high-volume cards (e.g., GRID, CQUAD4) are normally parsed one at a
+time (``to_fields`` -> ``BDFCard`` -> ``integer``/``double``/...).  For
+small field cards without commas, tabs, or continuation tricks, the
+fields are always in the same columns, so all the cards of a type with
+the same number of lines are converted in bulk:
+
+ 1. the lines are padded to 72 characters and stacked into a
+    (ncards, nfields, 8) array of characters
+ 2. each field is classified (blank/integer/float/invalid) with a state
+    machine, which follows the rules of ``assign_type.py`` (e.g., 1.0-3,
+    1.0D+3, '5' isn't a float)
+ 3. the integers are summed from their digits and the floats are
+    converted with ``astype``
+
+A card with a field that can't be parsed this way (e.g., a string, THRU,
+an invalid value) is returned as None and is read with the standard
+``add_card``, so the errors and cards match the standard reader.
+
+"""
+from __future__ import print_function
+from six import iteritems
+from six.moves import range
+import numpy as np
+
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CPENTA15, CHEXA8, CHEXA20)
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+from pyNastran.bdf.cards.elements.rigid import RBE2
+from pyNastran.bdf.cards.elements.mass import CONM2
+from pyNastran.bdf.cards.loads.static_loads import FORCE, PLOAD4
+from pyNastran.bdf.cards.constraints import SPC1
+
+# the field types (see assign_type.py)
+INT = 0  # integer
+INT_BLANK = 1  # integer_or_blank
+DOUBLE = 2  # double
+DOUBLE_BLANK = 3  # double_or_blank
+INT_DOUBLE_BLANK = 4  # integer_double_or_blank
+COMPONENTS = 5  # parse_components
+COMPONENTS_BLANK = 6  # components_or_blank
+BLANK = 7  # blank
+STRING_BLANK = 8  # integer_string_or_blank for a string of letters (e.g., GGG)
+
+def _fields(names, field_type, default=None):
+    """the fields of a card with the same type"""
+    return [(name, field_type, default) for name in names.split()]
+
+#: the fields of the cards after the card name
+#:   (name, field_type, default)
+#: a default that is a string is the name of a preceding field; a name
+#: that is a tuple is the (int, float) names of an INT_DOUBLE_BLANK
+#: field; the remaining fields of RBE2/SPC1 are the node ids
+CARD_FIELDS = {
+    'GRID' : (
+        _fields('nid', INT) + _fields('cp', INT_BLANK, 0) +
+        _fields('x1 x2 x3', DOUBLE_BLANK, 0.) + _fields('cd', INT_BLANK, 0) +
+        _fields('ps', COMPONENTS_BLANK, '') + _fields('seid', INT_BLANK, 0)),
+    'CQUAD4' : (
+        _fields('eid', INT) + _fields('pid', INT_BLANK, 'eid') +
+        _fields('n1 n2 n3 n4', INT) +
+        [(('mcid', 'theta'), INT_DOUBLE_BLANK, 0.)] +
+        _fields('zoffset', DOUBLE_BLANK, 0.) + _fields('blank', BLANK) +
+        _fields('tflag', INT_BLANK, 0) + _fields('T1 T2 T3 T4', DOUBLE_BLANK)),
+    'CTRIA3' : (
+        _fields('eid', INT) + _fields('pid', INT_BLANK, 'eid') +
+        _fields('n1 n2 n3', INT) +
+        [(('mcid', 'theta'), INT_DOUBLE_BLANK, 0.)] +
+        _fields('zoffset', DOUBLE_BLANK, 0.) + _fields('blank1 blank2', BLANK) +
+        _fields('tflag', INT_BLANK, 0) + _fields('T1 T2 T3', DOUBLE_BLANK)),
+    'CTETRA' : (
+        _fields('eid pid n1 n2 n3 n4', INT) +
+        _fields('n5 n6 n7 n8 n9 n10', INT_BLANK)),
+    'CPENTA' : (
+        _fields('eid pid n1 n2 n3 n4 n5 n6', INT) +
+        _fields('n7 n8 n9 n10 n11 n12 n13 n14 n15', INT_BLANK)),
+    'CHEXA' : (
+        _fields('eid pid n1 n2 n3 n4 n5 n6 n7 n8', INT) +
+        _fields('n9 n10 n11 n12 n13 n14 n15 n16 n17 n18 n19 n20', INT_BLANK)),
+    'CBAR' : (
+        _fields('eid', INT) + _fields('pid', INT_BLANK, 'eid') +
+        _fields('ga gb', INT) + [(('g0', 'x1'), INT_DOUBLE_BLANK, 0.)] +
+        _fields('x2 x3', DOUBLE_BLANK, 0.) + _fields('offt', STRING_BLANK, 'GGG') +
+        _fields('pa pb', INT_BLANK, 0) +
+        _fields('w1a w2a w3a w1b w2b w3b', DOUBLE_BLANK, 0.)),
+    'CBUSH' : (
+        _fields('eid', INT) + _fields('pid', INT_BLANK, 'eid') +
+        _fields('ga', INT) + _fields('gb', INT_BLANK) +
+        [(('g0', 'x1'), INT_DOUBLE_BLANK, None)] +
+        _fields('x2 x3', DOUBLE_BLANK, 0.) + _fields('cid', INT_BLANK) +
+        _fields('s', DOUBLE_BLANK, 0.5) + _fields('ocid', INT_BLANK, -1) +
+        _fields('s1 s2 s3', DOUBLE_BLANK)),
+    'RBE2' : (
+        _fields('eid gn', INT) + _fields('cm', COMPONENTS_BLANK)),
+    'CONM2' : (
+        _fields('eid nid', INT) + _fields('cid', INT_BLANK, 0) +
+        _fields('mass x1 x2 x3', DOUBLE_BLANK, 0.) + _fields('blank', BLANK) +
+        _fields('i11 i21 i22 i31 i32 i33', DOUBLE_BLANK, 0.)),
+    'FORCE' : (
+        _fields('sid node', INT) + _fields('cid', INT_BLANK, 0) +
+        _fields('mag', DOUBLE) + _fields('x1 x2 x3', DOUBLE_BLANK, 0.)),
+    'PLOAD4' : (
+        _fields('sid eid', INT) + _fields('p1', DOUBLE_BLANK, 0.) +
+        _fields('p2 p3 p4', DOUBLE_BLANK, 'p1') + _fields('g1 g34', INT_BLANK) +
+        _fields('cid', INT_BLANK, 0) + _fields('n1 n2 n3', DOUBLE_BLANK, 0.) +
+        _fields('sorl ldir', BLANK)),
+    'SPC1' : (
+        _fields('conid', INT) + _fields('components', COMPONENTS)),
+}
+
+#: the cards with a list of node ids after the fields in CARD_FIELDS
+LIST_CARD_NAMES = {'RBE2', 'SPC1'}
+
+#: the cards that may be read by the vectorized parser
+FAST_CARD_NAMES = set(CARD_FIELDS)
+
+# the character types
+_SPACE, _DIGIT, _SIGN, _DOT, _EXP, _OTHER = range(6)
+_CHAR_TYPES = np.full(256, _OTHER, dtype='int8')
+_CHAR_TYPES[ord(' ')] = _SPACE
+_CHAR_TYPES[ord('0'):ord('9') + 1] = _DIGIT
+_CHAR_TYPES[[ord('+'), ord('-')]] = _SIGN
+_CHAR_TYPES[ord('.')] = _DOT
+_CHAR_TYPES[[ord('E'), ord('e'), ord('D'), ord('d')]] = _EXP
+
+# the states of a field
+(_START, _SIGN0, _IDIGIT, _DOT0, _DOT1, _FDIGIT, _EXP0, _ESIGN, _ISIGN,
+ _EDIGIT, _END_INT, _END_FLOAT, _BAD) = range(13)
+
+#: the next state for the (state, character type);
+#: an _ISIGN is the sign of an implicit exponent (e.g., 1.0-3)
+_TRANSITIONS = np.full((13, 6), _BAD, dtype='int8')
+_TRANSITIONS[_START, [_SPACE, _DIGIT, _SIGN, _DOT]] = [_START, _IDIGIT, _SIGN0, _DOT0]
+_TRANSITIONS[_SIGN0, [_DIGIT, _DOT]] = [_IDIGIT, _DOT0]
+_TRANSITIONS[_IDIGIT, [_SPACE, _DIGIT, _SIGN, _DOT, _EXP]] = [
+    _END_INT, _IDIGIT, _ISIGN, _DOT1, _EXP0]
+_TRANSITIONS[_DOT0, _DIGIT] = _FDIGIT
+_TRANSITIONS[_DOT1, [_SPACE, _DIGIT, _SIGN, _EXP]] = [_END_FLOAT, _FDIGIT, _ISIGN, _EXP0]
+_TRANSITIONS[_FDIGIT, [_SPACE, _DIGIT, _SIGN, _EXP]] = [_END_FLOAT, _FDIGIT, _ISIGN, _EXP0]
+_TRANSITIONS[_EXP0, [_DIGIT, _SIGN]] = [_EDIGIT, _ESIGN]
+_TRANSITIONS[_ESIGN, _DIGIT] = _EDIGIT
+_TRANSITIONS[_ISIGN, _DIGIT] = _EDIGIT
+_TRANSITIONS[_EDIGIT, [_SPACE, _DIGIT]] = [_END_FLOAT, _EDIGIT]
+_TRANSITIONS[_END_INT, _SPACE] = _END_INT
+_TRANSITIONS[_END_FLOAT, _SPACE] = _END_FLOAT
+
+_INT_STATES = np.zeros(13, dtype='bool')
+_INT_STATES[[_IDIGIT, _END_INT]] = True
+_FLOAT_STATES = np.zeros(13, dtype='bool')
+_FLOAT_STATES[[_DOT1, _FDIGIT, _EDIGIT, _END_FLOAT]] = True
+
+#: maps the D exponent to an E exponent
+_NORMALIZE_CHARS = np.arange(256, dtype='uint8')
+_NORMALIZE_CHARS[[ord('D'), ord('d')]] = ord('E')
+
+
+def is_fast_card(card_lines):
+    """
+    Can the card be read by the vectorized parser?
+
+    The lines must be small field and fixed format (no commas, tabs, or
+    large field markers).
+    """
+    for line in card_lines:
+        if ',' in line or '\t' in line or '*' in line or '=' in line:
+            return False
+    return True
+
+
+def _get_card_chars(cards_list, icards, nlines):
+    """
+    Stacks the fields of cards with the same number of lines
+
+    Returns
+    -------
+    chars : (ncards, nlines*8, 8) uint8 ndarray
+        the characters of the fields (the card name/continuation marker
+        isn't included)
+
+    """
+    text = ''.join([
+        line[:72].rstrip('\r\n').ljust(72)
+        for icard in icards
+        for line in cards_list[icard][2]])
+    data = np.frombuffer(text.encode('ascii', 'replace'), dtype='uint8')
+    chars = data.reshape(len(icards), nlines, 72)[:, :, 8:]
+    return chars.reshape(len(icards), nlines * 8, 8)
+
+
+def _parse_fields(chars):
+    """
+    Converts fields (e.g., ' 1.0-3  ') to integers/floats
+
+    Parameters
+    ----------
+    chars : (n, 8) uint8 ndarray
+        the characters of the fields
+
+    Returns
+    -------
+    blank : (n, ) bool ndarray
+        is the field blank
+    is_int : (n, ) bool ndarray
+        is the field an integer (e.g., 1, -1)
+    is_float : (n, ) bool ndarray
+        is the field a float (e.g., 1., 1.0e3, 1.0-3, 1.0D+3)
+    int_values : (n, ) int64 ndarray
+        the integer values (0 if it isn't an integer)
+    float_values : (n, ) float64 ndarray
+        the float values of the integer/float fields
+
+    """
+    nvalues = chars.shape[0]
+    char_types = _CHAR_TYPES[chars]
+    is_digit = char_types == _DIGIT
+
+    state = np.full(nvalues, _START, dtype='int8')
+    isign = np.full(nvalues, -1, dtype='int64')
+    int_values = np.zeros(nvalues, dtype='int64')
+    for j in range(8):
+        state = _TRANSITIONS[state, char_types[:, j]]
+        isign[state == _ISIGN] = j
+        int_values = np.where(is_digit[:, j], int_values * 10 + (chars[:, j] - 48), int_values)
+
+    blank = state == _START
+    is_int = _INT_STATES[state]
+    is_float = _FLOAT_STATES[state]
+    int_values[(chars == ord('-')).any(axis=1)] *= -1
+    int_values[~is_int] = 0
+
+    float_values = np.zeros(nvalues, dtype='float64')
+    inumber = np.where(is_int | is_float)[0]
+    if len(inumber):
+        # 1.0D+3 -> 1.0E+3, 1.0-3 -> 1.0E-3
+        number_chars = np.full((len(inumber), 9), ord(' '), dtype='uint8')
+        number_chars[:, :8] = _NORMALIZE_CHARS[chars[inumber, :]]
+        isigni = isign[inumber]
+        iexp = np.where(isigni >= 0)[0]
+        if len(iexp):
+            exp_chars = number_chars[iexp, :8]
+            is_shifted = np.arange(8) >= isigni[iexp, np.newaxis]
+            number_chars[iexp, :8] = np.where(is_shifted, ord(' '), exp_chars)
+            number_chars[iexp, 1:] = np.where(is_shifted, exp_chars, number_chars[iexp, 1:])
+            number_chars[iexp, isigni[iexp]] = ord('E')
+        float_values[inumber] = number_chars.view('S9').ravel().astype('float64')
+    return blank, is_int, is_float, int_values, float_values
+
+
+def _parse_components(chars, int_values):
+    """
+    Gets the sorted components (e.g., ' 312' -> 123) of integer fields
+
+    Returns
+    -------
+    is_valid : (n, ) bool ndarray
+        is the integer a valid component
+    components : (n, ) int64 ndarray
+        the sorted components
+
+    """
+    is_valid = ~((chars == ord('+')) | (chars == ord('-'))).any(axis=1)
+    components = np.zeros(len(chars), dtype='int64')
+    for component in range(1, 10):
+        ncomponent = (chars == ord('0') + component).sum(axis=1)
+        if component > 6:
+            is_valid &= ncomponent == 0
+        else:
+            is_valid &= ncomponent <= 1
+            components = np.where(ncomponent, components * 10 + component, components)
+
+    # 0 or 123456, but not both
+    is_valid &= ((chars != ord('0')).all(axis=1) | (int_values == 0))
+    return is_valid, components
+
+
+#: the strings of letters that are floats (e.g., float('inf'))
+_FLOAT_STRINGS = ['INF', 'INFINITY', 'NAN']
+
+def _is_letters(chars):
+    """is the field a string of letters (e.g., 'GGG', 'bgg')?"""
+    is_letter = ((chars >= ord('A')) & (chars <= ord('Z'))) | (
+        (chars >= ord('a')) & (chars <= ord('z')))
+    is_nonblank = chars != ord(' ')
+    ifirst = np.argmax(is_nonblank, axis=1)
+    ilast = 7 - np.argmax(is_nonblank[:, ::-1], axis=1)
+    return (
+        is_letter.any(axis=1) & (is_letter | ~is_nonblank).all(axis=1) &
+        (is_letter.sum(axis=1) == ilast - ifirst + 1))
+
+
+def _is_integer_or_double_float(chars):
+    """
+    Is the field a float for ``integer_or_double``, which requires a dot
+    or an exponent sign (e.g., 1., 1.0-3, 1.0E+3)?
+    """
+    ifirst = np.argmax(chars != ord(' '), axis=1)
+    is_exp_sign = (
+        (_CHAR_TYPES[chars] == _SIGN) &
+        (np.arange(8) > ifirst[:, np.newaxis]))
+    return (chars == ord('.')).any(axis=1) | is_exp_sign.any(axis=1)
+
+
+def _parse_card_group(card_name, chars):
+    """
+    Parses the cards of a type with the same number of lines
+
+    Parameters
+    ----------
+    card_name : str
+        the card name (e.g., GRID)
+    chars : (ncards, nfields, 8) uint8 ndarray
+        the characters of the fields (see ``_get_card_chars``)
+
+    Returns
+    -------
+    is_valid : (ncards, ) bool ndarray
+        can the card be created from the arrays
+    nfields : (ncards, ) int ndarray
+        the number of fields on the card (including the card name)
+    arrays : Dict[name] = (ncards, ) ndarray
+        the field values; blank fields are NaN for floats and 0 for
+        integers unless there is a default
+    blanks : Dict[name] = (ncards, ) bool ndarray
+        the blank fields that don't have a default
+    int_fields : Dict[name] = (ncards, ) bool ndarray
+        the INT_DOUBLE_BLANK fields that are integers
+
+    """
+    ncards, nfields_max = chars.shape[:2]
+    is_blank_char = chars == ord(' ')
+    is_nonblank = ~is_blank_char.all(axis=2)
+    nfields = np.where(
+        is_nonblank.any(axis=1),
+        nfields_max + 1 - np.argmax(is_nonblank[:, ::-1], axis=1), 1)
+
+    card_fields = CARD_FIELDS[card_name]
+    nspec = min(len(card_fields), nfields_max)
+    blank, is_int, is_float, int_values, float_values = _parse_fields(
+        chars[:, :nspec, :].reshape(ncards * nspec, 8))
+    blank = blank.reshape(ncards, nspec)
+    is_int = is_int.reshape(ncards, nspec)
+    is_float = is_float.reshape(ncards, nspec)
+    int_values = int_values.reshape(ncards, nspec)
+    float_values = float_values.reshape(ncards, nspec)
+
+    is_valid = np.ones(ncards, dtype='bool')
+    arrays = {}
+    blanks = {}
+    int_fields = {}
+    for ifield, (name, field_type, default) in enumerate(card_fields):
+        if ifield >= nspec:
+            # the remaining fields are blank
+            blank_field = np.ones(ncards, dtype='bool')
+            is_int_field = np.zeros(ncards, dtype='bool')
+            is_float_field = np.zeros(ncards, dtype='bool')
+            int_field = np.zeros(ncards, dtype='int64')
+            float_field = np.zeros(ncards, dtype='float64')
+        else:
+            blank_field = blank[:, ifield]
+            is_int_field = is_int[:, ifield]
+            is_float_field = is_float[:, ifield]
+            int_field = int_values[:, ifield]
+            float_field = float_values[:, ifield]
+
+        if field_type == BLANK:
+            is_valid &= blank_field
+            continue
+        elif field_type in (INT, INT_BLANK):
+            array = int_field
+            if field_type == INT:
+                is_valid &= is_int_field
+                arrays[name] = array
+                continue
+            is_valid &= is_int_field | blank_field
+        elif field_type in (DOUBLE, DOUBLE_BLANK):
+            # 5 isn't a float, but -5 is
+            array = float_field
+            is_signed = np.zeros(ncards, dtype='bool')
+            if ifield < nspec:
+                is_signed = (_CHAR_TYPES[chars[:, ifield, :]] == _SIGN).any(axis=1)
+            is_double = is_float_field | (is_int_field & is_signed)
+            if field_type == DOUBLE:
+                is_valid &= is_double
+                arrays[name] = array
+                continue
+            is_valid &= is_double | blank_field
+            array[blank_field] = np.nan
+        elif field_type == INT_DOUBLE_BLANK:
+            # a float must have a dot or an exponent sign (e.g., 1., 1-3)
+            name_int, name_float = name
+            if ifield < nspec:
+                is_float_field &= _is_integer_or_double_float(chars[:, ifield, :])
+            is_valid &= is_int_field | is_float_field | blank_field
+            int_array = np.where(is_int_field, int_field, -1)
+            float_array = np.where(is_float_field, float_field, np.nan)
+            if default is not None:
+                float_array[blank_field] = default
+                is_float_field |= blank_field
+            else:
+                blanks[name_int] = blank_field
+            arrays[name_int] = int_array
+            arrays[name_float] = float_array
+            int_fields[name_int] = is_int_field
+            continue
+        elif field_type == STRING_BLANK:
+            array = np.full(ncards, default, dtype='U8')
+            if ifield < nspec:
+                is_string = _is_letters(chars[:, ifield, :])
+                istring = np.where(is_string)[0]
+                if len(istring):
+                    strings = chars[istring, ifield, :].copy().view('S8').ravel()
+                    array[istring] = np.char.upper(np.char.strip(strings)).astype('U8')
+
+                    # INF/NAN are read as floats by integer_string_or_blank
+                    is_string[istring] &= ~np.in1d(array[istring], _FLOAT_STRINGS)
+                is_valid &= is_string | blank_field
+            arrays[name] = array
+            continue
+        elif field_type in (COMPONENTS, COMPONENTS_BLANK):
+            if ifield < nspec:
+                is_component, array = _parse_components(chars[:, ifield, :], int_field)
+            else:
+                is_component = array = np.zeros(ncards, dtype='int64')
+            if field_type == COMPONENTS:
+                is_valid &= is_int_field & is_component
+                arrays[name] = array
+                continue
+            is_valid &= (is_int_field & is_component) | blank_field
+        else:  # pragma: no cover
+            raise NotImplementedError(field_type)
+
+        if field_type == COMPONENTS_BLANK or default is None:
+            blanks[name] = blank_field
+        elif isinstance(default, str):
+            array[blank_field] = arrays[default][blank_field]
+        else:
+            array[blank_field] = default
+        arrays[name] = array
+
+    if card_name in LIST_CARD_NAMES:
+        is_valid &= _parse_node_list(card_name, chars, nfields, len(card_fields), arrays, int_fields)
+    else:
+        is_valid &= nfields <= len(card_fields) + 1
+
+    if card_name == 'CBAR':
+        # G0 vector defining plane 1 is not defined
+        is_valid &= ~(
+            ~int_fields['g0'] &
+            (arrays['x1'] == 0.) & (arrays['x2'] == 0.) & (arrays['x3'] == 0.))
+    elif card_name == 'CBUSH':
+        # the x vector must be defined when cid is blank
+        x = np.column_stack([arrays['x1'], arrays['x2'], arrays['x3']])
+        is_valid &= ~(
+            ~int_fields['g0'] & ~blanks['g0'] & blanks['cid'] &
+            (x.max(axis=1) == x.min(axis=1)))
+    return is_valid, nfields, arrays, blanks, int_fields
+
+
+def _parse_node_list(card_name, chars, nfields, ifield0, arrays, int_fields):
+    """
+    Parses the node ids of an RBE2/SPC1 (and the RBE2's alpha), which
+    are the fields after ifield0
+
+    Returns
+    -------
+    is_valid : (ncards, ) bool ndarray
+        can the card be created from the arrays
+
+    """
+    ncards, nfields_max = chars.shape[:2]
+    nnodes_max = max(nfields_max - ifield0, 0)
+    nnodes = nfields - ifield0 - 1
+    is_valid = nnodes > 0
+    if nnodes_max == 0:
+        arrays['nodes'] = np.zeros((ncards, 0), dtype='int64')
+        arrays['nnodes'] = np.zeros(ncards, dtype='int64')
+        return is_valid
+
+    unused_blank, is_int, is_float, int_values, float_values = _parse_fields(
+        chars[:, ifield0:, :].reshape(ncards * nnodes_max, 8))
+    is_int = is_int.reshape(ncards, nnodes_max)
+    int_values = int_values.reshape(ncards, nnodes_max)
+
+    # the fields before the last field must be integers
+    inode = np.arange(nnodes_max)
+    is_node = inode < nnodes[:, np.newaxis]
+    is_valid &= (is_int | ~is_node).all(axis=1)
+
+    if card_name == 'RBE2':
+        # the last field is a float (alpha) or an integer (node)
+        irow = np.arange(ncards)
+        ilast = np.maximum(nnodes - 1, 0)
+        is_float = is_float.reshape(ncards, nnodes_max)[irow, ilast]
+        is_float &= _is_integer_or_double_float(chars[irow, ifield0 + ilast, :])
+        is_alpha = is_float & ~is_int[irow, ilast]
+        is_valid |= is_alpha & (nnodes > 1) & (
+            (is_int | ~is_node)[:, :-1] | (inode[:-1] >= ilast[:, np.newaxis])).all(axis=1)
+        is_valid &= nnodes > is_alpha
+        nnodes = nnodes - is_alpha
+        arrays['alpha'] = np.where(
+            is_alpha, float_values.reshape(ncards, nnodes_max)[irow, ilast], 0.)
+        is_node = inode < nnodes[:, np.newaxis]
+
+    arrays['nodes'] = np.where(is_node, int_values, 0)
+    arrays['nnodes'] = nnodes
+    return is_valid
+
+
+def parse_fast_cards(cards_list, card_names):
+    """
+    Parses the cards that can be read by the vectorized parser
+
+    Parameters
+    ----------
+    cards_list : List[(card_name, comment, card_lines)]
+        the cards (see ``BDF.get_bdf_cards``)
+    card_names : Set[str]
+        the cards to parse (a subset of FAST_CARD_NAMES)
+
+    Returns
+    -------
+    fast_rows : List[(row, nfields) / None]
+        row : tuple
+            the values of the fields that are passed to ``build_fast_card``
+        nfields : int
+            the number of fields on the card
+        None : the card must be read by ``add_card``
+    card_arrays : Dict[card_name] = Dict[name] = ndarray
+        the values of the fields of the parsed cards in the order they
+        are in cards_list (e.g., card_arrays['GRID']['nid'])
+
+    """
+    groups = {}
+    for icard, (card_name, unused_comment, card_lines) in enumerate(cards_list):
+        if card_name in card_names and is_fast_card(card_lines):
+            key = (card_name, len(card_lines))
+            if key in groups:
+                groups[key].append(icard)
+            else:
+                groups[key] = [icard]
+
+    fast_rows = [None] * len(cards_list)
+    card_groups = {}
+    for (card_name, nlines), icards in sorted(iteritems(groups)):
+        chars = _get_card_chars(cards_list, icards, nlines)
+        is_valid, nfields, arrays, blanks, int_fields = _parse_card_group(card_name, chars)
+        ivalid = np.where(is_valid)[0]
+        if not len(ivalid):
+            continue
+
+        icards = np.array(icards)[ivalid]
+        arrays = {name: array[ivalid] for name, array in iteritems(arrays)}
+        card_groups.setdefault(card_name, []).append((icards, arrays))
+
+        columns = _get_columns(card_name, arrays, {
+            name: is_blank[ivalid] for name, is_blank in iteritems(blanks)}, {
+                name: is_int[ivalid] for name, is_int in iteritems(int_fields)})
+        for icard, nfieldsi, row in zip(icards.tolist(), nfields[ivalid].tolist(),
+                                        zip(*columns)):
+            fast_rows[icard] = (row, nfieldsi)
+
+    card_arrays = {}
+    for card_name, groupsi in iteritems(card_groups):
+        isort = np.argsort(np.hstack([icards for icards, unused_arrays in groupsi]))
+        card_arrays[card_name] = {
+            name: _stack_arrays([arrays[name] for unused_icards, arrays in groupsi])[isort]
+            for name in groupsi[0][1]}
+    return fast_rows, card_arrays
+
+
+def _stack_arrays(arrays):
+    """stacks the arrays from groups with different numbers of lines"""
+    if arrays[0].ndim == 1:
+        return np.hstack(arrays)
+    ncolumns = max(array.shape[1] for array in arrays)
+    return np.vstack([
+        np.hstack([array, np.zeros((array.shape[0], ncolumns - array.shape[1]),
+                                   dtype=array.dtype)])
+        for array in arrays])
+
+
+def _get_columns(card_name, arrays, blanks, int_fields):
+    """
+    Gets the values of the fields as lists of python ints/floats/strings
+    (None for a blank field without a default)
+    """
+    columns = []
+    for name, field_type, default in CARD_FIELDS[card_name]:
+        if field_type == BLANK:
+            continue
+        if field_type == INT_DOUBLE_BLANK:
+            name_int, name_float = name
+            column = arrays[name_float].tolist()
+            int_column = arrays[name_int].tolist()
+            for i in np.where(int_fields[name_int])[0].tolist():
+                column[i] = int_column[i]
+            name = name_int
+        elif field_type in (COMPONENTS, COMPONENTS_BLANK):
+            column = [str(value) for value in arrays[name].tolist()]
+        else:
+            column = arrays[name].tolist()
+
+        if name in blanks:
+            blank_value = default if field_type == COMPONENTS_BLANK else None
+            for i in np.where(blanks[name])[0].tolist():
+                column[i] = blank_value
+        columns.append(column)
+
+    if card_name in LIST_CARD_NAMES:
+        nodes = arrays['nodes'].tolist()
+        columns.append([nodesi[:nnodes] for nodesi, nnodes in zip(
+            nodes, arrays['nnodes'].tolist())])
+        if card_name == 'RBE2':
+            columns.append(arrays['alpha'].tolist())
+    return columns
+
+
+def _build_grid(row, unused_nfields, comment):
+    nid, cp, x1, x2, x3, cd, ps, seid = row
+    return GRID(nid, [x1, x2, x3], cp, cd, ps, seid, comment=comment)
+
+def _build_cquad4(row, unused_nfields, comment):
+    eid, pid, n1, n2, n3, n4, theta_mcid, zoffset, tflag, t1, t2, t3, t4 = row
+    return CQUAD4(eid, pid, [n1, n2, n3, n4], theta_mcid, zoffset,
+                  tflag, t1, t2, t3, t4, comment=comment)
+
+def _build_ctria3(row, unused_nfields, comment):
+    eid, pid, n1, n2, n3, theta_mcid, zoffset, tflag, t1, t2, t3 = row
+    return CTRIA3(eid, pid, [n1, n2, n3], zoffset=zoffset, theta_mcid=theta_mcid,
+                  tflag=tflag, T1=t1, T2=t2, T3=t3, comment=comment)
+
+def _build_ctetra(row, nfields, comment):
+    if nfields == 7:
+        return CTETRA4(row[0], row[1], list(row[2:6]), comment=comment)
+    return CTETRA10(row[0], row[1], list(row[2:]), comment=comment)
+
+def _build_cpenta(row, nfields, comment):
+    if nfields == 9:
+        return CPENTA6(row[0], row[1], list(row[2:8]), comment=comment)
+    return CPENTA15(row[0], row[1], list(row[2:]), comment=comment)
+
+def _build_chexa(row, nfields, comment):
+    if nfields == 11:
+        return CHEXA8(row[0], row[1], list(row[2:10]), comment=comment)
+    return CHEXA20(row[0], row[1], list(row[2:]), comment=comment)
+
+def _build_cbar(row, unused_nfields, comment):
+    eid, pid, ga, gb, g0_x1, x2, x3, offt, pa, pb, w1a, w2a, w3a, w1b, w2b, w3b = row
+    if isinstance(g0_x1, float):
+        g0 = None
+        x = np.array([g0_x1, x2, x3], dtype='float64')
+    else:
+        g0 = g0_x1
+        x = None
+    wa = np.array([w1a, w2a, w3a], dtype='float64')
+    wb = np.array([w1b, w2b, w3b], dtype='float64')
+    return CBAR(eid, pid, [ga, gb], x, g0, offt, pa, pb, wa, wb, comment=comment)
+
+def _build_cbush(row, unused_nfields, comment):
+    eid, pid, ga, gb, g0_x1, x2, x3, cid, s, ocid, s1, s2, s3 = row
+    if isinstance(g0_x1, float):
+        g0 = None
+        x = [g0_x1, x2, x3]
+    else:
+        g0 = g0_x1
+        x = None if g0 is not None else [None, None, None]
+    return CBUSH(eid, pid, [ga, gb], x, g0, cid=cid, s=s, ocid=ocid,
+                 si=[s1, s2, s3], comment=comment)
+
+def _build_rbe2(row, unused_nfields, comment):
+    eid, gn, cm, gmi, alpha = row
+    return RBE2(eid, gn, cm, gmi, alpha, comment=comment)
+
+def _build_conm2(row, unused_nfields, comment):
+    eid, nid, cid, mass, x1, x2, x3, i11, i21, i22, i31, i32, i33 = row
+    return CONM2(eid, nid, mass, cid=cid, X=[x1, x2, x3],
+                 I=[i11, i21, i22, i31, i32, i33], comment=comment)
+
+def _build_force(row, unused_nfields, comment):
+    sid, node, cid, mag, x1, x2, x3 = row
+    return FORCE(sid, node, mag, np.array([x1, x2, x3]), cid=cid, comment=comment)
+
+def _build_pload4(row, unused_nfields, comment):
+    sid, eid, p1, p2, p3, p4, g1, g34, cid, n1, n2, n3 = row
+    return PLOAD4(sid, [eid], [p1, p2, p3, p4], g1, g34, cid, np.array([n1, n2, n3]),
+                  'SURF', 'NORM', comment=comment)
+
+def _build_spc1(row, unused_nfields, comment):
+    conid, components, nodes = row
+    return SPC1(conid, components, nodes, comment=comment)
+
+_CARD_BUILDERS = {
+    'GRID' : _build_grid,
+    'CQUAD4' : _build_cquad4,
+    'CTRIA3' : _build_ctria3,
+    'CTETRA' : _build_ctetra,
+    'CPENTA' : _build_cpenta,
+    'CHEXA' : _build_chexa,
+    'CBAR' : _build_cbar,
+    'CBUSH' : _build_cbush,
+    'RBE2' : _build_rbe2,
+    'CONM2' : _build_conm2,
+    'FORCE' : _build_force,
+    'PLOAD4' : _build_pload4,
+    'SPC1' : _build_spc1,
+}
+
+def build_fast_card(card_name, row, nfields, comment=''):
+    """
+    Builds a card from the values of ``parse_fast_cards``
+
+    Parameters
+    ----------
+    card_name : str
+        the card name (e.g., GRID)
+    row : tuple
+        the values of the fields
+    nfields : int
+        the number of fields on the card (including the card name)
+    comment : str; default=''
+        a comment for the card
+
+    Returns
+    -------
+    card : BaseCard()
+        the card object (e.g., a GRID, CTETRA4)
+
+    """
+    return _CARD_BUILDERS[card_name](row, nfields, comment)
@@ -115,6 +115,9 @@ class GetCard(GetMethods):
         #}
         out_dict = {}
         for key in card_types:
+            if self._type_to_slot_map.get(key) in self._lazy_cards:
+                # the ids of the lazy cards are found when they're built
+                getattr(self, self._type_to_slot_map[key])
             if key in self.card_count:
                 out_dict[key] = sorted(self._type_to_id_map[key])
             else:
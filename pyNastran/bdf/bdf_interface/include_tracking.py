@@ -0,0 +1,343 @@
+"""
+Defines:
+ - get_card_id_lengths(model)
+ - track_include_cards(model, filename, lengths, include_info)
+ - remove_include_cards(model, filename)
+ - remove_empty_lists(model, list_keys)
+ - update_card(card, card_new)
+ - get_include_state(model, filename, card_types)
+ - restore_include_state(model, state)
+
+For BDF.read_bdf(..., track_includes=True), the cards of each bulk data
+INCLUDE file are recorded, so BDF.update_include(filename) can replace
+the cards of a file that changed without reading the whole deck again.
+
+The cards of a file are found from the ids that the add methods append
+to ``model._type_to_id_map`` while the file is parsed.  The cards that
+are stored in a list (e.g., the FORCE cards in model.loads[sid]) are
+found from the lengths of the lists and are stored, so they can be
+removed without removing the cards with the same id from the other
+files.
+
+"""
+from __future__ import print_function
+from collections import defaultdict
+from six import iteritems, itervalues
+
+from pyNastran.bdf.cards.base_card import get_card_state, set_card_state
+
+
+def get_card_id_lengths(model):
+    """
+    Gets the state of the model before a file is parsed
+
+    Returns
+    -------
+    id_lengths : Dict[card_type] = int
+        the number of ids of each card type in model._type_to_id_map
+    list_lengths : Dict[slot_name] = int / Dict[key] = int
+        the length of the lists of cards (e.g., model.suport) and of the
+        lists in a dictionary (e.g., model.loads[sid])
+    card_count : Dict[card_name] = int
+        a copy of model.card_count
+
+    """
+    id_lengths = {card_type : len(ids)
+                  for card_type, ids in iteritems(model._type_to_id_map)
+                  if isinstance(ids, list)}
+    list_lengths = {}
+    for slot_name in model._slot_to_type_map:
+        slot = getattr(model, slot_name, None)
+        if isinstance(slot, list):
+            list_lengths[slot_name] = len(slot)
+        elif isinstance(slot, dict):
+            if not slot:
+                list_lengths[slot_name] = {}
+            elif isinstance(next(itervalues(slot)), list):
+                list_lengths[slot_name] = {key : len(cards) for key, cards in iteritems(slot)}
+    return id_lengths, list_lengths, dict(model.card_count)
+
+
+def _get_list_cards(model, list_lengths):
+    """gets the cards that were added to the lists since ``get_card_id_lengths``"""
+    list_cards = []
+    for slot_name, lengths in iteritems(list_lengths):
+        slot = getattr(model, slot_name)
+        if isinstance(slot, list):
+            list_cards.extend((slot_name, None, card) for card in slot[lengths:])
+        elif slot and isinstance(next(itervalues(slot)), list):
+            for key, cards in iteritems(slot):
+                list_cards.extend((slot_name, key, card) for card in cards[lengths.get(key, 0):])
+    return list_cards
+
+
+def track_include_cards(model, filename, lengths, include_info):
+    """
+    Records the cards that were added by an INCLUDE file
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    filename : str
+        the absolute path to the INCLUDE file
+    lengths : (id_lengths, list_lengths, card_count)
+        the state of the model before the file was parsed
+        (see ``get_card_id_lengths``)
+    include_info : tuple
+        (bdf_filename, include_comment, nested_filenames) that are used
+        to parse the file again
+
+    Returns
+    -------
+    is_tracked : bool
+        False if some cards of the file can't be found (e.g., a card
+        that's merged with another card like a SET1), so the file can't
+        be updated
+
+    """
+    id_lengths, list_lengths, card_count = lengths
+    list_cards = _get_list_cards(model, list_lengths)
+    list_slot_names = set(slot_name for slot_name, unused_key, unused_card in list_cards)
+
+    # the cards in a list have an id in model._type_to_id_map for the
+    # first card of a key, so the key of each card is used
+    card_ids = defaultdict(list)  # type: Dict[str, List[Any]]
+    for unused_slot_name, key, card in list_cards:
+        card_ids[card.type].append(key)
+    for card_type, ids in iteritems(model._type_to_id_map):
+        if not isinstance(ids, list) or model._type_to_slot_map.get(card_type) in list_slot_names:
+            continue
+        nids0 = id_lengths.get(card_type, 0)
+        if len(ids) > nids0:
+            card_ids[card_type] = ids[nids0:]
+
+    # every card that was counted must be found
+    ncards = {}
+    for card_name, count in iteritems(model.card_count):
+        ncardsi = count - card_count.get(card_name, 0)
+        if ncardsi and card_name != 'ENDDATA':
+            ncards[card_name] = ncardsi
+    untracked_types = set(card_name for card_name, ncardsi in iteritems(ncards)
+                          if len(card_ids.get(card_name, [])) != ncardsi)
+    untracked_types.update(card_type for card_type in card_ids if card_type not in ncards)
+    for card_type, ids in iteritems(card_ids):
+        slot = getattr(model, model._type_to_slot_map.get(card_type, ''), None)
+        if not isinstance(slot, (dict, list)):
+            untracked_types.add(card_type)
+
+    model.include_cards.pop(filename, None)
+    model._include_info.pop(filename, None)
+    if untracked_types:
+        model.log.warning(
+            "the cards of %r can't be updated by update_include; card_types=%s" % (
+                filename, sorted(untracked_types)))
+        return False
+
+    model.include_cards[filename] = dict(card_ids)
+    model._include_info[filename] = tuple(include_info) + (list_cards, )
+    return True
+
+
+def remove_include_cards(model, filename):
+    """
+    Removes the cards of an INCLUDE file from the model
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    filename : str
+        the absolute path to the INCLUDE file
+
+    Returns
+    -------
+    cards : Dict[(slot_name, key)] = card
+        the cards that were removed from a dictionary (e.g., model.properties)
+    list_keys : List[(slot_name, key)]
+        the lists that cards were removed from (key=None for a list
+        attribute like model.suport); the lists are kept, so the cards
+        that reference a list (e.g., a LOAD) are still valid
+
+    """
+    card_ids = model.include_cards.pop(filename)
+    list_cards = model._include_info.pop(filename)[-1]
+    list_types = set(card.type for unused_slot_name, unused_key, card in list_cards)
+
+    cards = {}
+    for card_type, ids in iteritems(card_ids):
+        model.card_count[card_type] -= len(ids)
+        if not model.card_count[card_type]:
+            del model.card_count[card_type]
+        if card_type in list_types:
+            continue
+
+        slot_name = model._type_to_slot_map[card_type]
+        slot = getattr(model, slot_name)
+        if isinstance(slot, dict):
+            for key in ids:
+                cards[(slot_name, key)] = slot.pop(key)
+
+        # the ids are removed once
+        nids = defaultdict(int)  # type: Dict[Any, int]
+        for key in ids:
+            nids[key] += 1
+        all_ids = []
+        for key in model._type_to_id_map[card_type]:
+            if nids.get(key, 0):
+                nids[key] -= 1
+            else:
+                all_ids.append(key)
+        model._type_to_id_map[card_type] = all_ids
+
+    card_ids_by_list = defaultdict(set)  # type: Dict[Tuple[str, Any], Set[int]]
+    for slot_name, key, card in list_cards:
+        card_ids_by_list[(slot_name, key)].add(id(card))
+    for (slot_name, key), ids in iteritems(card_ids_by_list):
+        cardsi = getattr(model, slot_name)
+        if key is not None:
+            cardsi = cardsi[key]
+        cardsi[:] = [card for card in cardsi if id(card) not in ids]
+    return cards, list(card_ids_by_list)
+
+
+def remove_empty_lists(model, list_keys):
+    """
+    Removes the lists in a dictionary that are empty after an INCLUDE
+    file was updated (e.g., model.loads[sid])
+
+    Returns
+    -------
+    is_removed : bool
+        was a list removed
+    """
+    is_removed = False
+    for slot_name, key in list_keys:
+        slot = getattr(model, slot_name)
+        if key is None or key not in slot or slot[key]:
+            continue
+        del slot[key]
+        is_removed = True
+        for card_type in model._slot_to_type_map[slot_name]:
+            ids = model._type_to_id_map.get(card_type)
+            if isinstance(ids, list) and key in ids:
+                ids.remove(key)
+                break
+    return is_removed
+
+
+def update_card(card, card_new):
+    """
+    Copies the fields of a new card into an existing card of the same
+    class, so the cards that reference the existing card don't need to
+    be cross-referenced again
+    """
+    assert card.__class__ is card_new.__class__, 'card=%s card_new=%s' % (
+        card.__class__.__name__, card_new.__class__.__name__)
+    _replace_card_state(card, get_card_state(card_new))
+
+
+def _replace_card_state(card, state):
+    """replaces all the attributes of a card (see ``get_card_state``)"""
+    for name in get_card_state(card):
+        delattr(card, name)
+    set_card_state(card, state)
+
+
+def get_include_state(model, filename, card_types):
+    """
+    Gets the state of the parts of the model that an update of an
+    INCLUDE file changes, so the model can be restored if the file
+    can't be added (e.g., a card has a bad field)
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    filename : str
+        the absolute path to the INCLUDE file
+    card_types : List[str]
+        the card types of the old and the new file
+
+    Returns
+    -------
+    state : tuple
+        the state for ``restore_include_state``
+
+    """
+    slots = {}
+    for card_type in card_types:
+        slot_name = model._type_to_slot_map.get(card_type)
+        if slot_name is None or slot_name in slots:
+            continue
+        slot = getattr(model, slot_name, None)
+        if isinstance(slot, dict):
+            # the lists in a dictionary (e.g., model.loads[sid]) are
+            # referenced by other cards, so they're restored in place
+            lists = [(cards, list(cards)) for cards in itervalues(slot)
+                     if isinstance(cards, list)]
+            slots[slot_name] = (dict(slot), lists)
+        elif isinstance(slot, list):
+            slots[slot_name] = (list(slot), [])
+
+    type_to_ids = {card_type : list(model._type_to_id_map[card_type])
+                   if isinstance(model._type_to_id_map.get(card_type), list) else None
+                   for card_type in card_types}
+    include_info = (model.include_cards.get(filename), model._include_info.get(filename))
+    parse_errors = (model._iparse_errors, len(model._stored_parse_errors))
+    xref_errors = (model._ixref_errors, len(model._stored_xref_errors))
+    return (slots, type_to_ids, dict(model.card_count), list(model.active_filenames),
+            len(model.reject_cards), parse_errors, xref_errors, filename, include_info)
+
+
+def restore_include_state(model, state, card_states=None):
+    """
+    Restores the model to the state from ``get_include_state``
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    state : tuple
+        the state from ``get_include_state``
+    card_states : List[(card, Dict[name] = value)]; default=None
+        the cards that were updated in place (see ``update_card``) and
+        their attributes before the update
+
+    """
+    (slots, type_to_ids, card_count, active_filenames, nreject_cards,
+     parse_errors, xref_errors, filename, include_info) = state
+    for slot_name, (slot_old, lists) in iteritems(slots):
+        slot = getattr(model, slot_name)
+        if isinstance(slot, dict):
+            slot.clear()
+            slot.update(slot_old)
+        else:
+            slot[:] = slot_old
+        for cards, cards_old in lists:
+            cards[:] = cards_old
+
+    for card_type, ids in iteritems(type_to_ids):
+        if ids is None:
+            model._type_to_id_map.pop(card_type, None)
+        else:
+            model._type_to_id_map[card_type] = ids
+    model.card_count.clear()
+    model.card_count.update(card_count)
+    model.active_filenames[:] = active_filenames
+    del model.reject_cards[nreject_cards:]
+    model._iparse_errors, nstored_parse_errors = parse_errors
+    del model._stored_parse_errors[nstored_parse_errors:]
+    model._ixref_errors, nstored_xref_errors = xref_errors
+    del model._stored_xref_errors[nstored_xref_errors:]
+    if card_states:
+        for card, card_state in card_states:
+            _replace_card_state(card, card_state)
+
+    include_cards, include_infoi = include_info
+    if include_cards is None:
+        model.include_cards.pop(filename, None)
+        model._include_info.pop(filename, None)
+    else:
+        model.include_cards[filename] = include_cards
+        model._include_info[filename] = include_infoi
@@ -0,0 +1,238 @@
+"""
+Defines:
+ - get_lazy_card_names(model, card_count)
+ - add_lazy_card(model, card_name, comment, card_lines)
+ - build_lazy_slot(model, slot_name)
+ - defer_cross_reference(model, slot_names)
+ - hide_lazy_slots(model)
+ - write_lazy_cards(model, bdf_file)
+
+For BDF.read_bdf(..., lazy=True), the aero, optimization, DMIG, table,
+and thermal cards are stored as the card lines that were read.  The
+attribute of a lazy slot (e.g., model.caeros) is removed from the model,
+so the first access goes through ``BDF.__getattr__``, which builds the
+cards of the slot.  Until then, write_bdf writes the card lines as they
+were read.
+
+The methods that loop over every slot don't build the lazy slots:
+ - validate : the cards are validated when they're built
+ - cross_reference : the aero and optimization cards are
+   cross-referenced when they're built
+ - uncross_reference : the cards haven't been cross-referenced
+ - write_bdf : the card lines are written
+
+"""
+from __future__ import print_function
+from contextlib import contextmanager
+from threading import RLock
+from six import iteritems, itervalues
+
+from pyNastran.bdf.cards.base_card import _format_comment
+
+#: the aero slots that are cross-referenced by ``_cross_reference_aero``
+AERO_XREF_SLOT_NAMES = [
+    'caeros', 'paeros', 'trims', 'csschds', 'splines', 'aecomps', 'aelists',
+    'aeparams', 'aesurf', 'aesurfs', 'flutters', 'monitor_points', 'aero', 'aeros',
+]
+AERO_SLOT_NAMES = AERO_XREF_SLOT_NAMES + [
+    'gusts', 'flfacts', 'mkaeros', 'aefacts', 'aelinks', 'aestats', 'divergs',
+]
+
+#: the optimization slots that are cross-referenced by
+#: ``_cross_reference_optimization``
+OPTIMIZATION_XREF_SLOT_NAMES = [
+    'dequations', 'dresps', 'dconstrs', 'dvcrels', 'dvmrels', 'dvprels',
+]
+OPTIMIZATION_SLOT_NAMES = OPTIMIZATION_XREF_SLOT_NAMES + [
+    'dtable', 'desvars', 'ddvals', 'dlinks', 'dvgrids', 'doptprm', 'dscreen',
+]
+DMIG_SLOT_NAMES = ['dmigs', 'dmijs', 'dmijis', 'dmiks', 'dmis', 'dti']
+TABLE_SLOT_NAMES = ['tables', 'tables_d', 'tables_m', 'tables_sdamping', 'random_tables']
+THERMAL_SLOT_NAMES = ['phbdys', 'convection_properties', 'bcs', 'tempds']
+
+#: the slots that are built on first access for read_bdf(..., lazy=True)
+LAZY_SLOT_NAMES = set(AERO_SLOT_NAMES + OPTIMIZATION_SLOT_NAMES + DMIG_SLOT_NAMES +
+                      TABLE_SLOT_NAMES + THERMAL_SLOT_NAMES)
+
+# a slot is built once when the cross-referencing threads access it
+# (see ``BDF.cross_reference(..., nworkers=2)``); building a slot may
+# build another slot (e.g., the DVPREL2s build the DEQATNs)
+_BUILD_LOCK = RLock()
+
+
+def get_lazy_card_names(model, card_count):
+    """
+    Gets the cards that are stored as card lines
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    card_count : Dict[card_name] = int
+        the cards that are being parsed
+
+    Returns
+    -------
+    card_names : Set[str]
+        the card names (empty if the model isn't read with lazy=True,
+        or the cards can't be stored, e.g., the deck has an ECHOON)
+
+    """
+    if not model._lazy or model._is_dynamic_syntax or 'ECHOON' in card_count:
+        return set([])
+
+    card_names = set([])
+    for slot_name in LAZY_SLOT_NAMES:
+        for card_name in model._slot_to_type_map[slot_name]:
+            if model._type_to_slot_map.get(card_name) != slot_name:
+                # e.g., the TABRNDG is stored in model.random_tables
+                continue
+            if card_name in model.cards_to_read and (
+                    card_name in model._card_parser or card_name in model._card_parser_prepare):
+                card_names.add(card_name)
+    return card_names
+
+
+def add_lazy_card(model, card_name, comment, card_lines):
+    """stores the lines of a card until its slot is accessed"""
+    slot_name = model._type_to_slot_map[card_name]
+    lazy_cards = model._lazy_cards
+    if slot_name in lazy_cards:
+        lazy_cards[slot_name][1].append((card_name, comment, card_lines))
+    else:
+        # the cards are added to the current slot when it's built
+        slot = getattr(model, slot_name)
+        lazy_cards[slot_name] = (slot, [(card_name, comment, card_lines)])
+        del model.__dict__[slot_name]
+    model.increase_card_count(card_name)
+
+
+def _get_slot_cards(slot):
+    """gets the cards in a slot (e.g., model.dconstrs, which is a dict of lists)"""
+    if slot is None:
+        return []
+    elif isinstance(slot, dict):
+        cards = []
+        for card in itervalues(slot):
+            if isinstance(card, list):
+                cards.extend(card)
+            else:
+                cards.append(card)
+        return cards
+    elif isinstance(slot, list):
+        return list(slot)
+    return [slot]
+
+
+def build_lazy_slot(model, slot_name):
+    """
+    Builds the cards of a lazy slot
+
+    The cards are validated if the model was validated and are
+    cross-referenced if their cross-referencing was deferred (see
+    ``defer_cross_reference``).  The card_count isn't changed because
+    the cards were counted when they were read.
+    """
+    with _BUILD_LOCK:
+        if slot_name in model._lazy_building:
+            # the cards are being added to the slot by this thread
+            return model._lazy_building[slot_name]
+        if slot_name not in model._lazy_cards:
+            # another thread built the slot
+            return getattr(model, slot_name)
+        return _build_lazy_slot(model, slot_name)
+
+
+def _build_lazy_slot(model, slot_name):
+    """
+    Helper for ``build_lazy_slot``
+
+    The slot is set on the model after the cards are built, so another
+    thread waits for the cards.
+    """
+    slot, cards = model._lazy_cards.pop(slot_name)
+    model._lazy_building[slot_name] = slot
+    try:
+        card_ids0 = set(id(card) for card in _get_slot_cards(slot))
+
+        card_count = model.card_count
+        card_names = set(card_name for card_name, unused_comment, unused_card_lines in cards)
+        counts = {card_name : card_count[card_name] for card_name in card_names}
+        for card_name, comment, card_lines in cards:
+            model.add_card(card_lines, card_name, comment=comment,
+                           is_list=False, has_none=False)
+        card_count.update(counts)
+        model.pop_parse_errors()
+        if model._dmig_temp:
+            model.fill_dmigs()
+
+        # a card like the DOPTPRM replaces the slot
+        slot = model.__dict__.pop(slot_name, slot)
+        model._lazy_building[slot_name] = slot
+        new_cards = [card for card in _get_slot_cards(slot) if id(card) not in card_ids0]
+        if model._lazy_validate:
+            for card in new_cards:
+                card.validate()
+        if slot_name in model._lazy_xref_slots:
+            model._lazy_xref_slots.remove(slot_name)
+            model._cross_reference_cards(new_cards)
+    finally:
+        slot = model._lazy_building.pop(slot_name)
+        model.__dict__[slot_name] = slot
+    return slot
+
+
+def _get_lazy_slot(model, slot_name):
+    """gets a slot without building it"""
+    if slot_name in model._lazy_cards:
+        return model._lazy_cards[slot_name][0]
+    return getattr(model, slot_name)
+
+
+def defer_cross_reference(model, slot_names):
+    """
+    Defers the cross-referencing of a group of slots (e.g., the aero
+    slots) until they are built if the cards of the group are all lazy
+
+    Returns
+    -------
+    is_deferred : bool
+        False if the group must be cross-referenced now
+    """
+    lazy_cards = model._lazy_cards
+    if not any(slot_name in lazy_cards for slot_name in slot_names):
+        return False
+    if any(_get_lazy_slot(model, slot_name) for slot_name in slot_names):
+        return False
+    model._lazy_xref_slots.update(slot_name for slot_name in slot_names
+                                  if slot_name in lazy_cards)
+    return True
+
+
+@contextmanager
+def hide_lazy_slots(model):
+    """
+    Sets the lazy slots to the cards that have been built (usually
+    none), so a method that loops over every slot doesn't build them
+    """
+    lazy_cards = model._lazy_cards
+    for slot_name, (slot, unused_cards) in iteritems(lazy_cards):
+        model.__dict__[slot_name] = slot
+    try:
+        yield
+    finally:
+        for slot_name, (unused_slot, cards) in iteritems(lazy_cards):
+            # a slot that isn't a dict/list may have been replaced
+            lazy_cards[slot_name] = (model.__dict__.pop(slot_name), cards)
+
+
+def write_lazy_cards(model, bdf_file):
+    """writes the lines of the lazy cards as they were read"""
+    if not model._lazy_cards:
+        return
+    bdf_file.write('$LAZY CARDS\n')
+    for unused_slot_name, (unused_slot, cards) in sorted(iteritems(model._lazy_cards)):
+        for unused_card_name, comment, card_lines in cards:
+            bdf_file.write(_format_comment(comment))
+            for line in card_lines:
+                bdf_file.write('%s\n' % line.rstrip())
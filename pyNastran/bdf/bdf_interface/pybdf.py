@@ -23,6 +23,10 @@ FILE_MANAGEMENT = (
 )
 EXECUTIVE_CASE_SPACES = tuple(list(FILE_MANAGEMENT) + ['SOL ', 'SET ', 'SUBCASE '])
 
+#: the line that replaces a bulk data INCLUDE that's read by a worker
+#: (see BDFInputPy.bulk_includes)
+BULK_INCLUDE_LINE = '$ pyNastran: bulk include'
+
 
 class BDFInputPy(object):
     def __init__(self, read_includes, dumplines, encoding, log=None, debug=False):
@@ -35,6 +39,12 @@ class BDFInputPy(object):
         self.active_filenames = []
         self.active_filename = None
 
+        #: if a list, the bulk data INCLUDEs aren't read; the
+        #: (include_filename, include_comment) are stored and the INCLUDE
+        #: is replaced by BULK_INCLUDE_LINE, so the files may be parsed
+        #: by separate processes
+        self.bulk_includes = None
+
         self.debug = debug
         self.log = get_logger2(log, debug)
 
@@ -64,7 +74,7 @@ class BDFInputPy(object):
             the bulk data lines (stores geometry, boundary conditions, loads, etc.)
         """
         main_lines = self._get_main_lines(bdf_filename)
-        all_lines = self._lines_to_deck_lines(main_lines)
+        all_lines = self._lines_to_deck_lines(main_lines, punch=punch)
         out = _lines_to_decks(all_lines, punch)
         system_lines, executive_control_lines, case_control_lines, bulk_data_lines = out
         return system_lines, executive_control_lines, case_control_lines, bulk_data_lines
@@ -103,8 +113,8 @@ class BDFInputPy(object):
                 _show_bad_file(self, bdf_filename, encoding=self.encoding)
         return lines
 
-    def _lines_to_deck_lines(self, lines):
-        # type: (List[str]) -> List[str], int
+    def _lines_to_deck_lines(self, lines, punch=False):
+        # type: (List[str], bool) -> List[str], int
         """
         Merges the includes into the main deck.
 
@@ -112,6 +122,9 @@ class BDFInputPy(object):
         ----------
         lines : List[str]
             the lines from the main BDF
+        punch : bool; default=False
+            is this a punch file (used to find the bulk data INCLUDEs
+            for ``bulk_includes``)
 
         Returns
         -------
@@ -120,6 +133,9 @@ class BDFInputPy(object):
         """
         nlines = len(lines)
 
+        # 1=executive, 2=case control, 3=bulk data (see _lines_to_decks)
+        deck_flag = 3 if punch else 1
+
         i = 0
         while i < nlines:
             try:
@@ -127,6 +143,15 @@ class BDFInputPy(object):
             except IndexError:
                 break
             uline = line.upper()
+            if self.bulk_includes is not None and deck_flag != 3:
+                if deck_flag == 1:
+                    if uline.startswith('CEND'):
+                        deck_flag = 2
+                else:
+                    uline_base = uline.split('$', 1)[0]
+                    if 'BEGIN' in uline_base and ('BULK' in uline_base or 'SUPER' in uline_base):
+                        deck_flag = 3
+
             if uline.startswith('INCLUDE'):
                 j, include_lines = self._get_include_lines(lines, line, i, nlines)
                 bdf_filename2 = get_include_filename(include_lines, include_dir=self.include_dir)
@@ -145,17 +170,17 @@ class BDFInputPy(object):
                         raise
                         #raise IOError(msg)
 
-                    with self._open_file(bdf_filename2, basename=False) as bdf_file:
-                        #print('bdf_file.name = %s' % bdf_file.name)
-                        try:
-                            lines2 = bdf_file.readlines()
-                        except UnicodeDecodeError:
-                            msg = 'Invalid Encoding: encoding=%r.  Fix it by:\n' % self.encoding
-                            msg += '  1.  try a different encoding (e.g., latin1)\n'
-                            msg += "  2.  call read_bdf(...) with `encoding`'\n"
-                            msg += ("  3.  Add '$ pyNastran : encoding=latin1"
-                                    ' (or other encoding) to the top of the main file\n')
-                            raise RuntimeError(msg)
+                    include_comment = '\n$ INCLUDE processed:  %s\n' % bdf_filename2
+                    if self.bulk_includes is not None and deck_flag == 3:
+                        # the file is read later (e.g., by a worker)
+                        self.active_filenames.append(os.path.join(self.include_dir, bdf_filename2))
+                        self.bulk_includes.append((bdf_filename2, include_comment))
+                        lines = lines[:i] + [BULK_INCLUDE_LINE] + lines[j:]
+                        nlines = len(lines)
+                        i += 1
+                        continue
+
+                    lines2 = self._read_include_lines(bdf_filename2)
 
                     #print('lines2 = %s' % lines2)
                     nlines += len(lines2)
@@ -164,7 +189,6 @@ class BDFInputPy(object):
                     #if not line2[0].isalpha():
                         #print('** %s' % line2)
 
-                    include_comment = '\n$ INCLUDE processed:  %s\n' % bdf_filename2
                     #for line in lines2:
                         #print("  ?%s" % line.rstrip())
                     lines = lines[:i] + [include_comment] + lines2 + lines[j:]
@@ -180,6 +204,22 @@ class BDFInputPy(object):
             self._dump_file('pyNastran_dump.bdf', lines, i)
         return lines
 
+    def _read_include_lines(self, bdf_filename):
+        # type: (str) -> List[str]
+        """reads the lines of an INCLUDE file (the INCLUDEs aren't merged)"""
+        with self._open_file(bdf_filename, basename=False) as bdf_file:
+            #print('bdf_file.name = %s' % bdf_file.name)
+            try:
+                lines = bdf_file.readlines()
+            except UnicodeDecodeError:
+                msg = 'Invalid Encoding: encoding=%r.  Fix it by:\n' % self.encoding
+                msg += '  1.  try a different encoding (e.g., latin1)\n'
+                msg += "  2.  call read_bdf(...) with `encoding`'\n"
+                msg += ("  3.  Add '$ pyNastran : encoding=latin1"
+                        ' (or other encoding) to the top of the main file\n')
+                raise RuntimeError(msg)
+        return lines
+
     def _get_include_lines(self, lines, line, i, nlines):
         """
         gets the lines for the include file
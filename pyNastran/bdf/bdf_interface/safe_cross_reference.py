@@ -5,6 +5,7 @@ Safe cross-referencing skips failed xref's
 """
 from __future__ import print_function
 from collections import defaultdict
+from functools import partial
 import traceback
 from typing import List, Dict, Any
 from six import iteritems, itervalues
@@ -12,6 +13,7 @@ from six import iteritems, itervalues
 import numpy as np
 from numpy import zeros, argsort, arange, array_equal
 from pyNastran.bdf.bdf_interface.cross_reference import XrefMesh
+from pyNastran.bdf.bdf_interface.xref_schedule import run_xref_stages
 
 
 class SafeXrefMesh(XrefMesh):
@@ -44,43 +46,50 @@ class SafeXrefMesh(XrefMesh):
                              xref_aero=True,
                              xref_sets=True,
                              xref_optimization=True,
-                             debug=True):
+                             debug=True,
+                             nworkers=1):
         """
         Performs cross referencing in a way that skips data gracefully.
 
+        The independent card groups are cross-referenced at the same
+        time for nworkers > 1 (see ``cross_reference``).
+
         .. warning:: not fully implemented
         """
         if not xref:
             return
         self.log.debug("Safe Cross Referencing...")
+        # the lazy slots are built by the loops
+        self._lazy_xref_slots = set([])
+        stages = []
         if xref_nodes:
-            self._cross_reference_nodes()
-            self._cross_reference_coordinates()
+            stages.append(('nodes', self._cross_reference_nodes))
+            stages.append(('coordinates', self._cross_reference_coordinates))
 
         if xref_elements:
-            self._safe_cross_reference_elements()
+            stages.append(('elements', self._safe_cross_reference_elements))
         if xref_properties:
-            self._cross_reference_properties()
+            stages.append(('properties', self._cross_reference_properties))
         if xref_masses:
-            self._cross_reference_masses()
+            stages.append(('masses', self._cross_reference_masses))
         if xref_materials:
-            self._cross_reference_materials()
+            stages.append(('materials', self._cross_reference_materials))
 
         if xref_sets:
-            self._cross_reference_sets()
+            stages.append(('sets', self._cross_reference_sets))
         if xref_aero:
-            self._safe_cross_reference_aero()
+            stages.append(('aero', self._safe_cross_reference_aero))
         if xref_constraints:
-            self._safe_cross_reference_constraints()
+            stages.append(('constraints', self._safe_cross_reference_constraints))
         if xref_loads:
-            self._safe_cross_reference_loads(debug=debug)
-        if xref_sets:
-            self._cross_reference_sets()
+            stages.append(('loads', partial(self._safe_cross_reference_loads, debug=debug)))
         if xref_optimization:
-            self._cross_reference_optimization()
+            stages.append(('optimization', self._cross_reference_optimization))
         if xref_nodes_with_elements:
-            self._cross_reference_nodes_with_elements()
+            stages.append(('nodes_with_elements', self._cross_reference_nodes_with_elements))
+        self.xref_timings = run_xref_stages(stages, nworkers=nworkers, log=self.log)
         self.pop_xref_errors()
+        self._xref = True
 
     def _safe_cross_reference_constraints(self):
         # type: () -> None
@@ -6,7 +6,7 @@ from pyNastran.bdf.bdf_interface.assign_type import (
     string, string_or_blank, double_or_string, double_string_or_blank,
     integer_or_string, integer_string_or_blank, integer_double_or_string,
     blank, parse_components, components_or_blank, integer_double_string_or_blank,
-    _get_dtype, interpret_value, modal_components)
+    _get_dtype, interpret_value, modal_components, parse_nastran_floats)
 
 
 class TestAssignType(unittest.TestCase):
@@ -686,6 +686,26 @@ class TestAssignType(unittest.TestCase):
         val = interpret_value('1.000000000D+00')
         #print "val = ", val
 
+    def test_nastran_floats(self):
+        """tests the Nastran floats (e.g., 1.0-3)"""
+        svalues = ['1.0', '-2.5-3', '3.D+2', '.5d-1', '+1.+3', '-7.E2', '1-9', '2D3']
+        exact = [1.0, -2.5e-3, 300., 0.05, 1000., -700., 1e-9, 2000.]
+        for svalue, value in zip(svalues, exact):
+            self.assertEqual(double(BDFCard([svalue]), 0, 'field'), value)
+            self.assertEqual(interpret_value(svalue), value)
+        self.assertEqual(parse_nastran_floats(svalues).tolist(), exact)
+
+        # an integer, blank, string, or SKIP is converted by field
+        self.assertIsNone(parse_nastran_floats(['1.0', '2']))
+        self.assertIsNone(parse_nastran_floats(['1.0', '']))
+        self.assertIsNone(parse_nastran_floats(['1.0', None]))
+        self.assertIsNone(parse_nastran_floats(['1.0', 'SKIP']))
+        self.assertIsNone(parse_nastran_floats(['1.0', '1.0-3-4']))
+        self.assertIsNone(parse_nastran_floats(['1.0\n2.0']))
+        self.assertIsNone(parse_nastran_floats([]))
+        with self.assertRaises(SyntaxError):
+            interpret_value('1.0-3-4')
+
     def test_modal_components(self):
         """modal components """
         card = BDFCard(['42'])
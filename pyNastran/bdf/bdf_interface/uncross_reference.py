@@ -5,6 +5,7 @@ from __future__ import print_function
 from typing import List, Dict, Any
 from six import iteritems, itervalues
 from pyNastran.bdf.bdf_interface.safe_cross_reference import SafeXrefMesh
+from pyNastran.bdf.bdf_interface.lazy_cards import hide_lazy_slots
 
 class UnXrefMesh(SafeXrefMesh):
     """
@@ -19,17 +20,21 @@ class UnXrefMesh(SafeXrefMesh):
     def uncross_reference(self):
         """uncross references the model"""
         self.log.debug("Uncross Referencing...")
-        self._uncross_reference_nodes()
-        self._uncross_reference_coords()
-        self._uncross_reference_elements()
-        self._uncross_reference_properties()
-        self._uncross_reference_materials()
-        self._uncross_reference_masses()
-        self._uncross_reference_aero()
-        self._uncross_reference_constraints()
-        self._uncross_reference_loads()
-        self._uncross_reference_sets()
-        self._uncross_reference_optimization()
+        # the lazy slots haven't been cross-referenced
+        with hide_lazy_slots(self):
+            self._uncross_reference_nodes()
+            self._uncross_reference_coords()
+            self._uncross_reference_elements()
+            self._uncross_reference_properties()
+            self._uncross_reference_materials()
+            self._uncross_reference_masses()
+            self._uncross_reference_aero()
+            self._uncross_reference_constraints()
+            self._uncross_reference_loads()
+            self._uncross_reference_sets()
+            self._uncross_reference_optimization()
+        self._xref = False
+        self._lazy_xref_slots = set([])
 
     def _uncross_reference_nodes(self):
         # type: () -> None
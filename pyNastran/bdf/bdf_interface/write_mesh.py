@@ -16,6 +16,8 @@ from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
 from pyNastran.bdf.cards.nodes import write_xpoints
+from pyNastran.bdf.bdf_interface.write_mesh_arrays import write_grids, write_elements
+from pyNastran.bdf.bdf_interface.lazy_cards import hide_lazy_slots, write_lazy_cards
 
 
 class WriteMesh(BDFAttributes):
@@ -210,19 +212,23 @@ class WriteMesh(BDFAttributes):
             bdf_file = out_filename
         else:
             bdf_file = open(out_filename, 'w', encoding=encoding)
-        self._write_header(bdf_file, encoding)
-        self._write_params(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_nodes(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
-        if interspersed:
-            self._write_elements_interspersed(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        else:
-            self._write_elements(bdf_file, size, is_double, is_long_ids=is_long_ids)
-            self._write_properties(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        # the lazy cards are written as they were read
+        with hide_lazy_slots(self):
+            self._write_header(bdf_file, encoding)
+            self._write_params(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            self._write_nodes(bdf_file, size, is_double, is_long_ids=is_long_ids)
+
+            if interspersed:
+                self._write_elements_interspersed(bdf_file, size, is_double,
+                                                  is_long_ids=is_long_ids)
+            else:
+                self._write_elements(bdf_file, size, is_double, is_long_ids=is_long_ids)
+                self._write_properties(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            self._write_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
 
-        self._write_masses(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_common(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            self._write_masses(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            self._write_common(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        write_lazy_cards(self, bdf_file)
         if (enddata is None and 'ENDDATA' in self.card_count) or enddata:
             bdf_file.write('ENDDATA\n')
         if close:
@@ -297,13 +303,15 @@ class WriteMesh(BDFAttributes):
                 for (eid, element) in sorted(iteritems(self.elements)):
                     bdf_file.write(element.write_card_16(is_double))
             else:
-                for (eid, element) in sorted(iteritems(self.elements)):
+                def write_card(element):
                     try:
-                        bdf_file.write(element.write_card(size, is_double))
+                        return element.write_card(size, is_double)
                     except:
                         print('failed printing element...'
-                              'type=%s eid=%s' % (element.type, eid))
+                              'type=%s eid=%s' % (element.type, element.eid))
                         raise
+                elements = [element for (unused_eid, element) in sorted(iteritems(self.elements))]
+                write_elements(bdf_file, elements, write_card)
         if self.ao_element_flags:
             for (eid, element) in sorted(iteritems(self.ao_element_flags)):
                 bdf_file.write(element.write_card(size, is_double))
@@ -822,11 +830,9 @@ class WriteMesh(BDFAttributes):
             if self.grdset:
                 bdf_file.write(self.grdset.write_card(size))
             if is_long_ids:
-                for (unused_nid, node) in sorted(iteritems(self.nodes)):
-                    bdf_file.write(node.write_card_16(is_double))
-            else:
-                for (unused_nid, node) in sorted(iteritems(self.nodes)):
-                    bdf_file.write(node.write_card(size, is_double))
+                size = 16
+            nodes = [node for (unused_nid, node) in sorted(iteritems(self.nodes))]
+            write_grids(bdf_file, nodes, size, is_double)
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
@@ -0,0 +1,461 @@
+# coding: utf-8
+"""
+Defines:
+ - write_grids(bdf_file, nodes, size, is_double)
+ - write_elements(bdf_file, elements, write_card)
+
+Writes the GRID cards and the common elements (CQUAD4, CTRIA3, CTETRA,
+CPENTA, CHEXA) in bulk.  The fields are formatted as arrays and each row
+of a card is stored as a row of a character array, so the cards are
+joined without a write_card call for every card.  The cards are the same
+as the card's write_card; a card that doesn't fit the bulk format (e.g.,
+a card with a comment, a non-default field, or a blank midside node) is
+written with write_card.
+"""
+from __future__ import print_function
+from itertools import groupby
+from six import integer_types, string_types
+
+import numpy as np
+
+from pyNastran.bdf.field_writer_8 import print_float_8_array
+from pyNastran.bdf.field_writer_16 import print_float_16_array
+from pyNastran.bdf.field_writer_double import print_scientific_double_array
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CPENTA15, CHEXA8, CHEXA20)
+
+#: the number of cards that are formatted at once
+NCARDS_BLOCK = 100000
+
+_SPACE = ord(' ')
+_ZERO = ord('0')
+_MINUS = ord('-')
+
+
+def write_grids(bdf_file, nodes, size=8, is_double=False):
+    """
+    Writes GRID cards
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    nodes : List[GRID]
+        the nodes to write (in order)
+    size : int; default=8
+        the size of the card (8/16)
+    is_double : bool; default=False
+        should the cards be written with double precision
+    """
+    for i0 in range(0, len(nodes), NCARDS_BLOCK):
+        nodes_block = nodes[i0:i0 + NCARDS_BLOCK]
+        if size == 8:
+            templates = _get_grid_templates_8(nodes_block)
+        else:
+            templates = _get_grid_templates_16(nodes_block, is_double)
+        _write_rows(bdf_file, nodes_block, templates,
+                    lambda node: node.write_card(size, is_double))
+
+
+def _get_grid_values(nodes):
+    """gets the nid, cp, xyz, cd, ps, seid and is_default of the nodes"""
+    nids = []
+    cps = []
+    xyzs = []
+    cds = []
+    pss = []
+    seids = []
+    is_default = []
+    for node in nodes:
+        if node.__class__ is not GRID or node.comment:
+            is_default.append(None)
+            continue
+        cd = node.Cd()
+        nids.append(node.nid)
+        cps.append(node.Cp())
+        xyzs.append(node.xyz)
+        cds.append(cd)
+        pss.append(node.ps)
+        seids.append(node.SEid())
+        is_default.append([cd, node.ps, node.seid] == [0, '', 0])
+    return nids, cps, xyzs, cds, pss, seids, is_default
+
+
+def _get_grid_templates_8(nodes):
+    """
+    Gets the rows of the small field GRID cards (see ``GRID.write_card_8``)
+    """
+    nids, cps, xyzs, cds, pss, seids, is_default = _get_grid_values(nodes)
+    if not nids:
+        return []
+
+    is_valid = np.array([value is not None for value in is_default])
+    is_default = np.array([bool(value) for value in is_default])[is_valid]
+    nid_chars, is_valid_nid = _ints_to_chars(nids, 8)
+    cp_chars, is_valid_cp = _ints_to_chars(cps, 8, blank=0)
+    xyz = np.array(xyzs, dtype='float64')
+    xyz_chars, is_valid_xyz = _strings_to_chars(print_float_8_array(xyz.ravel()), 8)
+    xyz_chars = xyz_chars.reshape(len(nids), 24)
+    is_valid_xyz = is_valid_xyz.reshape(len(nids), 3).all(axis=1)
+    is_validi = is_valid_nid & is_valid_cp & is_valid_xyz
+
+    # GRID    nid     cp      x1      x2      x3
+    templates = []
+    is_default_row = np.zeros(len(nodes), dtype='bool')
+    is_default_row[is_valid] = is_default & is_validi
+    ifast = np.where(is_default & is_validi)[0]
+    templates.append((is_default_row, _hstack_chars([
+        'GRID    ', nid_chars[ifast], cp_chars[ifast], xyz_chars[ifast], '\n'])))
+
+    # GRID    nid     cp      x1      x2      x3      cd      ps      seid
+    ilong = np.where(~is_default)[0]
+    if len(ilong):
+        cd_chars, is_valid_cd = _ints_to_chars([cds[i] for i in ilong], 8, blank=0)
+        ps_chars, is_valid_ps = _strings_to_chars(['%8s' % pss[i] for i in ilong], 8)
+        seid_chars, is_valid_seid = _ints_to_chars([seids[i] for i in ilong], 8, blank=0)
+        is_validi_long = is_validi[ilong] & is_valid_cd & is_valid_ps & is_valid_seid
+        is_long_row = np.zeros(len(nodes), dtype='bool')
+        is_long_row[np.where(is_valid)[0][ilong]] = is_validi_long
+        ilong2 = ilong[is_validi_long]
+        templates.append((is_long_row, _hstack_chars([
+            'GRID    ', nid_chars[ilong2], cp_chars[ilong2], xyz_chars[ilong2],
+            cd_chars[is_validi_long], ps_chars[is_validi_long],
+            seid_chars[is_validi_long], '\n'])))
+    return templates
+
+
+def _get_grid_templates_16(nodes, is_double):
+    """
+    Gets the rows of the large field GRID cards
+    (see ``GRID.write_card_16``)
+    """
+    nids, cps, xyzs, cds, pss, seids, is_default = _get_grid_values(nodes)
+    if not nids:
+        return []
+
+    is_valid = np.array([value is not None for value in is_default])
+    nid_chars, is_valid_nid = _ints_to_chars(nids, 16)
+    cp_chars, is_valid_cp = _ints_to_chars(cps, 16, blank=0)
+    cd_chars, is_valid_cd = _ints_to_chars(cds, 16, blank=0)
+    ps_chars, is_valid_ps = _strings_to_chars(['%16s' % ps for ps in pss], 16)
+    seid_chars, is_valid_seid = _ints_to_chars(seids, 16, blank=0)
+
+    xyz = np.array(xyzs, dtype='float64')
+    if is_double:
+        xyz_fields = print_scientific_double_array(xyz.ravel())
+    else:
+        xyz_fields = print_float_16_array(xyz.ravel())
+    xyz_chars, is_valid_xyz = _strings_to_chars(xyz_fields, 16)
+    xyz_chars = xyz_chars.reshape(len(nids), 48)
+    is_valid_xyz = is_valid_xyz.reshape(len(nids), 3).all(axis=1)
+    is_validi = (is_valid_nid & is_valid_cp & is_valid_xyz &
+                 is_valid_cd & is_valid_ps & is_valid_seid)
+
+    # the cd, ps, seid line is always written
+    is_row = np.zeros(len(nodes), dtype='bool')
+    is_row[is_valid] = is_validi
+    ifast = np.where(is_validi)[0]
+    return [(is_row, _hstack_chars([
+        'GRID*   ', nid_chars[ifast], cp_chars[ifast], xyz_chars[ifast, :32], '\n',
+        '*       ', xyz_chars[ifast, 32:], cd_chars[ifast], ps_chars[ifast],
+        seid_chars[ifast], '\n']))]
+
+
+def write_elements(bdf_file, elements, write_card):
+    """
+    Writes elements
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    elements : List[Element]
+        the elements to write (in order)
+    write_card : function
+        writes an element that isn't written in bulk
+        (e.g., element.write_card(size, is_double))
+
+    .. note:: the CQUAD4, CTRIA3, and solid elements are always written
+              in small field format (see ``CQUAD4.write_card``)
+    """
+    for card_class, elements_group in groupby(elements, key=lambda element: element.__class__):
+        elements_group = list(elements_group)
+        get_templates = _ELEMENT_TEMPLATES.get(card_class)
+        if get_templates is None:
+            for element in elements_group:
+                bdf_file.write(write_card(element))
+            continue
+
+        for i0 in range(0, len(elements_group), NCARDS_BLOCK):
+            elements_block = elements_group[i0:i0 + NCARDS_BLOCK]
+            templates = get_templates(elements_block)
+            _write_rows(bdf_file, elements_block, templates, write_card)
+
+
+def _get_element_ids(elements, nnodes, is_default=None):
+    """
+    Gets the eid, pid, and node ids of the elements
+
+    Parameters
+    ----------
+    elements : List[Element]
+        the elements
+    nnodes : int
+        the number of nodes of the element
+    is_default : function; default=None
+        is the element written with the default format (e.g., a CQUAD4
+        with a blank theta/mcid)
+
+    Returns
+    -------
+    is_row : (n, ) bool ndarray
+        is the element written in bulk
+    ids : List[List[int]]
+        the eid, pid, and node ids of the bulk elements
+    """
+    is_row = []
+    ids = []
+    for element in elements:
+        if element.comment or (is_default is not None and not is_default(element)):
+            is_row.append(False)
+            continue
+        nids = element.node_ids
+        if len(nids) != nnodes or None in nids or 0 in nids:
+            is_row.append(False)
+            continue
+        is_row.append(True)
+        ids.append([element.eid, element.Pid()] + nids)
+    return np.array(is_row, dtype='bool'), ids
+
+
+def _get_element_templates(card_name, nfields_per_line):
+    """
+    Gets the method that creates the rows of an element with a fixed
+    number of integer fields on each line
+
+    Parameters
+    ----------
+    card_name : str
+        the card name in the first field (e.g., 'CTETRA  ')
+    nfields_per_line : List[int]
+        the number of fields on each line (8 on a full line)
+
+    Returns
+    -------
+    get_templates : function
+        get_templates(elements, is_default=None) returns the templates
+        for ``_write_rows``
+    """
+    nfields = sum(nfields_per_line)
+    def get_templates(elements, is_default=None):
+        is_row, ids = _get_element_ids(elements, nfields - 2, is_default)
+        if not ids:
+            return []
+        id_chars, is_valid = _ints_to_chars(np.array(ids).ravel(), 8)
+        id_chars = id_chars.reshape(len(ids), 8 * nfields)
+        is_valid = is_valid.reshape(len(ids), nfields).all(axis=1)
+        is_row[is_row] = is_valid
+        id_chars = id_chars[is_valid]
+
+        chars = [card_name]
+        ifield0 = 0
+        for iline, nfields_line in enumerate(nfields_per_line):
+            if iline:
+                chars.append('        ')
+            chars.append(id_chars[:, 8 * ifield0:8 * (ifield0 + nfields_line)])
+            chars.append('\n')
+            ifield0 += nfields_line
+        return [(is_row, _hstack_chars(chars))]
+    return get_templates
+
+
+def _is_blank(value, default):
+    """is the field written as a blank (see ``set_blank_if_default``)"""
+    return value is None or (not isinstance(value, string_types) and value == default)
+
+
+def _is_default_shell(element, thicknesses):
+    """
+    are the fields on the second line of the CQUAD4/CTRIA3 blank, so
+    the card is written on one line
+    """
+    theta_mcid = element.Theta_mcid()
+    if not (theta_mcid is None or isinstance(theta_mcid, float) and theta_mcid == 0.0):
+        return False
+    for thickness in thicknesses:
+        if not _is_blank(thickness, 1.0):
+            return False
+    return _is_blank(element.zoffset, 0.0) and _is_blank(element.tflag, 0)
+
+
+def _is_default_cquad4(element):
+    """is the CQUAD4 written on one line"""
+    return _is_default_shell(element, [element.T1, element.T2, element.T3, element.T4])
+
+
+def _is_default_ctria3(element):
+    """is the CTRIA3 written on one line"""
+    return _is_default_shell(element, [element.T1, element.T2, element.T3])
+
+
+_get_cquad4_templates = _get_element_templates('CQUAD4  ', [6])
+_get_ctria3_templates = _get_element_templates('CTRIA3  ', [5])
+
+_ELEMENT_TEMPLATES = {
+    CQUAD4 : lambda elements: _get_cquad4_templates(elements, _is_default_cquad4),
+    CTRIA3 : lambda elements: _get_ctria3_templates(elements, _is_default_ctria3),
+    CTETRA4 : _get_element_templates('CTETRA  ', [6]),
+    CTETRA10 : _get_element_templates('CTETRA  ', [8, 4]),
+    CPENTA6 : _get_element_templates('CPENTA  ', [8]),
+    CPENTA15 : _get_element_templates('CPENTA  ', [8, 8, 1]),
+    CHEXA8 : _get_element_templates('CHEXA   ', [8, 2]),
+    CHEXA20 : _get_element_templates('CHEXA   ', [8, 8, 6]),
+}
+
+
+def _ints_to_chars(values, width, blank=None):
+    """
+    Formats integers as right justified fields (e.g., '%8i')
+
+    Parameters
+    ----------
+    values : (n, ) int ndarray
+        the values
+    width : int
+        the field width
+    blank : int; default=None
+        a value that's written as a blank field (e.g., cp=0)
+
+    Returns
+    -------
+    chars : (n, width) uint8 ndarray
+        the characters of the fields
+    is_valid : (n, ) bool ndarray
+        does the value fit in the field
+    """
+    values = np.asarray(values)
+    if not len(values):
+        return np.zeros((0, width), dtype='uint8'), np.zeros(0, dtype='bool')
+    if values.dtype.kind not in 'iu':
+        # e.g., a None
+        is_valid = np.array([isinstance(value, integer_types) and abs(value) < 10 ** 17
+                             for value in values.tolist()], dtype='bool')
+        values = np.where(is_valid, values, 0).astype('int64')
+        chars = _ints_to_chars(values, width, blank)[0]
+        return chars, is_valid
+    values = values.astype('int64')
+
+    chars = np.full((len(values), width), _SPACE, dtype='uint8')
+    is_negative = values < 0
+    abs_values = np.abs(values)
+
+    ndigits = np.ones(len(values), dtype='int64')
+    remainder = abs_values // 10
+    for unused_i in range(width + 1):
+        is_digit = remainder > 0
+        if not is_digit.any():
+            break
+        ndigits += is_digit
+        remainder //= 10
+    is_valid = ndigits + is_negative <= width
+
+    remainder = abs_values.copy()
+    for i in range(width):
+        is_digit = i < ndigits
+        chars[is_digit, width - 1 - i] = _ZERO + remainder[is_digit] % 10
+        remainder //= 10
+    ineg = np.where(is_negative & is_valid)[0]
+    chars[ineg, width - 1 - ndigits[ineg]] = _MINUS
+
+    if blank is not None:
+        chars[values == blank] = _SPACE
+    return chars, is_valid
+
+
+def _strings_to_chars(fields, width):
+    """
+    Stores strings as a character array
+
+    Returns
+    -------
+    chars : (n, width) uint8 ndarray
+        the characters of the fields
+    is_valid : (n, ) bool ndarray
+        is the string width characters long
+    """
+    nfields = len(fields)
+    if not nfields:
+        return np.zeros((0, width), dtype='uint8'), np.zeros(0, dtype='bool')
+    try:
+        chars = np.array(fields, dtype='S%i' % (width + 1)).view('uint8').reshape(
+            nfields, width + 1)
+    except UnicodeEncodeError:
+        chars = np.zeros((nfields, width + 1), dtype='uint8')
+        is_valid = np.zeros(nfields, dtype='bool')
+        return chars[:, :width], is_valid
+    is_valid = (chars[:, width] == 0) & (chars[:, width - 1] != 0)
+    return chars[:, :width], is_valid
+
+
+def _hstack_chars(chars):
+    """
+    Stacks the fields of the rows of a card
+
+    Parameters
+    ----------
+    chars : List[(n, w) uint8 ndarray / str]
+        the fields of the rows; a string is the same for every row
+
+    Returns
+    -------
+    rows : (n, nchars) uint8 ndarray
+        the characters of the rows
+    """
+    nrows = [charsi.shape[0] for charsi in chars if isinstance(charsi, np.ndarray)][0]
+    chars2 = []
+    for charsi in chars:
+        if isinstance(charsi, np.ndarray):
+            chars2.append(charsi)
+        else:
+            string = np.frombuffer(charsi.encode('ascii'), dtype='uint8')
+            chars2.append(np.broadcast_to(string, (nrows, len(string))))
+    return np.hstack(chars2)
+
+
+def _write_rows(bdf_file, cards, templates, write_card):
+    """
+    Writes the cards in order
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    cards : List[BaseCard]
+        the cards
+    templates : List[(is_row, rows)]
+        is_row : (ncards, ) bool ndarray
+            is the card in rows
+        rows : (nrows, nchars) uint8 ndarray
+            the cards that are written in bulk
+    write_card : function
+        writes a card that isn't in the templates
+    """
+    ncards = len(cards)
+    itemplate = np.full(ncards, -1, dtype='int64')
+    irow = np.zeros(ncards, dtype='int64')
+    for i, (is_row, unused_rows) in enumerate(templates):
+        itemplate[is_row] = i
+        irow[is_row] = np.arange(is_row.sum())
+
+    # the cards with the same template are written together
+    istarts = np.hstack([0, np.where(np.diff(itemplate) != 0)[0] + 1, ncards]).tolist()
+    for istart, iend in zip(istarts[:-1], istarts[1:]):
+        i = itemplate[istart]
+        if i == -1:
+            for card in cards[istart:iend]:
+                bdf_file.write(write_card(card))
+        else:
+            rows = templates[i][1][irow[istart]:irow[iend - 1] + 1]
+            bdf_file.write(rows.tobytes().decode('ascii'))
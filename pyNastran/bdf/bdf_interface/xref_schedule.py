@@ -0,0 +1,141 @@
+"""
+Defines:
+ - XREF_DEPENDENCIES
+ - run_xref_stages(stages, nworkers=1, log=None)
+
+The cross-referencing of a BDF is split into stages (e.g., the elements,
+the loads).  A stage only reads the cards of the other groups, so the
+stages that don't depend on each other can run at the same time once
+the nodes and coordinate systems are linked.  For
+BDF.cross_reference(..., nworkers=2), the stages are run on a thread pool
+in the order of ``XREF_DEPENDENCIES``.
+
+The stages are pure Python, so the threads don't make the
+cross-referencing faster because of the GIL; the stages are run in
+order by default (nworkers=1).  The cross-reference errors of the
+stages are stored under a lock (see ``XrefMesh._store_xref_error``).
+
+The time of each stage is stored in model.xref_timings, so the slow
+stages of a large model can be found.
+
+"""
+from __future__ import print_function
+import sys
+import time
+from multiprocessing.pool import ThreadPool
+from six import reraise
+from six.moves.queue import Queue
+
+#: the stages that must be finished before a stage starts
+XREF_DEPENDENCIES = {
+    'nodes' : [],
+    'coordinates' : ['nodes'],
+
+    # the CBAR g0 vector, CAERO panels, FORCE1 direction, etc. use the
+    # positions of the nodes
+    'elements' : ['coordinates'],
+    'masses' : ['coordinates'],
+    'constraints' : ['coordinates'],
+    'aero' : ['coordinates'],
+    'properties' : [],
+    'materials' : [],
+    'sets' : [],
+
+    # a PLOAD1 uses the nodes of its CBAR/CBEAM
+    'loads' : ['coordinates', 'elements'],
+    # the design cards check the cards they reference
+    'optimization' : ['coordinates', 'elements', 'masses', 'properties', 'materials'],
+    # the element nodes are found from the cross-referenced elements
+    'nodes_with_elements' : ['elements'],
+}
+
+
+def _run_stage(name, func):
+    """runs a stage and returns the time and the error"""
+    time0 = time.time()
+    try:
+        func()
+    except Exception:
+        return name, time.time() - time0, sys.exc_info()
+    return name, time.time() - time0, None
+
+
+def _get_ready_stages(pending, done, stage_names):
+    """gets the stages whose dependencies are finished (or aren't run)"""
+    ready = []
+    for stage in pending:
+        name = stage[0]
+        if all(dep in done or dep not in stage_names for dep in XREF_DEPENDENCIES[name]):
+            ready.append(stage)
+    return ready
+
+
+def run_xref_stages(stages, nworkers=1, log=None):
+    """
+    Runs the cross-referencing stages
+
+    Parameters
+    ----------
+    stages : List[(name, func)]
+        the stages in the serial order; name is a key of
+        XREF_DEPENDENCIES and func() cross-references the cards
+    nworkers : int; default=1
+        the number of threads (1 runs the stages in order)
+    log : logger; default=None
+        logs the time of each stage
+
+    Returns
+    -------
+    timings : Dict[name] = float
+        the time of each stage in seconds
+
+    """
+    timings = {}
+    if nworkers == 1:
+        for name, func in stages:
+            unused_name, dt, exc_info = _run_stage(name, func)
+            timings[name] = dt
+            if exc_info is not None:
+                reraise(*exc_info)
+    else:
+        _run_stages_parallel(stages, nworkers, timings)
+
+    if log is not None:
+        for name, unused_func in stages:
+            log.debug('  xref %-20s %.3f sec' % (name, timings[name]))
+    return timings
+
+
+def _run_stages_parallel(stages, nworkers, timings):
+    """runs the stages that are ready on a thread pool"""
+    stage_names = set(name for name, unused_func in stages)
+    pending = list(stages)
+    done = set([])
+    finished = Queue()
+    nrunning = 0
+    exc_info = None
+
+    pool = ThreadPool(nworkers)
+    try:
+        while pending or nrunning:
+            if exc_info is None:
+                # a failed stage stops the stages that haven't started
+                for stage in _get_ready_stages(pending, done, stage_names):
+                    pending.remove(stage)
+                    pool.apply_async(_run_stage, stage, callback=finished.put)
+                    nrunning += 1
+            elif not nrunning:
+                break
+
+            name, dt, exc_infoi = finished.get()
+            nrunning -= 1
+            timings[name] = dt
+            done.add(name)
+            if exc_infoi is not None and exc_info is None:
+                exc_info = exc_infoi
+    finally:
+        pool.close()
+        pool.join()
+
+    if exc_info is not None:
+        reraise(*exc_info)
@@ -51,10 +51,24 @@ class BaseCard(object):
      - comment
      - update_field(self, n, value)
 
+    The high-volume cards (e.g., GRID, CQUAD4) define ``__slots__``, so
+    the base classes define an empty ``__slots__``.  The other cards
+    have an instance ``__dict__``.
+
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
+    def __getstate__(self):
+        """gets the attributes of a card with/without __slots__ for pickle"""
+        return get_card_state(self)
+
+    def __setstate__(self, state):
+        """sets the attributes of an unpickled card"""
+        set_card_state(self, state)
+
     def __deepcopy__(self, memo_dict):
         #raw_fields = self.repr_fields()
         raw_fields = self.raw_fields()
@@ -414,6 +428,7 @@ class Material(BaseCard):
 
 class Element(BaseCard):
     """defines the Element class"""
+    __slots__ = ()
     pid = 0  # CONM2, rigid
 
     def __init__(self):
@@ -634,11 +649,72 @@ def _format_comment(comment):
         return ''.join([u'${}\n'.format(comment_line)
                         for comment_line in comment.rstrip().split('\n')])
 
+_SLOT_NAMES = {}  # type: Dict[type, tuple]
+
+def _get_slot_names(card_class):
+    # type: (type) -> tuple
+    """gets the names in the __slots__ of a card class and its bases"""
+    try:
+        return _SLOT_NAMES[card_class]
+    except KeyError:
+        pass
+    slot_names = []
+    for cls in reversed(card_class.__mro__):
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, string_types):
+            slots = [slots]
+        slot_names.extend(name for name in slots if name not in ['__dict__', '__weakref__'])
+    slot_names = tuple(slot_names)
+    _SLOT_NAMES[card_class] = slot_names
+    return slot_names
+
+def get_card_state(card):
+    # type: (BaseCard) -> Dict[str, Any]
+    """
+    Gets the attributes of a card, which may be stored in __slots__
+    (e.g., GRID) or the instance __dict__
+
+    Returns
+    -------
+    state : Dict[name] = value
+        the attributes that are set (e.g., an unset comment isn't included)
+    """
+    state = {}
+    for name in _get_slot_names(card.__class__):
+        try:
+            state[name] = getattr(card, name)
+        except AttributeError:
+            pass
+    attributes = getattr(card, '__dict__', None)
+    if attributes:
+        state.update(attributes)
+    return state
+
+def set_card_state(card, state):
+    # type: (BaseCard, Any) -> None
+    """
+    Sets the attributes of a card (see ``get_card_state``)
+
+    Parameters
+    ----------
+    card : BaseCard
+        the card
+    state : Dict[name] = value / List[(name, value)]
+        the attributes
+    """
+    if not _get_slot_names(card.__class__):
+        card.__dict__.update(state)
+        return
+    if isinstance(state, dict):
+        state = state.items()
+    for name, value in state:
+        setattr(card, name, value)
+
 def _node_ids(card, nodes=None, allow_empty_nodes=False, msg=''):
     try:
         if not nodes:
             nodes = card.nodes
-            assert nodes is not None, card.__dict__
+            assert nodes is not None, get_card_state(card)
 
         if allow_empty_nodes:
             nodes2 = []
@@ -33,7 +33,7 @@ from pyNastran.bdf.cards.base_card import BaseCard
 #from pyNastran.utils.dev import list_print
 from pyNastran.bdf.bdf_interface.assign_type import (
     integer, integer_or_blank, double, string, string_or_blank,
-    double_or_string, double_or_blank, integer_or_string)
+    double_or_string, double_or_blank, integer_or_string, parse_nastran_floats)
 
 def make_xy(table_id, table_type, xy):
     try:
@@ -1460,6 +1460,13 @@ def read_table(card, table_id, table_type):
     if nterms < 0:
         raise SyntaxError('%r card is too short' % table_type)
 
+    # the x/y values are usually all floats, so they're converted in one
+    # pass; a table with a SKIP, an integer, or a blank is read by field
+    xy_values = parse_nastran_floats(card[9:9 + 2 * nterms])
+    if xy_values is not None:
+        string(card, nfields, 'ENDT')
+        return xy_values[0::2], xy_values[1::2]
+
     xy = []
     for i in range(nterms):
         n = 9 + i * 2
@@ -123,6 +123,7 @@ def _normal4(n1, n2, n3, n4, card):
 
 
 class ShellElement(Element):
+    __slots__ = ()
     type = 'ShellElement'
 
     def __init__(self):
@@ -240,6 +241,7 @@ class ShellElement(Element):
 
 
 class TriShell(ShellElement):
+    __slots__ = ()
     def __init__(self):
         ShellElement.__init__(self)
         self.nodes_ref = None  # type: Optional[List[Any]]
@@ -423,6 +425,8 @@ class CTRIA3(TriShell):
     +--------+-------+-------+----+----+----+------------+---------+
     """
     type = 'CTRIA3'
+    __slots__ = ('eid', 'pid', 'nodes', 'theta_mcid', 'zoffset', 'tflag', 'T1', 'T2', 'T3',
+                 'nodes_ref', 'pid_ref', 'theta_mcid_ref', '_comment')
     _field_map = {
         1: 'eid', 2:'pid', 6:'theta_mcid', 7:'zoffset', 10:'tflag',
         11:'T1', 12:'T2', 13:'T3'}
@@ -1426,6 +1430,7 @@ class CTRIAR(TriShell):
 
 
 class QuadShell(ShellElement):
+    __slots__ = ()
     def __init__(self):
         ShellElement.__init__(self)
         self.nodes_ref = None  # type: Optional[List[Any]]
@@ -1923,6 +1928,8 @@ class CQUAD4(QuadShell):
     +--------+-------+-------+----+----+----+----+------------+---------+
     """
     type = 'CQUAD4'
+    __slots__ = ('eid', 'pid', 'nodes', 'theta_mcid', 'zoffset', 'tflag', 'T1', 'T2', 'T3',
+                 'T4', 'nodes_ref', 'pid_ref', 'theta_mcid_ref', '_comment')
     cp_name_map = {
         'T1' : 'T1',
         'T2' : 'T2',
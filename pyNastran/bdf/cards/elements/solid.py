@@ -93,6 +93,7 @@ def area_centroid(n1, n2, n3, n4):
 
 
 class SolidElement(Element):
+    __slots__ = ()
     _field_map = {1: 'nid', 2:'pid'}
 
     def __init__(self):
@@ -184,6 +185,7 @@ class CHEXA8(SolidElement):
     +-------+-----+-----+----+----+----+----+----+----+
     """
     type = 'CHEXA'
+    __slots__ = ('eid', 'pid', 'nodes', 'nodes_ref', 'pid_ref', '_comment')
     def write_card(self, size=8, is_double=False):
         data = [self.eid, self.Pid()] + self.node_ids
         msg = ('CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
@@ -454,6 +456,7 @@ class CHEXA20(SolidElement):
     +-------+-----+-----+-----+-----+-----+-----+-----+-----+
     """
     type = 'CHEXA'
+    __slots__ = ('eid', 'pid', 'nodes', 'nodes_ref', 'pid_ref', '_comment')
     def write_card(self, size=8, is_double=False):
         nodes = self.node_ids
         nodes2 = ['' if node is None else '%8i' % node for node in nodes[8:]]
@@ -1803,6 +1806,7 @@ class CTETRA4(SolidElement):
     +--------+-----+-----+----+----+----+----+
     """
     type = 'CTETRA'
+    __slots__ = ('eid', 'pid', 'nodes', 'nodes_ref', 'pid_ref', '_comment')
     @property
     def faces(self):
         """
@@ -2076,6 +2080,7 @@ class CTETRA10(SolidElement):
     +--------+-----+-----+-----+-----+-----+----+-----+-----+
     """
     type = 'CTETRA'
+    __slots__ = ('eid', 'pid', 'nodes', 'nodes_ref', 'pid_ref', '_comment')
     def write_card(self, size=8, is_double=False):
         nodes = self.node_ids
         nodes2 = ['' if node is None else '%8i' % node for node in nodes[4:]]
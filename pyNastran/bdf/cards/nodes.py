@@ -930,6 +930,8 @@ class GRID(BaseCard):
      node.set_position(model, array([1.,2.,3.]), cid=3)
     """
     type = 'GRID'
+    __slots__ = ('nid', 'cp', 'xyz', 'cd', 'ps', 'seid', 'cp_ref', 'cd_ref',
+                 'elements_ref', 'ps_ref', 'seid_ref', '_comment')
 
     #: allows the get_field method and update_field methods to be used
     _field_map = {1: 'nid', 2:'cp', 6:'cd', 7:'ps', 8:'seid'}
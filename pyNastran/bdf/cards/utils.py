@@ -78,17 +78,11 @@ def wipe_empty_fields(card):
     short_card : List[str]
         the card with no trailing blank fields
     """
-    short_card = []
-    for field in card:
-        if isinstance(field, string_types):
-            field = field.strip()
-            if field == '':
-                field = None
-        short_card.append(field)
+    short_card = [(field.strip() or None) if isinstance(field, string_types) else field
+                  for field in card]
 
-    imax = 0
-    for i, field in enumerate(card):
-        if short_card[i] is not None:
-            imax = i
-    out = short_card[:imax + 1]
-    return out
+    # the first field is kept, even if it's blank
+    imax = len(short_card) - 1
+    while imax > 0 and short_card[imax] is None:
+        imax -= 1
+    return short_card[:imax + 1]
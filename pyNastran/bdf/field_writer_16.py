@@ -11,7 +11,7 @@ from numpy import float32, isnan  # type: ignore
 
 from pyNastran.utils import integer_types
 from pyNastran.bdf.cards.utils import wipe_empty_fields
-from pyNastran.bdf.field_writer_8 import set_blank_if_default
+from pyNastran.bdf.field_writer_8 import set_blank_if_default, _print_float_array
 
 def set_string16_blank_if_default(value, default):
     # type: (Any, Any) -> str
@@ -200,6 +200,30 @@ def print_float_16(value):
     return field
 
 
+#: the upper limits of the fixed point formats that print_float_16 uses
+#: (see ``field_writer_8._POSITIVE_LIMITS_8``)
+_POSITIVE_LIMITS_16 = [0.001, 0.1] + [10. ** i for i in range(15)]
+_POSITIVE_FORMATS_16 = ([None, '%16.15f', '%16.15f'] +
+                        ['%%16.%if' % i for i in range(14, 0, -1)] + [None])
+_NEGATIVE_LIMITS_16 = [0.01, 0.1] + [10. ** i for i in range(14)]
+_NEGATIVE_FORMATS_16 = ([None, '%16.14f', '%16.14f'] +
+                        ['%%16.%if' % i for i in range(13, 0, -1)] + [None])
+
+
+def print_float_16_array(values):
+    # type: (Any) -> List[str]
+    """
+    Prints an array of floats in nastran 16-character width syntax.
+    The fields are the same as print_float_16.
+
+    .. seealso:: print_float_8_array
+    """
+    return _print_float_array(
+        values, 16, print_float_16,
+        _POSITIVE_LIMITS_16, _POSITIVE_FORMATS_16,
+        _NEGATIVE_LIMITS_16, _NEGATIVE_FORMATS_16)
+
+
 def print_field_16(value):
     # type: (Optional[Union[int, float, str]]) -> str
     """
@@ -7,6 +7,7 @@ from six import string_types, integer_types
 from six.moves import range
 import sys
 from typing import List, Union, Any
+import numpy as np
 from numpy import float32, isnan
 
 
@@ -203,6 +204,87 @@ def print_float_8(value):
     return field
 
 
+#: the upper limits of the fixed point formats that print_float_8 uses
+#: (positive values and the absolute value of negative values); a
+#: format of None is a value that uses print_float_8 (e.g., 1e-5, 1e7)
+_POSITIVE_LIMITS_8 = [0.001, 0.1, 1., 10., 100., 1000., 10000., 100000., 1000000.]
+_POSITIVE_FORMATS_8 = [None, '%8.7f', '%8.7f', '%8.6f', '%8.5f', '%8.4f', '%8.3f',
+                       '%8.2f', '%8.1f', None]
+_NEGATIVE_LIMITS_8 = [0.01, 0.1, 1., 10., 100., 1000., 10000., 100000.]
+_NEGATIVE_FORMATS_8 = [None, '%8.6f', '%8.6f', '%8.5f', '%8.4f', '%8.3f', '%8.2f',
+                       '%8.1f', None]
+
+
+def print_float_8_array(values):
+    # type: (np.ndarray) -> List[str]
+    """
+    Prints an array of floats in nastran 8-character width syntax.
+
+    The fields are the same as print_float_8, but the values are
+    grouped by the format that print_float_8 uses, so each group is
+    written with a single format.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : List[str]
+        the 8-character fields
+    """
+    return _print_float_array(
+        values, 8, print_float_8,
+        _POSITIVE_LIMITS_8, _POSITIVE_FORMATS_8,
+        _NEGATIVE_LIMITS_8, _NEGATIVE_FORMATS_8)
+
+
+def _print_float_array(values, width, print_float,
+                       positive_limits, positive_formats,
+                       negative_limits, negative_formats):
+    """
+    Prints an array of floats (see ``print_float_8_array``)
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+    width : int
+        the field width (8/16)
+    print_float : function
+        the method for a single value (e.g., print_float_8)
+    positive_limits / negative_limits : List[float]
+        the upper limits of the formats
+    positive_formats / negative_formats : List[str/None]
+        the formats (None for print_float)
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    fields = np.empty(len(values), dtype='object')
+    fields[np.isnan(values)] = ' ' * width
+    fields[values == 0.0] = '%*s' % (width, '0.')
+
+    blank = '%%%is' % width
+    for sign, limits, formats in [(1., positive_limits, positive_formats),
+                                  (-1., negative_limits, negative_formats)]:
+        ivalues = np.where(sign * values > 0.)[0]
+        ibuckets = np.searchsorted(limits, sign * values[ivalues], side='right')
+        for ibucket, fmt in enumerate(formats):
+            i = ivalues[ibuckets == ibucket]
+            if not len(i):
+                continue
+            valuesi = values[i].tolist()
+            if fmt is None:
+                fields[i] = [print_float(value) for value in valuesi]
+            elif sign < 0. and ibucket < 3:
+                # -1 < x <= -0.01
+                fields[i] = [blank % (fmt % value).replace('-0.', '-.').strip(' 0')
+                             for value in valuesi]
+            else:
+                fields[i] = [blank % (fmt % value).strip(' 0') for value in valuesi]
+    return fields.tolist()
+
+
 #def print_float_or_int_8(value):
     ## type: (Union[int, float]) -> str
     #"""
@@ -7,6 +7,7 @@ from six.moves import range
 
 import sys
 from typing import List, Union
+import numpy as np
 from pyNastran.utils import integer_types
 from pyNastran.bdf.cards.utils import wipe_empty_fields
 
@@ -33,6 +34,23 @@ def print_scientific_double(value):
     return field
 
 
+def print_scientific_double_array(values):
+    # type: (np.ndarray) -> List[str]
+    """
+    Prints an array of floats in 16-character scientific double
+    precision.  The fields are the same as print_scientific_double.
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    fields = np.empty(len(values), dtype='object')
+    is_negative = values < 0
+    fields[is_negative] = [('%16.9e' % value).replace('e', 'D')
+                           for value in values[is_negative].tolist()]
+    fields[~is_negative] = [('%16.10e' % value).replace('e', 'D').replace(
+        '-0.0000000000D+00', '0.0000000000D+00')
+                            for value in values[~is_negative].tolist()]
+    return fields.tolist()
+
+
 def print_field_double(value):
     # type: (Union[int, float, str, None]) -> str
     """
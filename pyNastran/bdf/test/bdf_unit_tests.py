@@ -1,6 +1,10 @@
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
+import pickle
+import shutil
+import tempfile
+from copy import deepcopy
 import unittest
 from numpy import allclose, array
 from six import StringIO
@@ -9,7 +13,11 @@ import pyNastran
 from pyNastran.utils import object_attributes, object_methods
 from pyNastran.bdf.cards.collpase_card import collapse_thru_by
 from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.errors import CrossReferenceError, CardParseSyntaxError
+from pyNastran.bdf.utils import to_fields, to_stripped_fields
+from pyNastran.bdf.cards.utils import wipe_empty_fields
 from pyNastran.bdf.write_path import write_include, _split_path
+from pyNastran.bdf.bdf_interface.write_mesh_arrays import write_grids, write_elements
 from pyNastran.bdf.test.test_bdf import run_bdf, run_all_files_in_folder
 
 PKG_PATH = pyNastran.__path__[0]
@@ -245,6 +253,533 @@ class TestBDF(Tester):
                          debug=True, mode='msc')
 
 
+    def test_bdf_fast_parse(self):
+        """checks that read_bdf(fast_parse=True) matches the standard parser"""
+        lines = [
+            'GRID    1               0.0     0.0     0.0\n',
+            'GRID    2       0       1.0-3   0.      0.      0       123\n',
+            'GRID    3               1.0D+1  1.      -2.5+1\n',
+            'GRID    4               1.      1.      0.\n',
+            'GRID,5,,2.,3.,4.\n',
+            'CQUAD4  10      1       1       2       3       4\n',
+            'CTRIA3  11      1       1       2       3       0.5\n',
+            'CTETRA  20      2       1       2       3       4\n',
+            'CPENTA  21      2       1       2       3       4       5       6\n',
+            'CHEXA   22      2       1       2       3       4       5       6\n',
+            '+       7       8\n',
+            'CBAR    30      3       1       2       1.      0.      1.      GGO\n',
+            'CBUSH   31      4       1       2                               0\n',
+            'RBE2    40      1       123456  2       3       4       5       6\n',
+            '+       7       1.0-5\n',
+            'CONM2   50      1       0       10.0\n',
+            'FORCE   100     1       0       1.0     1.0     0.0     0.0\n',
+            'PLOAD4  101     10      -1.0\n',
+            'SPC1    200     123     1       2       3\n',
+            'ENDDATA\n',
+        ]
+        models = []
+        for fast_parse in [False, True, 'arrays']:
+            bdf_file = StringIO()
+            bdf_file.writelines(lines)
+            bdf_file.seek(0)
+            model = read_bdf(bdf_file, xref=False, punch=True,
+                             fast_parse=fast_parse, debug=None)
+            models.append(model)
+        model, model_fast, model_arrays = models
+
+        assert model.card_count == model_fast.card_count, model_fast.card_count
+        assert model.card_count == model_arrays.card_count, model_arrays.card_count
+        assert len(model_fast.nodes) == 5, model_fast.nodes
+        assert len(model_fast.elements) == 7, model_fast.elements
+        assert allclose(model_fast.nodes[2].xyz, [1e-3, 0., 0.]), model_fast.nodes[2].xyz
+        assert allclose(model_fast.nodes[3].xyz, [10., 1., -25.]), model_fast.nodes[3].xyz
+        assert model_fast.rigid_elements[40].alpha == 1e-5, model_fast.rigid_elements[40]
+        assert model_fast.elements[30].offt == 'GGO', model_fast.elements[30]
+
+        bdf_file = StringIO()
+        bdf_file_fast = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model_fast.write_bdf(bdf_file_fast, close=False)
+        assert bdf_file.getvalue() == bdf_file_fast.getvalue()
+
+        # the free field GRID is read by the standard parser
+        card_arrays = model_arrays.card_arrays
+        assert list(model_arrays.nodes) == [5], list(model_arrays.nodes)
+        assert card_arrays['GRID']['nid'].tolist() == [1, 2, 3, 4], card_arrays['GRID']
+        assert allclose(card_arrays['GRID']['x1'], [0., 1e-3, 10., 1.]), card_arrays['GRID']
+        assert card_arrays['SPC1']['nnodes'].tolist() == [3], card_arrays['SPC1']
+        assert card_arrays['CHEXA']['n8'].tolist() == [8], card_arrays['CHEXA']
+
+    def test_bdf_parallel_includes(self):
+        """checks that read_bdf(nworkers=2) matches the serial reader"""
+        bdf_filenames = {
+            'parallel_main.bdf' : (
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID    1               0.      0.      0.\n'
+                '$ the first include\n'
+                'INCLUDE parallel_include1.bdf\n'
+                'GRID    10              1.      0.      0.\n'
+                'INCLUDE parallel_include2.bdf\n'
+                'ENDDATA\n'
+            ),
+            'parallel_include1.bdf' : (
+                'GRID    2               1.      0.      0.\n'
+                'CQUAD4  100     1       1       2       3       4\n'
+                'INCLUDE parallel_include3.bdf\n'
+                '$ a comment at the end of the file\n'
+            ),
+            'parallel_include2.bdf' : (
+                'GRID    1               0.      0.      0.\n'
+                'GRID    4               0.      1.      0.\n'
+                'CBAR    200     2       1       2       0.      0.      1.\n'
+            ),
+            'parallel_include3.bdf' : (
+                'GRID    3               1.      1.      0.\n'
+                'PSHELL  1       1       0.1\n'
+            ),
+        }
+        dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dirname)
+        for bdf_filename, msg in bdf_filenames.items():
+            with open(os.path.join(dirname, bdf_filename), 'w') as bdf_file:
+                bdf_file.write(msg)
+        bdf_filename = os.path.join(dirname, 'parallel_main.bdf')
+
+        # the workers send the fields (and the fast_parse rows) back
+        for fast_parse in [False, True]:
+            model = read_bdf(bdf_filename, xref=False, debug=None, fast_parse=fast_parse)
+            model_parallel = read_bdf(bdf_filename, xref=False, debug=None,
+                                      fast_parse=fast_parse, nworkers=2)
+
+            assert model.card_count == model_parallel.card_count, model_parallel.card_count
+            assert len(model.active_filenames) == 4, model.active_filenames
+            assert model.active_filenames == model_parallel.active_filenames, model_parallel.active_filenames
+            assert sorted(model_parallel.nodes) == [1, 2, 3, 4, 10], list(model_parallel.nodes)
+            comment = model_parallel.nodes[2].comment
+            assert comment.startswith('$ the first include\n'), comment
+
+            bdf_file = StringIO()
+            bdf_file_parallel = StringIO()
+            model.write_bdf(bdf_file, close=False)
+            model_parallel.write_bdf(bdf_file_parallel, close=False)
+            assert bdf_file.getvalue() == bdf_file_parallel.getvalue()
+
+    def test_bdf_cache(self):
+        """checks that read_bdf(cache=True) is used until the deck changes"""
+        dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dirname)
+        bdf_filename = os.path.join(dirname, 'cache_main.bdf')
+        include_filename = os.path.join(dirname, 'cache_include.bdf')
+        cache_filename = bdf_filename + '.cache'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                '$ a comment\n'
+                'GRID    1               0.      0.      0.\n'
+                'GRID    2               1.      0.      0.\n'
+                'CQUAD4  10      1       1       2       3       4\n'
+                'PSHELL  1       1       0.1\n'
+                'MAT1    1       3.0e7           0.3\n'
+                'INCLUDE cache_include.bdf\n'
+                'ENDDATA\n')
+        with open(include_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'GRID    3               1.      1.      0.\n'
+                'GRID    4               0.      1.      0.\n')
+
+        model = read_bdf(bdf_filename, xref=False, debug=None, cache=True)
+        assert os.path.exists(cache_filename)
+        mtime = os.path.getmtime(cache_filename)
+
+        model_cache = read_bdf(bdf_filename, xref=True, debug=None, cache=True)
+        assert os.path.getmtime(cache_filename) == mtime
+        assert model.card_count == model_cache.card_count, model_cache.card_count
+        assert model.active_filenames == model_cache.active_filenames, model_cache.active_filenames
+        assert model_cache.elements[10].nodes_ref[2].nid == 3
+        assert model_cache.nodes[1].comment == '$ a comment\n', model_cache.nodes[1].comment
+        model_cache.uncross_reference()
+
+        bdf_file = StringIO()
+        bdf_file_cache = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model_cache.write_bdf(bdf_file_cache, close=False)
+        assert bdf_file.getvalue() == bdf_file_cache.getvalue()
+
+        # the modification time changed, but the file didn't
+        os.utime(include_filename, (mtime + 10., mtime + 10.))
+        read_bdf(bdf_filename, xref=False, debug=None, cache=True)
+        assert os.path.getmtime(cache_filename) == mtime
+
+        # an INCLUDE changed with the same size
+        with open(include_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'GRID    3               2.      1.      0.\n'
+                'GRID    4               0.      1.      0.\n')
+        os.utime(include_filename, (mtime + 20., mtime + 20.))
+        model_cache = read_bdf(bdf_filename, xref=False, debug=None, cache=True)
+        assert allclose(model_cache.nodes[3].xyz, [2., 1., 0.]), model_cache.nodes[3].xyz
+
+        # the read settings changed
+        model_cache = read_bdf(bdf_filename, xref=False, debug=None, cache=True,
+                               skip_cards=['CQUAD4'])
+        assert len(model_cache.elements) == 0, model_cache.elements
+
+    def test_bdf_update_include(self):
+        """checks that an INCLUDE file can be read again with update_include"""
+        dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dirname)
+        bdf_filename = os.path.join(dirname, 'update_main.bdf')
+        props_filename = os.path.join(dirname, 'update_props.inc')
+        loads_filename = os.path.join(dirname, 'update_loads.inc')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID    1               0.      0.      0.\n'
+                'GRID    2               1.      0.      0.\n'
+                'GRID    3               1.      1.      0.\n'
+                'GRID    4               0.      1.      0.\n'
+                'CQUAD4  10      1       1       2       3       4\n'
+                'FORCE   1       1               1.      1.      0.      0.\n'
+                'INCLUDE update_props.inc\n'
+                'INCLUDE update_loads.inc\n'
+                'ENDDATA\n')
+        with open(props_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'PSHELL  1       1       0.1\n'
+                'MAT1    1       3.0e7           0.3\n')
+        with open(loads_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'FORCE   1       2               2.      1.      0.      0.\n')
+
+        model = read_bdf(bdf_filename, debug=None, track_includes=True)
+        props_filename2 = os.path.abspath(props_filename)
+        loads_filename2 = os.path.abspath(loads_filename)
+        assert model.include_cards[props_filename2] == {'PSHELL' : [1], 'MAT1' : [1]}, model.include_cards
+        assert model.include_cards[loads_filename2] == {'FORCE' : [1]}, model.include_cards
+
+        # the PSHELL is updated in place
+        elem = model.elements[10]
+        pshell = model.properties[1]
+        with open(props_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'PSHELL  1       1       0.2\n'
+                'MAT1    1       3.0e7           0.3\n')
+        model.update_include(props_filename)
+        assert model.properties[1] is pshell
+        assert elem.pid_ref is pshell
+        assert allclose(elem.Thickness(), 0.2), elem.Thickness()
+
+        # the FORCE from the main deck is kept
+        with open(loads_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'FORCE   1       3               3.      1.      0.      0.\n'
+                'FORCE   1       4               4.      1.      0.      0.\n')
+        model.update_include(loads_filename)
+        assert [load.node for load in model.loads[1]] == [1, 3, 4], model.loads[1]
+        assert model.card_count['FORCE'] == 3, model.card_count
+
+        bdf_file = StringIO()
+        bdf_file_expected = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        read_bdf(bdf_filename, debug=None).write_bdf(bdf_file_expected, close=False)
+        assert bdf_file.getvalue() == bdf_file_expected.getvalue()
+
+        # a bad card doesn't change the model, so the update can be retried
+        card_count = dict(model.card_count)
+        with open(props_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'PSHELL  1       1       abc\n'
+                'MAT1    1       3.0e7           0.3\n')
+        with self.assertRaises(SyntaxError):
+            model.update_include(props_filename)
+        assert model.properties == {1 : pshell}, model.properties
+        assert sorted(model.materials) == [1], model.materials
+        assert model.card_count == card_count, model.card_count
+        assert elem.pid_ref is pshell
+        assert model.include_cards[props_filename2] == {'PSHELL' : [1], 'MAT1' : [1]}, model.include_cards
+
+        with open(props_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'PSHELL  1       1       0.3\n'
+                'MAT1    1       3.0e7           0.3\n')
+        model.update_include(props_filename)
+        assert model.properties[1] is pshell
+        assert allclose(elem.Thickness(), 0.3), elem.Thickness()
+        assert model.card_count == card_count, model.card_count
+
+        # a dangling reference doesn't change the model either
+        mat1 = model.materials[1]
+        with open(props_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'PSHELL  1       2       0.4\n'
+                'MAT1    1       3.0e7           0.3\n')
+        with self.assertRaises(CrossReferenceError):
+            model.update_include(props_filename)
+        assert model.properties[1] is pshell
+        assert pshell.mid1 == 1, pshell.mid1
+        assert pshell.mid1_ref is mat1
+        assert elem.pid_ref is pshell
+        assert allclose(elem.Thickness(), 0.3), elem.Thickness()
+        assert model.card_count == card_count, model.card_count
+
+        # the MAT1 is removed, so the model is cross-referenced again
+        with open(props_filename, 'w') as bdf_file:
+            bdf_file.write('PSHELL  1       1       0.4\n')
+        with self.assertRaises(CrossReferenceError):
+            model.update_include(props_filename)
+        assert model.materials == {1 : mat1}, model.materials
+        assert model.properties[1] is pshell
+        assert pshell.mid1_ref is mat1
+        assert elem.pid_ref is pshell
+        assert elem.nodes_ref[0] is model.nodes[1]
+        assert model.include_cards[props_filename2] == {'PSHELL' : [1], 'MAT1' : [1]}, model.include_cards
+        assert model.card_count == card_count, model.card_count
+
+        with open(props_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'PSHELL  1       1       0.4\n'
+                'MAT1    1       3.0e7           0.3\n')
+        model.update_include(props_filename)
+        assert model.properties[1] is pshell
+        assert allclose(elem.Thickness(), 0.4), elem.Thickness()
+
+        with self.assertRaises(RuntimeError):
+            model.update_include(bdf_filename)
+
+    def test_bdf_lazy(self):
+        """checks that the lazy cards are built on first access"""
+        bdf_filename = os.path.join(MODEL_PATH, 'sol200', 'model_200.bdf')
+        model_expected = read_bdf(bdf_filename, debug=None)
+        model = read_bdf(bdf_filename, debug=None, lazy=True)
+        assert sorted(model._lazy_cards) == [
+            'dequations', 'desvars', 'doptprm', 'dresps', 'dtable', 'dvprels'], model._lazy_cards
+        assert 'dvprels' not in model.__dict__
+        assert model.card_count == model_expected.card_count
+
+        # the lazy cards are written as they were read
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        assert 'dvprels' not in model.__dict__
+        bdf_file.seek(0)
+        model2 = read_bdf(bdf_file, debug=None)
+        assert sorted(model2.dvprels) == sorted(model_expected.dvprels)
+
+        # the DVPREL2s are cross-referenced when they're built, which
+        # builds the DEQATNs
+        dvprel = model.dvprels[11]
+        assert dvprel.pid_ref is model.properties[1], dvprel.pid_ref
+        assert 'dequations' not in model._lazy_cards
+        assert model.get_card_ids_by_card_types('DRESP1') == \
+            model_expected.get_card_ids_by_card_types('DRESP1')
+        assert model.card_count == model_expected.card_count
+
+        assert model.doptprm is not None
+        assert not model._lazy_cards
+        bdf_file = StringIO()
+        bdf_file_expected = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model_expected.write_bdf(bdf_file_expected, close=False)
+        assert bdf_file.getvalue() == bdf_file_expected.getvalue()
+
+    def test_xref_arrays(self):
+        """checks the array-based cross-referencing"""
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, debug=None)
+        xref_arrays = model.cross_reference_arrays()
+        assert model.xref_arrays is xref_arrays
+        assert not xref_arrays.missing_nodes and not xref_arrays.missing_properties
+
+        for etype in ['CTRIA3', 'CQUAD4', 'CTETRA', 'CPENTA', 'CHEXA', 'CBAR']:
+            elements = xref_arrays.elements[etype]
+            assert elements.eids.tolist() == sorted(model._type_to_id_map[etype]), etype
+            centroid = xref_arrays.Centroid(etype)
+            for i, eid in enumerate(elements.eids):
+                elem = model.elements[eid]
+                assert elements.nids[i, 0] == elem.node_ids[0], etype
+                assert xref_arrays.property_ids[elements.iproperties[i]] == elem.Pid()
+                assert allclose(centroid[i], elem.Centroid()), etype
+
+        for etype in ['CTRIA3', 'CQUAD4']:
+            area, centroid, normal = xref_arrays.AreaCentroidNormal(etype)
+            assert allclose(area, xref_arrays.Area(etype))
+            assert allclose(normal, xref_arrays.Normal(etype))
+            for i, eid in enumerate(xref_arrays.elements[etype].eids):
+                elem = model.elements[eid]
+                assert allclose(area[i], elem.Area()), etype
+                assert allclose(centroid[i], elem.Centroid()), etype
+                assert allclose(normal[i], elem.Normal()), etype
+
+        # the GRID/element arrays are cross-referenced without the objects
+        model2 = read_bdf(bdf_filename, debug=None, fast_parse='arrays', xref='arrays')
+        assert model2._xref is False
+        assert 'CQUAD4' in model2.card_arrays
+        assert allclose(model2.xref_arrays.Area('CQUAD4'), xref_arrays.Area('CQUAD4'))
+        assert allclose(model2.xref_arrays.Centroid('CHEXA'), xref_arrays.Centroid('CHEXA'))
+
+        # the missing references are reported together
+        model.add_cquad4(1000, 1000, [1, 2, 1001, 1002])
+        model.add_ctria3(1001, 1, [1, 2, 1003])
+        with self.assertRaises(CrossReferenceError) as context:
+            model.cross_reference_arrays()
+        msg = str(context.exception)
+        assert 'CQUAD4: missing node_ids=[1001, 1002]' in msg, msg
+        assert 'CQUAD4: missing property_ids=[1000]' in msg, msg
+        assert 'CTRIA3: missing node_ids=[1003]' in msg, msg
+
+        model._stop_on_xref_error = False
+        xref_arrays = model.cross_reference_arrays()
+        eids, nids = xref_arrays.missing_nodes['CQUAD4']
+        assert eids.tolist() == [1000, 1000] and nids.tolist() == [1001, 1002]
+
+    def test_xref_nworkers(self):
+        """checks that the threaded cross-referencing matches the serial one"""
+        bdf_filename = os.path.join(MODEL_PATH, 'sol200', 'model_200.bdf')
+        model_expected = read_bdf(bdf_filename, debug=None)
+        bdf_file_expected = StringIO()
+        model_expected.write_bdf(bdf_file_expected, close=False)
+        assert model_expected.xref_timings['elements'] >= 0.
+
+        for lazy in [False, True]:
+            model = read_bdf(bdf_filename, debug=None, xref=False, lazy=lazy)
+            model.cross_reference(nworkers=2)
+            assert model._xref is True
+            assert model.dvprels[11].pid_ref is model.properties[1]
+            if not lazy:
+                assert sorted(model.xref_timings) == sorted(model_expected.xref_timings)
+                bdf_file = StringIO()
+                model.write_bdf(bdf_file, close=False)
+                assert bdf_file.getvalue() == bdf_file_expected.getvalue()
+
+            model = read_bdf(bdf_filename, debug=None, xref=False, lazy=lazy)
+            model.safe_cross_reference(nworkers=2)
+            assert model.dvprels[11].pid_ref is model.properties[1]
+
+        # the error of a stage is raised after the running stages finish
+        model = read_bdf(bdf_filename, debug=None, xref=False)
+        model.add_ctria3(1000, 1000, [1, 2, 3])
+        with self.assertRaises(CrossReferenceError):
+            model.cross_reference(nworkers=2)
+
+        # the errors of the stages that run at the same time are all stored
+        model = read_bdf(bdf_filename, debug=None, xref=False)
+        model.add_ctria3(1000, 1001, [1, 2, 3])
+        model.add_pshell(1002, mid1=1002, t=0.1)
+        with self.assertRaises(CrossReferenceError):
+            model.cross_reference(nworkers=2)
+        assert model._ixref_errors == 2, model._stored_xref_errors
+        assert len(model._stored_xref_errors) == 2, model._stored_xref_errors
+
+    def test_write_mesh_arrays(self):
+        """checks that the bulk GRID/element writer matches write_card"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., -0.5, 1e-6], cp=1, comment='a comment')
+        model.add_grid(3, [1e20, -1e-20, 123456.7], cd=2)
+        model.add_grid(4, [0.1, 0.2, 0.3], ps='123', seid=5)
+        model.add_grid(123456789, [4., 5., 6.])
+        model.add_grid(6, [-3.14159265, 2.71828183, 1.41421356])
+
+        model.add_cquad4(10, 1, [1, 2, 3, 4])
+        model.add_cquad4(11, 1, [1, 2, 3, 4], theta_mcid=5.)
+        model.add_ctria3(12, 1, [1, 2, 3])
+        model.add_ctria3(13, 1, [1, 2, 3], zoffset=0.1, comment='a comment')
+        model.add_cbar(14, 2, [1, 2], [0., 1., 0.], None)
+        model.add_ctetra(15, 3, [1, 2, 3, 4])
+        model.add_ctetra(16, 3, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+        model.add_ctetra(17, 3, [1, 2, 3, 4, 5, 6, 7, 8, 9, None])
+        model.add_cpenta(18, 3, [1, 2, 3, 4, 5, 6])
+        model.add_cpenta(19, 3, list(range(1, 16)))
+        model.add_chexa(20, 3, list(range(1, 9)))
+        model.add_chexa(21, 3, list(range(1, 21)))
+
+        nodes = [node for nid, node in sorted(model.nodes.items())]
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            bdf_file = StringIO()
+            write_grids(bdf_file, nodes, size, is_double)
+            expected = ''.join(node.write_card(size, is_double) for node in nodes)
+            self.assertEqual(bdf_file.getvalue(), expected)
+
+        elements = [element for eid, element in sorted(model.elements.items())]
+        bdf_file = StringIO()
+        write_elements(bdf_file, elements, lambda element: element.write_card(8, False))
+        expected = ''.join(element.write_card(8, False) for element in elements)
+        self.assertEqual(bdf_file.getvalue(), expected)
+
+    def test_card_slots(self):
+        """checks the cards that use __slots__"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.], comment='a comment')
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_cquad4(10, 1, [1, 2, 3, 4])
+        model.add_ctria3(11, 1, [1, 2, 3], comment='a comment')
+        model.add_ctetra(12, 2, [1, 2, 3, 4])
+        model.add_conm2(13, 1, 2.0)
+        model.add_pshell(1, mid1=100, t=0.1)
+        model.add_psolid(2, 100)
+        model.add_mat1(100, 3.0e7, None, 0.3)
+        model.cross_reference()
+
+        cards = list(model.nodes.values()) + list(model.elements.values()) + list(
+            model.masses.values())
+        for card in cards:
+            assert not hasattr(card, '__dict__'), card.type
+        self.assertEqual(model.nodes[1].comment, '$a comment\n')
+        self.assertEqual(model.nodes[2].comment, '')
+        self.assertEqual(model.elements[10].Area(), 1.0)
+
+        # the cards are pickled and copied with their slots
+        model.uncross_reference()
+        cards2 = pickle.loads(pickle.dumps(cards))
+        self.assertEqual(cards2[0].comment, '$a comment\n')
+        for card, card2 in zip(cards, cards2):
+            self.assertEqual(card2.write_card(), card.write_card())
+
+        model3 = deepcopy(model)
+        model3.cross_reference()
+        self.assertEqual(model3.elements[11].Area(), 0.5)
+        self.assertEqual(model3.masses[13].Mass(), 2.0)
+
+    def test_to_fields(self):
+        """checks the small field, large field, CSV, and tabbed cards"""
+        cards = [
+            (['GRID           1        1.0     2.-3    3.0'],
+             ['GRID', '1', None, '1.0', '2.-3', '3.0']),
+            (['CHEXA          1       1       1       2       3       4       5       6',
+              '               7       8'],
+             ['CHEXA', '1', '1', '1', '2', '3', '4', '5', '6', '7', '8']),
+            (['GRID*                  1                             1.0             2.0',
+              '*                    3.0'],
+             ['GRID*', '1', None, '1.0', '2.0', '3.0']),
+            (['GRID,1,,1.0,2.0,3.0'],
+             ['GRID', '1', None, '1.0', '2.0', '3.0']),
+            (['GRID\t1\t\t1.0\t2.0\t3.0'],
+             ['GRID', '1', None, '1.0', '2.0', '3.0']),
+            (['CHEXA          1       1       1       2       3       4       5       6',
+              ',7,8'],
+             ['CHEXA', '1', '1', '1', '2', '3', '4', '5', '6', '7', '8']),
+            (['CONM2          1       1'],
+             ['CONM2', '1', '1']),
+        ]
+        for card_lines, expected in cards:
+            card_lines0 = list(card_lines)
+            fields = wipe_empty_fields(to_fields(card_lines, 'GRID'))
+            self.assertEqual(fields, expected)
+            self.assertEqual(to_stripped_fields(card_lines, 'GRID'), expected)
+            self.assertEqual(card_lines, card_lines0)
+
+        with self.assertRaises(CardParseSyntaxError):
+            to_fields(['GRID,1,,1.0\t2.0,3.0'], 'GRID')
+        with self.assertRaises(CardParseSyntaxError):
+            to_fields(['GRID=1'], 'GRID')
+
     def test_bdf_05(self):
         """checks testA.dat"""
         bdf_filename = os.path.join(PKG_PATH, 'bdf', 'test', 'unit', 'testA.bdf')
@@ -0,0 +1,105 @@
+"""
+Measures the memory of the high-volume cards (GRID, CQUAD4, CTRIA3,
+CHEXA, CTETRA, CONM2), which use __slots__ instead of an instance
+__dict__.  The "dict" column is the same card class with a __dict__
+(i.e., the memory before the cards used __slots__).
+
+Usage
+-----
+python benchmark_card_memory.py [ncards]
+"""
+from __future__ import print_function
+import sys
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    # Python 2; the size of the card objects is used instead
+    tracemalloc = None
+
+from pyNastran.bdf.bdf import BDF
+
+
+def _get_card_args(card_type, i):
+    """gets the arguments of the i-th card of a mesh"""
+    nid = i + 1
+    if card_type == 'GRID':
+        return (nid, [float(i), 0., 0.])
+    elif card_type == 'CQUAD4':
+        return (nid, 1, [nid, nid + 1, nid + 2, nid + 3])
+    elif card_type == 'CTRIA3':
+        return (nid, 1, [nid, nid + 1, nid + 2])
+    elif card_type == 'CHEXA':
+        return (nid, 1, list(range(nid, nid + 8)))
+    elif card_type == 'CTETRA':
+        return (nid, 1, list(range(nid, nid + 4)))
+    elif card_type == 'CONM2':
+        return (nid, nid, 1.0)
+    raise NotImplementedError(card_type)
+
+
+def _measure(add_card, card_type, ncards):
+    """gets the bytes per card of the cards created by add_card"""
+    if tracemalloc is None:
+        return _measure_getsizeof(add_card, card_type, ncards)
+    tracemalloc.start()
+    snapshot0 = tracemalloc.take_snapshot()
+    cards = [add_card(*_get_card_args(card_type, i)) for i in range(ncards)]
+    snapshot1 = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    nbytes = sum(stat.size_diff for stat in snapshot1.compare_to(snapshot0, 'filename'))
+    del cards
+    return nbytes / float(ncards)
+
+
+def _measure_getsizeof(add_card, card_type, ncards):
+    """
+    Gets the bytes per card of the object and its __dict__, which doesn't
+    include the fields (e.g., the node list), so it's less than the
+    tracemalloc value
+    """
+    cards = [add_card(*_get_card_args(card_type, i)) for i in range(ncards)]
+    nbytes = 0
+    for card in cards:
+        nbytes += sys.getsizeof(card)
+        if hasattr(card, '__dict__'):
+            nbytes += sys.getsizeof(card.__dict__)
+    return nbytes / float(ncards)
+
+
+def get_card_memory(ncards=100000):
+    """
+    Gets the memory of the high-volume cards
+
+    Returns
+    -------
+    memory : Dict[card_type] = (slots_bytes, dict_bytes)
+        the bytes per card with and without __slots__
+    """
+    memory = {}
+    for card_type in ['GRID', 'CQUAD4', 'CTRIA3', 'CHEXA', 'CTETRA', 'CONM2']:
+        # the add method picks the class (e.g., CHEXA8 for 8 nodes)
+        model = BDF(debug=None)
+        add_method = getattr(model, 'add_' + card_type.lower())
+        card_class = add_method(*_get_card_args(card_type, 0)).__class__
+        dict_class = type(card_class.__name__, (card_class,), {})
+        assert not hasattr(card_class(*_get_card_args(card_type, 0)), '__dict__'), card_type
+
+        slots_bytes = _measure(card_class, card_type, ncards)
+        dict_bytes = _measure(dict_class, card_type, ncards)
+        memory[card_type] = (slots_bytes, dict_bytes)
+    return memory
+
+
+def main():
+    """prints the bytes per card"""
+    ncards = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    memory = get_card_memory(ncards)
+    print('%-8s %10s %10s %8s' % ('card', 'slots', 'dict', 'ratio'))
+    for card_type, (slots_bytes, dict_bytes) in sorted(memory.items()):
+        print('%-8s %10.1f %10.1f %8.2f' % (
+            card_type, slots_bytes, dict_bytes, dict_bytes / slots_bytes))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
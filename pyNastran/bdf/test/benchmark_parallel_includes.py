@@ -0,0 +1,74 @@
+"""
+Times read_bdf(..., nworkers=n) against the serial reader for a deck
+with a few large INCLUDE files of GRID/CQUAD4 cards.  The workers only
+help on a machine with multiple cores; the main process still builds
+the cards (see ``bdf_interface/bdf_parallel.py``).
+
+Usage
+-----
+python benchmark_parallel_includes.py [ncards] [nincludes] [nworkers]
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+import shutil
+import tempfile
+import multiprocessing
+
+from pyNastran.bdf.bdf import read_bdf
+
+
+def write_deck(dirname, ncards, nincludes):
+    """writes a deck with nincludes INCLUDE files of ncards GRIDs and CQUAD4s"""
+    bdf_filename = os.path.join(dirname, 'main.bdf')
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write('SOL 101\nCEND\nBEGIN BULK\n')
+        bdf_file.write('PSHELL         1       1      .1\n')
+        bdf_file.write('MAT1           1   3.0+7              .3\n')
+        for iinclude in range(nincludes):
+            include_filename = 'include%i.bdf' % iinclude
+            bdf_file.write('INCLUDE %s\n' % include_filename)
+
+            i0 = iinclude * ncards
+            with open(os.path.join(dirname, include_filename), 'w') as include_file:
+                for i in range(i0, i0 + ncards):
+                    include_file.write('GRID    %8i        %8s%8s%8s\n' % (
+                        i + 1, '%.2f' % (i * 0.01), '0.', '0.'))
+                for i in range(i0, i0 + ncards - 3):
+                    include_file.write('CQUAD4  %8i       1%8i%8i%8i%8i\n' % (
+                        i + 1, i + 1, i + 2, i + 3, i + 4))
+        bdf_file.write('ENDDATA\n')
+    return bdf_filename
+
+
+def _time(bdf_filename, fast_parse, nworkers):
+    """gets the time of a read"""
+    time0 = time.time()
+    read_bdf(bdf_filename, xref=False, debug=None, fast_parse=fast_parse,
+             nworkers=nworkers)
+    return time.time() - time0
+
+
+def main():
+    """prints the time of the serial and parallel reads"""
+    ncards = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    nincludes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    nworkers = int(sys.argv[3]) if len(sys.argv) > 3 else nincludes
+
+    dirname = tempfile.mkdtemp()
+    try:
+        bdf_filename = write_deck(dirname, ncards, nincludes)
+        print('%i INCLUDE files of %i GRIDs/CQUAD4s; %i cores' % (
+            nincludes, ncards, multiprocessing.cpu_count()))
+        for fast_parse in [False, True]:
+            serial = _time(bdf_filename, fast_parse, 1)
+            parallel = _time(bdf_filename, fast_parse, nworkers)
+            print('fast_parse=%-5s serial: %.3f sec; nworkers=%i: %.3f sec; speedup=%.2f' % (
+                fast_parse, serial, nworkers, parallel, serial / parallel))
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,106 @@
+"""
+Times the field tokenizer (``to_fields`` and ``wipe_empty_fields`` and
+the combined ``to_stripped_fields`` that the reader uses), the
+conversion of Nastran floats (e.g., 1.-3) by ``double`` and
+``interpret_value``, and the table reader.
+
+Usage
+-----
+python benchmark_tokenizer.py [ncards]
+"""
+from __future__ import print_function
+import sys
+import time
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.utils import to_fields, to_stripped_fields
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.bdf_interface.assign_type import double, interpret_value
+from pyNastran.bdf.field_writer_8 import print_float_8
+
+
+def _get_card_lines(ncards):
+    """gets the lines of small field, large field, and CSV cards"""
+    cards = []
+    for i in range(ncards):
+        nid = i + 1
+        x = print_float_8(i * 1.234e-3)
+        cards.append(('GRID', ['GRID    %8i        %8s%8s%8s' % (nid, x, '-2.5-4', '1.')]))
+        cards.append(('CQUAD4', ['CQUAD4  %8i       1%8i%8i%8i%8i' % (
+            nid, nid, nid + 1, nid + 2, nid + 3)]))
+        cards.append(('CHEXA', [
+            'CHEXA   %8i       1%8i%8i%8i%8i%8i%8i' % (
+                nid, nid, nid + 1, nid + 2, nid + 3, nid + 4, nid + 5),
+            '        %8i%8i' % (nid + 6, nid + 7)]))
+        cards.append(('GRID', ['GRID*   %16i%16s%16s%16s' % (nid, '', x, '2.5-4'),
+                               '*       %16s' % '3.0']))
+        cards.append(('CTRIA3', ['CTRIA3,%i,1,%i,%i,%i' % (nid, nid, nid + 1, nid + 2)]))
+    return cards
+
+
+def _get_table_lines(ntables, npoints):
+    """gets the lines of TABLED1 cards"""
+    cards = []
+    for itable in range(ntables):
+        xy = []
+        for i in range(npoints):
+            xy.extend([print_float_8(float(i)), print_float_8(i * 1.5e-3)])
+        lines = ['TABLED1 %8i' % (itable + 1)]
+        xy.append('ENDT')
+        for i in range(0, len(xy), 8):
+            lines.append('        ' + ''.join('%8s' % value for value in xy[i:i+8]))
+        cards.append(('TABLED1', lines))
+    return cards
+
+
+def _time(func, *args):
+    """gets the time of a function call"""
+    time0 = time.time()
+    func(*args)
+    return time.time() - time0
+
+
+def _tokenize(cards):
+    for card_name, card_lines in cards:
+        wipe_empty_fields(to_fields(list(card_lines), card_name))
+
+
+def _tokenize_stripped(cards):
+    for card_name, card_lines in cards:
+        to_stripped_fields(card_lines, card_name)
+
+
+def _convert(svalues):
+    card = BDFCard(svalues, has_none=False)
+    for i in range(len(svalues)):
+        double(card, i, 'value')
+    for svalue in svalues:
+        interpret_value(svalue)
+
+
+def _read_tables(cards):
+    model = BDF(debug=None)
+    for card_name, card_lines in cards:
+        model.add_card(list(card_lines), card_name, is_list=False, has_none=False)
+
+
+def main():
+    """prints the time of each step"""
+    ncards = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    cards = _get_card_lines(ncards)
+    svalues = ['1.-3', '-2.5+4', '1.0D-3', '1.234', '-.5-2', '7.E+3'] * ncards
+    tables = _get_table_lines(ncards // 100, 500)
+
+    print('to_fields/wipe_empty_fields (%i cards): %.3f sec' % (
+        len(cards), _time(_tokenize, cards)))
+    print('to_stripped_fields (%i cards): %.3f sec' % (
+        len(cards), _time(_tokenize_stripped, cards)))
+    print('double/interpret_value (%i values): %.3f sec' % (
+        len(svalues), _time(_convert, svalues)))
+    print('TABLED1 (%i tables, %i points): %.3f sec' % (
+        len(tables), 500, _time(_read_tables, tables)))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
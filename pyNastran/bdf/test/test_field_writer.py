@@ -4,11 +4,15 @@ from six.moves import zip, range
 import random
 import unittest
 
-from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
+import numpy as np
+
+from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8, print_float_8_array,
                                           set_default_if_blank,
                                           set_blank_if_default, is_same, print_card_8)
-from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
-from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_16 import (
+    print_field_16, print_card_16, print_float_16, print_float_16_array, print_scientific_16)
+from pyNastran.bdf.field_writer_double import (
+    print_card_double, print_scientific_double, print_scientific_double_array)
 
 
 from pyNastran.bdf.bdf_interface.assign_type import interpret_value
@@ -441,6 +445,27 @@ class Testfield_writer_8(unittest.TestCase):
             positive_output = [print_float_16(x) for x in nums]
             negative_output = [print_float_16(-x) for x in nums]
 
+    def test_float_array(self):
+        """checks that the array printers match the single value printers"""
+        nums = [0., np.nan, 1., -1., 0.001, -0.001, 0.01, -0.01, 0.1, -0.1,
+                5e-8, -5e-7, 0.999999999, -0.99999999, 999999.96, -99999.996,
+                1e20, -1e20]
+        for exponent in range(-17, 18):
+            nums += [9. / 11 * 10**exponent, -9. / 11 * 10**exponent,
+                     10.**exponent, -10.**exponent]
+        nums += np.random.RandomState(0).uniform(-1., 1., 1000).tolist()
+        nums += (np.random.RandomState(1).uniform(-1., 1., 1000) *
+                 10. ** np.random.RandomState(2).randint(-10, 10, 1000)).tolist()
+
+        fields = print_float_8_array(np.array(nums))
+        self.assertEqual(fields, [print_float_8(x) for x in nums])
+        fields = print_float_16_array(np.array(nums))
+        self.assertEqual(fields, [print_float_16(x) for x in nums])
+
+        nums_double = [x for x in nums if not np.isnan(x)]
+        fields = print_scientific_double_array(np.array(nums_double))
+        self.assertEqual(fields, [print_scientific_double(x) for x in nums_double])
+
 def compare(value_in):
     field = print_field_8(value_in)
 
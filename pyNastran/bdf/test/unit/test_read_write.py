@@ -366,6 +366,8 @@ class TestReadWrite(unittest.TestCase):
         with self.assertRaises(IOError):
             read_bdf(bdf_filename='a.bdf', xref=True, punch=False,
                      encoding=None, log=log)
+        # the missing INCLUDE is dumped to pyNastran_crash.bdf
+        os.remove('pyNastran_crash.bdf')
         model.read_bdf(bdf_filename='a.bdf', xref=True, punch=False,
                        read_includes=False, encoding=None)
         model.write_bdf('out.bdf')
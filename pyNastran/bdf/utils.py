@@ -1,6 +1,7 @@
 """
 Defines various utilities for BDF parsing including:
  - to_fields
+ - to_stripped_fields
  - parse_patran_syntax
  - parse_patran_syntax_dict
  - Position
@@ -22,6 +23,7 @@ from numpy import unique, cross, dot, array  # type: ignore
 import pyNastran
 from pyNastran.bdf.errors import CardParseSyntaxError
 from pyNastran.bdf.cards.collpase_card import collapse_colon_packs
+from pyNastran.bdf.cards.utils import wipe_empty_fields
 
 
 _REMOVED_LINES = [
@@ -173,6 +175,15 @@ def _to_fields_mntpnt1(card_lines):
         #fields += new_fields
     #return fields #[field.strip() for field in fields]
 
+def _is_small_field_block(card_lines):
+    # type: (List[str]) -> bool
+    """
+    Are the lines of a card small field and fixed format (no commas,
+    tabs, large field markers, or equal signs)?
+    """
+    block = ''.join(card_lines)
+    return not (',' in block or '\t' in block or '*' in block or '=' in block)
+
 def to_fields(card_lines, card_name):
     # type: (List[str], str) -> List[str]
     """
@@ -202,80 +213,99 @@ def to_fields(card_lines, card_name):
       >>> fields
       ['GRID', '1', '', '1.0', '2.0', '3.0']
 
+    The block of lines is checked once, so the common small field,
+    fixed format card is sliced without checking each line.
     """
-    fields = []  # type: List[str]
-
     if card_name == 'MONPNT1':
         return _to_fields_mntpnt1(card_lines)
+    if not _is_small_field_block(card_lines):
+        return _to_fields_by_line(card_lines, card_name)
+
+    line = card_lines[0]
+    fields = [line[0:8], line[8:16], line[16:24], line[24:32], line[32:40],
+              line[40:48], line[48:56], line[56:64], line[64:72]]
+    for line in card_lines[1:]:
+        fields += [line[8:16], line[16:24], line[24:32], line[32:40],
+                   line[40:48], line[48:56], line[56:64], line[64:72]]
+    return fields
 
-    # first line
-    line = card_lines.pop(0)
-    if '=' in line:
-        msg = 'card_name=%r\nequal signs are not supported...line=%r' % (card_name, line)
-        raise CardParseSyntaxError(msg)
+def to_stripped_fields(card_lines, card_name):
+    # type: (List[str], str) -> List[Optional[str]]
+    """
+    Converts the lines of a card into the fields of a BDFCard, which is
+    ``wipe_empty_fields(to_fields(card_lines, card_name))`` in one pass
 
-    if '\t' in line:
-        line = line.expandtabs()
-        if ',' in line:
-            msg = 'tabs and commas in the same line are not supported...line=%r' % line
-            raise CardParseSyntaxError(msg)
+    Returns
+    -------
+    fields : List[str/None]
+        the stripped fields; a blank field is None and the trailing
+        blank fields are removed
 
-    if '*' in line:  # large field
-        if ',' in line:  # csv
-            new_fields = line.split(',')[:5]
-            for i in range(5 - len(new_fields)):
-                new_fields.append('')
-        else:  # standard
-            new_fields = [line[0:8], line[8:24], line[24:40], line[40:56],
-                          line[56:72]]
-        fields += new_fields
-        assert len(fields) == 5, fields
-    else:  # small field
-        if ',' in line:  # csv
-            new_fields = line.split(',')[:9]
-            for i in range(9 - len(new_fields)):
-                new_fields.append('')
-        else:  # standard
-            new_fields = [line[0:8], line[8:16], line[16:24], line[24:32],
-                          line[32:40], line[40:48], line[48:56], line[56:64],
-                          line[64:72]]
-        fields += new_fields
-        assert len(fields) == 9, fields
+    """
+    if card_name == 'MONPNT1' or not _is_small_field_block(card_lines):
+        return wipe_empty_fields(to_fields(card_lines, card_name))
 
-    for j, line in enumerate(card_lines): # continuation lines
-        if '=' in line and card_name != 'EIGRL':
+    line = card_lines[0]
+    fields = [
+        line[0:8].strip() or None, line[8:16].strip() or None,
+        line[16:24].strip() or None, line[24:32].strip() or None,
+        line[32:40].strip() or None, line[40:48].strip() or None,
+        line[48:56].strip() or None, line[56:64].strip() or None,
+        line[64:72].strip() or None]
+    for line in card_lines[1:]:
+        fields += [
+            line[8:16].strip() or None, line[16:24].strip() or None,
+            line[24:32].strip() or None, line[32:40].strip() or None,
+            line[40:48].strip() or None, line[48:56].strip() or None,
+            line[56:64].strip() or None, line[64:72].strip() or None]
+
+    # the first field is kept, even if it's blank
+    while len(fields) > 1 and fields[-1] is None:
+        fields.pop()
+    return fields
+
+def _to_fields_by_line(card_lines, card_name):
+    # type: (List[str], str) -> List[str]
+    """
+    Helper for ``to_fields`` for cards with large field, CSV, or tabbed
+    lines, which may be mixed on a card
+    """
+    fields = []  # type: List[str]
+    for iline, line in enumerate(card_lines):
+        if '=' in line and (iline == 0 or card_name != 'EIGRL'):
             msg = 'card_name=%r\nequal signs are not supported...line=%r' % (card_name, line)
             raise CardParseSyntaxError(msg)
+
         if '\t' in line:
             line = line.expandtabs()
             if ',' in line:
                 msg = 'tabs and commas in the same line are not supported...line=%r' % line
                 raise CardParseSyntaxError(msg)
 
+        # the card name is the first field of the first line; the
+        # continuation marker of the other lines is skipped
         if '*' in line:  # large field
             if ',' in line:  # csv
-                new_fields = line.split(',')[1:5]
-                for i in range(4 - len(new_fields)):
-                    new_fields.append('')
-            else:  # standard
+                ifield0 = 0 if iline == 0 else 1
+                new_fields = line.split(',')[ifield0:5]
+                new_fields += [''] * (5 - ifield0 - len(new_fields))
+            elif iline == 0:  # standard
+                new_fields = [line[0:8], line[8:24], line[24:40], line[40:56], line[56:72]]
+            else:
                 new_fields = [line[8:24], line[24:40], line[40:56], line[56:72]]
-            assert len(new_fields) == 4, new_fields
         else:  # small field
             if ',' in line:  # csv
-                new_fields = line.split(',')[1:9]
-                for i in range(8 - len(new_fields)):
-                    new_fields.append('')
-            else:  # standard
-                new_fields = [line[8:16], line[16:24], line[24:32],
-                              line[32:40], line[40:48], line[48:56],
-                              line[56:64], line[64:72]]
-            if len(new_fields) != 8:
-                nfields = len(new_fields)
-                msg = 'nFields=%s new_fields=%s' % (nfields, new_fields)
-                raise RuntimeError(msg)
-
+                ifield0 = 0 if iline == 0 else 1
+                new_fields = line.split(',')[ifield0:9]
+                new_fields += [''] * (9 - ifield0 - len(new_fields))
+            elif iline == 0:  # standard
+                new_fields = [line[0:8], line[8:16], line[16:24], line[24:32], line[32:40],
+                              line[40:48], line[48:56], line[56:64], line[64:72]]
+            else:
+                new_fields = [line[8:16], line[16:24], line[24:32], line[32:40],
+                              line[40:48], line[48:56], line[56:64], line[64:72]]
         fields += new_fields
-    return fields #[field.strip() for field in fields]
+    return fields
 
 def parse_executive_control_deck(executive_control_lines):
     """Extracts the solution from the executive control deck"""
@@ -1,10 +1,23 @@
 """
 Defines:
- - data_in_material_coord(bdf, op2, in_place=False)
+ - data_in_material_coord(bdf, op2, in_place=False, material_angles=None)
+ - get_material_angles(bdf)
+
+The material angles of the shells only depend on the model, so they may
+be calculated once and reused for multiple OP2s:
+
+.. code-block:: python
+
+   material_angles = get_material_angles(bdf)
+   for op2_filename in op2_filenames:
+       op2 = read_op2(op2_filename)
+       data_in_material_coord(bdf, op2, in_place=True,
+                              material_angles=material_angles)
 
 """
 from __future__ import print_function
 import copy
+from six import iteritems
 
 import numpy as np
 from numpy import cos, sin, cross
@@ -26,9 +39,11 @@ def transf_Mohr(Sxx, Syy, Sxy, thetarad):
     Parameters
     ----------
     Sxx, Syy, Sxy : array-like
-        Sigma_xx, Sigma_yy, Sigma_xy stresses.
+        Sigma_xx, Sigma_yy, Sigma_xy stresses (real or complex).
     thetarad : array-like
         Array with angles for wich the stresses should be transformed.
+        The angles are broadcast against the stresses, so a
+        (nelements, ) array may be used for (ntimes, nelements) stresses.
 
     Returns
     -------
@@ -41,12 +56,17 @@ def transf_Mohr(Sxx, Syy, Sxy, thetarad):
     Sxy = np.asarray(Sxy)
     thetarad = np.asarray(thetarad)
     Scenter = (Sxx + Syy)/2.
-    R = np.sqrt((Sxx - Scenter)**2 + Sxy**2)
-    thetarad_Mohr = np.arctan2(-Sxy, Sxx - Scenter) + 2*thetarad
-    cos_Mohr = cos(thetarad_Mohr)
-    Sxx_theta = Scenter + R*cos_Mohr
-    Syy_theta = Scenter - R*cos_Mohr
-    Sxy_theta = -R*sin(thetarad_Mohr)
+    Sradius = (Sxx - Syy)/2.
+
+    # the angle is typically per element, so the trig functions are
+    # only calculated once for all the time steps; the transform is
+    # linear, so complex stresses are also supported
+    cos_2theta = cos(2*thetarad)
+    sin_2theta = sin(2*thetarad)
+    Smohr = Sradius*cos_2theta + Sxy*sin_2theta
+    Sxx_theta = Scenter + Smohr
+    Syy_theta = Scenter - Smohr
+    Sxy_theta = Sxy*cos_2theta - Sradius*sin_2theta
     return Sxx_theta, Syy_theta, Sxy_theta
 
 
@@ -152,7 +172,139 @@ def calc_imat(normals, csysi):
     return imat
 
 
-def data_in_material_coord(bdf, op2, in_place=False):
+def get_material_angles(bdf):
+    """Calculates the angle of the material x-axis of the 2D elements
+
+    The element normals and the MCID/THETA angles of all the elements are
+    calculated at once from the node locations.
+
+    Parameters
+    ----------
+    bdf : :class:`.BDF` object
+        A :class:`.BDF` object.
+
+    Returns
+    -------
+    eids : (nelements, ) int ndarray
+        the sorted element ids
+    thetarad : (nelements, ) float ndarray
+        the angle from the element x-axis to the material x-axis in radians
+        (0. for elements that aren't 2D elements)
+
+    """
+    nelements = len(bdf.elements)
+    eids = np.zeros(nelements, dtype='int32')
+    thetadeg = np.zeros(nelements, dtype='float64')
+    mcids = np.full(nelements, -1, dtype='int32')
+
+    # the corner nodes of the CQUADx/CTRIAx elements
+    nnodes = np.zeros(nelements, dtype='int32')
+    corner_nids = np.zeros((nelements, 4), dtype='int32')
+    for ielem, (eid, elem) in enumerate(sorted(iteritems(bdf.elements))):
+        eids[ielem] = eid
+        theta_mcid = getattr(elem, 'theta_mcid', None)
+        if theta_mcid is None:
+            continue
+        if isinstance(theta_mcid, integer_types):
+            mcids[ielem] = theta_mcid
+        elif isinstance(theta_mcid, float):
+            thetadeg[ielem] = theta_mcid
+
+        #NOTE separating quad types to get vectorizable "corner"
+        if elem.type in ['CQUAD4', 'CQUAD8', 'CQUADR']:
+            corner_nids[ielem, :] = elem.node_ids[:4]
+            nnodes[ielem] = 4
+        elif elem.type in ['CTRIA3', 'CTRIA6', 'CTRIAR'] and mcids[ielem] >= 0:
+            corner_nids[ielem, :3] = elem.node_ids[:3]
+            nnodes[ielem] = 3
+
+    thetarad = np.deg2rad(thetadeg)
+    is_corner = nnodes > 0
+    if not is_corner.any():
+        return eids, thetarad
+
+    # the location of the corner nodes
+    icd_transform, icp_transform, xyz_cp, nid_cp_cd = bdf.get_displacement_index_xyz_cp_cd()
+    nids = nid_cp_cd[:, 0]
+    xyz_cid0 = bdf.transform_xyzcp_to_xyz_cid(xyz_cp, nids, icp_transform, cid=0)
+    corner_nids = corner_nids[is_corner, :]
+    inodes = np.searchsorted(nids, corner_nids).clip(max=len(nids) - 1)
+    is_missing = (nids[inodes] != corner_nids) & (corner_nids > 0)
+    if is_missing.any():
+        raise RuntimeError('nids=%s are missing' % np.unique(corner_nids[is_missing]))
+    corner = xyz_cid0[inodes, :]
+    g1 = corner[:, 0, :]
+    g2 = corner[:, 1, :]
+    g3 = corner[:, 2, :]
+    g4 = corner[:, 3, :]
+    is_quad = nnodes[is_corner] == 4
+    is_tria = ~is_quad
+
+    normals = np.zeros(g1.shape, dtype='float64')
+    normals[is_quad] = cross(g1[is_quad] - g3[is_quad], g2[is_quad] - g4[is_quad])
+    normals[is_tria] = cross(g1[is_tria] - g2[is_tria], g1[is_tria] - g3[is_tria])
+    normals /= norm(normals, axis=1)[:, np.newaxis]
+
+    # elems with MCID
+    thetarad_corner = thetarad[is_corner]
+    mcids_corner = mcids[is_corner]
+    is_mcids = mcids_corner >= 0
+    if is_mcids.any():
+        unique_mcids, imcids = np.unique(mcids_corner[is_mcids], return_inverse=True)
+        csysi = np.array([bdf.coords[mcid].i for mcid in unique_mcids])[imcids, :]
+        normalsi = normals[is_mcids]
+        imat = calc_imat(normalsi, csysi)
+        g21 = g2[is_mcids] - g1[is_mcids]
+        thetarad_mcid = angle2vec(g21, imat)
+        # getting sign of THETA
+        check_normal = cross(g21, imat)
+        thetarad_mcid *= np.sign((check_normal * normalsi).sum(axis=1))
+        thetarad_corner[is_mcids] = thetarad_mcid
+
+    # the quad x-axis bisects the diagonals
+    g1q = g1[is_quad]
+    g2q = g2[is_quad]
+    betarad = angle2vec(g3[is_quad] - g1q, g2q - g1q)
+    gammarad = angle2vec(g4[is_quad] - g2q, g1q - g2q)
+    alpharad = (betarad + gammarad) / 2.
+    thetarad_corner[is_quad] += alpharad - betarad
+    thetarad[is_corner] = thetarad_corner
+    return eids, thetarad
+
+
+def _get_vector_thetarad(eids, thetarad, veceids, cache):
+    """gets the material angles of the elements of an op2 vector"""
+    key = (veceids.dtype.str, veceids.tobytes())
+    if key in cache:
+        return cache[key]
+    #NOTE assuming thetarad=0 for elements that exist in the op2 but
+    #     not in the supplied bdf file
+    if len(eids):
+        ieids = np.searchsorted(eids, veceids).clip(max=len(eids) - 1)
+        vecthetarad = np.where(eids[ieids] == veceids, thetarad[ieids], 0.)
+    else:
+        vecthetarad = np.zeros(veceids.shape, dtype='float64')
+    cache[key] = vecthetarad
+    return vecthetarad
+
+
+def _transform_plane(data, irows, icolumns, thetarad, is_strain=False):
+    """rotates the xx, yy, xy columns of a (ntimes, nrows, ncolumns) array in place"""
+    ixx, iyy, ixy = icolumns
+    Sxx = data[:, irows, ixx]
+    Syy = data[:, irows, iyy]
+    Sxy = data[:, irows, ixy]
+    if is_strain:
+        # engineering to tensor shear strain
+        Sxy = Sxy / 2.
+    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, thetarad)
+    data[:, irows, ixx] = Sxx_theta
+    data[:, irows, iyy] = Syy_theta
+    data[:, irows, ixy] = Sxy_theta * 2. if is_strain else Sxy_theta
+    return Sxx_theta, Syy_theta, Sxy_theta
+
+
+def data_in_material_coord(bdf, op2, in_place=False, material_angles=None):
     """Convert OP2 2D element outputs to material coordinates
 
     Nastran allows the use of 'PARAM,OMID,YES' to print 2D element forces,
@@ -172,7 +324,10 @@ def data_in_material_coord(bdf, op2, in_place=False):
         A :class:`.OP2` object that corresponds to the 'bdf'.
     in_place : bool; default=False
         If true the original op2 object is modified, otherwise a new one
-        is created.
+        is created, which doesn't share any results with the original.
+    material_angles : (eids, thetarad); default=None
+        the output of ``get_material_angles(bdf)``, which may be reused
+        for multiple op2s; None -> calculated
 
     Returns
     -------
@@ -189,259 +344,69 @@ def data_in_material_coord(bdf, op2, in_place=False):
     else:
         op2_new = copy.deepcopy(op2)
 
-    eids = np.array(list(bdf.elements.keys()))
-    elems = np.array(list(bdf.elements.values()))
-    mcid = np.array([is_mcid(e) for e in elems])
-    elemsmcid = elems[mcid]
-    elemstheta = elems[~mcid]
-
-    thetadeg = np.zeros(elems.shape)
-    thetadeg[~mcid] = np.array([check_theta(e) for e in elemstheta])
-    thetarad = np.deg2rad(thetadeg)
-
-    #NOTE separating quad types to get vectorizable "corner"
-    quad_types = ['CQUAD4', 'CQUAD8', 'CQUADR']
-    for quad_type in quad_types:
-        # elems with THETA
-        thisquad = np.array([quad_type in e.type for e in elemstheta])
-        if np.any(thisquad):
-            quadelems = elemstheta[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp = thetarad[~mcid]
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[~mcid] = tmp
-
-        # elems with MCID
-        thisquad = np.array([quad_type in e.type for e in elemsmcid])
-        if np.any(thisquad):
-            quadelems = elemsmcid[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            normals = np.array([e.Normal() for e in quadelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in quadelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thisquad] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thisquad] *= np.sign((check_normal * normals).sum(axis=1))
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[mcid] = tmp
-
-    tria_types = ['CTRIA3', 'CTRIA6', 'CTRIAR']
-    for tria_type in tria_types:
-        # elems with MCID
-        thistria = np.array([tria_type in e.type for e in elemsmcid])
-        if np.any(thistria):
-            triaelems = elemsmcid[thistria]
-            corner = np.array([e.get_node_positions() for e in triaelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            normals = np.array([e.Normal() for e in triaelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in triaelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thistria] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thistria] *= np.sign((check_normal * normals).sum(axis=1))
-            thetarad[mcid] = tmp
-
-    thetarad = dict([[eid, theta] for eid, theta in zip(eids, thetarad)])
+    if material_angles is None:
+        material_angles = get_material_angles(bdf)
+    eids, thetarad = material_angles
+    vecthetarads = {}
 
     for vecname in force_vectors:
-        op2_vectors = getattr(op2, vecname)
         new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            if veceids.shape[0] == vector.data.shape[1] // 5:
-                steps = [5, 5, 5, 5, 5]
-            else: # assuming  always that veceids.shape[0] == vector.data.shape[1]
-                steps = [1]
-
-            for start, step in enumerate(steps):
-                slicei = slice(start, vector.data.shape[1], step)
-                # membrane terms
-                Sxx = vector.data[:, slicei, 0]
-                Syy = vector.data[:, slicei, 1]
-                Sxy = vector.data[:, slicei, 2]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 0].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 1].real = Syy_theta_real
-                    new_vector.data[:, slicei, 2].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 0].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 1].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 2].imag = Sxy_theta_imag
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 0] = Sxx_theta
-                    new_vector.data[:, slicei, 1] = Syy_theta
-                    new_vector.data[:, slicei, 2] = Sxy_theta
-
-                # bending terms
-                Sxx = vector.data[:, slicei, 3]
-                Syy = vector.data[:, slicei, 4]
-                Sxy = vector.data[:, slicei, 5]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 3].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 4].real = Syy_theta_real
-                    new_vector.data[:, slicei, 5].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 3].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 4].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 5].imag = Sxy_theta_imag
-
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 3] = Sxx_theta
-                    new_vector.data[:, slicei, 4] = Syy_theta
-                    new_vector.data[:, slicei, 5] = Sxy_theta
-
-                # transverse terms
-                Qx = vector.data[:, slicei, 6]
-                Qy = vector.data[:, slicei, 7]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Qx_new_real = cos(vecthetarad)*Qx.real + sin(vecthetarad)*Qy.real
-                    Qy_new_real = -sin(vecthetarad)*Qx.real + cos(vecthetarad)*Qy.real
-                    new_vector.data[:, slicei, 6].real = Qx_new_real
-                    new_vector.data[:, slicei, 7].real = Qy_new_real
-                    Qx_new_imag = cos(vecthetarad)*Qx.imag + sin(vecthetarad)*Qy.imag
-                    Qy_new_imag = -sin(vecthetarad)*Qx.imag + cos(vecthetarad)*Qy.imag
-                    new_vector.data[:, slicei, 6].imag = Qx_new_imag
-                    new_vector.data[:, slicei, 7].imag = Qy_new_imag
-                else:
-                    Qx_new = cos(vecthetarad)*Qx + sin(vecthetarad)*Qy
-                    Qy_new = -sin(vecthetarad)*Qx + cos(vecthetarad)*Qy
-                    new_vector.data[:, slicei, 6] = Qx_new
-                    new_vector.data[:, slicei, 7] = Qy_new
+        for subcase, new_vector in iteritems(new_vectors):
+            data = new_vector.data
+            veceids = get_eids_from_op2_vector(new_vector)
+            vecthetarad = _get_vector_thetarad(eids, thetarad, veceids, vecthetarads)
+            if veceids.shape[0] == data.shape[1] // 5:
+                # the center and the 4 corners of each element
+                vecthetarad = np.repeat(vecthetarad, 5)
+            # else: assuming  always that veceids.shape[0] == vector.data.shape[1]
+
+            irows = slice(None)
+            # membrane terms
+            _transform_plane(data, irows, [0, 1, 2], vecthetarad)
+            # bending terms
+            _transform_plane(data, irows, [3, 4, 5], vecthetarad)
+
+            # transverse terms
+            cos_theta = cos(vecthetarad)
+            sin_theta = sin(vecthetarad)
+            Qx = data[:, :, 6].copy()
+            Qy = data[:, :, 7].copy()
+            data[:, :, 6] = cos_theta*Qx + sin_theta*Qy
+            data[:, :, 7] = -sin_theta*Qx + cos_theta*Qy
 
             #TODO implement transformation for corner nodes
             #     for now we just zero the wrong values
             if 'quad8' in vecname:
                 for j in [1, 2, 3, 4]:
-                    new_vector.data[:, j, :] = 0
-
-    for vecname in stress_vectors:
-        op2_vectors = getattr(op2, vecname)
-        new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
-            check = veceids != 0
-            veceids = veceids[check]
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane stresses
-            if vector.data.shape[2] > 3:
-                Sxx = vector.data[:, :, 1][:, check]
-                Syy = vector.data[:, :, 2][:, check]
-                Sxy = vector.data[:, :, 3][:, check]
-            else:
-                Sxx = vector.data[:, :, 0][:, check]
-                Syy = vector.data[:, :, 1][:, check]
-                Sxy = vector.data[:, :, 2][:, check]
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = Sxx_theta_real
-                tmp.imag = Sxx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = Syy_theta_real
-                tmp.imag = Syy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = Sxy_theta_real
-                tmp.imag = Sxy_theta_imag
-                new_vector.data[:, :, 2][:, check] = tmp
-            else:
-                Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                new_vector.data[:, :, 1][:, check] = Sxx_theta
-                new_vector.data[:, :, 2][:, check] = Syy_theta
-                new_vector.data[:, :, 3][:, check] = Sxy_theta
-                thetadeg_new = thetadeg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
-
-            #TODO implement transformation for corner nodes
-            #     for now we just zero the wrong values
-            if 'quad8' in vecname:
-                for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    new_vector.data[:, i, :] = 0
+                    data[:, j, :] = 0
 
-    for vecname in strain_vectors:
-        op2_vectors = getattr(op2, vecname)
+    for vecname in stress_vectors + strain_vectors:
+        is_strain = vecname in strain_vectors
         new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
+        for subcase, new_vector in iteritems(new_vectors):
+            data = new_vector.data
+            veceids = get_eids_from_op2_vector(new_vector)
             check = veceids != 0
-            veceids = veceids[check]
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane strains
-            if vector.data.shape[2] > 3:
-                exx = vector.data[:, :, 1][:, check]
-                eyy = vector.data[:, :, 2][:, check]
-                exy = vector.data[:, :, 3][:, check] / 2.
+            if check.all():
+                irows = slice(None)
             else:
-                exx = vector.data[:, :, 0][:, check]
-                eyy = vector.data[:, :, 1][:, check]
-                exy = vector.data[:, :, 2][:, check] / 2.
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                exx_theta_real, eyy_theta_real, exy_theta_real = transf_Mohr(exx.real, eyy.real, exy.real, vecthetarad)
-                exx_theta_imag, eyy_theta_imag, exy_theta_imag = transf_Mohr(exx.imag, eyy.imag, exy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = exx_theta_real
-                tmp.imag = exx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = eyy_theta_real
-                tmp.imag = eyy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = exy_theta_real * 2.
-                tmp.imag = exy_theta_imag * 2.
-                new_vector.data[:, :, 2][:, check] = tmp
+                irows = np.where(check)[0]
+                veceids = veceids[check]
+            vecthetarad = _get_vector_thetarad(eids, thetarad, veceids, vecthetarads)
+
+            # bottom and top in-plane stresses/strains
+            is_complex = np.iscomplexobj(data)
+            if data.shape[2] > 3:
+                Sxx_theta, Syy_theta, Sxy_theta = _transform_plane(
+                    data, irows, [1, 2, 3], vecthetarad, is_strain=is_strain)
+                if not is_complex:
+                    data[:, irows, 4] = thetadeg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
             else:
-                exx_theta, eyy_theta, exy_theta = transf_Mohr(exx, eyy, exy, vecthetarad)
-                thetadeg_new = thetadeg_to_principal(exx_theta, eyy_theta, exy_theta)
-                new_vector.data[:, :, 1][:, check] = exx_theta
-                new_vector.data[:, :, 2][:, check] = eyy_theta
-                new_vector.data[:, :, 3][:, check] = exy_theta * 2.
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
+                _transform_plane(data, irows, [0, 1, 2], vecthetarad, is_strain=is_strain)
 
             #TODO implement transformation for corner nodes
             #     for now we just zero the wrong values
             if 'quad8' in vecname:
                 for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    new_vector.data[:, i, :] = 0
+                    data[:, i, :] = 0
     return op2_new
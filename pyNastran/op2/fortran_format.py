@@ -13,6 +13,7 @@ from six.moves import range
 from pyNastran.utils import integer_types
 from pyNastran.op2.errors import FortranMarkerError, SortCodeError
 from pyNastran.utils import object_attributes
+from pyNastran.op2.op2_interface.op2_index import TABLE3_KEYS
 
 # this is still a requirement, but disabling it so readthedocs works
 if sys.version_info < (2, 7, 7):
@@ -36,6 +37,13 @@ class FortranFormat(object):
         self._endian = None
         self._table_mapper = {}
 
+        #: a memoryview of the memory-mapped OP2; None -> standard file reads
+        self._mmap_view = None
+
+        #: the OP2TableIndex of the table that is being read;
+        #: set during the array sizing pass when the OP2Index is used
+        self._table_index = None
+
         #: stores if the user entered [] for iSubcases
         self.is_all_subcases = True
         self.valid_subcases = []
@@ -224,24 +232,30 @@ class FortranFormat(object):
             the data in binary
 
         """
-        data_out = b''
+        data_out = []
         for unused_i in range(3):
             data = self.f.read(4)
             ndata, = self.struct_i.unpack(data)
 
-            data_out += self.f.read(ndata)
+            data_out.append(self.f.read(ndata))
             data = self.f.read(4)
             self.n += 8 + ndata
-        return data_out
+        return b''.join(data_out)
 
-    def _read_block_ndata(self):
+    def _read_block_ndata(self, zero_copy=False):
         """
         Reads a block following a pattern of:
             [nbytes, data, nbytes]
 
+        Parameters
+        ----------
+        zero_copy : bool; default=False
+            True : return a memoryview of the memory-mapped file instead
+                   of copying the data (requires use_mmap=True)
+
         Returns
         -------
-        data : bytes
+        data : bytes / memoryview
             the data in binary
         ndata : int
             len(data)
@@ -250,8 +264,13 @@ class FortranFormat(object):
         data = self.f.read(4)
         ndata, = self.struct_i.unpack(data)
 
-        data_out = self.f.read(ndata)
-        data = self.f.read(4)
+        if zero_copy and self._mmap_view is not None:
+            i = self.f.tell()
+            data_out = self._mmap_view[i:i + ndata]
+            self.f.seek(i + ndata + 4)
+        else:
+            data_out = self.f.read(ndata)
+            data = self.f.read(4)
         self.n += 8 + ndata
         return data_out, ndata
 
@@ -424,6 +443,51 @@ class FortranFormat(object):
         if self.is_debug_file:
             self.binary_debug.write('***isubtable = %i\n' % self.isubtable)
             self.binary_debug.write('---markers = [-3, 1, 0]---\n')
+        table3_parser, table4_parser, passer = self._get_table_parsers()
+
+        # we need to check the marker, so we read it and rewind, so we don't
+        # screw up our positioning in the file
+        markers = self.get_nmarkers(1, rewind=True)
+        if self.is_debug_file:
+            self.binary_debug.write('---marker0 = %s---\n' % markers)
+
+        # while the subtables aren't done
+        while markers[0] != 0:
+            self.is_start_of_subtable = True
+            if self.is_debug_file:
+                self.binary_debug.write('***isubtable = %i\n' % self.isubtable)
+            if self._table_index is not None:
+                self._read_subtable_3_4_indexed(table3_parser, table4_parser, passer)
+            else:
+                self._read_subtable_3_4(table3_parser, table4_parser, passer)
+            #force_table4 = self._read_subtable_3_4(table3_parser, table4_parser, passer)
+            self.isubtable -= 1
+            self.read_markers([self.isubtable, 1, 0])
+            markers = self.get_nmarkers(1, rewind=True)
+        if self.is_debug_file:
+            self.binary_debug.write('breaking on marker=%r\n' % str(markers))
+
+        # we've finished reading all subtables, but have one last marker to read
+        self.read_markers([0])
+        self._finish()
+
+    def _finish(self):
+        raise NotImplementedError('overwrite this')
+
+    def _get_table_parsers(self):
+        """
+        Gets the parsing functions for the current table
+
+        Returns
+        -------
+        table3_parser : function / None
+            the table 3 reading function
+        table4_parser : function / None
+            the table 4 reading function
+        passer : bool
+            flag to see if we're skipping tables
+
+        """
         table_mapper = self._get_table_mapper()
 
         # get the parsing functions (table3_parser, table4_parser)
@@ -450,33 +514,68 @@ class FortranFormat(object):
             table4_parser = None
             passer = True
 
-        # we need to check the marker, so we read it and rewind, so we don't
-        # screw up our positioning in the file
-        markers = self.get_nmarkers(1, rewind=True)
-        if self.is_debug_file:
-            self.binary_debug.write('---marker0 = %s---\n' % markers)
+        return table3_parser, table4_parser, passer
 
-        # while the subtables aren't done
-        while markers[0] != 0:
-            self.is_start_of_subtable = True
-            if self.is_debug_file:
-                self.binary_debug.write('***isubtable = %i\n' % self.isubtable)
-            self._read_subtable_3_4(table3_parser, table4_parser, passer)
-            #force_table4 = self._read_subtable_3_4(table3_parser, table4_parser, passer)
-            self.isubtable -= 1
-            self.read_markers([self.isubtable, 1, 0])
-            markers = self.get_nmarkers(1, rewind=True)
-        if self.is_debug_file:
-            self.binary_debug.write('breaking on marker=%r\n' % str(markers))
+    def _read_subtables_from_index(self, records):
+        """
+        Reads a series of subtables using the record locations that were
+        found during the array sizing pass (or loaded from an index file),
+        so we don't need to rescan the markers of the table.
 
-        # we've finished reading all subtables, but have one last marker to read
-        self.read_markers([0])
+        Parameters
+        ----------
+        records : List[(isubtable, n, record_len, table3_info), ...]
+            the location/length of the table3/table4 records
+            (see ``OP2TableIndex``)
+
+        """
+        self._table4_count = 0
+        self.is_table_1 = True
+        self._data_factor = 1
+
+        table3_parser, table4_parser, passer = self._get_table_parsers()
+        if not passer:
+            is_valid_subcase = True
+            for isubtable, n, record_len, table3_info in records:
+                if table3_info is not None:
+                    # we know the subcase of the table3/table4 pair, so we
+                    # don't need to read either record for skipped subcases
+                    isubcase = table3_info[0]
+                    is_valid_subcase = (
+                        self.is_all_subcases or isubcase is None or
+                        isubcase in self.valid_subcases)
+                if not is_valid_subcase:
+                    continue
+
+                self.is_start_of_subtable = True
+                self.isubtable = isubtable
+                if self.is_debug_file:
+                    self.binary_debug.write('***isubtable = %i (indexed)\n' % self.isubtable)
+                self._goto(n)
+                self._read_subtable_3_4(table3_parser, table4_parser, passer,
+                                        record_len=record_len, from_index=True)
         self._finish()
 
-    def _finish(self):
-        raise NotImplementedError('overwrite this')
+    def _read_subtable_3_4_indexed(self, table3_parser, table4_parser, passer):
+        """
+        Reads a subtable 3/4 record and stores its location in the current
+        OP2TableIndex.  See ``_read_subtable_3_4``.
 
-    def _read_subtable_3_4(self, table3_parser, table4_parser, passer):
+        """
+        n = self.n
+        record_len = self._get_record_length()
+        flag = self._read_subtable_3_4(table3_parser, table4_parser, passer,
+                                       record_len=record_len)
+
+        table3_info = None
+        if record_len == 584 and not passer:
+            data_code = self.data_code if hasattr(self, 'data_code') else {}
+            table3_info = tuple([data_code.get(key) for key in TABLE3_KEYS])
+        self._table_index.add_record(self.isubtable, n, record_len, table3_info)
+        return flag
+
+    def _read_subtable_3_4(self, table3_parser, table4_parser, passer, record_len=None,
+                           from_index=False):
         """
         Reads a series of subtable 3/4
 
@@ -490,6 +589,13 @@ class FortranFormat(object):
             function : the table 4 reading function
         passer : bool
             flag to see if we're skipping tables
+        record_len : int; default=None
+            the length of the record, which is known when reading from
+            an OP2Index (None -> calculate it)
+        from_index : bool; default=False
+            the record was found with an OP2Index, so the file position
+            after the record doesn't matter and skipped data doesn't need
+            to be walked
 
         Returns
         -------
@@ -502,7 +608,8 @@ class FortranFormat(object):
         if self.binary_debug:
             self.binary_debug.write('-' * 60 + '\n')
         # this is the length of the current record inside table3/table4
-        record_len = self._get_record_length()
+        if record_len is None:
+            record_len = self._get_record_length()
         if self.is_debug_file:
             self.binary_debug.write('record_length = %s\n' % record_len)
 
@@ -531,18 +638,20 @@ class FortranFormat(object):
                     #print("code = ", self._get_code())
         else:
             if passer or not self.is_valid_subcase():
-                data = self._skip_record()
+                if not from_index:
+                    data = self._skip_record()
             else:
                 if hasattr(self, 'num_wide'):
                     # num_wide is the result size and is usually found in
                     # table3, but some B-list tables don't have it
-                    unused_n = self._read_subtable_results(table4_parser, record_len)
+                    unused_n = self._read_subtable_results(table4_parser, record_len,
+                                                           from_index=from_index)
                 else:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
                 #del n
 
-    def _read_subtable_results(self, table4_parser, record_len):
+    def _read_subtable_results(self, table4_parser, record_len, from_index=False):
         """
         # if reading the data
         # 1 - 1st pass to size the array (vectorized)
@@ -554,6 +663,9 @@ class FortranFormat(object):
             the parser function for table 4
         record_len : int
             the length of the record block
+        from_index : bool; default=False
+            the record was found with an OP2Index, so the array
+            sizing pass doesn't need to walk the record
 
         Returns
         -------
@@ -577,7 +689,7 @@ class FortranFormat(object):
                     assert isinstance(n, integer_types), self.table_name
                     datai = data[n:]
             else:
-                data, ndata = self._read_record_ndata()
+                data, ndata = self._read_record_ndata(zero_copy=True)
                 n = table4_parser(data, ndata)
                 assert isinstance(n, integer_types), self.table_name
 
@@ -608,6 +720,8 @@ class FortranFormat(object):
             else:
                 if self.table_name in [b'R1TABRG', b'ONRGY1']:
                     data, ndata = self._read_record_ndata()
+                elif from_index:
+                    data, ndata = None, record_len
                 else:
                     data, ndata = self._skip_record_ndata()
                 n = table4_parser(data, ndata)
@@ -903,13 +1017,23 @@ class FortranFormat(object):
         """
         return self._read_record_ndata(stream, debug, macro_rewind)[0]
 
-    def _read_record_ndata(self, stream=False, debug=True, macro_rewind=False):
-        """reads a record and the length of the record"""
+    def _read_record_ndata(self, stream=False, debug=True, macro_rewind=False,
+                           zero_copy=False):
+        """
+        reads a record and the length of the record
+
+        Parameters
+        ----------
+        zero_copy : bool; default=False
+            True : a single block record is returned as a memoryview of the
+                   memory-mapped file (requires use_mmap=True)
+
+        """
         markers0 = self.get_nmarkers(1, rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [4, %i, 4]; macro_rewind=%s\n' % (
                 markers0[0], macro_rewind))
-        record, nrecord = self._read_block_ndata()
+        record, nrecord = self._read_block_ndata(zero_copy=zero_copy)
 
         if self.is_debug_file and debug:
             msg = 'read_record - record = [%i, recordi, %i]; macro_rewind=%s\n' % (
@@ -927,7 +1051,7 @@ class FortranFormat(object):
                 markers1 = self.get_nmarkers(1, rewind=False)
                 if self.is_debug_file and debug:
                     self.binary_debug.write('read_record - markers1 = [4, %i, 4]\n' % markers1[0])
-                recordi, nrecordi = self._read_block_ndata()
+                recordi, nrecordi = self._read_block_ndata(zero_copy=zero_copy)
                 nrecord += nrecordi
                 records.append(recordi)
                 #record += recordi
@@ -0,0 +1,249 @@
+"""
+Defines:
+ - get_load_combinations(results, coefficients, subcases=None,
+                         combination_ids=None)
+ - iter_load_combinations(results, coefficients, subcases=None,
+                          combination_ids=None, chunk_size=100)
+ - set_plate_principal(data, is_strain=False, is_von_mises=True)
+
+A load combination is a linear combination of the results of a set of
+subcases (e.g., 1.5*subcase 3 + 1.0*subcase 7).  The coefficients are
+a (ncombinations, nsubcases) dense or scipy.sparse matrix, so the
+combinations of a result are calculated by one matrix multiplication:
+
+.. code-block:: python
+
+   combined_data = coefficients.dot(data)
+
+   # data          : (nsubcases, ntimes * ntotal * ncolumns)
+   # combined_data : (ncombinations, ntimes * ntotal * ncolumns)
+
+The derived columns (e.g., the principal and von Mises stresses of a
+RealPlateStressArray) aren't linear, so they're recalculated from the
+combined components.
+
+Supported results:
+ - RealTableArray : e.g., RealDisplacementArray, RealSPCForcesArray
+ - RealGridPointForcesArray
+ - RealPlateArray : RealPlateStressArray, RealPlateStrainArray
+
+"""
+from __future__ import print_function, division
+import copy
+from collections import OrderedDict
+from six import iteritems
+
+import numpy as np
+import scipy.sparse
+
+from pyNastran.op2.result_objects.table_object import RealTableArray
+from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
+from pyNastran.op2.tables.oes_stressStrain.real.oes_plates import RealPlateArray
+
+#: the attributes that map the rows of the data to the nodes/elements;
+#: they must be the same for each subcase and are shared by the
+#: combined results
+INDEX_NAMES = ['node_gridtype', 'gridtype_str', 'node_element', 'element_names',
+               'element_node', 'element']
+
+
+def get_load_combinations(results, coefficients, subcases=None, combination_ids=None):
+    """
+    Gets the load combinations of a result
+
+    Parameters
+    ----------
+    results : Dict[isubcase] = result
+        the results of a type (e.g., model.cquad4_stress)
+    coefficients : (ncombinations, nsubcases) float ndarray / scipy.sparse matrix
+        the load factors of the subcases of each combination
+    subcases : List[isubcase]; default=None -> all
+        the subcases that are the columns of coefficients
+    combination_ids : List[int]; default=None -> 1, 2, ..., ncombinations
+        the ids of the combinations (the isubcase of the new results)
+
+    Returns
+    -------
+    combinations : Dict[combination_id] = result
+        the combined results
+
+    """
+    return OrderedDict(iter_load_combinations(
+        results, coefficients, subcases=subcases, combination_ids=combination_ids,
+        chunk_size=None))
+
+
+def iter_load_combinations(results, coefficients, subcases=None, combination_ids=None,
+                           chunk_size=100):
+    """
+    Iterates over the load combinations of a result, so only chunk_size
+    combinations are in memory
+
+    Parameters
+    ----------
+    results : Dict[isubcase] = result
+        the results of a type (e.g., model.cquad4_stress)
+    coefficients : (ncombinations, nsubcases) float ndarray / scipy.sparse matrix
+        the load factors of the subcases of each combination
+    subcases : List[isubcase]; default=None -> all
+        the subcases that are the columns of coefficients
+    combination_ids : List[int]; default=None -> 1, 2, ..., ncombinations
+        the ids of the combinations (the isubcase of the new results)
+    chunk_size : int; default=100
+        the number of combinations that are calculated by a matrix
+        multiplication; None -> all
+
+    Yields
+    ------
+    combination_id : int
+        the id of the combination
+    result : varies
+        the combined result (e.g., a RealPlateStressArray), which
+        shares the node/element ids with the results of the subcases
+
+    """
+    if subcases is None:
+        subcases = list(results.keys())
+    objs = [results[isubcase] for isubcase in subcases]
+    if not objs:
+        raise ValueError('no subcases were found')
+    obj = objs[0]
+    icolumns = _get_linear_columns(obj)
+
+    if scipy.sparse.issparse(coefficients):
+        coefficients = scipy.sparse.csr_matrix(coefficients, dtype=obj.data.dtype)
+    else:
+        coefficients = np.atleast_2d(np.asarray(coefficients, dtype=obj.data.dtype))
+    ncombinations, nsubcases = coefficients.shape
+    if nsubcases != len(objs):
+        raise ValueError('coefficients.shape=%s; expected %s subcases' % (
+            str(coefficients.shape), len(objs)))
+
+    if combination_ids is None:
+        combination_ids = np.arange(1, ncombinations + 1)
+    if len(combination_ids) != ncombinations:
+        raise ValueError('ncombination_ids=%s; expected %s' % (
+            len(combination_ids), ncombinations))
+    if chunk_size is None:
+        chunk_size = max(ncombinations, 1)
+
+    # the (nsubcases, ntimes * ntotal * ncolumns) matrix of the linear columns
+    data = _stack_subcases(objs, subcases, icolumns)
+    data_shape = obj.data.shape[:2] + (len(icolumns),)
+
+    for i0 in range(0, ncombinations, chunk_size):
+        combined = coefficients[i0:i0 + chunk_size].dot(data)
+        ncombinationsi = combined.shape[0]
+        combined = combined.reshape((ncombinationsi, ) + data_shape)
+        if len(icolumns) != obj.data.shape[2]:
+            combined_data = np.empty((ncombinationsi, ) + obj.data.shape, dtype=obj.data.dtype)
+            combined_data[:, :, :, icolumns] = combined
+            _set_derived_columns(obj, combined_data)
+            combined = combined_data
+
+        for combination_id, datai in zip(combination_ids[i0:i0 + chunk_size], combined):
+            yield combination_id, _get_combined_result(obj, combination_id, datai)
+
+
+def _get_linear_columns(obj):
+    """gets the columns of the data that are combined"""
+    if isinstance(obj, RealPlateArray):
+        # [oxx, oyy, txy]; the fiber distance and the principal stresses
+        # are set by _set_derived_columns
+        return [1, 2, 3]
+    elif isinstance(obj, (RealTableArray, RealGridPointForcesArray)):
+        return list(range(obj.data.shape[2]))
+    raise NotImplementedError('load combinations of %s are not supported' % obj.class_name)
+
+
+def _stack_subcases(objs, subcases, icolumns):
+    """
+    Gets the (nsubcases, ntimes * ntotal * ncolumns) matrix of the data
+    that's combined
+    """
+    obj = objs[0]
+    nvalues = obj.data[:, :, icolumns].size
+    data = np.empty((len(objs), nvalues), dtype=obj.data.dtype)
+    for i, (isubcase, objb) in enumerate(zip(subcases, objs)):
+        if objb.class_name != obj.class_name or objb.data.shape != obj.data.shape:
+            raise ValueError('subcase=%r: %s data.shape=%s; expected %s data.shape=%s' % (
+                isubcase, objb.class_name, str(objb.data.shape),
+                obj.class_name, str(obj.data.shape)))
+        for name in INDEX_NAMES:
+            if hasattr(obj, name) and not np.array_equal(getattr(obj, name),
+                                                         getattr(objb, name)):
+                raise ValueError('subcase=%r: %s is different than subcase=%r' % (
+                    isubcase, name, subcases[0]))
+        data[i, :] = objb.data[:, :, icolumns].ravel()
+    return data
+
+
+def _set_derived_columns(obj, data):
+    """sets the columns that aren't linear for a chunk of combinations"""
+    if isinstance(obj, RealPlateArray):
+        # the fiber distance isn't a function of the load
+        data[:, :, :, 0] = obj.data[:, :, 0]
+        set_plate_principal(data, is_strain=obj.is_strain, is_von_mises=obj.is_von_mises)
+    else:  # pragma: no cover
+        raise NotImplementedError(obj.class_name)
+
+
+def set_plate_principal(data, is_strain=False, is_von_mises=True):
+    """
+    Calculates the angle, principal, and von Mises/max shear columns of
+    plate stresses/strains from oxx, oyy, and txy (in place)
+
+    Parameters
+    ----------
+    data : (..., 8) float ndarray
+        [fiber_dist, oxx, oyy, txy, angle, omax, omin, ovm/max_shear]
+    is_strain : bool; default=False
+        txy is the engineering shear strain (exy)
+    is_von_mises : bool; default=True
+        von Mises or max shear
+
+    """
+    oxx = data[..., 1]
+    oyy = data[..., 2]
+    txy = data[..., 3]
+    if is_strain:
+        txy = txy / 2.
+    half_diff = (oxx - oyy) / 2.
+    ocenter = oyy + half_diff
+    radius = np.hypot(half_diff, txy)
+
+    # 2*theta = atan2(2*txy, oxx - oyy)
+    angle = np.arctan2(txy, half_diff)
+    np.degrees(angle, out=angle)
+    angle *= 0.5
+    data[..., 4] = angle
+    data[..., 5] = ocenter + radius
+    data[..., 6] = ocenter - radius
+
+    if is_von_mises:
+        # omax^2 - omax*omin + omin^2 = ocenter^2 + 3*radius^2
+        ovm = np.sqrt(ocenter ** 2 + 3. * radius ** 2)
+        if is_strain:
+            ovm *= 2. / 3.
+        data[..., 7] = ovm
+    elif is_strain:
+        # max shear strain is an engineering strain
+        data[..., 7] = 2. * radius
+    else:
+        data[..., 7] = radius
+
+
+def _get_combined_result(obj, combination_id, data):
+    """creates a result with the data of a combination"""
+    result = copy.copy(obj)
+    for name, value in iteritems(obj.__dict__):
+        if isinstance(value, list):
+            # e.g., the lsdvmns, _ntotals
+            setattr(result, name, list(value))
+    result.data_code = copy.deepcopy(obj.data_code)
+    result.data_code['isubcase'] = combination_id
+    result.isubcase = combination_id
+    result._times = obj._times.copy()
+    result.data = data
+    result.data_frame = None
+    return result
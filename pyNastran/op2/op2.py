@@ -5,18 +5,33 @@ Defines the main OP2 class.  Defines:
  - read_op2(op2_filename=None, combine=True, subcases=None,
             exclude_results=None, include_results=None,
             log=None, debug=True, debug_file=None, build_dataframe=None,
-            skip_undefined_matrices=True, mode='msc', encoding=None)
+            skip_undefined_matrices=True, mode='msc', encoding=None,
+            use_index=False, index_filename=None, use_mmap=False,
+            nworkers=1, lazy=False, memmap_dir=None)
+
+ - iter_op2_results(op2_filename, result_names=None, subcases=None,
+                    log=None, debug=False, mode='msc', encoding=None,
+                    index_filename=None)
 
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
    - combine_results(combine=True)
    - create_objects_from_matrices()
+   - get_envelope(result_name, subcases=None)
+   - get_load_combinations(result_name, coefficients, subcases=None,
+                           combination_ids=None)
+   - iter_load_combinations(result_name, coefficients, subcases=None,
+                            combination_ids=None, chunk_size=100)
    - object_attributes(mode='public', keys_to_skip=None)
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
+   - remove_memmap_files()
    - read_op2(op2_filename=None, combine=True, build_dataframe=None,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, use_index=False,
+              index_filename=None, use_mmap=False, nworkers=1, lazy=False,
+              memmap_dir=None)
    - set_mode(mode)
+   - transform_results_to_global(nodal_transform, include_gpforce=True)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
 
@@ -25,7 +40,9 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
 import sys
+import weakref
 from copy import deepcopy
+from collections import OrderedDict
 from six import iterkeys, iteritems, string_types, itervalues, b
 from six.moves.cPickle import load, dump
 
@@ -41,12 +58,42 @@ from pyNastran.op2.errors import SortCodeError, DeviceCodeError, FortranMarkerEr
 #from pyNastran.op2.op2_interface.op2_writer import OP2Writer
 from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.op2_index import OP2Index, OP2TableIndex, read_op2_index
+from pyNastran.op2.op2_interface.op2_parallel import (
+    get_parallel_tasks, read_results_parallel, is_independent_table, IS_CONCURRENT)
+from pyNastran.op2.op2_interface.op2_lazy import set_lazy_results, is_lazy
+
+
+#: the weak references that delete the memmap_dir files of an OP2
+#: (keyed by id because an OP2 isn't hashable)
+_MEMMAP_CLEANUPS = {}
+
+
+def _remove_files(filenames):
+    """deletes the files and empties the list"""
+    for filename in filenames:
+        try:
+            os.remove(filename)
+        except OSError:  # pragma: no cover
+            # e.g., the file is still mapped on Windows
+            pass
+    del filenames[:]
+
+
+def _get_memmap_cleanup(filenames):
+    """gets the weak reference callback that deletes the memmap files of an OP2"""
+    def _cleanup(ref):
+        _MEMMAP_CLEANUPS.pop(id(ref), None)
+        _remove_files(filenames)
+    return _cleanup
 
 
 def read_op2(op2_filename=None, combine=True, subcases=None,
              exclude_results=None, include_results=None,
              log=None, debug=True, debug_file=None, build_dataframe=None,
-             skip_undefined_matrices=True, mode='msc', encoding=None):
+             skip_undefined_matrices=True, mode='msc', encoding=None,
+             use_index=False, index_filename=None, use_mmap=False, nworkers=1,
+             lazy=False, memmap_dir=None):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -79,6 +126,28 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    use_index : bool; default=False
+        True : the array sizing pass stores the table/record locations,
+               so the array filling pass reads only the result records
+               instead of rescanning the file
+    index_filename : str; default=None
+        an OP2 sidecar index file (implies use_index=True)
+        If the file exists and matches the OP2, the file scan is skipped;
+        otherwise, the index is written after the OP2 is read.
+    use_mmap : bool; default=False
+        True : memory-maps the OP2, so the result records are parsed
+               directly from the mapped pages without being copied
+    nworkers : int; default=1
+        the number of processes used to read the result tables
+        (implies use_index=True for nworkers > 1)
+    lazy : bool; default=False
+        True : the result objects are created, but their data is read
+               the first time it's accessed (implies use_index=True)
+    memmap_dir : str; default=None
+        a scratch directory for the result data arrays, which are
+        stored as memory-mapped files (np.memmap), so results that are
+        larger than the available memory can be read; the files are
+        deleted with the OP2
 
     Returns
     -------
@@ -107,7 +176,9 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, use_index=use_index, index_filename=index_filename,
+                   use_mmap=use_mmap, nworkers=nworkers, lazy=lazy,
+                   memmap_dir=memmap_dir)
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
     ## doesn't support F06 writer
@@ -120,6 +191,188 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
     return model
 
 
+def iter_op2_results(op2_filename, result_names=None, subcases=None,
+                     log=None, debug=False, mode='msc', encoding=None,
+                     index_filename=None):
+    """
+    Reads the results of an OP2 one time step (mode, frequency, load step)
+    at a time, so the memory doesn't grow with the number of time steps.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    result_names : List[str] / str; default=None -> all results
+        the results to read (e.g., 'displacements', 'stress');
+        see ``OP2.set_results``
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    log : Log()
+        a logging object to write debug messages to
+    debug : bool; default=False
+        enables the debug log and sets the debug in the logger
+    mode : str; default='msc'
+        the version of the Nastran you're using
+        {nx, msc}
+    encoding : str
+        the unicode encoding (default=None; system default)
+    index_filename : str; default=None
+        an OP2 sidecar index file (see ``OP2.read_op2``);
+        the OP2 is scanned once to find the records if the index
+        doesn't exist
+
+    Yields
+    ------
+    result_name : str
+        the result type (e.g., 'displacements', 'cquad4_stress')
+    isubcase : int
+        the subcase id
+    itime : int
+        the index of the first time step/mode/frequency of obj in the
+        subcase
+    obj : result object
+        the result (e.g., RealDisplacementArray) for a single time step
+        (e.g., obj.data.shape = (1, nnodes, 6)); SORT2 results have all
+        the time steps, so obj.ntimes > 1
+
+    Examples
+    --------
+    >>> max_disp = 0.
+    >>> for result_name, isubcase, itime, obj in iter_op2_results(
+    ...         'transient.op2', result_names='displacements'):
+    ...     max_disp = max(max_disp, np.abs(obj.data[0, :, :3]).max())
+
+    .. note :: only the result tables (e.g., OUGV1, OES1X1, OEF1X, OGPFB1)
+               are read; use ``read_op2`` for the geometry, eigenvalues, and
+               matrices.  A result table without table3/table4 records
+               can't be streamed, so it's skipped with a warning.
+
+    """
+    model = OP2(log=log, debug=debug, mode=mode)
+    model.set_subcases(subcases)
+    if result_names:
+        model.set_results(result_names)
+    if encoding is None:
+        encoding = sys.getdefaultencoding()
+    model.encoding = encoding
+    model.is_vectorized = True
+
+    op2_filename = model._validate_op2_filename(op2_filename)
+    model.op2_filename = op2_filename
+    op2_index = None
+    if index_filename is not None:
+        op2_index = read_op2_index(index_filename, op2_filename, log=model.log)
+    if op2_index is None:
+        # find the records with an array sizing pass
+        model.op2_index = OP2Index()
+        model.read_mode = 1
+        model._close_op2 = True
+        OP2_Scalar.read_op2(model, op2_filename=op2_filename)
+        op2_index = model.op2_index
+        if index_filename is not None:
+            op2_index.write(index_filename, op2_filename)
+
+    # open the file and read the header; the model (and the open file) is
+    # reused for each time step
+    table_types = model.get_table_types()
+    model.op2_index = OP2Index()
+    model.op2_index.is_complete = True
+    model.read_mode = 1
+    model._close_op2 = False
+    OP2_Scalar.read_op2(model, op2_filename=op2_filename)
+
+    itimes = {}
+    try:
+        for table_index in op2_index.tables:
+            if not is_independent_table(table_index, check_name=False):
+                if table_index.is_results and table_index.records:
+                    model.log.warning(
+                        '%r cannot be streamed; use read_op2' % table_index.table_name)
+                continue
+            steps = [
+                records for records in _get_subtable_records(table_index.records)
+                if model.is_all_subcases or records[0][3][0] in model.valid_subcases]
+            if not steps:
+                continue
+
+            # a SORT2 table3/table4 pair has all the time steps of a single
+            # node/element, so the pairs of a result are read together
+            _read_op2_records(model, table_index, steps[0], read_modes=[1])
+            is_sort2 = any(
+                not obj.is_sort1 for result_type in table_types
+                for obj in itervalues(getattr(model, result_type)))
+            if is_sort2:
+                steps = _get_sort2_records(steps)
+
+            for records in steps:
+                # the array sizing pass creates the objects of the results
+                # that are saved, so the array filling pass may be skipped
+                _read_op2_records(model, table_index, records, read_modes=[1])
+                if not any(getattr(model, result_type) for result_type in table_types):
+                    continue
+                _read_op2_records(model, table_index, records, read_modes=[2])
+
+                isubcase = records[0][3][0]
+                for result_type in table_types:
+                    for key, obj in iteritems(getattr(model, result_type)):
+                        if hasattr(obj, 'finalize'):
+                            obj.finalize()
+                        itime = itimes.get((result_type, key), 0)
+                        itimes[(result_type, key)] = itime + getattr(obj, 'ntimes', 1)
+                        yield result_type, isubcase, itime, obj
+    finally:
+        model._close_op2_file()
+        del model.f
+
+
+def _read_op2_records(model, table_index, records, read_modes):
+    """
+    Reads some of the table3/table4 records of a result table from the
+    open OP2; the array sizing pass clears the previous result objects
+    """
+    step_table_index = OP2TableIndex(table_index.table_name, table_index.n)
+    step_table_index.is_results = True
+    step_table_index.subtable_name = table_index.subtable_name
+    step_table_index.count = table_index.count
+    step_table_index.records = records
+    op2_index = OP2Index()
+    op2_index.tables = [step_table_index]
+    op2_index.is_complete = True
+    for read_mode in read_modes:
+        if read_mode == 1:
+            for result_type in model.get_table_types():
+                getattr(model, result_type).clear()
+        model.read_mode = read_mode
+        model._setup_op2()
+        model._read_tables_from_index(op2_index)
+
+
+def _get_subtable_records(records):
+    """
+    Splits the records of a result table into table3/table4 groups
+    (a time step of a single element type)
+    """
+    subtable_records = []
+    for record in records:
+        if record[0] % 2 == 1:
+            subtable_records.append([])
+        subtable_records[-1].append(record)
+    return subtable_records
+
+
+def _get_sort2_records(subtable_records):
+    """
+    Combines the table3/table4 groups of a SORT2 table that have the same
+    subcase, table_code and element_type
+    """
+    sort2_records = OrderedDict()
+    for records in subtable_records:
+        isubcase, unused_analysis_code, table_code, element_type = records[0][3][:4]
+        key = (isubcase, table_code, element_type)
+        sort2_records.setdefault(key, []).extend(records)
+    return list(sort2_records.values())
+
+
 #class OP2(OP2_Scalar, OP2Writer):
 class OP2(OP2_Scalar):
 
@@ -512,7 +765,9 @@ class OP2(OP2_Scalar):
         #self.ask = ask
 
     def read_op2(self, op2_filename=None, combine=True, build_dataframe=None,
-                 skip_undefined_matrices=False, encoding=None):
+                 skip_undefined_matrices=False, encoding=None, use_index=False,
+                 index_filename=None, use_mmap=False, nworkers=1, lazy=False,
+                 memmap_dir=None):
         """
         Starts the OP2 file reading
 
@@ -530,6 +785,44 @@ class OP2(OP2_Scalar):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        use_index : bool; default=False
+            True : the array sizing pass stores the table/record locations
+                   (self.op2_index), so the array filling pass jumps straight
+                   to the result records instead of rescanning the file
+            False : the file is scanned twice
+        index_filename : str; default=None
+            an OP2 sidecar index file (implies use_index=True)
+            If the file exists and matches the OP2, the table/record
+            locations are loaded from it and the file scan is skipped;
+            otherwise, the index is written after the OP2 is read.
+        use_mmap : bool; default=False
+            True : memory-maps the OP2, so the result records are parsed
+                   directly from the mapped pages without being copied
+            False : the OP2 is read with standard file reads
+        nworkers : int; default=1
+            the number of processes used to read the result tables
+            (implies use_index=True for nworkers > 1)
+            The result tables (e.g., OUGV1, OES1X1) and the subcases of
+            each table are split between a pool of processes for the array
+            filling pass.  The other tables are read by this process.
+            Requires concurrent.futures (Python 3 or the futures package).
+        lazy : bool; default=False
+            True : only the array sizing pass is run for the result tables
+                   (implies use_index=True).  The result objects (e.g.,
+                   displacements, cquad4_stress) are created, but their
+                   arrays (e.g., data, element_node) are read from the OP2
+                   the first time they're accessed, so the OP2 must not be
+                   moved or changed.  nworkers is ignored.
+        memmap_dir : str; default=None
+            a scratch directory for the result data arrays (e.g.,
+            displacements[1].data), which is created if it doesn't exist
+            None : the result data arrays are stored in memory
+            str : the data arrays are memory-mapped files (np.memmap) in
+                  the directory, so results that are larger than the
+                  available memory can be read and sliced.  The files
+                  are owned by the OP2 and are deleted when it's garbage
+                  collected or ``remove_memmap_files`` is called.
+                  nworkers is ignored.
 
         """
         if build_dataframe is None:
@@ -546,8 +839,30 @@ class OP2(OP2_Scalar):
         self.is_vectorized = True
         self.log.debug('combine=%s' % combine)
         self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
+        self.memmap_dir = memmap_dir
+        if memmap_dir is not None:
+            if not os.path.exists(memmap_dir):
+                os.makedirs(memmap_dir)
+            ref = weakref.ref(self, _get_memmap_cleanup(self._memmap_filenames))
+            _MEMMAP_CLEANUPS[id(ref)] = ref
+            # the workers would send the arrays back through memory
+            nworkers = 1
+        if nworkers > 1 and not IS_CONCURRENT:  # pragma: no cover
+            self.log.warning('nworkers=%s requires concurrent.futures (Python 3 or the '
+                             'futures package); the op2 is read serially' % nworkers)
+            nworkers = 1
+
         self.read_mode = 1
         self._close_op2 = False
+        self.op2_index = None
+        if index_filename is not None:
+            op2_filename = self._validate_op2_filename(op2_filename)
+            self.op2_index = read_op2_index(index_filename, op2_filename, log=self.log)
+        is_index_loaded = self.op2_index is not None
+        if not is_index_loaded and (use_index or index_filename is not None or
+                                    nworkers > 1 or lazy):
+            self.op2_index = OP2Index()
+        self.use_mmap = use_mmap
 
         # get GUI object names, build objects, but don't read data
         OP2_Scalar.read_op2(self, op2_filename=op2_filename)
@@ -558,7 +873,14 @@ class OP2(OP2_Scalar):
         self.read_mode = 2
         self._close_op2 = True
         self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
-        OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+        if lazy:
+            self._read_op2_lazy(build_dataframe)
+        elif nworkers > 1:
+            self._read_op2_parallel(nworkers)
+        else:
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+        if index_filename is not None and not is_index_loaded:
+            self.op2_index.write(index_filename, self.op2_filename)
 
         self._finalize()
         if build_dataframe:
@@ -567,6 +889,35 @@ class OP2(OP2_Scalar):
         self.combine_results(combine=combine)
         self.log.debug('finished reading op2')
 
+    def _read_op2_parallel(self, nworkers):
+        """
+        Runs the array filling pass, where the result tables are read by
+        a pool of processes and the other tables are read by this process.
+        """
+        op2_index = self.op2_index
+        tasks, self.op2_index = get_parallel_tasks(op2_index)
+        try:
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+        finally:
+            self.op2_index = op2_index
+        if tasks:
+            read_results_parallel(self, tasks, nworkers)
+
+    def _read_op2_lazy(self, build_dataframe):
+        """
+        Runs the array filling pass for the tables that aren't result
+        tables, and sets up the result objects to be read when they're
+        accessed.
+        """
+        op2_index = self.op2_index
+        tasks, self.op2_index = get_parallel_tasks(op2_index)
+        try:
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+        finally:
+            self.op2_index = op2_index
+        if tasks:
+            set_lazy_results(self, tasks, build_dataframe=build_dataframe)
+
     def create_objects_from_matrices(self):
         """
         creates the following objects:
@@ -591,10 +942,19 @@ class OP2(OP2_Scalar):
         for result_type in result_types:
             result = getattr(self, result_type)
             for obj in itervalues(result):
-                if hasattr(obj, 'finalize'):
+                # lazy results are finalized when they're loaded
+                if not is_lazy(obj) and hasattr(obj, 'finalize'):
                     obj.finalize()
         self.del_structs()
 
+    def remove_memmap_files(self):
+        """
+        Deletes the memory-mapped scratch files of the result data arrays
+        (see ``read_op2(memmap_dir=...)``).  The results shouldn't be used
+        afterwards.
+        """
+        _remove_files(self._memmap_filenames)
+
     def build_dataframe(self):
         """
         Converts the OP2 objects into pandas DataFrames
@@ -625,6 +985,9 @@ class OP2(OP2_Scalar):
         for result_type in result_types:
             result = getattr(self, result_type)
             for obj in itervalues(result):
+                if is_lazy(obj):
+                    # the DataFrame is built when the result is loaded
+                    continue
                 class_name = obj.__class__.__name__
                 #print('working on %s' % class_name)
                 obj.object_attributes()
@@ -658,8 +1021,27 @@ class OP2(OP2_Scalar):
                     self.log.error('build_dataframe is broken for %s' % class_name)
                     raise
 
-    def load_hdf5(self, hdf5_filename, combine=True):
-        """loads an h5 file into an OP2 object"""
+    def load_hdf5(self, hdf5_filename, combine=True, result_names=None, subcases=None,
+                  itimes=None, eid_range=None, nid_range=None):
+        """
+        loads an h5 file into an OP2 object
+
+        Parameters
+        ----------
+        hdf5_filename : str
+            the HDF5 file
+        combine : bool; default=True
+            see ``combine_results``
+        result_names : List[str] / str; default=None -> all
+            the results to load (e.g., ['displacements', 'cquad4_stress'])
+        subcases : List[int] / int; default=None -> all
+            the subcases to load
+        itimes : List[int]; default=None -> all
+            the indices of the time steps/modes/frequencies to load
+        eid_range / nid_range : (int, int); default=None -> all
+            the range of element/node ids to load (inclusive)
+
+        """
         assert os.path.exists(hdf5_filename), print_bad_path(hdf5_filename)
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
         import h5py
@@ -668,20 +1050,35 @@ class OP2(OP2_Scalar):
         self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
         with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug,
+                                    result_names=result_names, subcases=subcases,
+                                    itimes=itimes, eid_range=eid_range, nid_range=nid_range)
         self.combine_results(combine=combine)
 
-    def export_to_hdf5(self, hdf5_filename):
+    def export_to_hdf5(self, hdf5_filename, compression=None):
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the HDF5 file to write
+        compression : str; default=None
+            the compression filter of the arrays
+            None : no compression
+            'lzf' : fast compression
+            'gzip' : smaller files, but slower
+
+        The arrays are chunked along the time and element/node axes, so
+        part of a result can be loaded (see ``load_hdf5``).
+
         TODO: doesn't support:
           - matrices
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
-        export_op2_to_hdf5_file(hdf5_filename, self)
+        export_op2_to_hdf5_file(hdf5_filename, self, compression=compression)
 
     def combine_results(self, combine=True):
         """
@@ -965,6 +1362,151 @@ class OP2(OP2_Scalar):
                     self.log.info('  %s' % str(key))
         #self.log.info('subcase_key = %s' % self.subcase_key)
 
+    def get_envelope(self, result_name, subcases=None):
+        """
+        Gets the max/min/absolute max of a result over the subcases and
+        time steps and the subcase/time step that controls each value
+
+        Parameters
+        ----------
+        result_name : str
+            the result type (e.g., 'displacements', 'cquad4_stress',
+            'cbar_force')
+        subcases : List[isubcase]; default=None -> all
+            the subcases to include
+
+        Returns
+        -------
+        envelope : ResultEnvelope
+            the envelope
+
+        .. seealso:: pyNastran.op2.result_envelope
+
+        """
+        from pyNastran.op2.result_envelope import get_envelope
+        return get_envelope(getattr(self, result_name), subcases=subcases)
+
+    def get_load_combinations(self, result_name, coefficients, subcases=None,
+                              combination_ids=None):
+        """
+        Gets the load combinations of a result (e.g., 1.5*subcase 3 + 1.0*subcase 7)
+
+        Parameters
+        ----------
+        result_name : str
+            the result type (e.g., 'displacements', 'cquad4_stress',
+            'grid_point_forces')
+        coefficients : (ncombinations, nsubcases) float ndarray / scipy.sparse matrix
+            the load factors of the subcases of each combination
+        subcases : List[isubcase]; default=None -> all
+            the subcases that are the columns of coefficients
+        combination_ids : List[int]; default=None -> 1, 2, ..., ncombinations
+            the ids of the combinations (the isubcase of the new results)
+
+        Returns
+        -------
+        combinations : Dict[combination_id] = result
+            the combined results (e.g., RealPlateStressArray), which
+            have the principal/von Mises stresses of the combination
+
+        .. seealso:: pyNastran.op2.load_combinations
+
+        """
+        from pyNastran.op2.load_combinations import get_load_combinations
+        return get_load_combinations(getattr(self, result_name), coefficients,
+                                     subcases=subcases, combination_ids=combination_ids)
+
+    def iter_load_combinations(self, result_name, coefficients, subcases=None,
+                               combination_ids=None, chunk_size=100):
+        """
+        Iterates over the load combinations of a result, so only
+        chunk_size combinations are in memory
+
+        Parameters
+        ----------
+        result_name : str
+            the result type (e.g., 'displacements', 'cquad4_stress',
+            'grid_point_forces')
+        coefficients : (ncombinations, nsubcases) float ndarray / scipy.sparse matrix
+            the load factors of the subcases of each combination
+        subcases : List[isubcase]; default=None -> all
+            the subcases that are the columns of coefficients
+        combination_ids : List[int]; default=None -> 1, 2, ..., ncombinations
+            the ids of the combinations (the isubcase of the new results)
+        chunk_size : int; default=100
+            the number of combinations that are calculated at once
+
+        Yields
+        ------
+        combination_id : int
+            the id of the combination
+        result : varies
+            the combined result
+
+        """
+        from pyNastran.op2.load_combinations import iter_load_combinations
+        return iter_load_combinations(getattr(self, result_name), coefficients,
+                                      subcases=subcases, combination_ids=combination_ids,
+                                      chunk_size=chunk_size)
+
+    def _get_displacement_like_dicts(self):
+        """gets the results that are transformed by ``transform_displacements_to_global``"""
+        disp_like_dicts = [
+            # should NO results be transformed?
+            #self.displacements_NO, self.velocities_NO, self.accelerations_NO,
+            #self.spc_forces_NO, self.mpc_forces_NO,
+
+            self.displacements,
+            self.displacements_ATO, self.displacements_CRM, self.displacements_PSD, self.displacements_RMS,
+            self.displacements_scaled,
+            self.displacement_scaled_response_spectra_ABS,
+            self.displacement_scaled_response_spectra_NRL,
+
+            self.velocities,
+            self.velocities_ATO, self.velocities_CRM, self.velocities_PSD, self.velocities_RMS,
+            self.velocity_scaled_response_spectra_ABS,
+
+            self.accelerations,
+            self.accelerations_ATO, self.accelerations_CRM, self.accelerations_PSD, self.accelerations_RMS,
+            self.acceleration_scaled_response_spectra_ABS,
+            self.acceleration_scaled_response_spectra_NRL,
+
+            self.eigenvectors,
+            self.eigenvectors_RADCONS, self.eigenvectors_RADEFFM,
+            self.eigenvectors_RADEATC, self.eigenvectors_ROUGV1,
+
+            self.spc_forces, self.spc_forces_ATO, self.spc_forces_CRM, self.spc_forces_PSD, self.spc_forces_RMS,
+            self.mpc_forces, self.mpc_forces_ATO, self.mpc_forces_CRM, self.mpc_forces_PSD, self.mpc_forces_RMS,
+
+            self.applied_loads, self.load_vectors,
+        ]
+        return disp_like_dicts
+
+    def transform_results_to_global(self, nodal_transform, include_gpforce=True):
+        """
+        Transforms the ``data`` of the displacement-like (and grid point
+        force) results into the global coordinate system.
+
+        The rows of the results are matched to the nodes by node id, so
+        the results may be for a subset of the nodes.
+
+        Parameters
+        ----------
+        nodal_transform : NodalTransform
+            the CD to global transforms of the nodes
+            (e.g., from ``get_nodal_transform(bdf_model)``), which may
+            be reused for multiple OP2s of the same model
+        include_gpforce : bool; default=True
+            transform the grid point forces
+
+        """
+        disp_like_dicts = self._get_displacement_like_dicts()
+        if include_gpforce:
+            disp_like_dicts.append(self.grid_point_forces)
+        for disp_like_dict in disp_like_dicts:
+            for result in itervalues(disp_like_dict):
+                nodal_transform.transform_result(result)
+
     def transform_displacements_to_global(self, i_transform, coords, xyz_cid0=None, debug=False):
         """
         Transforms the ``data`` of displacement-like results into the
@@ -994,6 +1536,8 @@ class OP2(OP2_Scalar):
 
         .. warning:: only works if all nodes are included...
                      ``test_pynastrangui isat_tran.dat isat_tran.op2 -f nastran``
+                     use ``transform_results_to_global`` for a subset
+                     of the nodes
         .. note:: Nastran has this concept of a basic (cid=0) and global (cid=cd)
                   coordinate system.  They occur at the same time.  Basic is for
                   positions/properties, while global is for result outputs.
@@ -1006,153 +1550,24 @@ class OP2(OP2_Scalar):
                     - cp>0 are local frames
 
         """
-        #output = {}
-        disp_like_dicts = [
-            # should NO results be transformed?
-            #self.displacements_NO, self.velocities_NO, self.accelerations_NO,
-            #self.spc_forces_NO, self.mpc_forces_NO,
-
-            self.displacements,
-            self.displacements_ATO, self.displacements_CRM, self.displacements_PSD, self.displacements_RMS,
-            self.displacements_scaled,
-            self.displacement_scaled_response_spectra_ABS,
-            self.displacement_scaled_response_spectra_NRL,
-
-            self.velocities,
-            self.velocities_ATO, self.velocities_CRM, self.velocities_PSD, self.velocities_RMS,
-            self.velocity_scaled_response_spectra_ABS,
-
-            self.accelerations,
-            self.accelerations_ATO, self.accelerations_CRM, self.accelerations_PSD, self.accelerations_RMS,
-            self.acceleration_scaled_response_spectra_ABS,
-            self.acceleration_scaled_response_spectra_NRL,
+        from pyNastran.op2.result_transforms import NodalTransform
+        if not i_transform:
+            return
+        if xyz_cid0 is None:
+            npoints = max([max(inode) for inode in itervalues(i_transform) if len(inode)]) + 1
+        else:
+            npoints = xyz_cid0.shape[0]
 
-            self.eigenvectors,
-            self.eigenvectors_RADCONS, self.eigenvectors_RADEFFM,
-            self.eigenvectors_RADEATC, self.eigenvectors_ROUGV1,
+        # the rows of the results are the indices of BDF.point_ids
+        nodal_transform = NodalTransform.from_icd_transform(
+            np.arange(npoints), i_transform, coords, xyz_cid0=xyz_cid0)
+        if debug:
+            self.log.debug('nodal_transform = %s' % nodal_transform)
 
-            self.spc_forces, self.spc_forces_ATO, self.spc_forces_CRM, self.spc_forces_PSD, self.spc_forces_RMS,
-            self.mpc_forces, self.mpc_forces_ATO, self.mpc_forces_CRM, self.mpc_forces_PSD, self.mpc_forces_RMS,
-
-            self.applied_loads, self.load_vectors,
-        ]
-        for disp_like_dict in disp_like_dicts:
-            if not disp_like_dict:
-                continue
-            #print('-----------')
-            for subcase, result in iteritems(disp_like_dict):
-                #print('result.name = ', result.class_name)
+        for disp_like_dict in self._get_displacement_like_dicts():
+            for result in itervalues(disp_like_dict):
                 data = result.data
-                for cid, inode in iteritems(i_transform):
-                    if cid in [-1, 0]:
-                        continue
-                    coord = coords[cid]
-                    coord_type = coord.type
-                    cid_transform = coord.beta()
-
-                    # a global coordinate system has 1s along the main diagonal
-                    is_global_cid = False
-                    if np.array_equal([1., 1., 1.], np.diagonal(cid_transform)):
-                        is_global_cid = True
-
-                    if not is_global_cid and debug:
-                        self.log.debug('coord\n%s' % coord)
-                        self.log.debug(cid_transform)
-                        self.log.debug('inode = %s' % [str(val).rstrip('L') for val in inode.tolist()])
-                        self.log.debug('data.shape = %s' % str(data.shape))
-                        self.log.debug('len(inode) = %s' % len(inode))
-                        assert np.array_equal(inode, np.unique(inode))
-                    if coord_type in ['CORD2R', 'CORD1R']:
-                        if is_global_cid:
-                            #self.log.debug('is_global_cid')
-                            continue
-                        #self.log.debug('rectangular')
-
-
-                        # isat_tran.op2
-                        #  - nspoint = 4
-                        #  - ngrid = 5379
-                        #
-                        #  - ntotal = 5383
-                        #  data.shape = (101, 8, 6)
-                        translation = data[:, inode, :3]
-                        rotation = data[:, inode, 3:]
-                        data[:, inode, :3] = translation.dot(cid_transform)
-                        data[:, inode, 3:] = rotation.dot(cid_transform)
-                    elif coord_type in ['CORD2C', 'CORD1C']:
-                        #self.log.debug('cylindrical')
-                        if xyz_cid0 is None:
-                            msg = ('xyz_cid is required for cylindrical '
-                                   'coordinate transforms')
-                            raise RuntimeError(msg)
-                        xyzi = xyz_cid0[inode, :]
-                        rtz_cid = coord.xyz_to_coord_array(xyzi)
-                        theta = rtz_cid[:, 1]
-                        #self.log.debug('theta = %s' % list(theta))
-                        for itime in range(data.shape[0]):
-                            translation = data[itime, inode, :3]
-                            rotation = data[itime, inode, 3:]
-                            #theta_max1 = translation[:, 1].max()
-                            #theta_max2 = rotation[:, 1].max()
-                            #print('theta_max = ', max(theta_max1, theta_max2))
-
-                            if 0:
-                                # actually somewhat close
-                                translation[:, 1] += theta
-                                rotation[:, 1] += theta
-                                translation = coord.coord_to_xyz_array(data[itime, inode, :3])
-                                rotation = coord.coord_to_xyz_array(data[itime, inode, 3:])
-                            elif 0:
-                                # bad for spc (global_radial_cd)
-                                translation[:, 1] += theta
-                                rotation[:, 1] += theta
-                                translation = coord.coord_to_xyz_array(translation)
-                                rotation = coord.coord_to_xyz_array(rotation)
-                            elif 0:
-                                # very wrong...
-                                #print(translation.shape)
-                                translation[:, 1] += theta
-                                rotation[:, 1] += theta
-                            elif 1:
-                                pass
-                            else:
-                                raise RuntimeError('no option selected...')
-
-                            #if is_global_cid:
-                                #data[itime, inode, :3] = translation
-                                #data[itime, inode, 3:] = rotation
-                                #print('is_global_cid')
-                                #continue
-                            data[itime, inode, :3] = translation.dot(cid_transform)
-                            data[itime, inode, 3:] = rotation.dot(cid_transform)
-                    elif coord_type in ['CORD2S', 'CORD1S']:
-                        #print('spherical')
-                        if xyz_cid0 is None:
-                            msg = ('xyz_cid is required for spherical '
-                                   'coordinate transforms')
-                            raise RuntimeError(msg)
-                        xyzi = xyz_cid0[inode, :]
-                        rtp_cid = coord.xyz_to_coord_array(xyzi)
-                        theta = rtp_cid[:, 1]
-                        phi = rtp_cid[:, 2]
-                        for itime in range(data.shape[0]):
-                            translation = data[itime, inode, :3]
-                            rotation = data[itime, inode, 3:]
-                            if 0:
-                                translation[:, 1] += theta
-                                translation[:, 2] += phi
-                                rotation[:, 1] += theta
-                                rotation[:, 2] += phi
-                            translation = coord.coord_to_xyz_array(translation)
-                            rotation = coord.coord_to_xyz_array(rotation)
-                            if is_global_cid:
-                                data[itime, inode, :3] = translation
-                                data[itime, inode, 3:] = rotation
-                                continue
-                            data[itime, inode, :3] = translation.dot(cid_transform)
-                            data[itime, inode, 3:] = rotation.dot(cid_transform)
-                    else:
-                        raise RuntimeError(coord)
+                nodal_transform.transform_data(data, np.arange(data.shape[1]))
 
     def transform_gpforce_to_global(self, nids_all, nids_transform, i_transform, coords, xyz_cid0=None):
         """
@@ -1166,8 +1581,8 @@ class OP2(OP2_Scalar):
 
         Parameters
         ----------
-        nids_all : ???
-            ???
+        nids_all : (nnodes+nspoints, ) int ndarray
+            the GRID/SPOINT/EPOINT ids (``BDF.point_ids``)
         nids_transform : dict{int cid : int ndarray nds}
             Dictionary from coordinate id to corresponding node ids.
         i_transform : dict{int cid : int ndarray}
@@ -1178,185 +1593,20 @@ class OP2(OP2_Scalar):
             Dictionary of coordinate id to the coordinate object
             Use this if CD is only rectangular
             Use this if CD is not rectangular
-        xyz_cid0 : ???
-            ???
+        xyz_cid0 : (nnodes+nspoints, 3) float ndarray
+            the nodes in the global frame
+            Don't use this if CD is only rectangular
+            Use this if CD is not rectangular
 
         """
-        disp_like_dicts = [
-            # TODO: causes test_op2_solid_shell_bar_01_gpforce_xyz to fail
-            #       even though it should be uncommented
-            self.grid_point_forces,
-        ]
-        for disp_like_dict in disp_like_dicts:
-            if not disp_like_dict:
-                continue
-            self.log.debug('-----------')
-            for subcase, result in iteritems(disp_like_dict):
-                self.log.debug('result.name = %s' % result.class_name)
-                data = result.data
-
-                # inode_xyz :
-                #    the indices of the nodes in the model grid point list
-                for cid, inode_xyz in iteritems(i_transform):
-                    self.log.debug('cid = %s' % cid)
-                    if cid in [-1, 0]:
-                        continue
-                    coord = coords[cid]
-                    coord_type = coord.type
-                    cid_transform = coord.beta()
-
-                    # a global coordinate system has 1s along the main diagonal
-                    is_global_cid = False
-                    if np.array_equal([1., 1., 1.], np.diagonal(cid_transform)):
-                        is_global_cid = True
-                    nids = np.array(nids_transform[cid])
-
-                    #from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
-                    #result = RealGridPointForcesArray()
-                    if result.is_unique: # TODO: doesn't support preload
-                        #self.node_element = zeros((self.ntimes, self.ntotal, 2), dtype='int32')
-                        nids_all_gp = result.node_element[0, :, 0]
-
-                        self.log.debug('nids_all_gp = %s' % list(nids_all_gp))
-                        self.log.debug('nids = %s' % list(nids))
-
-                        # the indices of the grid points that we're transforming
-                        inode_gp = np.where(np.in1d(nids_all_gp, nids))[0]
-                        self.log.debug('inode_gp = %s' % list(inode_gp))
-                        nids_gp = nids_all_gp[inode_gp]
-                        self.log.debug('nids_gp = %s' % list(nids_gp))
-                        assert np.array_equal(np.unique(nids_gp), np.unique(nids)), 'nids_gp=%s nids=%s' % (nids_gp, nids)
-                        self.log.debug('---------')
-                        # the transformation index to go from xyz to the grid point forces
-                        inode_gp_xyz = np.searchsorted(nids_all, nids_all_gp)
-                        self.log.debug('nids_all = %s' % list(nids_all))
-                        self.log.debug('nids_all_gp = %s' % list(nids_all_gp))
-                        self.log.debug('inode_xyz = %s' % list(inode_xyz))
-                        self.log.debug('inode_gp_xyz = %s' % list(inode_gp_xyz))
-                        sys.stdout.flush()
-                        assert len(inode_gp_xyz) == len(nids_all_gp), len(nids_all_gp)
+        from pyNastran.op2.result_transforms import NodalTransform
+        if not i_transform:
+            return
+        nodal_transform = NodalTransform.from_icd_transform(
+            np.asarray(nids_all), i_transform, coords, xyz_cid0=xyz_cid0)
+        for result in itervalues(self.grid_point_forces):
+            nodal_transform.transform_result(result)
 
-                    else:
-                        raise NotImplementedError(result)
-
-                    if coord_type in ['CORD2R', 'CORD1R']:
-                        if is_global_cid:
-                            continue
-                        #print('coord\n', coord)
-                        #print(cid_transform)
-                        #print('inode = %s' % inode)
-                        #print('rectangular')
-                        translation = data[:, inode_gp, :3]
-                        rotation = data[:, inode_gp, 3:]
-                        data[:, inode_gp, :3] = translation.dot(cid_transform)
-                        data[:, inode_gp, 3:] = rotation.dot(cid_transform)
-                    elif coord_type in ['CORD2C', 'CORD1C']:
-                        #print('cylindrical')
-                        if xyz_cid0 is None:
-                            msg = ('xyz_cid is required for cylindrical '
-                                   'coordinate transforms')
-                            raise RuntimeError(msg)
-                        xyzi = xyz_cid0[inode_xyz, :]
-                        rtz_cid = coord.xyz_to_coord_array(xyzi)
-                        theta_xyz = rtz_cid[inode_xyz, 1]
-                        theta = rtz_cid[inode_gp_xyz, 1]
-                        self.log.debug('coord\n%s' % coord)
-                        self.log.debug(cid_transform)
-                        #print('theta_xyz = %s' % list(theta_xyz))
-                        #print('theta     = %s' % list(theta))
-
-                        for itime in range(data.shape[0]):
-                            #inode = np.where(np.in1d(nids_all, 2))[0]
-                            #print('start', data[itime, inode_gp, :3])
-                            translation = data[itime, inode_gp, :3]
-                            rotation = data[itime, inode_gp, 3:]
-                            if 0:
-                                # horrible
-                                translation = coord.coord_to_xyz_array(data[itime, inode_gp, :3])
-                                rotation = coord.coord_to_xyz_array(data[itime, inode_gp, 3:])
-                                data[itime, inode_gp, :3] = translation.dot(cid_transform)
-                                data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-                            elif 0:
-                                # expectedly horrible
-                                translation[:, 1] += theta
-                                rotation[:, 1] += theta
-                                translation = coord.coord_to_xyz_array(data[itime, inode_gp, :3])
-                                rotation = coord.coord_to_xyz_array(data[itime, inode_gp, 3:])
-                                data[itime, inode_gp, :3] = translation.dot(cid_transform)
-                                data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-                            elif 0:
-                                # actually not bad...
-                                translation = coord.xyz_to_coord_array(translation)
-                                rotation = coord.xyz_to_coord_array(rotation)
-                                translation[:, 1] += theta
-                                rotation[:, 1] += theta
-                                translation = coord.coord_to_xyz_array(translation)
-                                rotation = coord.coord_to_xyz_array(rotation)
-                                data[itime, inode_gp, :3] = translation.dot(cid_transform)
-                                data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-                            elif 0:
-                                # not that bad, worse than previous
-                                translation = coord.xyz_to_coord_array(translation)
-                                rotation = coord.xyz_to_coord_array(rotation)
-                                translation[:, 1] += theta
-                                rotation[:, 1] += theta
-                                translation = coord.coord_to_xyz_array(translation)
-                                rotation = coord.coord_to_xyz_array(rotation)
-                                data[itime, inode_gp, :3] = translation.dot(cid_transform.T)
-                                data[itime, inode_gp, 3:] = rotation.dot(cid_transform.T)
-                            elif 1:
-                                # doesn't work...actually pretty close
-                                data[itime, inode_gp, :3] = translation.dot(cid_transform)
-                                data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-                            elif 0:
-                                # very, very close
-                                data[itime, inode_gp, :3] = translation.dot(cid_transform.T)
-                                data[itime, inode_gp, 3:] = rotation.dot(cid_transform.T)
-                            elif 0:
-                                # is this just the same as one of the previous?
-                                data[itime, inode_gp, :3] = cid_transform.T.dot(translation.T).T
-                                data[itime, inode_gp, 3:] = cid_transform.T.dot(rotation.T).T
-                            else:
-                                raise RuntimeError('no option selected...')
-
-                            #if is_global_cid:
-                                #data[itime, inode, :3] = translation
-                                #data[itime, inode, 3:] = rotation
-                                #continue
-                            #data[itime, inode_gp, :3] = translation.dot(cid_transform)
-                            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-                            #print('end', data[itime, inode_gp, :3])
-
-                    elif coord_type in ['CORD2S', 'CORD1S']:
-                        self.log.debug('spherical')
-                        if xyz_cid0 is None:
-                            msg = ('xyz_cid is required for spherical '
-                                   'coordinate transforms')
-                            raise RuntimeError(msg)
-                        xyzi = xyz_cid0[inode, :]
-                        rtp_cid = coord.xyz_to_coord_array(xyzi)
-                        theta = rtp_cid[:, 1]
-                        phi = rtp_cid[:, 2]
-                        for itime in range(data.shape[0]):
-                            translation = data[itime, inode, :3]
-                            rotation = data[itime, inode, 3:]
-                            #if 0:
-                                #translation[:, 1] += theta
-                                #translation[:, 2] += phi
-                                #rotation[:, 1] += theta
-                                #rotation[:, 2] += phi
-                            translation = coord.coord_to_xyz_array(data[itime, inode, :3])
-                            rotation = coord.coord_to_xyz_array(data[itime, inode, 3:])
-                            #if is_global_cid:
-                                #data[itime, inode, :3] = translation
-                                #data[itime, inode, 3:] = rotation
-                                #continue
-                            data[itime, inode, :3] = translation.dot(cid_transform)
-                            data[itime, inode, 3:] = rotation.dot(cid_transform)
-                    else:
-                        raise RuntimeError(coord)
-        self.log.debug('-----------')
-        return
 
 def main():  # pragma: no cover
     """testing new ideas"""
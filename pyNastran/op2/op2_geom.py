@@ -17,7 +17,8 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
                   exclude_results=None, include_results=None,
                   validate=True, xref=True,
                   build_dataframe=False, skip_undefined_matrices=True,
-                  mode='msc', log=None, debug=True, debug_file=None, encoding=None):
+                  mode='msc', log=None, debug=True, debug_file=None, encoding=None,
+                  vectorized_geom=False):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -51,6 +52,10 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    vectorized_geom : bool; default=False
+        reads the GRID, CQUAD4, CQUADR, CTRIA3, CHEXA, CTETRA, PSHELL and
+        MAT1 cards into arrays (see ``model.card_arrays``); the card
+        objects are only built when they're accessed
 
     Returns
     -------
@@ -64,6 +69,7 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
 
     """
     model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode)
+    model.vectorized_geom = vectorized_geom
     model.set_subcases(subcases)
     if exclude_results and include_results:
         msg = 'exclude_results or include_results must be None\n'
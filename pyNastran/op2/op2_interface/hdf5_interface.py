@@ -2,12 +2,20 @@
 """
 defines:
  model = load_op2_from_h5(h5_filename, log=None)
- export_op2_to_hdf5(hdf5_filename, op2_model)
+ export_op2_to_hdf5(hdf5_filename, op2_model, compression=None)
 
- model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None)
- model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
- export_op2_to_hdf5_file(hdf5_filename, op2_model)
- export_op2_to_hdf5_file(hdf5_file, op2_model)
+ model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None,
+                            result_names=None, subcases=None, itimes=None,
+                            eid_range=None, nid_range=None)
+ model = load_op2_from_hdf5_file(model, h5_file, log, debug=False,
+                                 result_names=None, subcases=None, itimes=None,
+                                 eid_range=None, nid_range=None)
+ export_op2_to_hdf5_file(hdf5_filename, op2_model, compression=None)
+ export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None)
+
+The arrays are chunked along the time and element/node axes, so the
+loader can read a subset of the time steps and elements/nodes without
+reading the whole array.
 
 """
 from __future__ import (nested_scopes, generators, division, absolute_import,
@@ -15,7 +23,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 import os
 from six import b
 
-from six import iteritems, PY3, binary_type
+from six import iteritems, PY3, binary_type, string_types
 import numpy as np
 import h5py
 
@@ -99,18 +107,173 @@ from pyNastran.op2.tables.oef_forces.oef_thermal_objects import (
     HeatFlux_2D_3DArray,
 )
 #from pyNastran.op2.tables.oqg_constraintForces.oqg_thermal_gradient_and_flux import RealTemperatureGradientAndFluxArray
-from pyNastran.utils import print_bad_path
+from pyNastran.utils import print_bad_path, integer_types
+
+#: the arrays with an element/node id for each row of the data array
+ELEMENT_ID_NAMES = ['element_node', 'element_layer', 'element']
+NODE_ID_NAMES = ['node_gridtype', 'node_element']
+
+#: the arrays that may have a value for each row of the data array
+ROW_NAMES = ELEMENT_ID_NAMES + NODE_ID_NAMES + [
+    'element_names', 'element_cid', 'element_type', 'location']
+
+def _cast(h5_result_attr, index=None):
+    """
+    converts the h5py type back into the OP2 type
 
-def _cast(h5_result_attr):
-    """converts the h5py type back into the OP2 type"""
+    Parameters
+    ----------
+    h5_result_attr : h5py.Dataset
+        the dataset
+    index : Tuple[slice/int ndarray/None, ...]; default=None
+        the part of the array to read (e.g., the time steps and
+        elements of the data array); None -> all
+
+    """
     if h5_result_attr is None:
         return None
 
+    if index is not None and any(indexi is not None for indexi in index):
+        index = tuple(slice(None) if indexi is None else indexi for indexi in index)
+        return np.asarray(_read_hdf5_dataset(h5_result_attr, index))
+
     if len(h5_result_attr.shape) == 0:
-        return np.array(h5_result_attr).tolist()
+        value = np.array(h5_result_attr).tolist()
+        if PY3 and isinstance(value, binary_type):
+            # h5py>=3.0 reads strings as bytes
+            value = value.decode('utf8')
+        return value
         #raise NotImplementedError(h5_result_attr.dtype)
     return np.array(h5_result_attr)
 
+def _read_hdf5_dataset(h5_dataset, index):
+    """reads part of a dataset; h5py only supports one list index per read"""
+    ilists = [i for i, indexi in enumerate(index) if not isinstance(indexi, slice)]
+    if len(ilists) <= 1:
+        return h5_dataset[index]
+
+    # read the block that contains the other lists and index it with numpy
+    index1 = list(index)
+    index2 = [slice(None)] * len(index)
+    for i in ilists[1:]:
+        indexi = index[i]
+        index1[i] = slice(indexi[0], indexi[-1] + 1)
+        index2[i] = indexi - indexi[0]
+    return h5_dataset[tuple(index1)][tuple(index2)]
+
+def _get_index(index, n):
+    """simplifies an index array to a slice if it's a contiguous range"""
+    if len(index) == 0:
+        return slice(0, 0)
+    if index[-1] - index[0] + 1 == len(index):
+        if len(index) == n:
+            return None
+        return slice(index[0], index[-1] + 1)
+    return index
+
+def _get_index_size(index, n):
+    """gets the number of items in an index"""
+    if index is None:
+        return n
+    if isinstance(index, slice):
+        return len(range(*index.indices(n)))
+    return len(index)
+
+def _get_ids(h5_ids):
+    """gets the element/node ids of an ELEMENT_ID_NAMES/NODE_ID_NAMES array"""
+    ids = np.asarray(h5_ids)
+    if ids.ndim == 2:
+        ids = ids[:, 0]
+    return ids
+
+def _get_id_index(ids, id_range):
+    """gets the rows with an id in the range"""
+    id_min, id_max = id_range
+    return _get_index(np.where((ids >= id_min) & (ids <= id_max))[0], len(ids))
+
+def _get_hdf5_selection(h5_result, str_data_names, itimes=None, eid_range=None, nid_range=None):
+    """
+    Gets the parts of the arrays of a SORT1 result to load
+
+    Parameters
+    ----------
+    h5_result : h5py.Group
+        the result group
+    str_data_names : List[str]
+        the time step arrays (e.g., dts, modes)
+    itimes : List[int]; default=None
+        the time step indices to load; None -> all
+    eid_range / nid_range : (int, int); default=None
+        the element/node ids to load (inclusive); None -> all
+
+    Returns
+    -------
+    indexs : Dict[name] = Tuple[slice/int ndarray/None, ...]
+        the index of each array (see ``_cast``)
+    counts : Dict[name] = int
+        the sizes that change (e.g., ntimes, nelements)
+
+    """
+    indexs = {}
+    counts = {}
+    h5_data = h5_result.get('data')
+    if h5_data is None or len(h5_data.shape) != 3 or not _cast(h5_result.get('is_sort1')):
+        return indexs, counts
+    ntimes, nrows = h5_data.shape[:2]
+
+    itime = None
+    if itimes is not None and _cast(h5_result.get('nonlinear_factor')) is not None:
+        itimes = np.asarray(itimes, dtype='int64')
+        itimes = np.where(itimes < 0, itimes + ntimes, itimes)
+        itimes = np.unique(itimes[(itimes >= 0) & (itimes < ntimes)])
+        itime = _get_index(itimes, ntimes)
+        if itime is not None:
+            counts['ntimes'] = _get_index_size(itime, ntimes)
+            for name in str_data_names:
+                h5_times = h5_result.get(name)
+                if h5_times is not None and h5_times.shape == (ntimes, ):
+                    indexs[name] = (itime, )
+
+    irow = None
+    for id_range, id_names in [(eid_range, ELEMENT_ID_NAMES), (nid_range, NODE_ID_NAMES)]:
+        if id_range is None:
+            continue
+        for name in id_names:
+            h5_ids = h5_result.get(name)
+            if h5_ids is None or h5_ids.shape[:1] != (nrows, ):
+                continue
+            ids = _get_ids(h5_ids)
+            irow = _get_id_index(ids, id_range)
+            if irow is None:
+                break
+
+            # an array with a row for each element (e.g., element for
+            # the solids) is indexed by its own ids
+            for row_name in ROW_NAMES:
+                h5_row = h5_result.get(row_name)
+                if h5_row is None or len(h5_row.shape) == 0:
+                    continue
+                if h5_row.shape[0] == nrows:
+                    indexs[row_name] = (irow, )
+                elif row_name in id_names:
+                    indexs[row_name] = (_get_id_index(_get_ids(h5_row), id_range), )
+
+            # the sizes are either the number of rows or the number of
+            # unique elements/nodes
+            nrows_new = _get_index_size(irow, nrows)
+            nids = len(np.unique(ids))
+            nids_new = len(np.unique(ids[irow]))
+            for count_name in ['ntotal', 'nelements', 'nnodes']:
+                count = _cast(h5_result.get(count_name))
+                if count == nrows:
+                    counts[count_name] = nrows_new
+                elif count == nids:
+                    counts[count_name] = nids_new
+            break
+    if itime is not None or irow is not None:
+        indexs['data'] = (itime, irow)
+    return indexs, counts
+
 TABLE_OBJ_MAP = {
     'displacements' : (RealDisplacementArray, ComplexDisplacementArray),
     'velocities' : (RealVelocityArray, ComplexVelocityArray, RealThermalVelocityVectorArray),
@@ -380,8 +543,14 @@ def _load_eigenvalue(h5_result, log):
             setattr(obj, key, datai)
     return obj
 
-def _load_table(result_name, h5_result, objs, log, debug=False):# real_obj, complex_obj
-    """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
+def _load_table(result_name, h5_result, objs, log, debug=False,
+                itimes=None, eid_range=None, nid_range=None):# real_obj, complex_obj
+    """
+    loads a RealEigenvectorArray/ComplexEigenvectorArray
+
+    itimes, eid_range, nid_range select part of the arrays
+    (see ``load_op2_from_hdf5_file``)
+    """
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
     nonlinear_factor = _cast(h5_result.get('nonlinear_factor'))
@@ -438,13 +607,19 @@ def _load_table(result_name, h5_result, objs, log, debug=False):# real_obj, comp
     if obj.class_name != class_name:
         msg = 'class_name=%r selected; should be %r' % (obj.class_name, class_name)
         raise RuntimeError(msg)
+    indexs, counts = _get_hdf5_selection(
+        h5_result, str_data_names, itimes=itimes, eid_range=eid_range, nid_range=nid_range)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     debug=debug)
+                                     debug=debug, indexs=indexs)
+    for name, count in iteritems(counts):
+        setattr(obj, name, count)
     return obj
 
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     debug=False):
+                                     debug=False, indexs=None):
     """helper method for ``_load_table``"""
+    if indexs is None:
+        indexs = {}
     keys_to_skip = [
         'class_name', 'headers', 'is_real', 'is_complex',
         'is_sort1', 'is_sort2', 'table_name_str',
@@ -461,11 +636,11 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
         elif key in str_data_names:
             if debug:  # pragma: no cover
                 print('  *****key=%r' % key)
-            datai = _cast(h5_result.get(key))
+            datai = _cast(h5_result.get(key), indexs.get(key))
             setattr(obj, key, datai)
             setattr(obj, '_times', datai)
         elif key not in data_code:
-            datai = _cast(h5_result.get(key))
+            datai = _cast(h5_result.get(key), indexs.get(key))
             if debug:  # pragma: no cover
                 print('  **key=%r' % key)
                 if key not in ['data']:
@@ -513,38 +688,55 @@ def _get_obj_class(objs, class_name, result_name, unused_is_real, log):
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_file(hdf5_filename, op2_model):
-    """exports an OP2 object to an HDF5 file"""
+def export_op2_to_hdf5_file(hdf5_filename, op2_model, compression=None):
+    """
+    exports an OP2 object to an HDF5 file
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the HDF5 file to write
+    op2_model : OP2
+        the OP2 object
+    compression : str; default=None
+        the compression filter of the arrays
+        None : no compression
+        'lzf' : fast compression
+        'gzip' : smaller files, but slower
+
+    """
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
 
     with h5py.File(hdf5_filename, 'w') as hdf5_file:
-        export_op2_to_hdf5(hdf5_file, op2_model)
+        export_op2_to_hdf5(hdf5_file, op2_model, compression=compression)
 
-def export_op2_to_hdf5(hdf5_file, op2_model):
+def export_op2_to_hdf5(hdf5_file, op2_model, compression=None):
     """exports an OP2 object to an HDF5 file object"""
+    if compression not in [None, 'lzf', 'gzip']:
+        raise ValueError('compression=%r and must be [None, lzf, gzip]' % compression)
     info_group = hdf5_file.create_group('info')
     info_group.create_dataset('pyNastran_version', data=pyNastran.__version__)
     info_group.create_dataset('nastran_format', data=op2_model._nastran_format)
     #info_group.create_dataset('is_msc', data=self.is_msc)
     #info_group.create_dataset('is_nx', data=self.is_nx)
     #info_group.create_dataset('nastran_version', data=self.is_nx)
-    _export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    _export_matrices(hdf5_file, op2_model, compression)
+    _export_subcases(hdf5_file, op2_model, compression)
 
-def _export_matrices(hdf5_file, op2_model):
+def _export_matrices(hdf5_file, op2_model, compression):
     """exports the matrices to HDF5"""
     if len(op2_model.matrices):
         matrix_group = hdf5_file.create_group('matrices')
         for key, matrix in sorted(iteritems(op2_model.matrices)):
             matrixi_group = matrix_group.create_group(b(key))
             if hasattr(matrix, 'export_to_hdf5'):
-                matrix.export_to_hdf5(matrixi_group, op2_model.log)
+                matrix.export_to_hdf5(matrixi_group, op2_model.log, compression=compression)
             else:
                 op2_model.log.warning('HDF5: key=%r type=%s cannot be exported' % (key, str(type(matrix))))
                 #raise NotImplementedError()
                 continue
 
-def _export_subcases(hdf5_file, op2_model):
+def _export_subcases(hdf5_file, op2_model, compression):
     """exports the subcases to HDF5"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
@@ -570,10 +762,17 @@ def _export_subcases(hdf5_file, op2_model):
             #result_name = result_type + ':' + class_name
             result_name = result_type
             result_group = subcase_group.create_group(result_name)
-            obj.export_to_hdf5(result_group, op2_model.log)
+            obj.export_to_hdf5(result_group, op2_model.log, compression=compression)
 
-def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
-    """loads an hdf5 file into an OP2 object"""
+def load_op2_from_hdf5(hdf5_filename, combine=True, log=None,
+                       result_names=None, subcases=None, itimes=None,
+                       eid_range=None, nid_range=None):
+    """
+    loads an hdf5 file into an OP2 object
+
+    See ``load_op2_from_hdf5_file`` for the result_names, subcases,
+    itimes, eid_range, and nid_range filters.
+    """
     assert os.path.exists(hdf5_filename), print_bad_path(hdf5_filename)
     model = OP2(log=None)
     model.op2_filename = hdf5_filename
@@ -581,17 +780,55 @@ def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
     log.info('hdf5_op2_filename = %r' % hdf5_filename)
     debug = False
     with h5py.File(hdf5_filename, 'r') as h5_file:
-        load_op2_from_hdf5_file(model, h5_file, log, debug=debug)
+        load_op2_from_hdf5_file(model, h5_file, log, debug=debug,
+                                result_names=result_names, subcases=subcases, itimes=itimes,
+                                eid_range=eid_range, nid_range=nid_range)
     model.combine_results(combine=combine)
     return model
 
-def load_op2_from_hdf5_file(model, h5_file, log, debug=False):
-    """loads an h5 file object into an OP2 object"""
+def load_op2_from_hdf5_file(model, h5_file, log, debug=False,
+                            result_names=None, subcases=None, itimes=None,
+                            eid_range=None, nid_range=None):
+    """
+    loads an h5 file object into an OP2 object
+
+    Parameters
+    ----------
+    model : OP2
+        the OP2 object to fill
+    h5_file : h5py.File
+        the HDF5 file object
+    log : logger
+        a logger object
+    debug : bool; default=False
+        prints the loaded attributes
+    result_names : List[str] / str; default=None -> all
+        the results to load (e.g., ['displacements', 'cquad4_stress'])
+    subcases : List[int] / int; default=None -> all
+        the subcases to load
+    itimes : List[int]; default=None -> all
+        the indices of the time steps/modes/frequencies to load for
+        transient results
+    eid_range : (int, int); default=None -> all
+        the range of element ids to load for element results (inclusive)
+    nid_range : (int, int); default=None -> all
+        the range of node ids to load for nodal results (inclusive)
+
+    Only the selected parts of the arrays are read, so the SORT1 data
+    arrays are sliced before they're loaded.
+    """
+    if isinstance(result_names, string_types):
+        result_names = [result_names]
+    if isinstance(subcases, integer_types):
+        subcases = [subcases]
+
     for key in h5_file.keys():
         if key.startswith('Subcase'):
             h5_subcase = h5_file.get(key)
             log.debug('subcase:')
             for result_name in h5_subcase.keys():
+                if result_names is not None and result_name not in result_names:
+                    continue
                 if result_name == 'eigenvalues':
                     #log.warning('    skipping %r...' % result_name)
                     h5_result = h5_subcase.get(result_name)
@@ -609,7 +846,10 @@ def load_op2_from_hdf5_file(model, h5_file, log, debug=False):
                     if objs is None:
                         log.warning('  skipping %s...' % result_name)
                         continue
-                    obj = _load_table(result_name, h5_result, objs, log=log, debug=debug)
+                    if subcases is not None and _cast(h5_result.get('isubcase')) not in subcases:
+                        continue
+                    obj = _load_table(result_name, h5_result, objs, log=log, debug=debug,
+                                      itimes=itimes, eid_range=eid_range, nid_range=nid_range)
                     if obj is None:
                         continue
 
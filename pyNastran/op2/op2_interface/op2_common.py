@@ -1811,6 +1811,26 @@ class OP2Common(Op2Codes, F06Writer):
             return True
         return False
 
+    def _build_result_object(self):
+        """
+        Sizes the vectorized arrays of self.obj.  For memmap_dir, the data
+        array is allocated in a memory-mapped scratch file, so results that
+        are larger than the available memory can be read.
+        """
+        obj = self.obj
+        if self.memmap_dir is None:
+            obj.build()
+            return
+
+        obj._memmap_dir = self.memmap_dir
+        try:
+            obj.build()
+        finally:
+            del obj._memmap_dir
+        data = getattr(obj, 'data', None)
+        if isinstance(data, np.memmap):
+            self._memmap_filenames.append(data.filename)
+
     def _create_table_object(self, result_name, nnodes,
                              slot, slot_object, slot_vector, is_cid=False):
         assert isinstance(result_name, string_types), result_name
@@ -1831,7 +1851,7 @@ class OP2Common(Op2Codes, F06Writer):
                 self.code = self._get_code()
                 self.obj = slot[self.code]
                 #self.obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_result_object()
         else:  # not vectorized
             self.result_names.add(result_name)
             if self.read_mode == 1:
@@ -1857,7 +1877,7 @@ class OP2Common(Op2Codes, F06Writer):
             self.code = self._get_code()
             self.obj = slot[self.code]
             #self.obj.update_data_code(self.data_code)
-            self.obj.build()
+            self._build_result_object()
         else:
             auto_return = True
         return auto_return
@@ -1936,7 +1956,7 @@ class OP2Common(Op2Codes, F06Writer):
                     raise TypeError(msg)
 
                 #obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_result_object()
 
             else:  # not vectorized
                 auto_return = True
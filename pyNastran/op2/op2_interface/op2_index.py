@@ -0,0 +1,230 @@
+"""
+Defines:
+ - OP2Index()
+ - OP2TableIndex(table_name, n)
+ - read_op2_index(index_filename, op2_filename, log=None)
+
+The OP2Index stores the location of every table in an OP2, as well as the
+location and length of every subtable record (table3/table4) of the result
+tables.  It's built during the array sizing pass (read_mode=1) and lets the
+array filling pass (read_mode=2) jump straight to the data records instead
+of rescanning the file.
+
+The index may be saved as a sidecar file next to the OP2, so later reads
+of the same OP2 don't need to scan the file at all.
+
+"""
+from __future__ import print_function
+import os
+from six.moves.cPickle import load, dump
+
+#: the version of the sidecar index file
+INDEX_VERSION = 1
+
+#: the table3 parameters that are stored for each table3 record
+TABLE3_KEYS = ('isubcase', 'analysis_code', 'table_code', 'element_type', 'num_wide')
+
+
+class OP2TableIndex(object):
+    """the location of a single table in an OP2"""
+    def __init__(self, table_name, n):
+        """
+        Creates an OP2TableIndex
+
+        Parameters
+        ----------
+        table_name : bytes
+            the name of the table (e.g., b'OUGV1')
+        n : int
+            the position of the table name record in the file
+
+        """
+        self.table_name = table_name
+        self.n = n
+
+        #: is the table read from the index or does it go through the
+        #: standard table reader?
+        self.is_results = False
+        self.subtable_name = None
+
+        #: the design cycle counter at the start of the table, which is
+        #: found during the array sizing pass (it's not saved to the
+        #: index file)
+        self.count = None
+
+        #: [(isubtable, n, record_len, table3_info), ...]
+        #: where table3_info is a tuple of the TABLE3_KEYS values for a
+        #: table3 record and None for a table4 record
+        self.records = []
+
+    def add_record(self, isubtable, n, record_len, table3_info=None):
+        """
+        Adds a table3/table4 record
+
+        Parameters
+        ----------
+        isubtable : int
+            the subtable counter (-3, -4, ...)
+        n : int
+            the position of the record in the file
+        record_len : int
+            the length of the record (w/o the block markers)
+        table3_info : tuple; default=None
+            the TABLE3_KEYS values of a table3 record (e.g., isubcase)
+            None : a table4 record
+
+        """
+        self.records.append((isubtable, n, record_len, table3_info))
+
+    @property
+    def subcases(self):
+        """the subcases in the table"""
+        isubcases = set([])
+        for unused_isubtable, unused_n, unused_record_len, table3_info in self.records:
+            if table3_info is not None and table3_info[0] is not None:
+                isubcases.add(table3_info[0])
+        return sorted(isubcases)
+
+    def get_table3_info(self):
+        """
+        Gets the table3 parameters
+
+        Returns
+        -------
+        table3_infos : List[Dict[key] = value]
+            key : str
+                one of TABLE3_KEYS (e.g., 'isubcase', 'element_type')
+            value : int / None
+                the value of the parameter; None if it's not defined
+
+        """
+        table3_infos = []
+        for unused_isubtable, n, record_len, table3_info in self.records:
+            if table3_info is None:
+                continue
+            info = dict(zip(TABLE3_KEYS, table3_info))
+            info['n'] = n
+            info['record_len'] = record_len
+            table3_infos.append(info)
+        return table3_infos
+
+    def __repr__(self):
+        msg = 'OP2TableIndex(table_name=%r, n=%s, is_results=%s, nrecords=%s)' % (
+            self.table_name, self.n, self.is_results, len(self.records))
+        return msg
+
+
+class OP2Index(object):
+    """the location of the tables/records in an OP2"""
+    def __init__(self):
+        self.tables = []
+
+        #: has the OP2 been fully scanned (or has the index been loaded)?
+        self.is_complete = False
+
+    def add_table(self, table_name, n):
+        """
+        Adds a table to the index
+
+        Parameters
+        ----------
+        table_name : bytes
+            the name of the table (e.g., b'OUGV1')
+        n : int
+            the position of the table name record in the file
+
+        Returns
+        -------
+        table_index : OP2TableIndex
+            the index for the table
+
+        """
+        table_index = OP2TableIndex(table_name, n)
+        self.tables.append(table_index)
+        return table_index
+
+    @property
+    def table_names(self):
+        """the table names in the order they appear in the file"""
+        return [table_index.table_name for table_index in self.tables]
+
+    def write(self, index_filename, op2_filename):
+        """
+        Writes the sidecar index file
+
+        Parameters
+        ----------
+        index_filename : str
+            the index file to write
+        op2_filename : str
+            the OP2 that was indexed; the size and modification time
+            are used to check that the index is still valid
+
+        """
+        assert self.is_complete, 'the OP2 has not been fully indexed'
+        tables = []
+        for table_index in self.tables:
+            tables.append((
+                table_index.table_name, table_index.n, table_index.is_results,
+                table_index.subtable_name, table_index.records))
+        data = {
+            'version' : INDEX_VERSION,
+            'op2_size' : os.path.getsize(op2_filename),
+            'op2_mtime' : os.path.getmtime(op2_filename),
+            'tables' : tables,
+        }
+        with open(index_filename, 'wb') as index_file:
+            dump(data, index_file, protocol=2)
+
+    def __repr__(self):
+        msg = 'OP2Index(ntables=%s)\n' % len(self.tables)
+        for table_index in self.tables:
+            msg += '  %s\n' % table_index
+        return msg
+
+
+def read_op2_index(index_filename, op2_filename, log=None):
+    """
+    Reads a sidecar index file
+
+    Parameters
+    ----------
+    index_filename : str
+        the index file to read
+    op2_filename : str
+        the OP2 that was indexed
+    log : logger; default=None
+        a logger to explain why the index wasn't used
+
+    Returns
+    -------
+    op2_index : OP2Index / None
+        the index; None if the index doesn't exist or the OP2 has changed
+
+    """
+    if not os.path.exists(index_filename):
+        return None
+
+    with open(index_filename, 'rb') as index_file:
+        data = load(index_file)
+
+    if data.get('version') != INDEX_VERSION:
+        if log is not None:
+            log.info('index_filename=%r is out of date; version=%r' % (
+                index_filename, data.get('version')))
+        return None
+    if (data['op2_size'] != os.path.getsize(op2_filename) or
+            data['op2_mtime'] != os.path.getmtime(op2_filename)):
+        if log is not None:
+            log.info('op2_filename=%r has changed since index_filename=%r was written' % (
+                op2_filename, index_filename))
+        return None
+
+    op2_index = OP2Index()
+    for table_name, n, is_results, subtable_name, records in data['tables']:
+        table_index = op2_index.add_table(table_name, n)
+        table_index.is_results = is_results
+        table_index.subtable_name = subtable_name
+        table_index.records = records
+    op2_index.is_complete = True
+    return op2_index
@@ -0,0 +1,160 @@
+"""
+Defines:
+ - LazyResultLoader(op2_filename, table_indexs, settings, build_dataframe=False)
+ - set_lazy_results(model, tasks)
+ - is_lazy(obj)
+
+For OP2.read_op2(..., lazy=True), the result objects (e.g., displacements,
+cquad4_stress) are created by the array sizing pass, but the arrays
+(e.g., data, element_node) aren't filled.  Each object holds a
+LazyResultLoader, which reads the records of the object from the OP2 the
+first time a missing attribute (e.g., obj.data) is accessed.
+
+"""
+from __future__ import print_function
+from collections import defaultdict
+from six import iteritems
+
+from pyNastran.op2.op2_interface.op2_index import OP2Index
+from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.op2_parallel import (
+    get_task_tables, get_worker_settings, create_worker_model, read_op2_task)
+
+
+class LazyResultLoader(object):
+    """loads the result objects that are filled by the same records"""
+    def __init__(self, op2_filename, table_indexs, settings, build_dataframe=False):
+        """
+        Creates a LazyResultLoader
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 to read
+        table_indexs : List[OP2TableIndex]
+            the tables/records to read
+        settings : dict
+            the OP2 settings (see ``get_worker_settings``)
+        build_dataframe : bool; default=False
+            builds the pandas DataFrame after the objects are loaded
+
+        """
+        self.op2_filename = op2_filename
+        self.table_indexs = table_indexs
+        self.settings = settings
+        self.build_dataframe = build_dataframe
+
+        #: the unloaded result objects; {(result_type, key) : obj}
+        self.objects = {}
+
+    def load(self):
+        """reads the records and fills the result objects"""
+        objects = self.objects
+        if not objects:
+            return
+        self.objects = {}
+
+        try:
+            results = read_op2_task(self.op2_filename, self.table_indexs, self.settings)['results']
+        except Exception:
+            self.objects = objects
+            raise
+        for (result_type, key), obj in iteritems(objects):
+            loaded_obj = results[result_type][key]
+            if hasattr(loaded_obj, 'finalize'):
+                loaded_obj.finalize()
+            del obj._lazy_loader
+            obj.__dict__.update(loaded_obj.__dict__)
+            if self.build_dataframe and not obj.is_sort2:
+                obj.build_dataframe()
+
+    def __repr__(self):
+        return 'LazyResultLoader(table_names=%s, nobjects=%s)' % (
+            [table_index.table_name for table_index in self.table_indexs], len(self.objects))
+
+
+def is_lazy(obj):
+    """is the result object waiting to be loaded?"""
+    return obj.__dict__.get('_lazy_loader') is not None
+
+
+def set_lazy_results(model, tasks, build_dataframe=False):
+    """
+    Attaches a LazyResultLoader to the result objects that are created by
+    the array sizing pass
+
+    Parameters
+    ----------
+    model : OP2
+        the OP2 object, which has finished the array sizing pass
+    tasks : List[List[(itable, records)]]
+        the records of the result tables (see ``get_parallel_tasks``)
+    build_dataframe : bool; default=False
+        builds the pandas DataFrame after the objects are loaded
+
+    """
+    settings = get_worker_settings(model)
+    table_types = model.get_table_types()
+
+    # find the result objects that each task creates with an array sizing
+    # pass that only reads the table3 records of the task
+    sizing_model = create_worker_model(settings)
+    sizing_model.op2_index = OP2Index()
+    sizing_model.op2_index.is_complete = True
+    sizing_model.read_mode = 1
+    sizing_model._close_op2 = False
+    OP2_Scalar.read_op2(sizing_model, op2_filename=model.op2_filename)
+
+    task_keys = []
+    try:
+        for task in tasks:
+            op2_index = OP2Index()
+            op2_index.tables = get_task_tables(model.op2_index, [task])
+            op2_index.is_complete = True
+            for result_type in table_types:
+                getattr(sizing_model, result_type).clear()
+            sizing_model._setup_op2()
+            sizing_model._read_tables_from_index(op2_index)
+            task_keys.append([
+                (result_type, key) for result_type in table_types
+                for key in getattr(sizing_model, result_type)])
+    finally:
+        sizing_model._close_op2_file()
+        del sizing_model.f
+
+    # tasks that fill the same result object are loaded together
+    itask_groups = list(range(len(tasks)))
+    def get_group(itask):
+        while itask_groups[itask] != itask:
+            itask = itask_groups[itask]
+        return itask
+
+    key_itasks = {}
+    for itask, keys in enumerate(task_keys):
+        for key in keys:
+            if key in key_itasks:
+                itask_groups[get_group(itask)] = get_group(key_itasks[key])
+            else:
+                key_itasks[key] = itask
+
+    group_itasks = defaultdict(list)
+    for itask in range(len(tasks)):
+        group_itasks[get_group(itask)].append(itask)
+
+    loaders = {}
+    for igroup, itasks in iteritems(group_itasks):
+        table_indexs = get_task_tables(model.op2_index, [tasks[itask] for itask in itasks])
+        loaders[igroup] = LazyResultLoader(
+            model.op2_filename, table_indexs, settings, build_dataframe=build_dataframe)
+
+    for (result_type, key), itask in iteritems(key_itasks):
+        loader = loaders[get_group(itask)]
+        obj = getattr(model, result_type)[key]
+
+        # the arrays that are initialized to None (e.g., element) are
+        # removed, so accessing them loads the object
+        for name, value in list(obj.__dict__.items()):
+            if value is None:
+                del obj.__dict__[name]
+        obj._lazy_loader = loader
+        loader.objects[(result_type, key)] = obj
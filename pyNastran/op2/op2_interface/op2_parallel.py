@@ -0,0 +1,284 @@
+"""
+Defines:
+ - get_parallel_tasks(op2_index)
+ - is_independent_table(table_index)
+ - get_task_tables(op2_index, tasks)
+ - get_worker_settings(model)
+ - create_worker_model(settings)
+ - read_op2_task(op2_filename, tasks, settings)
+ - read_results_parallel(model, tasks, nworkers)
+
+The result tables of an OP2 (e.g., OUGV1, OES1X1, OEF1X, OGPFB1) are independent
+byte ranges, so once the OP2 has been indexed, the tables (and the
+subcases of a table) may be decoded by separate processes.  Each worker
+reads its table3/table4 records using the OP2Index and sends the result
+objects back, which are merged into the main OP2 object.
+
+"""
+from __future__ import print_function
+from collections import OrderedDict
+from six import iteritems
+try:
+    from concurrent.futures import ProcessPoolExecutor
+    IS_CONCURRENT = True
+except ImportError:  # pragma: no cover
+    # Python 2 without the futures backport
+    IS_CONCURRENT = False
+
+from pyNastran.utils.log import get_logger
+from pyNastran.op2.op2_interface.op2_index import OP2Index, OP2TableIndex
+from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+
+#: the result tables that can be read by a worker; they only create
+#: result objects (e.g., displacements, cquad4_stress)
+PARALLEL_TABLE_PREFIXES = (
+    b'OUG', b'BOUG', b'ROUG', b'TOUG', b'OVG', b'OAG',
+    b'OQG', b'OQM', b'OPG',
+    b'OES', b'OSTR', b'OSTN', b'OSTP',
+    b'OEF', b'ONR', b'OEKE', b'OGPF',
+)
+
+
+def get_parallel_tasks(op2_index):
+    """
+    Splits the result tables of an indexed OP2 into tasks
+
+    A task is the set of table3/table4 records with the same subcase,
+    table_code (w/o the random code) and element_type.  The records of a task may come from
+    multiple tables (e.g., an OUGV1 that's written for every design
+    cycle), which fill the same result object, so they must be read
+    by the same worker (in the order they're in the file).
+
+    Parameters
+    ----------
+    op2_index : OP2Index
+        a complete index
+
+    Returns
+    -------
+    tasks : List[List[(itable, records)]]
+        itable : int
+            the index of the table in op2_index.tables
+        records : List[(isubtable, n, record_len, table3_info), ...]
+            the table3/table4 records of the task in the table
+    main_index : OP2Index
+        the index of the tables that aren't part of a task
+
+    """
+    assert op2_index.is_complete, 'the OP2 has not been fully indexed'
+    task_records = OrderedDict()
+    main_index = OP2Index()
+    main_index.is_complete = True
+    for itable, table_index in enumerate(op2_index.tables):
+        if not is_independent_table(table_index):
+            main_index.tables.append(table_index)
+            continue
+
+        # a table4 record belongs to the preceding table3 record
+        for record in table_index.records:
+            isubtable, unused_n, unused_record_len, table3_info = record
+            if isubtable % 2 == 1:
+                isubcase, unused_analysis_code, table_code, element_type = table3_info[:4]
+                if table_code is not None:
+                    # the random tables (e.g., OPGRMS1=802, OPGNO1=902) may
+                    # fill the same result object
+                    table_code %= 100
+                table_records = task_records.setdefault(
+                    (isubcase, table_code, element_type), OrderedDict())
+                records = table_records.setdefault(itable, [])
+            records.append(record)
+
+    tasks = [list(table_records.items()) for table_records in task_records.values()]
+    return tasks, main_index
+
+
+def is_independent_table(table_index, check_name=True):
+    """
+    Can the records of the table be read without reading the rest of
+    the OP2 (e.g., by a worker)?
+
+    Parameters
+    ----------
+    table_index : OP2TableIndex
+        the table
+    check_name : bool; default=True
+        the table must be one of the PARALLEL_TABLE_PREFIXES;
+        False -> any result table with table3/table4 records
+
+    """
+    if not table_index.is_results or not table_index.records:
+        return False
+    if check_name and not table_index.table_name.startswith(PARALLEL_TABLE_PREFIXES):
+        return False
+
+    # the table must start with a table3 record and the table3 records
+    # (odd isubtable) must have the subcase info, so the records can be
+    # grouped
+    if table_index.records[0][0] % 2 == 0:
+        return False
+    for isubtable, unused_n, unused_record_len, table3_info in table_index.records:
+        if isubtable % 2 == 1 and table3_info is None:
+            return False
+    return True
+
+
+def _get_task_size(task):
+    """the number of bytes to read for a task"""
+    return sum(record[2] for unused_itable, records in task for record in records)
+
+
+def get_task_tables(op2_index, tasks):
+    """
+    Combines the records of a worker's tasks, so each table is read once
+    and the records are read in the order they're in the file
+    """
+    table_records = {}
+    for task in tasks:
+        for itable, records in task:
+            table_records.setdefault(itable, []).extend(records)
+
+    table_indexs = []
+    for itable, records in sorted(table_records.items()):
+        table_index = op2_index.tables[itable]
+        worker_table_index = OP2TableIndex(table_index.table_name, table_index.n)
+        worker_table_index.is_results = True
+        worker_table_index.subtable_name = table_index.subtable_name
+        worker_table_index.count = table_index.count
+        worker_table_index.records = sorted(records, key=lambda record: record[1])
+        table_indexs.append(worker_table_index)
+    return table_indexs
+
+
+def get_worker_settings(model):
+    """
+    Gets the OP2 settings that are needed to read some of the tables
+    with a separate OP2 object (see ``create_worker_model``)
+    """
+    settings = {
+        'nastran_format' : model._nastran_format,
+        'subcases' : None if model.is_all_subcases else sorted(model.valid_subcases),
+        'saved_results' : model._results.saved,
+        'use_vector' : model.use_vector,
+        'encoding' : model.encoding,
+        'use_mmap' : model.use_mmap,
+        'memmap_dir' : model.memmap_dir,
+    }
+    return settings
+
+
+def create_worker_model(settings):
+    """creates an OP2 object with the settings of ``get_worker_settings``"""
+    # the OP2 class imports this module
+    from pyNastran.op2.op2 import OP2
+
+    model = OP2(debug=False, log=get_logger(log=None, level='warning'))
+    getattr(model, 'set_as_%s' % settings['nastran_format'])()
+    model.set_subcases(settings['subcases'])
+    model._results.saved = settings['saved_results']
+    model.use_vector = settings['use_vector']
+    model.encoding = settings['encoding']
+    model.use_mmap = settings['use_mmap']
+    model.memmap_dir = settings['memmap_dir']
+    model.is_vectorized = True
+    return model
+
+
+def read_op2_task(op2_filename, tasks, settings):
+    """
+    Reads the records of a series of tables/subcases (e.g., by a worker)
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    tasks : List[OP2TableIndex]
+        the tables/records to read
+    settings : dict
+        the OP2 settings (see ``get_worker_settings``)
+
+    Returns
+    -------
+    results : dict
+        the result objects, result names, and found results
+
+    """
+    model = create_worker_model(settings)
+
+    op2_index = OP2Index()
+    op2_index.tables = tasks
+    op2_index.is_complete = True
+    model.op2_index = op2_index
+
+    model.read_mode = 1
+    model._close_op2 = False
+    OP2_Scalar.read_op2(model, op2_filename=op2_filename)
+    model.read_mode = 2
+    model._close_op2 = True
+    OP2_Scalar.read_op2(model, op2_filename=model.op2_filename)
+
+    result_objects = {}
+    for result_type in model.get_table_types():
+        result = getattr(model, result_type)
+        if result:
+            result_objects[result_type] = result
+    return {
+        'results' : result_objects,
+        'result_names' : model.result_names,
+        'found' : model._results.found,
+    }
+
+
+def read_results_parallel(model, tasks, nworkers):
+    """
+    Reads the result tables/subcases with a process pool and merges the
+    result objects into the model
+
+    Parameters
+    ----------
+    model : OP2
+        the OP2 object, which has finished the array sizing pass
+    tasks : List[List[(itable, records)]]
+        the records of the result tables (see ``get_parallel_tasks``)
+    nworkers : int
+        the number of processes
+
+    """
+    settings = get_worker_settings(model)
+
+    # balance the number of bytes each worker reads
+    nworkers = min(nworkers, len(tasks))
+    worker_tasks = [[] for unused_i in range(nworkers)]
+    worker_sizes = [0] * nworkers
+    itasks = sorted(range(len(tasks)), key=lambda itask: -_get_task_size(tasks[itask]))
+    for itask in itasks:
+        iworker = worker_sizes.index(min(worker_sizes))
+        worker_tasks[iworker].append(itask)
+        worker_sizes[iworker] += _get_task_size(tasks[itask])
+
+    model.log.debug('reading %i result tasks with %i workers' % (
+        len(tasks), nworkers))
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        futures = [
+            executor.submit(read_op2_task, model.op2_filename,
+                            get_task_tables(model.op2_index, [tasks[itask] for itask in itasksi]),
+                            settings)
+            for itasksi in worker_tasks]
+        worker_results = [future.result() for future in futures]
+
+    # the keys were created during the array sizing pass, so the result
+    # objects are replaced in place, which keeps the order of the file
+    merged_keys = set([])
+    for worker_result in worker_results:
+        for result_type, result in iteritems(worker_result['results']):
+            model_result = getattr(model, result_type)
+            for key, obj in iteritems(result):
+                if (result_type, key) in merged_keys:
+                    # two tables wrote to the same result object, so the
+                    # tables aren't independent
+                    msg = ('%s[%r] was read by multiple workers; '
+                           'use nworkers=1' % (result_type, key))
+                    raise RuntimeError(msg)
+                merged_keys.add((result_type, key))
+                model_result[key] = obj
+        model.result_names.update(worker_result['result_names'])
+        model._results.found.update(worker_result['found'])
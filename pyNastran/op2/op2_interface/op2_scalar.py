@@ -36,6 +36,8 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
    - _create_binary_debug()
    - _make_tables()
    - _read_tables(table_name)
+   - _read_table(table_name, table_index=None)
+   - _read_tables_from_index(op2_index)
    - _read_tol()
    - _skip_table(table_name)
    - _read_dit()
@@ -47,7 +49,7 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
    - _read_cmodext_helper(marker_orig, debug=False)
    - _get_marker_n(nmarkers)
    - _read_geom_table()
-   - _read_results_table()
+   - _read_results_table(table_index=None)
    - _print_month(month, day, year, zero, one)
    - _finish()
 
@@ -55,6 +57,7 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
+import mmap
 #import sys
 from struct import unpack, Struct
 from collections import Counter
@@ -213,7 +216,7 @@ GEOM_TABLES = [
     b'DIT', b'DITS',
 
     b'PVT0', b'CASECC',
-    b'EDOM', b'OGPFB1',
+    b'EDOM',
     # GPDT  - Grid point definition table
     # BGPDT - Basic grid point definition table.
     b'GPDT', b'BGPDT', b'BGPDTS', b'BGPDTOLD',
@@ -316,6 +319,10 @@ MSC_RESULT_TABLES = [b'ASSIG', b'ASEPS'] + [
     # ??? forces
     b'OQP1',
 
+    #----------------------
+    # grid point forces
+    b'OGPFB1',
+
     #----------------------
     # displacement/velocity/acceleration/eigenvector/temperature
     # OUPV1 - Scaled Response Spectra - displacements
@@ -700,6 +707,21 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.is_vectorized = False
         self._close_op2 = True
 
+        #: the table/record locations (OP2Index), which are found during
+        #: the array sizing pass or loaded from an index file;
+        #: None -> rescan the file on the 2nd pass
+        self.op2_index = None
+
+        #: memory-map the OP2, so the result records are parsed
+        #: without copying them
+        self.use_mmap = False
+
+        #: the scratch directory for the memory-mapped result arrays;
+        #: None -> the result arrays are stored in memory
+        self.memmap_dir = None
+        #: the memory-mapped scratch files, which are deleted with the OP2
+        self._memmap_filenames = []
+
         self.result_names = set([])
 
         self.grid_point_weight = GridPointWeight()
@@ -1312,14 +1334,19 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             raise FatalError('There was a Nastran FATAL Error.  Check the F06.\nNo tables exist...')
 
         self._make_tables()
-        table_names = self._read_tables(table_name)
+        if self.op2_index is not None and self.op2_index.is_complete:
+            table_names = self._read_tables_from_index(self.op2_index)
+        else:
+            table_names = self._read_tables(table_name)
+            if self.op2_index is not None and self.read_mode == 1:
+                self.op2_index.is_complete = True
         if self.is_debug_file:
             self.binary_debug.write('-' * 80 + '\n')
             self.binary_debug.write('f.tell()=%s\ndone...\n' % self.f.tell())
             self.binary_debug.close()
 
         if self._close_op2:
-            self.f.close()
+            self._close_op2_file()
             del self.binary_debug
             del self.f
         #self.remove_unpickable_data()
@@ -1339,7 +1366,7 @@ class OP2_Scalar(LAMA, ONR, OGPF,
 
         if not hasattr(self, 'f') or self.f is None:
             #: the OP2 file object
-            self.f = open(self.op2_filename, 'rb')
+            self.f = self._open_op2_file()
             #: the endian in bytes
             self._endian = None
             #: the endian in unicode
@@ -1371,6 +1398,37 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         if self.read_mode == 1:
             self._set_structs()
 
+    def _open_op2_file(self):
+        """
+        Opens the OP2 file.  For use_mmap=True, the file is memory-mapped,
+        which supports the same read/seek/tell calls as a file object.
+        """
+        op2_file = open(self.op2_filename, 'rb')
+        if not self.use_mmap:
+            return op2_file
+
+        # the map holds its own handle to the file
+        mmap_file = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+        op2_file.close()
+        if PY3:
+            # a memoryview of an mmap isn't supported on Python 2, so the
+            # data is copied
+            self._mmap_view = memoryview(mmap_file)
+        return mmap_file
+
+    def _close_op2_file(self):
+        """closes the OP2 file/memory map"""
+        if self._mmap_view is not None:
+            # memoryview.release is new in Python 3.2
+            self._mmap_view.release()
+            self._mmap_view = None
+        try:
+            self.f.close()
+        except BufferError:
+            # a result still references the mapped data; the map is closed
+            # when that result is deleted
+            self.log.warning('the OP2 memory map is still referenced and cannot be closed')
+
     def _read_version(self):
         """reads the version header"""
         #try:
@@ -1537,81 +1595,143 @@ class OP2_Scalar(LAMA, ONR, OGPF,
                 self.log.debug('  table_name=%r' % table_name)
 
             self.table_name = table_name
-            #if 0:
-                #self._skip_table(table_name)
-            #else:
-            if table_name in self.generalized_tables:
-                self.generalized_tables[table_name](self)
-            elif table_name in GEOM_TABLES:
-                self._read_geom_table()  # DIT (agard)
-            elif table_name == b'GPL':
-                self._read_gpl()
-            #elif table_name == b'MEFF':
-                #self._read_meff()
-            elif table_name == b'INTMOD':
-                self._read_intmod()
-            elif table_name == b'HISADD':
-                self._read_hisadd()
-            elif table_name == b'FRL':  # frequency response list
-                self._skip_table(self.table_name)
-            elif table_name == b'EXTDB':
-                self._read_extdb()
-            elif table_name == b'OMM2':
-                self._read_omm2()
-            elif table_name == b'TOL':
-                self._read_tol()
-            elif table_name == b'PCOMPTS': # blade
-                self._read_pcompts()
-            elif table_name == b'MONITOR':
-                self._read_monitor()
-            elif table_name == b'AEMONPT':
-                self._read_aemonpt()
-            elif table_name == b'FOL':
-                self._read_fol()
-            elif table_name == b'SDF':
-                self._read_sdf()
-            elif table_name in [b'IBULK', b'CDDATA']:
-                self._read_ibulk()
-            elif table_name == b'CMODEXT':
-                self._read_cmodext()
-            elif table_name in MATRIX_TABLES:
-                self._read_matrix(table_name)
-            elif table_name in RESULT_TABLES:
-                self._read_results_table()
-            elif self.skip_undefined_matrices:
-                self._read_matrix(table_name)
-            elif table_name.strip() in self.additional_matrices:
-                self._read_matrix(table_name)
-            else:
-                msg = (
-                    'Invalid Table = %r\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      b'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % table_name
-                )
-                raise NotImplementedError(msg)
+            table_index = None
+            if self.op2_index is not None and self.read_mode == 1:
+                table_index = self.op2_index.add_table(table_name, self.n)
+                table_index.count = self._count
+            self._read_table(table_name, table_index)
 
             table_name = self._read_table_name(rewind=True, stop_on_failure=False)
         return table_names
 
+    def _read_table(self, table_name, table_index=None):
+        """
+        Reads a single geometry/result table
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+        table_index : OP2TableIndex; default=None
+            stores the record locations of a result table
+            (only used during the array sizing pass)
+
+        """
+        #if 0:
+            #self._skip_table(table_name)
+        #else:
+        if table_name in self.generalized_tables:
+            self.generalized_tables[table_name](self)
+        elif table_name in GEOM_TABLES:
+            self._read_geom_table()  # DIT (agard)
+        elif table_name == b'GPL':
+            self._read_gpl()
+        #elif table_name == b'MEFF':
+            #self._read_meff()
+        elif table_name == b'INTMOD':
+            self._read_intmod()
+        elif table_name == b'HISADD':
+            self._read_hisadd()
+        elif table_name == b'FRL':  # frequency response list
+            self._skip_table(self.table_name)
+        elif table_name == b'EXTDB':
+            self._read_extdb()
+        elif table_name == b'OMM2':
+            self._read_omm2()
+        elif table_name == b'TOL':
+            self._read_tol()
+        elif table_name == b'PCOMPTS': # blade
+            self._read_pcompts()
+        elif table_name == b'MONITOR':
+            self._read_monitor()
+        elif table_name == b'AEMONPT':
+            self._read_aemonpt()
+        elif table_name == b'FOL':
+            self._read_fol()
+        elif table_name == b'SDF':
+            self._read_sdf()
+        elif table_name in [b'IBULK', b'CDDATA']:
+            self._read_ibulk()
+        elif table_name == b'CMODEXT':
+            self._read_cmodext()
+        elif table_name in MATRIX_TABLES:
+            self._read_matrix(table_name)
+        elif table_name in RESULT_TABLES:
+            self._read_results_table(table_index)
+        elif self.skip_undefined_matrices:
+            self._read_matrix(table_name)
+        elif table_name.strip() in self.additional_matrices:
+            self._read_matrix(table_name)
+        else:
+            msg = (
+                'Invalid Table = %r\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      b'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % table_name
+            )
+            raise NotImplementedError(msg)
+
+    def _read_tables_from_index(self, op2_index):
+        """
+        Reads all the geometry/result tables using the table/record
+        locations found during the array sizing pass (or loaded from an
+        index file).  The result tables jump straight to their
+        table3/table4 records, while the other tables are read in the
+        standard way.
+
+        Parameters
+        ----------
+        op2_index : OP2Index
+            the table/record locations
+
+        Returns
+        -------
+        table_names : List[bytes str]
+            the table names that were read
+
+        """
+        table_names = []
+        for table_index in op2_index.tables:
+            table_name = table_index.table_name
+            table_names.append(table_name)
+            if self.is_debug_file:
+                self.binary_debug.write('-' * 80 + '\n')
+                self.binary_debug.write('table_name = %r (indexed)\n' % (table_name))
+
+            self.table_name = table_name
+            if table_index.count is None:
+                table_index.count = self._count
+            else:
+                # the table may be read without the tables before it
+                # (e.g., by a worker), so the design cycle is set
+                self._count = table_index.count
+
+            if table_index.is_results:
+                self.subtable_name = table_index.subtable_name
+                self._read_subtables_from_index(table_index.records)
+            else:
+                self._goto(table_index.n)
+                self._read_table(table_name)
+        return table_names
+
     def _read_tol(self):
         """
         This is probably broken for MSC Nastran
@@ -1887,8 +2007,17 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.subtable_name = subtable_name.rstrip()
         self._read_subtables()
 
-    def _read_results_table(self):
-        """Reads a results table"""
+    def _read_results_table(self, table_index=None):
+        """
+        Reads a results table
+
+        Parameters
+        ----------
+        table_index : OP2TableIndex; default=None
+            stores the record locations of the table
+            (only used during the array sizing pass)
+
+        """
         if self.is_debug_file:
             self.binary_debug.write('read_results_table - %s\n' % self.table_name)
         self.table_name = self._read_table_name(rewind=False)
@@ -1934,7 +2063,12 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             raise RuntimeError('the file hasnt been cleaned up; subtable_name_old=%s new=%s' % (
                 self.subtable_name, subtable_name))
         self.subtable_name = subtable_name
+        if table_index is not None:
+            table_index.is_results = True
+            table_index.subtable_name = subtable_name
+            self._table_index = table_index
         self._read_subtables()
+        self._table_index = None
 
     def _print_month(self, month, day, year, zero, one):
         """
@@ -29,8 +29,77 @@ def write_table_header(f, fascii, table_name):
     f.write(st.pack(*table0))
     fascii.write('OUG header0 = %s\n' % table0)
 
-def export_to_hdf5(self, group, log):
-    """exports the object to HDF5 format"""
+#: the target size of an HDF5 chunk (bytes)
+HDF5_CHUNK_BYTES = 2 ** 18
+
+#: smaller arrays aren't chunked/compressed because the chunk index
+#: takes up more space than it saves
+HDF5_MIN_CHUNKED_BYTES = 2 ** 14
+
+def get_hdf5_chunk_shape(shape, itemsize, chunk_bytes=HDF5_CHUNK_BYTES):
+    """
+    Gets the chunk shape of an HDF5 dataset
+
+    The trailing axes are filled first, so the chunks of a
+    (ntimes, nelements, ncolumns) data array are blocks of elements
+    for a single time step, and for small models, blocks of time steps.
+    This lets a few time steps/elements be read without reading the
+    whole array.
+
+    Parameters
+    ----------
+    shape : Tuple[int, ...]
+        the shape of the array
+    itemsize : int
+        the size of the dtype (bytes)
+    chunk_bytes : int; default=HDF5_CHUNK_BYTES
+        the target size of a chunk (bytes)
+
+    Returns
+    -------
+    chunk_shape : Tuple[int, ...]
+        the chunk shape
+
+    """
+    nitems = max(1, chunk_bytes // itemsize)
+    chunk_shape = []
+    for n in reversed(shape):
+        ni = max(1, min(n, nitems))
+        chunk_shape.append(ni)
+        nitems //= ni
+    return tuple(reversed(chunk_shape))
+
+def _get_hdf5_dataset_kwargs(value, compression):
+    """gets the chunk/compression options for an HDF5 dataset"""
+    if not isinstance(value, np.ndarray) or value.ndim == 0 or value.size == 0:
+        # h5py can't chunk scalars/empty arrays
+        return {}
+    if value.nbytes < HDF5_MIN_CHUNKED_BYTES:
+        return {}
+    if value.dtype.kind not in 'biufcS':
+        return {}
+    kwargs = {
+        'chunks' : get_hdf5_chunk_shape(value.shape, value.dtype.itemsize),
+    }
+    if compression is not None:
+        kwargs['compression'] = compression
+        kwargs['shuffle'] = value.dtype.kind in 'biufc'
+    return kwargs
+
+def export_to_hdf5(self, group, log, compression=None):
+    """
+    exports the object to HDF5 format
+
+    Parameters
+    ----------
+    group : h5py.Group
+        the group to write the object to
+    log : logger
+        a logger object
+    compression : str; default=None
+        the compression filter of the array datasets (None, 'lzf', 'gzip')
+
+    """
     #headers = self.get_headers()
 
     names = self.object_attributes()
@@ -48,9 +117,10 @@ def export_to_hdf5(self, group, log):
             #
             # https://stackoverflow.com/questions/43390038/storing-scipy-sparse-matrix-as-hdf5
             #g = group.create_group('Mcoo')
-            group.create_dataset('data', data=value.data)
-            group.create_dataset('row', data=value.row)
-            group.create_dataset('col', data=value.col)
+            for coo_name in ['data', 'row', 'col']:
+                coo_value = getattr(value, coo_name)
+                group.create_dataset(coo_name, data=coo_value,
+                                     **_get_hdf5_dataset_kwargs(coo_value, compression))
             group.attrs['shape'] = value.shape
             continue
 
@@ -82,7 +152,8 @@ def export_to_hdf5(self, group, log):
             #msg = 'sub-object export_to_hdf5 not supported\nkey=%s value=%s' % (key, value)
             #raise NotImplementedError(msg)
         try:
-            group.create_dataset(name, data=value)
+            group.create_dataset(name, data=value,
+                                 **_get_hdf5_dataset_kwargs(value, compression))
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
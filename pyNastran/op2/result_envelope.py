@@ -0,0 +1,222 @@
+"""
+Defines:
+ - ResultEnvelope(headers=None)
+   - add_result(obj, isubcase=None, itime=0)
+   - add_results(results, subcases=None)
+   - abs_max / abs_max_icase / abs_max_itime
+   - get_subcases(icase)
+ - get_envelope(results, subcases=None)
+
+An envelope is the max, min, and absolute max of every column of a
+result (e.g., the von Mises stress of each element of a
+RealPlateStressArray) over the subcases and time steps, as well as the
+subcase/time step that controls each value.
+
+The results are added one at a time, so only the envelope (and not the
+results) must be kept in memory:
+
+.. code-block:: python
+
+   envelope = ResultEnvelope()
+   for result_name, isubcase, itime, obj in iter_op2_results(
+           op2_filename, result_names='cquad4_stress'):
+       envelope.add_result(obj, isubcase=isubcase, itime=itime)
+
+   ovm_max = envelope.max[:, 7]
+   ovm_subcase = envelope.get_subcases(envelope.max_icase[:, 7])
+
+"""
+from __future__ import print_function
+import numpy as np
+
+from pyNastran.op2.vector_utils import abs_max_min_vector
+from pyNastran.op2.load_combinations import INDEX_NAMES
+
+
+class ResultEnvelope(object):
+    """
+    The max/min/absolute max of a result over the subcases and time steps
+
+    Attributes
+    ----------
+    max / min : (ntotal, ncolumns) float ndarray
+        the max/min of each column of the rows (e.g., element/node) of
+        the result
+    max_icase / min_icase : (ntotal, ncolumns) int ndarray
+        the index of the controlling subcase in ``subcases``
+    max_itime / min_itime : (ntotal, ncolumns) int ndarray
+        the index of the controlling time step of the subcase
+    subcases : List[isubcase]
+        the subcases that have been added
+    headers : List[str]
+        the names of the columns (e.g., ['fiber_distance', 'oxx', ...])
+
+    The element/node ids of the rows are the same as the results
+    (e.g., ``envelope.element_node``, ``envelope.node_gridtype``).
+
+    """
+    def __init__(self, headers=None):
+        self.headers = headers
+        self.subcases = []
+        self.max = None
+        self.min = None
+        self.max_icase = None
+        self.min_icase = None
+        self.max_itime = None
+        self.min_itime = None
+        self._icases = {}
+        self._index_names = []
+
+    def add_result(self, obj, isubcase=None, itime=0):
+        """
+        Adds a result to the envelope
+
+        Parameters
+        ----------
+        obj : varies
+            a real result (e.g., a RealPlateStressArray,
+            RealDisplacementArray, RealCBarForceArray)
+        isubcase : int; default=None -> obj.isubcase
+            the subcase of the result
+        itime : int; default=0
+            the index of the first time step of the result (e.g., from
+            ``iter_op2_results``, which reads a time step at a time)
+
+        """
+        data = obj.data
+        if np.iscomplexobj(data):
+            raise NotImplementedError('envelopes of %s are not supported' % obj.class_name)
+        if isubcase is None:
+            isubcase = obj.isubcase
+
+        if isubcase in self._icases:
+            icase = self._icases[isubcase]
+        else:
+            icase = len(self.subcases)
+            self._icases[isubcase] = icase
+            self.subcases.append(isubcase)
+
+        # the max/min over the time steps of the result
+        imaxs = data.argmax(axis=0)
+        imins = data.argmin(axis=0)
+        irows, icolumns = np.indices(imaxs.shape)
+        maxs = data[imaxs, irows, icolumns]
+        mins = data[imins, irows, icolumns]
+
+        if self.max is None:
+            self._set_index(obj)
+            if self.headers is None and hasattr(obj, 'get_headers'):
+                self.headers = obj.get_headers()
+            self.max = maxs
+            self.min = mins
+            self.max_icase = np.full(maxs.shape, icase, dtype='int32')
+            self.min_icase = np.full(mins.shape, icase, dtype='int32')
+            self.max_itime = (imaxs + itime).astype('int32')
+            self.min_itime = (imins + itime).astype('int32')
+            return
+
+        self._check_index(obj, isubcase)
+        # the first case is used for a tie
+        is_max = maxs > self.max
+        self.max[is_max] = maxs[is_max]
+        self.max_icase[is_max] = icase
+        self.max_itime[is_max] = imaxs[is_max] + itime
+
+        is_min = mins < self.min
+        self.min[is_min] = mins[is_min]
+        self.min_icase[is_min] = icase
+        self.min_itime[is_min] = imins[is_min] + itime
+
+    def add_results(self, results, subcases=None):
+        """
+        Adds the results of a type (e.g., model.cquad4_stress)
+
+        Parameters
+        ----------
+        results : Dict[isubcase] = result
+            the results
+        subcases : List[isubcase]; default=None -> all
+            the subcases to add
+
+        """
+        if subcases is None:
+            subcases = list(results.keys())
+        for isubcase in subcases:
+            self.add_result(results[isubcase], isubcase=isubcase)
+
+    def _set_index(self, obj):
+        """the rows of the envelope are the rows of the first result"""
+        for name in INDEX_NAMES:
+            if hasattr(obj, name):
+                setattr(self, name, getattr(obj, name))
+                self._index_names.append(name)
+
+    def _check_index(self, obj, isubcase):
+        """the rows of the results must be the same"""
+        if obj.data.shape[1:] != self.max.shape:
+            raise ValueError('subcase=%r: data.shape=%s; expected (ntimes, %s, %s)' % (
+                isubcase, str(obj.data.shape), self.max.shape[0], self.max.shape[1]))
+        for name in self._index_names:
+            if not np.array_equal(getattr(obj, name), getattr(self, name)):
+                raise ValueError('subcase=%r: %s is different than subcase=%r' % (
+                    isubcase, name, self.subcases[0]))
+
+    @property
+    def abs_max(self):
+        """the value with the largest magnitude (the max is used for a tie)"""
+        return self._get_abs_max()[0]
+
+    @property
+    def abs_max_icase(self):
+        """the index of the subcase of the absolute max in ``subcases``"""
+        is_max = self._get_abs_max()[1]
+        return np.where(is_max, self.max_icase, self.min_icase)
+
+    @property
+    def abs_max_itime(self):
+        """the index of the time step of the absolute max"""
+        is_max = self._get_abs_max()[1]
+        return np.where(is_max, self.max_itime, self.min_itime)
+
+    def _get_abs_max(self):
+        """gets the absolute max and a flag for the values that are the max"""
+        shape = self.max.shape
+        max_min = np.stack([self.max.ravel(), self.min.ravel()], axis=1)
+        abs_max = abs_max_min_vector(max_min).reshape(shape)
+        return abs_max, abs_max == self.max
+
+    def get_subcases(self, icase):
+        """gets the subcase ids of an array of subcase indices (e.g., max_icase)"""
+        # the subcases may be tuples
+        subcases = np.empty(len(self.subcases), dtype='object')
+        for i, isubcase in enumerate(self.subcases):
+            subcases[i] = isubcase
+        return subcases[icase]
+
+    def __repr__(self):
+        if self.max is None:
+            return 'ResultEnvelope()'
+        return 'ResultEnvelope(nsubcases=%s, ntotal=%s, headers=%s)' % (
+            len(self.subcases), self.max.shape[0], self.headers)
+
+
+def get_envelope(results, subcases=None):
+    """
+    Gets the envelope of the results of a type
+
+    Parameters
+    ----------
+    results : Dict[isubcase] = result
+        the results (e.g., model.cquad4_stress)
+    subcases : List[isubcase]; default=None -> all
+        the subcases to include
+
+    Returns
+    -------
+    envelope : ResultEnvelope
+        the max/min/absolute max of the results
+
+    """
+    envelope = ResultEnvelope()
+    envelope.add_results(results, subcases=subcases)
+    return envelope
@@ -177,7 +177,7 @@ class ElementTableArray(ScalarObject):  # displacement style table
         self.element_data_type = empty(nelements, dtype='|U8')
 
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((nx, ny, 6), self.data_type())
+        self.data = self._zeros_data((nx, ny, 6), self.data_type())
 
     def add_sort1(self, dt, eid, etype, v1, v2, v3, v4, v5, v6):
         """unvectorized method for adding SORT1 transient data"""
@@ -1,6 +1,8 @@
 #pylint: disable=C0301,C0111
 from __future__ import print_function, unicode_literals
+import os
 import copy
+import tempfile
 from itertools import count
 from struct import pack
 from six import text_type, binary_type, iteritems, PY3, string_types
@@ -15,6 +17,9 @@ from pyNastran.op2.op2_interface.op2_codes import Op2Codes
 from pyNastran.op2.op2_interface.write_utils import write_table_header, export_to_hdf5
 
 class BaseScalarObject(Op2Codes):
+    #: a scratch directory for the data array (see ``read_op2(memmap_dir=...)``)
+    _memmap_dir = None
+
     def __init__(self):
         Op2Codes.__init__(self)
         self.is_built = False
@@ -36,6 +41,22 @@ class BaseScalarObject(Op2Codes):
         #self.ntotal = 0
         #assert isinstance(self.name, (text_type, binary_type)), 'name=%s type=%s' % (self.name, type(self.name))
 
+    def _zeros_data(self, shape, dtype='float64'):
+        """
+        Allocates the zeroed data array.  If ``_memmap_dir`` is set, the
+        array is created directly in a memory-mapped scratch file, so the
+        result doesn't have to fit in memory.
+        """
+        if self._memmap_dir is None or np.prod(shape) == 0:
+            return np.zeros(shape, dtype=dtype)
+        fd, data_filename = tempfile.mkstemp(
+            prefix='%s_%s_' % (self.__class__.__name__, getattr(self, 'isubcase', '')),
+            suffix='.dat', dir=self._memmap_dir)
+        os.close(fd)
+
+        # a new file is filled with zeros
+        return np.memmap(data_filename, dtype=dtype, mode='w+', shape=shape)
+
     def object_attributes(self, mode='public', keys_to_skip=None):
         if keys_to_skip is None:
             keys_to_skip = []
@@ -109,6 +130,21 @@ class BaseScalarObject(Op2Codes):
     def class_name(self):
         return self.__class__.__name__
 
+    def __getattr__(self, name):
+        """
+        Loads the data of a lazily read result the first time a missing
+        attribute (e.g., data, element_node) is accessed.
+
+        See ``OP2.read_op2(..., lazy=True)``
+        """
+        # __getattr__ is only called when the attribute doesn't exist
+        lazy_loader = self.__dict__.get('_lazy_loader')
+        if lazy_loader is None or name.startswith('__'):
+            raise AttributeError('%r object has no attribute %r' % (
+                self.__class__.__name__, name))
+        lazy_loader.load()
+        return getattr(self, name)
+
     def __getstate__(self):
         """we need to remove the saved functions"""
         state = self.__dict__.copy()
@@ -267,9 +303,9 @@ class BaseScalarObject(Op2Codes):
     def build_dataframe(self):
         print('build_dataframe is not implemented in %s' % self.__class__.__name__)
 
-    def export_to_hdf5(self, group, log):
+    def export_to_hdf5(self, group, log, compression=None):
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression)
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
                   page_num=1, is_mag_phase=False, is_sort1=True):
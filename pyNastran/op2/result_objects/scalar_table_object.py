@@ -181,7 +181,7 @@ class ScalarTableArray(ScalarObject):  # displacement style table
         self.node_gridtype = zeros((nnodes, 2), dtype='int32')
 
         #[t1]
-        self.data = zeros((nx, ny, 1), self.data_type())
+        self.data = self._zeros_data((nx, ny, 1), self.data_type())
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -346,7 +346,7 @@ class TableArray(ScalarObject):  # displacement style table
         self.node_gridtype = zeros((nnodes, 2), dtype='int32')
 
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((nx, ny, 6), self.data_type())
+        self.data = self._zeros_data((nx, ny, 6), self.data_type())
         #print('ntimes=%s nnodes=%s; nx=%s ny=%s; ntotal=%s' % (
             #ntimes, nnodes, nx, ny, self.ntotal))
 
@@ -0,0 +1,258 @@
+"""
+Defines:
+ - NodalTransform(nids, cd_transforms)
+   - from_icd_transform(nids, icd_transform, coords, xyz_cid0=None)
+   - transform_data(data, nids)
+   - transform_result(result)
+ - get_nodal_transform(model)
+ - get_cd_transforms(coords, nid_cd, icd_transform, xyz_cid0)
+
+Rotates the nodal results (e.g., displacements, eigenvectors, SPC
+forces, grid point forces) from the output (CD) frame of the nodes into
+the global frame.  The transform of each node (including cylindrical
+and spherical systems) is calculated once, so every subcase and time
+step of a result is rotated with a single einsum:
+
+.. code-block:: python
+
+   model = read_bdf(bdf_filename)
+   nodal_transform = get_nodal_transform(model)
+
+   op2_model = read_op2(op2_filename)
+   op2_model.transform_results_to_global(nodal_transform)
+
+"""
+from __future__ import print_function
+from six import iteritems
+
+import numpy as np
+
+
+class NodalTransform(object):
+    """the CD to global transforms of the nodes that aren't in the global frame"""
+    def __init__(self, nids, cd_transforms):
+        """
+        Creates the transform
+
+        Parameters
+        ----------
+        nids : (n, ) int ndarray
+            the node ids (or the rows of the results)
+        cd_transforms : (n, 3, 3) float ndarray
+            the CD to global transform of each node (see ``get_cd_transforms``)
+
+        """
+        nids = np.asarray(nids)
+        isort = np.argsort(nids)
+        self.nids = nids[isort]
+        self.cd_transforms = np.asarray(cd_transforms, dtype='float64')[isort, :, :]
+
+        # the rows of a set of result node ids
+        self._rows = {}
+
+    @classmethod
+    def from_icd_transform(cls, nids, icd_transform, coords, xyz_cid0=None):
+        """
+        Creates the transform from the output of ``BDF.get_displacement_index``
+
+        Parameters
+        ----------
+        nids : (M, ) int ndarray
+            the GRID/SPOINT/EPOINT ids (e.g., BDF.point_ids)
+        icd_transform : dict{int cd : (Mi, ) int ndarray}
+            the indices of the nodes in nids that have their output in cd
+        coords : dict{int cid : Coord()}
+            the coordinate systems
+        xyz_cid0 : (M, 3) float ndarray; default=None
+            the nodes in the global frame
+            required if a CD is cylindrical or spherical
+
+        """
+        nids = np.asarray(nids)
+        inodes = []
+        for cd, inodesi in sorted(iteritems(icd_transform)):
+            if cd in [-1, 0]:
+                continue
+            coord = coords[cd]
+            if coord.type in ['CORD2R', 'CORD1R'] and np.array_equal(coord.beta(), np.eye(3)):
+                # the coordinate system is the global frame
+                continue
+            inodes.append(inodesi)
+
+        if not inodes:
+            return cls(np.zeros(0, dtype=nids.dtype), np.zeros((0, 3, 3), dtype='float64'))
+        inodes = np.hstack(inodes)
+        nid_cd = np.zeros((len(nids), 2), dtype=nids.dtype)
+        nid_cd[:, 0] = nids
+        cd_transforms = get_cd_transforms(coords, nid_cd, icd_transform, xyz_cid0)
+        return cls(nids[inodes], cd_transforms[inodes, :, :])
+
+    def __len__(self):
+        return len(self.nids)
+
+    def _get_rows(self, nids):
+        """gets the rows of the results and the index of their transforms"""
+        key = (nids.dtype.str, nids.tobytes())
+        if key in self._rows:
+            return self._rows[key]
+        irows = np.where(np.in1d(nids, self.nids))[0]
+        itransforms = np.searchsorted(self.nids, nids[irows])
+        rows = (irows, itransforms)
+        self._rows[key] = rows
+        return rows
+
+    def transform_data(self, data, nids):
+        """
+        Rotates the translations/rotations of every time step into the
+        global frame (in place)
+
+        Parameters
+        ----------
+        data : (ntimes, nrows, 6) float/complex ndarray
+            the [t1, t2, t3, r1, r2, r3] results
+        nids : (nrows, ) int ndarray
+            the node id of each row; rows that aren't in the transform
+            (e.g., SPOINTs, CD=0 nodes) are skipped
+
+        """
+        irows, itransforms = self._get_rows(np.asarray(nids))
+        nrows = len(irows)
+        if nrows == 0:
+            return
+        ntimes = data.shape[0]
+        datai = data[:, irows, :6].reshape(ntimes, nrows, 2, 3)
+        data[:, irows, :6] = np.einsum(
+            'tnki,nij->tnkj', datai, self.cd_transforms[itransforms, :, :]).reshape(
+                ntimes, nrows, 6)
+
+    def transform_result(self, result):
+        """
+        Rotates a displacement-like (e.g., RealDisplacementArray,
+        ComplexEigenvectorArray) or grid point force result into the
+        global frame (in place)
+
+        """
+        data = result.data
+        if hasattr(result, 'node_element'):
+            # grid point forces; the rows can change with the time step
+            node_element = result.node_element
+            if node_element.ndim == 2:
+                self.transform_data(data, node_element[:, 0])
+            elif (node_element[:, :, 0] == node_element[0, :, 0]).all():
+                self.transform_data(data, node_element[0, :, 0])
+            else:
+                for itime in range(data.shape[0]):
+                    self.transform_data(data[itime:itime+1, :, :], node_element[itime, :, 0])
+            return
+        self.transform_data(data, result.node_gridtype[:, 0])
+
+    def __repr__(self):
+        return 'NodalTransform(nnodes=%s)' % len(self.nids)
+
+
+def get_nodal_transform(model):
+    """
+    Gets the CD to global transforms of the nodes of a model
+
+    Parameters
+    ----------
+    model : BDF()
+        the model (the coordinate systems must be setup)
+
+    Returns
+    -------
+    nodal_transform : NodalTransform
+        the transform
+
+    """
+    icd_transform, icp_transform, xyz_cp, nid_cp_cd = model.get_displacement_index_xyz_cp_cd()
+    nids = nid_cp_cd[:, 0]
+    xyz_cid0 = model.transform_xyzcp_to_xyz_cid(xyz_cp, nids, icp_transform, cid=0)
+    return NodalTransform.from_icd_transform(nids, icd_transform, model.coords, xyz_cid0)
+
+
+def get_cd_transforms(coords, nid_cd, icd_transform, xyz_cid0):
+    """
+    Gets the transform from the CD frame to the global frame of each node
+
+    A vector in the CD frame is rotated into the global frame by:
+
+    .. code-block:: python
+
+       vector_cid0 = vector_cd @ cd_transforms[inode]
+
+    For a rectangular system, the transform is beta.  For a cylindrical
+    (R, theta, z) or spherical (R, theta, phi) system, the axes depend
+    on the location of the node.
+
+    Parameters
+    ----------
+    coords : dict[int] = CORDx
+        all the coordinate systems
+    nid_cd : (M, 2) int ndarray
+        the (BDF.point_ids, cd) array
+    icd_transform : dict[cd] = (Mi, ) int ndarray
+        the mapping for nid_cd; None -> use the cd of nid_cd
+    xyz_cid0 : (M, 3) float ndarray
+        the grid locations in coordinate system 0
+        (only required for cylindrical/spherical systems)
+
+    Returns
+    -------
+    cd_transforms : (M, 3, 3) float ndarray
+        the transforms
+
+    """
+    nid_cd = np.asarray(nid_cd)
+    nnodes = nid_cd.shape[0]
+    cd_transforms = np.zeros((nnodes, 3, 3), dtype='float64')
+    cd_transforms[:, [0, 1, 2], [0, 1, 2]] = 1.
+
+    if icd_transform is None:
+        cds = nid_cd[:, 1]
+        icd_transform = {cd : np.where(cds == cd)[0] for cd in np.unique(cds)}
+
+    for cd, inodes in iteritems(icd_transform):
+        if cd in [-1, 0]:
+            continue
+        inodes = np.asarray(inodes)
+        coord = coords[cd]
+        beta = coord.beta()
+        if coord.type in ['CORD2R', 'CORD1R']:
+            cd_transforms[inodes, :, :] = beta
+            continue
+
+        if xyz_cid0 is None:
+            msg = 'xyz_cid0 is required for cylindrical/spherical coordinate transforms'
+            raise RuntimeError(msg)
+
+        # the node in the rectangular frame of the coordinate system
+        xyz = np.dot(xyz_cid0[inodes, :] - coord.origin, beta.T)
+        axes = np.zeros((len(inodes), 3, 3), dtype='float64')
+        if coord.type in ['CORD2C', 'CORD1C']:
+            theta = np.arctan2(xyz[:, 1], xyz[:, 0])
+            cos_theta = np.cos(theta)
+            sin_theta = np.sin(theta)
+            axes[:, 0, 0] = cos_theta  # R
+            axes[:, 0, 1] = sin_theta
+            axes[:, 1, 0] = -sin_theta  # theta
+            axes[:, 1, 1] = cos_theta
+            axes[:, 2, 2] = 1.  # z
+        elif coord.type in ['CORD2S', 'CORD1S']:
+            radius_xy = np.hypot(xyz[:, 0], xyz[:, 1])
+            theta = np.arctan2(radius_xy, xyz[:, 2])
+            phi = np.arctan2(xyz[:, 1], xyz[:, 0])
+            cos_theta = np.cos(theta)
+            sin_theta = np.sin(theta)
+            cos_phi = np.cos(phi)
+            sin_phi = np.sin(phi)
+            axes[:, 0, :] = np.column_stack([  # R
+                sin_theta * cos_phi, sin_theta * sin_phi, cos_theta])
+            axes[:, 1, :] = np.column_stack([  # theta
+                cos_theta * cos_phi, cos_theta * sin_phi, -sin_theta])
+            axes[:, 2, 0] = -sin_phi  # phi
+            axes[:, 2, 1] = cos_phi
+        else:
+            raise NotImplementedError(coord)
+        cd_transforms[inodes, :, :] = np.einsum('nij,jk->nik', axes, beta)
+    return cd_transforms
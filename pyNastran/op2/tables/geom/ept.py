@@ -25,6 +25,7 @@ from pyNastran.bdf.cards.properties.springs import PELAS, PELAST
 from pyNastran.bdf.cards.thermal.thermal import PCONV, PHBDY
 # PCOMPG, PBUSH1D, PBEAML, PBEAM3
 from pyNastran.op2.tables.geom.geom_common import GeomCommon
+from pyNastran.op2.tables.geom.lazy_cards import build_pshell
 
 
 class EPT(GeomCommon):
@@ -1389,6 +1390,10 @@ class EPT(GeomCommon):
         """
         PSHELL(2302,23,283) - the marker for Record 51
         """
+        if self.vectorized_geom and not self.is_debug_file:
+            n_vectorized = self._read_pshell_vectorized(data, n)
+            if n_vectorized is not None:
+                return n_vectorized
         ntotal = 44  # 11*4
         s = Struct(self._endian + b'iififi4fi')
         nproperties = (len(data) - n) // ntotal
@@ -1409,6 +1414,47 @@ class EPT(GeomCommon):
         self.card_count['PSHELL'] = nproperties
         return n
 
+    def _read_pshell_vectorized(self, data, n):
+        """
+        PSHELL(2302,23,283) - the marker for Record 51
+
+        Returns None if the record has duplicate ids (see
+        ``_is_unique_vectorized``)
+        """
+        ntotal = 44  # 11*4
+        nproperties = (len(data) - n) // ntotal
+        ints = np.frombuffer(data, self.idtype, count=nproperties * 11,
+                             offset=n).reshape(nproperties, 11)
+        floats = np.frombuffer(data, self.fdtype, count=nproperties * 11,
+                               offset=n).reshape(nproperties, 11)
+        if not self._is_unique_vectorized('properties', 'PSHELL', ints[:, 0]):
+            return None
+
+        #(pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4)
+        arrays = {
+            'pid' : ints[:, 0].copy(),
+            'mids' : ints[:, [1, 3, 5, 10]],
+            't' : floats[:, 2].copy(),
+            'bk' : floats[:, 4].copy(),
+            'ts' : floats[:, 6].copy(),
+            'nsm' : floats[:, 7].copy(),
+            'z1' : floats[:, 8].copy(),
+            'z2' : floats[:, 9].copy(),
+        }
+
+        # properties with large ids are stored separately and aren't vectorized
+        is_big = np.hstack([arrays['pid'][:, np.newaxis], arrays['mids']]).max(axis=1) > 1e8
+        if is_big.any():
+            for i in np.where(is_big)[0]:
+                prop = build_pshell(arrays, i)
+                self.big_properties[prop.pid] = prop
+            i = np.where(~is_big)[0]
+            arrays = {name : array[i] for name, array in arrays.items()}
+
+        self._add_lazy_cards('properties', 'PSHELL', arrays['pid'], arrays, build_pshell)
+        self.card_count['PSHELL'] = nproperties
+        return n + nproperties * ntotal
+
     def _read_psolid(self, data, n):
         """
         PSOLID(2402,24,281) - the marker for Record 52
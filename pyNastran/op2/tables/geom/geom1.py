@@ -14,6 +14,7 @@ from pyNastran.bdf.cards.coordinate_systems import (
 from pyNastran.bdf.cards.elements.damper import CVISC
 from pyNastran.bdf.cards.elements.mass import CMASS2
 from pyNastran.op2.tables.geom.geom_common import GeomCommon
+from pyNastran.op2.tables.geom.lazy_cards import build_grid
 
 class GEOM1(GeomCommon):
     """defines methods for reading op2 nodes/coords"""
@@ -248,6 +249,10 @@ class GEOM1(GeomCommon):
 
     def _read_grid(self, data, n):  # 21.8 sec, 18.9
         """(4501,45,1) - the marker for Record 17"""
+        if self.vectorized_geom and not self.is_debug_file:
+            n_vectorized = self._read_grid_vectorized(data, n)
+            if n_vectorized is not None:
+                return n_vectorized
         s = Struct(self._endian + b'ii3f3i')
         ntotal = 32
         nentries = (len(data) - n) // ntotal
@@ -279,6 +284,37 @@ class GEOM1(GeomCommon):
         self.increase_card_count('GRID', nentries - nfailed)
         return n
 
+    def _read_grid_vectorized(self, data, n):
+        """
+        (4501,45,1) - the marker for Record 17
+
+        Returns None if the record has duplicate ids (see
+        ``_is_unique_vectorized``)
+        """
+        ntotal = 32
+        nentries = (len(data) - n) // ntotal
+        ints = np.frombuffer(data, self.idtype, count=nentries * 8, offset=n).reshape(nentries, 8)
+        floats = np.frombuffer(data, self.fdtype, count=nentries * 8, offset=n).reshape(nentries, 8)
+
+        #(nid, cp, x1, x2, x3, cd, ps, seid)
+        nid = ints[:, 0]
+        i = np.where(nid < 10000000)[0]
+        nid = nid[i]
+        if not self._is_unique_vectorized('nodes', 'GRID', nid):
+            return None
+        arrays = {
+            'nid' : nid,
+            'cp' : ints[i, 1],
+            'xyz' : floats[i, 2:5],
+            'cd' : ints[i, 5],
+            'ps' : ints[i, 6],
+            'seid' : ints[i, 7],
+        }
+        self._add_lazy_cards('nodes', 'GRID', nid, arrays, build_grid,
+                             add_to_type_map=False)
+        self.increase_card_count('GRID', len(nid))
+        return n + nentries * ntotal
+
     def _read_seqgp(self, data, n):
         """(5301,53,4) - the marker for Record 27"""
         struct_2i = Struct(self._endian + b'2i')
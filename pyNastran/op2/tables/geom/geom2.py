@@ -6,6 +6,7 @@ defines readers for BDF objects in the OP2 GEOM2/GEOM2S table
 from struct import unpack, Struct
 from six import b
 from six.moves import range
+import numpy as np
 
 from pyNastran.bdf.cards.elements.elements import CGAP, PLOTEL
 from pyNastran.bdf.cards.elements.damper import (CDAMP1, CDAMP2, CDAMP3,
@@ -26,6 +27,8 @@ from pyNastran.bdf.cards.elements.solid import (CTETRA4, CPYRAM5, CPENTA6, CHEXA
 from pyNastran.bdf.cards.thermal.thermal import CHBDYG, CONV, CHBDYP, CHBDYE, CONVM
 from pyNastran.bdf.cards.nodes import SPOINTs
 from pyNastran.op2.tables.geom.geom_common import GeomCommon
+from pyNastran.op2.tables.geom.lazy_cards import (
+    build_cquad4, build_cquadr, build_ctria3, build_chexa, build_ctetra)
 from pyNastran.bdf.cards.elements.bush import CBUSH
 
 class GEOM2(GeomCommon):
@@ -268,6 +271,28 @@ class GEOM2(GeomCommon):
         self._add_element_object(elem, allow_overwrites=True)
         #print(str(elem)[:-1])
 
+    def _get_element_ints_floats(self, data, n, nwords, card_type):
+        """
+        gets the (nelements, nwords) int/float views of a vectorized
+        element record; ints is None if the record has duplicate ids
+        (see ``_is_unique_vectorized``)
+        """
+        nelements = (len(data) - n) // (nwords * 4)
+        ints = np.frombuffer(data, self.idtype, count=nelements * nwords,
+                             offset=n).reshape(nelements, nwords)
+        floats = np.frombuffer(data, self.fdtype, count=nelements * nwords,
+                               offset=n).reshape(nelements, nwords)
+        eids = ints[:, 0]
+        if nelements and eids.min() <= 0:
+            raise ValueError('eids=%s must be positive' % eids[eids <= 0])
+        if not self._is_unique_vectorized('elements', card_type, eids):
+            return nelements, None, None
+        return nelements, ints, floats
+
+    def _add_lazy_elements(self, card_type, arrays, build_card):
+        """adds vectorized elements, which are built when they're accessed"""
+        self._add_lazy_cards('elements', card_type, arrays['eid'], arrays, build_card)
+
 # 1-AEROQ4 (???)
 # AEROT3   (???)
 # 1-BEAMAERO (1701,17,0)
@@ -914,6 +939,10 @@ class GEOM2(GeomCommon):
         """
         CHEXA(7308,73,253) - the marker for Record 45
         """
+        if self.vectorized_geom and not self.is_debug_file:
+            n_vectorized = self._read_solid_vectorized(data, n, 'CHEXA', 22, build_chexa)
+            if n_vectorized is not None:
+                return n_vectorized
         s = Struct(self._endian + b'22i')
         ntotal = 88  # 22*4
         nelements = (len(data) - n) // ntotal
@@ -937,6 +966,24 @@ class GEOM2(GeomCommon):
         self.card_count['CHEXA'] = nelements
         return n
 
+    def _read_solid_vectorized(self, data, n, card_type, nwords, build_card):
+        """
+        common method for vectorized CHEXA, CTETRA; returns None if the
+        record has duplicate ids
+        """
+        nelements, ints, unused_floats = self._get_element_ints_floats(
+            data, n, nwords, card_type)
+        if ints is None:
+            return None
+        arrays = {
+            'eid' : ints[:, 0].copy(),
+            'pid' : ints[:, 1].copy(),
+            'nodes' : ints[:, 2:].copy(),
+        }
+        self._add_lazy_elements(card_type, arrays, build_card)
+        self.card_count[card_type] = nelements
+        return n + nelements * nwords * 4
+
 # CHEXA20F
 # CHEXAFD
 # CHEXAL
@@ -1404,6 +1451,11 @@ class GEOM2(GeomCommon):
         """
         common method for CQUAD4, CQUADR
         """
+        if self.vectorized_geom and not self.is_debug_file and element.type in ['CQUAD4', 'CQUADR']:
+            build_card = build_cquad4 if element.type == 'CQUAD4' else build_cquadr
+            n_vectorized = self._read_shell_vectorized(data, n, element.type, 14, 4, build_card)
+            if n_vectorized is not None:
+                return n_vectorized
         nelements = (len(data) - n) // 56
         s = Struct(self._endian + b'6iffii4f')
         if self.is_debug_file:
@@ -1426,6 +1478,30 @@ class GEOM2(GeomCommon):
         self.card_count[element.type] = nelements
         return n
 
+    def _read_shell_vectorized(self, data, n, card_type, nwords, nnodes, build_card):
+        """
+        common method for vectorized CQUAD4, CQUADR, CTRIA3; returns None
+        if the record has duplicate ids
+
+        (eid, pid, n1, ..., nnodes, theta, zoffs, blank, ..., tflag, t1, ..., tnodes)
+        """
+        nelements, ints, floats = self._get_element_ints_floats(data, n, nwords, card_type)
+        if ints is None:
+            return None
+        inode2 = 2 + nnodes
+        arrays = {
+            'eid' : ints[:, 0].copy(),
+            'pid' : ints[:, 1].copy(),
+            'nodes' : ints[:, 2:inode2].copy(),
+            'theta' : floats[:, inode2].copy(),
+            'zoffset' : floats[:, inode2 + 1].copy(),
+            'tflag' : ints[:, -nnodes - 1].copy(),
+            'thickness' : floats[:, -nnodes:].copy(),
+        }
+        self._add_lazy_elements(card_type, arrays, build_card)
+        self.card_count[card_type] = nelements
+        return n + nelements * nwords * 4
+
 # CQUAD4FD
 
     def _read_cquad8(self, data, n):
@@ -1610,6 +1686,10 @@ class GEOM2(GeomCommon):
         CTETR10F(16600,166,9999) - the marker for Record 90
         CTETR4FD(16100,161,9999) - the marker for Record 91
         """
+        if self.vectorized_geom and not self.is_debug_file:
+            n_vectorized = self._read_solid_vectorized(data, n, 'CTETRA', 12, build_ctetra)
+            if n_vectorized is not None:
+                return n_vectorized
         s = Struct(self._endian + b'12i')
         nelements = (len(data) - n) // 48  # 12*4
         for i in range(nelements):
@@ -1638,6 +1718,10 @@ class GEOM2(GeomCommon):
         """
         CTRIA3(5959,59,282)    - the marker for Record 94
         """
+        if self.vectorized_geom and not self.is_debug_file:
+            n_vectorized = self._read_shell_vectorized(data, n, 'CTRIA3', 13, 3, build_ctria3)
+            if n_vectorized is not None:
+                return n_vectorized
         ntotal = 52  # 13*4
         s = Struct(self._endian + b'5iff3i3f')
         nelements = (len(data) - n)// 52  # 13*4
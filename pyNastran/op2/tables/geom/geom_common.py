@@ -1,5 +1,7 @@
 #pylint: disable=W0613,R0201,C0111
 from struct import Struct
+import numpy as np
+from pyNastran.op2.tables.geom.lazy_cards import LazyCardDict
 
 class SuppressLogging(object):
     def __init__(self):
@@ -33,6 +35,78 @@ class GeomCommon(object):
         self.binary_debug = SuppressFileIO()
         #self.log = SuppressLogging()
 
+        #: read the common cards (e.g., GRID, CQUAD4, PSHELL, MAT1) into
+        #: arrays and only build the card objects when they're accessed
+        self.vectorized_geom = False
+
+        #: the vectorized card data (e.g., card_arrays['GRID']['xyz'])
+        self.card_arrays = {}
+
+    def _is_unique_vectorized(self, slot_name, card_type, keys):
+        """
+        Are the ids of a vectorized record unique and not already in the
+        model (e.g., a PSHELL and a PCOMP with the same pid)?  If not,
+        the record is read by the card reader, so the duplicate ids are
+        handled the same way.
+
+        Parameters
+        ----------
+        slot_name : str
+            the model dictionary (e.g., 'nodes', 'elements')
+        card_type : str
+            the card name (e.g., 'GRID')
+        keys : (n, ) int ndarray
+            the card ids (e.g., nid, eid)
+
+        """
+        slot = getattr(self, slot_name)
+        is_unique = len(np.unique(keys)) == len(keys)
+        if is_unique and slot:
+            is_unique = not any(key in slot for key in keys.tolist())
+        if not is_unique:
+            # e.g., the PSHELLs that Nastran writes for the PCOMPs
+            self.log.debug('%s has duplicate ids; it is read card by card' % card_type)
+        return is_unique
+
+    def _add_lazy_cards(self, slot_name, card_type, keys, arrays, build_card,
+                        add_to_type_map=True):
+        """
+        Stores the vectorized data for a card type and adds unbuilt cards
+        to the model (e.g., model.nodes)
+
+        Parameters
+        ----------
+        slot_name : str
+            the model dictionary (e.g., 'nodes', 'elements')
+        card_type : str
+            the card name (e.g., 'GRID')
+        keys : (n, ) int ndarray
+            the card ids (e.g., nid, eid)
+        arrays : Dict[name] = (n, ...) ndarray
+            the vectorized card data
+        build_card : function
+            build_card(arrays, i) -> card
+        add_to_type_map : bool; default=True
+            should the keys be added to _type_to_id_map
+            (matches the unvectorized reader)
+
+        """
+        if card_type in self.card_arrays:
+            arrays_old = self.card_arrays[card_type]
+            self.card_arrays[card_type] = {
+                name : np.concatenate([arrays_old[name], array])
+                for name, array in arrays.items()}
+        else:
+            self.card_arrays[card_type] = arrays
+
+        slot = getattr(self, slot_name)
+        if not isinstance(slot, LazyCardDict):
+            slot = LazyCardDict(slot)
+            setattr(self, slot_name, slot)
+        slot.add_lazy_cards(keys, arrays, build_card)
+        if add_to_type_map:
+            self._type_to_id_map[card_type].extend(keys.tolist())
+
     def _read_fake(self, data, n):
         self.log.info('skipping %s in %s' % (self.card_name, self.table_name))
         #if (self.card_name == '' or '?' in self.card_name) and data:
@@ -0,0 +1,229 @@
+"""
+Defines:
+ - LazyCardDict()
+
+and the card builders for the vectorized geometry readers:
+ - build_grid(arrays, i)
+ - build_cquad4(arrays, i)
+ - build_cquadr(arrays, i)
+ - build_ctria3(arrays, i)
+ - build_chexa(arrays, i)
+ - build_ctetra(arrays, i)
+ - build_pshell(arrays, i)
+ - build_mat1(arrays, i)
+
+The vectorized OP2Geom readers decode a full record into arrays (e.g.,
+nid, cp, xyz, cd for GRIDs) and store a placeholder for each card in a
+LazyCardDict.  The card object is built from the arrays the first time
+it's accessed, so a model can be loaded without creating millions of
+card objects that are never used.
+
+"""
+from __future__ import print_function
+from functools import partial
+from six import PY2
+
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CQUADR, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CHEXA8, CHEXA20, CTETRA4, CTETRA10
+from pyNastran.bdf.cards.properties.shell import PSHELL
+from pyNastran.bdf.cards.materials import MAT1
+
+#: the float fields on the MAT1 (in order)
+MAT1_FLOAT_NAMES = ('e', 'g', 'nu', 'rho', 'a', 'tref', 'ge', 'st', 'sc', 'ss')
+
+class _LazyCard(object):
+    """a placeholder for a card that hasn't been built"""
+    __slots__ = ('build_card', 'i')
+
+    def __init__(self, build_card, i):
+        self.build_card = build_card
+        self.i = i
+
+    def build(self):
+        """builds the card"""
+        return self.build_card(self.i)
+
+
+class LazyCardDict(dict):
+    """
+    A dictionary of cards (e.g., model.nodes), where some of the cards
+    are only built when they're accessed.
+
+    Accessing a single card (e.g., ``nodes[10]``) builds only that card.
+    Accessing all the cards (e.g., ``nodes.items()``) builds all the
+    remaining cards.  Checking membership or the number of cards never
+    builds a card.
+
+    """
+    def add_lazy_cards(self, keys, arrays, build_card):
+        """
+        Adds unbuilt cards
+
+        Parameters
+        ----------
+        keys : (n, ) int ndarray
+            the card ids (e.g., nid, eid)
+        arrays : Dict[name] = ndarray
+            the data for the n cards
+        build_card : function
+            build_card(arrays, i) -> card
+
+        """
+        build_card_i = partial(build_card, arrays)
+        dict.update(self, (
+            (key, _LazyCard(build_card_i, i)) for i, key in enumerate(keys.tolist())))
+
+    @property
+    def nlazy(self):
+        """the number of cards that haven't been built"""
+        return sum(1 for value in dict.values(self) if type(value) is _LazyCard)
+
+    def build_all(self):
+        """builds all the cards"""
+        for key, value in list(dict.items(self)):
+            if type(value) is _LazyCard:
+                dict.__setitem__(self, key, value.build())
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is _LazyCard:
+            value = value.build()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        if type(value) is _LazyCard:
+            value = value.build()
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def __iter__(self):
+        # overwriting __iter__ makes dict(lazy_dict) and dict.update(lazy_dict)
+        # use __getitem__, so the cards are built
+        return dict.__iter__(self)
+
+    def values(self):
+        self.build_all()
+        return dict.values(self)
+
+    def items(self):
+        self.build_all()
+        return dict.items(self)
+
+    if PY2:  # pragma: no cover
+        def itervalues(self):
+            self.build_all()
+            return dict.itervalues(self)
+
+        def iteritems(self):
+            self.build_all()
+            return dict.iteritems(self)
+
+    def copy(self):
+        self.build_all()
+        return LazyCardDict(dict.items(self))
+
+    def __eq__(self, other):
+        self.build_all()
+        if isinstance(other, LazyCardDict):
+            other.build_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (LazyCardDict, (list(self.items()), ))
+
+    def __repr__(self):
+        self.build_all()
+        return dict.__repr__(self)
+
+
+def build_grid(arrays, i):
+    """builds a GRID from the vectorized GEOM1 data"""
+    ps = int(arrays['ps'][i])
+    if ps == 0:
+        ps = ''
+    return GRID(int(arrays['nid'][i]), arrays['xyz'][i, :],
+                int(arrays['cp'][i]), int(arrays['cd'][i]), ps, int(arrays['seid'][i]))
+
+def _get_cquad4_data(arrays, i):
+    """gets the CQUAD4/CQUADR op2 data"""
+    data_init = [int(arrays['eid'][i]), int(arrays['pid'][i])]
+    data_init += arrays['nodes'][i, :].tolist()
+    data_init += [float(arrays['theta'][i]), float(arrays['zoffset'][i]),
+                  int(arrays['tflag'][i])]
+    data_init += arrays['thickness'][i, :].tolist()
+    return data_init
+
+def build_cquad4(arrays, i):
+    """builds a CQUAD4 from the vectorized GEOM2 data"""
+    return CQUAD4.add_op2_data(_get_cquad4_data(arrays, i))
+
+def build_cquadr(arrays, i):
+    """builds a CQUADR from the vectorized GEOM2 data"""
+    return CQUADR.add_op2_data(_get_cquad4_data(arrays, i))
+
+def build_ctria3(arrays, i):
+    """builds a CTRIA3 from the vectorized GEOM2 data"""
+    data_in = [int(arrays['eid'][i]), int(arrays['pid'][i])]
+    data_in += arrays['nodes'][i, :].tolist()
+    data_in += [float(arrays['theta'][i]), float(arrays['zoffset'][i]),
+                int(arrays['tflag'][i])]
+    data_in += arrays['thickness'][i, :].tolist()
+    return CTRIA3.add_op2_data(data_in)
+
+def build_chexa(arrays, i):
+    """builds a CHEXA8/CHEXA20 from the vectorized GEOM2 data"""
+    data_in = [int(arrays['eid'][i]), int(arrays['pid'][i])]
+    nodes = arrays['nodes'][i, :].tolist()
+    if sum(nodes[8:]) > 0:
+        return CHEXA20.add_op2_data(data_in + nodes)
+    return CHEXA8.add_op2_data(data_in + nodes[:8])
+
+def build_ctetra(arrays, i):
+    """builds a CTETRA4/CTETRA10 from the vectorized GEOM2 data"""
+    data_in = [int(arrays['eid'][i]), int(arrays['pid'][i])]
+    nodes = arrays['nodes'][i, :].tolist()
+    if sum(nodes[4:]) > 0:
+        return CTETRA10.add_op2_data(data_in + nodes)
+    return CTETRA4.add_op2_data(data_in + nodes[:4])
+
+def build_pshell(arrays, i):
+    """builds a PSHELL from the vectorized EPT data"""
+    mid1, mid2, mid3, mid4 = arrays['mids'][i, :].tolist()
+    out = (
+        int(arrays['pid'][i]), mid1, float(arrays['t'][i]),
+        mid2, float(arrays['bk'][i]),
+        mid3, float(arrays['ts'][i]), float(arrays['nsm'][i]),
+        float(arrays['z1'][i]), float(arrays['z2'][i]), mid4)
+    return PSHELL.add_op2_data(out)
+
+def build_mat1(arrays, i):
+    """builds a MAT1 from the vectorized MPT data"""
+    out = [int(arrays['mid'][i])]
+    out += [float(arrays[name][i]) for name in MAT1_FLOAT_NAMES]
+    out.append(int(arrays['mcsid'][i]))
+    return MAT1.add_op2_data(out)
@@ -6,12 +6,14 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from struct import Struct
 from six.moves import range
+import numpy as np
 
 from pyNastran.bdf.cards.materials import (CREEP, MAT1, MAT2, MAT3, MAT4, MAT5,
                                            MAT8, MAT9, MAT10, MAT11, MATHP)
 from pyNastran.bdf.cards.material_deps import MATS1, MATT1, MATT4, MATT5
 from pyNastran.bdf.cards.dynamic import NLPARM, TSTEPNL # TSTEP
 from pyNastran.op2.tables.geom.geom_common import GeomCommon
+from pyNastran.op2.tables.geom.lazy_cards import build_mat1, MAT1_FLOAT_NAMES
 #from pyNastran.bdf.cards.thermal.thermal import (CHBDYE, CHBDYG, CHBDYP, PCONV, PCONVM,
                                                  #PHBDY, CONV, CONVM, RADBC)
 from pyNastran.bdf.cards.thermal.radiation import RADM
@@ -90,6 +92,10 @@ class MPT(GeomCommon):
         """
         MAT1(103,1,77) - record 2
         """
+        if self.vectorized_geom and not self.is_debug_file:
+            n_vectorized = self._read_mat1_vectorized(data, n)
+            if n_vectorized is not None:
+                return n_vectorized
         ntotal = 48  # 12*4
         s = Struct(self._endian + b'i10fi')
         nmaterials = (len(data) - n) // ntotal
@@ -103,6 +109,33 @@ class MPT(GeomCommon):
         self.card_count['MAT1'] = nmaterials
         return n
 
+    def _read_mat1_vectorized(self, data, n):
+        """
+        MAT1(103,1,77) - record 2
+
+        Returns None if the record has duplicate ids (see
+        ``_is_unique_vectorized``)
+        """
+        ntotal = 48  # 12*4
+        nmaterials = (len(data) - n) // ntotal
+        ints = np.frombuffer(data, self.idtype, count=nmaterials * 12,
+                             offset=n).reshape(nmaterials, 12)
+        floats = np.frombuffer(data, self.fdtype, count=nmaterials * 12,
+                               offset=n).reshape(nmaterials, 12)
+        if not self._is_unique_vectorized('materials', 'MAT1', ints[:, 0]):
+            return None
+
+        #(mid, E, G, nu, rho, A, tref, ge, St, Sc, Ss, mcsid)
+        arrays = {
+            'mid' : ints[:, 0].copy(),
+            'mcsid' : ints[:, 11].copy(),
+        }
+        for i, name in enumerate(MAT1_FLOAT_NAMES):
+            arrays[name] = floats[:, i + 1].copy()
+        self._add_lazy_cards('materials', 'MAT1', arrays['mid'], arrays, build_mat1)
+        self.card_count['MAT1'] = nmaterials
+        return n + nmaterials * ntotal
+
     def _read_mat2(self, data, n):
         """
         MAT2(203,2,78) - record 3
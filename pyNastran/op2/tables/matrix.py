@@ -74,9 +74,9 @@ class Matrix(object):
         else:
             raise RuntimeError('form = %s' % self.form)
 
-    def export_to_hdf5(self, group, log):
+    def export_to_hdf5(self, group, log, compression=None):
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression)
 
     def build_dataframe(self):
         """exports the object to pandas format"""
@@ -110,7 +110,7 @@ class RealStrainEnergyArray(ScalarObject):
         #[energy, percent, density]
         assert isinstance(self.ntimes, integer_types), self.ntimes
         assert isinstance(self.ntotal, integer_types), self.ntotal
-        self.data = zeros((self.ntimes, self.nelements, 3), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 3), dtype='float32')
 
     def build_dataframe(self):
         """
@@ -473,7 +473,7 @@ class ComplexStrainEnergyArray(ScalarObject):
         #[energy, percent, density]
         assert isinstance(self.ntimes, integer_types), self.ntimes
         assert isinstance(self.ntotal, integer_types), self.ntotal
-        self.data = zeros((self.ntimes, self.nelements, 4), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 4), dtype='float32')
 
     #def build_dataframe(self):
         #"""
@@ -53,7 +53,6 @@ from pyNastran.op2.tables.oef_forces.oef_force_objects import (
 
 
     # TODO: vectorize 1
-    RealForce_VU_2D,
     RealForceVU2DArray,
 
     RealCBeamForceVUArray,
@@ -846,7 +845,6 @@ class OEF(OP2Common):
                 return self._not_implemented_or_skip(data, ndata, msg)
 
         elif self.element_type in [189, 190]:  # VUQUAD,VUTRIA
-            # TODO: vectorize
             # 189-VUQUAD
             # 190-VUTRIA
             if self.format_code == 1 and self.num_wide == 27:  # real
@@ -933,7 +931,6 @@ class OEF(OP2Common):
                 return self._not_implemented_or_skip(data, ndata, msg)
 
         elif self.element_type == 191:  # VUBEAM
-            # TODO: vectorize
             nnodes = 2
             numwide_real = 4 + 7 * nnodes
 
@@ -1287,88 +1284,40 @@ class OEF(OP2Common):
                 # real - format_code == 1
                 # random - format_code == 2
 
-                use_new = True
-                if use_new:
-                    #ntotal = (6 + nnodes * 13) * 4 # 6+n*13
-                    ntotal = 24 + 52 * nnodes
-                    nelements = ndata // ntotal
-                    #result_name = 'force_VU_2D'
-                    self._results._found_result(result_name)
-
-
-                    auto_return, is_vectorized = self._create_oes_object4(
-                        nelements, result_name, slot, RealForceVU2DArray)
-                    if auto_return:
-                        self._data_factor = nnodes
-                        return nelements * self.num_wide * 4
-
-                    obj = self.obj
-                    if self.use_vector and is_vectorized and 0:
-                        # self.itime = 0
-                        # self.ielement = 0
-                        # self.itotal = 0
-                        #self.ntimes = 0
-                        #self.nelements = 0
-                        n = nelements * self.num_wide * 4
-
-                        istart = obj.itotal
-                        iend = istart + nelements
-                        obj._times[obj.itime] = dt
-
-                        if obj.itime == 0:
-                            ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                            eids = ints[:, 0] // 10
-                            obj.element_node[istart:iend] = eids_nids
-                        results = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
-
-                        #[fx, fy, fz, mx, my, mz]
-                        obj.data[obj.itime, istart:iend, :] = results[:, 1:].copy()
-                    else:
-                        # 6+n*13
-                        s1 = Struct(self._endian + b'3i4s2i') # 6
-                        s2 = Struct(self._endian + b'i3f3i5fi') # 13
-                        for i in range(nelements):
-                            edata = data[n:n+24]  # 6*4
-                            n += 24
-
-                            out = s1.unpack(edata)
-                            if self.is_debug_file:
-                                self.binary_debug.write('OEF_Force_%s-%s - %s\n' % (
-                                    etype, self.element_type, str(out)))
-                            (eid_device, parent, coord, icord, theta, _) = out
-
-                            eid = eid_device // 10
-                            data_in = [eid, parent, coord, icord, theta]
-
-                            forces = []
-                            for j in range(nnodes):
-                                edata = data[n:n+52]  # 13*4
-                                n += 52
-                                out = s2.unpack(edata)
-                                if self.is_debug_file:
-                                    self.binary_debug.write('%s\n' % (str(out)))
-                                (vugrid, mfx, mfy, mfxy, unused_ai, bi, ci, bmx, bmy,
-                                 bmxy, syz, szx, di) = out
-                                out2 = (vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
-                                obj.add_sort1(dt, eid, parent, coord, icord, theta,
-                                              vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
-                                forces.append(out2)
-                            data_in.append(forces)
-                            #data_in = [vugrid,mfx,mfy,mfxy,a,b,c,bmx,bmy,bmxy,syz,szx,d]
-                            #obj.add_sort1(dt, data_in)
-                else:  # pragma: no cover
-                    if self.read_mode == 1:
-                        return ndata
+                #ntotal = (6 + nnodes * 13) * 4 # 6+n*13
+                ntotal = 24 + 52 * nnodes
+                nelements = ndata // ntotal
+                auto_return, is_vectorized = self._create_oes_object4(
+                    nelements, result_name, slot, RealForceVU2DArray)
+                if auto_return:
+                    self._data_factor = nnodes
+                    return nelements * self.num_wide * 4
 
-                    # TODO: vectorize
-                    self.create_transient_object(slot, RealForce_VU_2D)
+                obj = self.obj
+                if self.use_vector and is_vectorized:
+                    n = nelements * self.num_wide * 4
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * nnodes
 
-                    ntotal = 24 + 52 * nnodes
-                    nelements = ndata // ntotal
-                    obj = self.obj
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats2 = floats[:, 6:].reshape(nelements * nnodes, 13)
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints2 = ints[:, 6:].reshape(nelements * nnodes, 13)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element_node[itotal:itotal2, 0] = np.repeat(eids, nnodes)
+                        obj.element_node[itotal:itotal2, 1] = ints2[:, 0]
 
-                    s1 = Struct(self._endian + b'3i4s2i')
-                    s2 = Struct(self._endian + b'i3f3i5fi')
+                    #[vugrid, mfx, mfy, mfxy, ai, bi, ci, bmx, bmy, bmxy, syz, szx, di]
+                    #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, [1, 2, 3, 7, 8, 9, 10, 11]]
+                    obj.itotal = itotal2
+                else:
+                    # 6+n*13
+                    s1 = Struct(self._endian + b'3i4s2i') # 6
+                    s2 = Struct(self._endian + b'i3f3i5fi') # 13
                     for i in range(nelements):
                         edata = data[n:n+24]  # 6*4
                         n += 24
@@ -1380,22 +1329,16 @@ class OEF(OP2Common):
                         (eid_device, parent, coord, icord, theta, _) = out
 
                         eid = eid_device // 10
-                        data_in = [eid, parent, coord, icord, theta]
-
-                        forces = []
-                        for i in range(nnodes):
+                        for j in range(nnodes):
                             edata = data[n:n+52]  # 13*4
                             n += 52
                             out = s2.unpack(edata)
                             if self.is_debug_file:
                                 self.binary_debug.write('%s\n' % (str(out)))
-                            (vugrid, mfx, mfy, mfxy, ai, bi, ci, bmx, bmy,
+                            (vugrid, mfx, mfy, mfxy, unused_ai, bi, ci, bmx, bmy,
                              bmxy, syz, szx, di) = out
-                            out2 = (vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
-                            forces.append(out2)
-                        data_in.append(forces)
-                        #data_in = [vugrid, mfx, mfy, mfxy, a, b,c, bmx, bmy, bmxy, syz, szx, d]
-                        obj.add(nnodes, dt, data_in)
+                            obj.add_sort1(dt, eid, parent, coord, icord, theta,
+                                          vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
 
             elif self.format_code in [2, 3] and self.num_wide == numwide_imag:  # imag
                 if 0:
@@ -2546,7 +2489,6 @@ class OEF(OP2Common):
         elif self.format_code in [2, 3] and self.num_wide == 17: # imag
             slot = self.cbar_force
 
-            # TODO: vectorize
             ntotal = 68  # 17*4
             nelements = ndata // ntotal
 
@@ -2556,41 +2498,61 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            s = Struct(self._endian + b'i16f')
-            for i in range(nelements):
-                edata = data[n:n + 68]
+            if self.use_vector and is_vectorized:
+                n = nelements * 4 * self.num_wide
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
 
-                out = s.unpack(edata)
-                (eid_device,
-                 bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
-                 bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
-                if self.is_debug_file:
-                    self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
-                eid = eid_device // 10
-                if is_magnitude_phase:
-                    bm1a = polar_to_real_imag(bm1ar, bm1ai)
-                    bm2a = polar_to_real_imag(bm2ar, bm2ai)
-                    bm1b = polar_to_real_imag(bm1br, bm1bi)
-                    bm2b = polar_to_real_imag(bm2br, bm2bi)
-                    ts1 = polar_to_real_imag(ts1r, ts1i)
-                    ts2 = polar_to_real_imag(ts2r, ts2i)
-                    af = polar_to_real_imag(afr, afi)
-                    trq = polar_to_real_imag(trqr, trqi)
-                else:
-                    bm1a = complex(bm1ar, bm1ai)
-                    bm2a = complex(bm2ar, bm2ai)
-                    bm1b = complex(bm1br, bm1bi)
-                    bm2b = complex(bm2br, bm2bi)
-                    ts1 = complex(ts1r, ts1i)
-                    ts2 = complex(ts2r, ts2i)
-                    af = complex(afr, afi)
-                    trq = complex(trqr, trqi)
-
-                #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                #print "%s" % (self.get_element_type(self.element_type)), data_in
-                #eid = obj.add_new_eid(out)
-                obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
-                n += ntotal
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
+                    eids = ints[:, 0] // 10
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
+
+                #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                isave1 = [1, 2, 3, 4, 5, 6, 7, 8]
+                isave2 = [9, 10, 11, 12, 13, 14, 15, 16]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                obj.itotal = itotal2
+            else:
+                s = Struct(self._endian + b'i16f')
+                for i in range(nelements):
+                    edata = data[n:n + 68]
+
+                    out = s.unpack(edata)
+                    (eid_device,
+                     bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
+                     bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
+                    if self.is_debug_file:
+                        self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
+                    eid = eid_device // 10
+                    if is_magnitude_phase:
+                        bm1a = polar_to_real_imag(bm1ar, bm1ai)
+                        bm2a = polar_to_real_imag(bm2ar, bm2ai)
+                        bm1b = polar_to_real_imag(bm1br, bm1bi)
+                        bm2b = polar_to_real_imag(bm2br, bm2bi)
+                        ts1 = polar_to_real_imag(ts1r, ts1i)
+                        ts2 = polar_to_real_imag(ts2r, ts2i)
+                        af = polar_to_real_imag(afr, afi)
+                        trq = polar_to_real_imag(trqr, trqi)
+                    else:
+                        bm1a = complex(bm1ar, bm1ai)
+                        bm2a = complex(bm2ar, bm2ai)
+                        bm1b = complex(bm1br, bm1bi)
+                        bm2b = complex(bm2br, bm2bi)
+                        ts1 = complex(ts1r, ts1i)
+                        ts2 = complex(ts2r, ts2i)
+                        af = complex(afr, afi)
+                        trq = complex(trqr, trqi)
+
+                    #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                    #print "%s" % (self.get_element_type(self.element_type)), data_in
+                    #eid = obj.add_new_eid(out)
+                    obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
+                    n += ntotal
         else:
             msg = self.code_information()
             return self._not_implemented_or_skip(data, ndata, msg)
@@ -3397,7 +3359,6 @@ class OEF(OP2Common):
                         nid_b, bm1_b, bm2_b, ts1_b, ts2_b, af_b, trq_b)
                     n += ntotal
         elif self.format_code in [2, 3] and self.num_wide == 27:  # imag
-            # TODO: vectorize
             ntotal = 108  # 27*4
             nelements = ndata // ntotal
 
@@ -3698,6 +3659,7 @@ class OEF(OP2Common):
 
                 #[fx, fy, fz, mx, my, mz]
                 obj.data[obj.itime, istart:iend, :] = results[:, 1:].copy()
+                obj.itotal = iend
             else:
                 s = Struct(self._endian + b'i6f')
                 for i in range(nelements):
@@ -3710,7 +3672,6 @@ class OEF(OP2Common):
                     obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
                     n += ntotal
         elif self.format_code in [2, 3] and self.num_wide == 13:  # imag
-            # TODO: vectorize
             ntotal = 52  # 13*4
             nelements = ndata // ntotal
             result_name = 'cbush_force'
@@ -3719,37 +3680,55 @@ class OEF(OP2Common):
             if auto_return:
                 return nelements * self.num_wide * 4, None, None
 
-            s = Struct(self._endian + b'i12f')
-
             obj = self.obj
-            for i in range(nelements):
-                edata = data[n:n + 52]
+            if self.use_vector and is_vectorized:
+                n = nelements * self.num_wide * 4
+                istart = obj.itotal
+                iend = istart + nelements
+                obj._times[obj.itime] = dt
 
-                out = s.unpack(edata)
-                if self.is_debug_file:
-                    self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
-                (eid_device,
-                 fxr, fyr, fzr, mxr, myr, mzr,
-                 fxi, fyi, fzi, mxi, myi, mzi) = out
-                eid = eid_device // 10
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
+                    eids = ints[:, 0] // 10
+                    obj.element[istart:iend] = eids
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
 
-                if is_magnitude_phase:
-                    fx = polar_to_real_imag(fxr, fxi)
-                    mx = polar_to_real_imag(mxr, mxi)
-                    fy = polar_to_real_imag(fyr, fyi)
-                    my = polar_to_real_imag(myr, myi)
-                    fz = polar_to_real_imag(fzr, fzi)
-                    mz = polar_to_real_imag(mzr, mzi)
-                else:
-                    fx = complex(fxr, fxi)
-                    mx = complex(mxr, mxi)
-                    fy = complex(fyr, fyi)
-                    my = complex(myr, myi)
-                    fz = complex(fzr, fzi)
-                    mz = complex(mzr, mzi)
-
-                obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
-                n += ntotal
+                #[fx, fy, fz, mx, my, mz]
+                isave1 = [1, 2, 3, 4, 5, 6]
+                isave2 = [7, 8, 9, 10, 11, 12]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                obj.data[obj.itime, istart:iend, :] = real_imag
+                obj.itotal = iend
+            else:
+                s = Struct(self._endian + b'i12f')
+                for i in range(nelements):
+                    edata = data[n:n + 52]
+
+                    out = s.unpack(edata)
+                    if self.is_debug_file:
+                        self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
+                    (eid_device,
+                     fxr, fyr, fzr, mxr, myr, mzr,
+                     fxi, fyi, fzi, mxi, myi, mzi) = out
+                    eid = eid_device // 10
+
+                    if is_magnitude_phase:
+                        fx = polar_to_real_imag(fxr, fxi)
+                        mx = polar_to_real_imag(mxr, mxi)
+                        fy = polar_to_real_imag(fyr, fyi)
+                        my = polar_to_real_imag(myr, myi)
+                        fz = polar_to_real_imag(fzr, fzi)
+                        mz = polar_to_real_imag(mzr, mzi)
+                    else:
+                        fx = complex(fxr, fxi)
+                        mx = complex(mxr, mxi)
+                        fy = complex(fyr, fyi)
+                        my = complex(myr, myi)
+                        fz = complex(fzr, fzi)
+                        mz = complex(mzr, mzi)
+
+                    obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
+                    n += ntotal
         #elif self.format_code == 2 and self.num_wide == 7:
             #self.log.warning(self.code_information())
             #asdf
@@ -75,7 +75,7 @@ class ComplexRodForceArray(ScalarObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 2), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -300,7 +300,7 @@ class ComplexCShearForceArray(ScalarObject):
         #[force41, force14, force21, force12, force32, force23, force43, force34,
         #kick_force1, kick_force2, kick_force3, kick_force4,
         #shear12, shear23, shear34, shear41]
-        self.data = zeros((self.ntimes, self.ntotal, 16), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 16), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -553,7 +553,7 @@ class ComplexSpringDamperForceArray(ScalarObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 1), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 1), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -776,7 +776,7 @@ class ComplexViscForceArray(ScalarObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 2), dtype='complex64')
 
     def __eq__(self, table):
         self._eq_header(table)
@@ -976,7 +976,7 @@ class ComplexPlateForceArray(ScalarObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -1206,7 +1206,7 @@ class ComplexPlate2ForceArray(ScalarObject):
         self.element_node = zeros((self.ntotal, 2), dtype='int32')
 
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -1468,7 +1468,7 @@ class ComplexCBarForceArray(ScalarObject):
                 self.ntimes, self.nelements, nnodes, self.nelements * nnodes, self.ntotal)
             raise RuntimeError(msg)
         #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-        self.data = zeros((self.ntimes, self.ntotal, 8), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), 'complex64')
 
 
     def build_dataframe(self):
@@ -1493,17 +1493,14 @@ class ComplexCBarForceArray(ScalarObject):
                     for ieid, eid in enumerate(self.element):
                         t1 = self.data[itime, ieid, :]
                         t2 = table.data[itime, ieid, :]
-                        (s1a1, s2a1, s3a1, s4a1, axial1, s2a1, s2b1, s2c1, s2d1) = t1
-                        (s1a2, s2a2, s3a2, s4a2, axial2, s2a2, s2b2, s2c2, s2d2) = t2
-                        #d = t1 - t2
-                        if not allclose([s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real],
-                                        [s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real], atol=0.0001):
+                        #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                        if not allclose(t1, t2, atol=0.0001):
                         #if not np.array_equal(t1, t2):
-                            msg += '%-4s  (%s, %s, %s, %s, %s, %s, %s, %s, %s)\n      (%s, %s, %s, %s, %s, %s, %s, %s, %s)\n' % (
+                            msg += '%-4s  (%s)\n      (%s)\n' % (
                                 eid,
-                                s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real,
-                                s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real,
-                                )
+                                ', '.join(['%s' % ti for ti in t1]),
+                                ', '.join(['%s' % ti for ti in t2]),
+                            )
                             i += 1
                         if i > 10:
                             print(msg)
@@ -1728,7 +1725,7 @@ class ComplexCBeamForceArray(ScalarObject):
                 self.ntimes, self.nelements, nnodes, self.nelements * nnodes, self.ntotal)
             raise RuntimeError(msg)
         #[sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq]
-        self.data = zeros((self.ntimes, self.ntotal, 8), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), 'complex64')
 
     def finalize(self):
         sd = self.data[0, :, 0].real
@@ -1990,7 +1987,7 @@ class ComplexCBendForceArray(ScalarObject):  # 69-CBEND
 
         #[bending_moment_1a, bending_moment_2a, shear_1a, shear_2a, axial_a, torque_a
         # bending_moment_1b, bending_moment_2b, shear_1b, shear_2b, axial_b, torque_b]
-        self.data = zeros((self.ntimes, self.nelements, 12), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 12), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -2246,7 +2243,7 @@ class ComplexSolidPressureForceArray(ScalarObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[ax, ay, az, vx, vy, vz, pressure]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 7), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -2474,7 +2471,7 @@ class ComplexCBushForceArray(ScalarObject):
                 self.ntimes, self.nelements, nnodes, self.nelements * nnodes, self.ntotal)
             raise RuntimeError(msg)
         #[fx, fy, fz, mx, my, mz]
-        self.data = zeros((self.ntimes, self.ntotal, 6), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), 'complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -2774,7 +2771,7 @@ class ComplexCBeamForceVUArray(ScalarObject):  # 191-VUBEAM
         self.parent_coord = np.zeros((self.ntotal, 2), dtype='int32')
 
         #[xxb, force_x, shear_y, shear_z, torsion, bending_y, bending_z]
-        self.data = np.zeros((self.ntimes, self.ntotal, 7), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 7), dtype='complex64')
 
     #def build_dataframe(self):
         #headers = self.get_headers()
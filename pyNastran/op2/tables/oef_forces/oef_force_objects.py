@@ -91,7 +91,7 @@ class FailureIndices(RealForceObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[force]
-        self.data = zeros((self.ntimes, self.nelements, 1), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 1), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -209,7 +209,7 @@ class RealSpringDamperForceArray(RealForceObject):
         self.element = zeros(nelements, dtype='int32')
 
         #[force]
-        self.data = zeros((ntimes, nelements, 1), dtype='float32')
+        self.data = self._zeros_data((ntimes, nelements, 1), dtype='float32')
 
 
     def build_dataframe(self):
@@ -484,7 +484,7 @@ class RealRodForceArray(RealForceObject):
         self.element = zeros(nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((ntimes, nelements, 2), dtype='float32')
+        self.data = self._zeros_data((ntimes, nelements, 2), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -695,7 +695,7 @@ class RealCBeamForceArray(ScalarObject):
                                                                            self.ntotal)
             raise RuntimeError(msg)
         #[sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq]
-        self.data = zeros((self.ntimes, self.ntotal, 8), 'float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), 'float32')
 
     def finalize(self):
         sd = self.data[0, :, 0]
@@ -946,7 +946,7 @@ class RealCShearForceArray(ScalarObject):
         # force34, force14,
         # kick_force1, shear12, kick_force2, shear23,
         # kick_force3, shear34, kick_force4, shear41]
-        self.data = zeros((self.ntimes, self.ntotal, 16), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 16), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -1167,7 +1167,7 @@ class RealViscForceArray(RealForceObject):  # 24-CVISC
         self.element = zeros(self.nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 2), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -1368,7 +1368,7 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         self.element = zeros(self.ntotal, dtype='int32')
 
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -1588,7 +1588,7 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         #     FX FY FXY           MX MY MXY            QX QY
         #[fx, fy, fxy,  mx,  my,  mxy, qx, qy]
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -1885,7 +1885,7 @@ class RealCBarForceArray(ScalarObject):  # 34-CBAR
         self.element = zeros(self.nelements, dtype='int32')
 
         #[bending_moment_a1, bending_moment_a2, bending_moment_b1, bending_moment_b2, shear1, shear2, axial, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -2073,7 +2073,7 @@ class RealConeAxForceArray(ScalarObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[hopa, bmu, bmv, tm, su, sv]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -2261,7 +2261,7 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         self.element = zeros(self.nelements, dtype='int32')
 
         # [station, bending_moment1, bending_moment2, shear1, shear2, axial, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 7), dtype='float32')
 
     #def finalize(self):
         #sd = self.data[0, :, 0]
@@ -2464,7 +2464,7 @@ class RealCGapForceArray(ScalarObject):  # 38-CGAP
         self.element = zeros(self.nelements, dtype='int32')
 
         # [fx, sfy, sfz, u, v, w, sv, sw]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -2631,7 +2631,7 @@ class RealBendForceArray(RealForceObject):  # 69-CBEND
 
         #[bending_moment_1a, bending_moment_2a, shear_1a, shear_2a, axial_a, torque_a
         # bending_moment_1b, bending_moment_2b, shear_1b, shear_2b, axial_b, torque_b]
-        self.data = zeros((self.ntimes, self.nelements, 12), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 12), dtype='float32')
 
     def build_dataframe(self):
         element = self.element_node[:, 0]
@@ -2856,7 +2856,7 @@ class RealSolidPressureForceArray(ScalarObject):  # 77-PENTA_PR,78-TETRA_PR
         self.element = zeros(self.nelements, dtype='int32')
 
         #[ax, ay, az, vx, vy, vz, pressure]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 7), dtype='float32')
 
     def __eq__(self, table):
         self._eq_header(table)
@@ -3099,7 +3099,7 @@ class RealCBeamForceVUArray(ScalarObject):  # 191-VUBEAM
         self.parent_coord = zeros((self.ntotal, 2), dtype='int32')
 
         #[xxb, fx, fy, fz, mx, my, mz]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 7), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -3325,7 +3325,7 @@ class RealCBushForceArray(ScalarObject):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[fx, fy, fz, mx, my, mz]
-        self.data = zeros((self.ntimes, self.nelements, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 6), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -3534,7 +3534,7 @@ class RealForceVU2DArray(RealForceObject):  # 189-VUQUAD, 190-VUTRIA
         self.element_node = zeros((self.ntotal, 2), dtype='int32')
 
         #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         return
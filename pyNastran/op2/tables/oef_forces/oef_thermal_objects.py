@@ -72,7 +72,7 @@ class Real1DHeatFluxArray(ScalarObject):
         self.element_data_type = empty(self.nelements, dtype='|U8')
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -259,7 +259,7 @@ class RealHeatFluxVU3DArray(ScalarObject):
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
         self.vugrid = zeros((self.ntimes, self.ntotal, 1), dtype='int32')
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         # TODO: fix me
@@ -537,7 +537,7 @@ class RealHeatFluxVUArray(ScalarObject):
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
         self.int_data = zeros((self.ntimes, self.ntotal, 1), dtype='int32')
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def _build_dataframe(self):
         # TODO: fix me
@@ -822,7 +822,7 @@ class RealHeatFluxVUBeamArray(ScalarObject):  # 191-VUBEAM
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
         self.vugrid = zeros((self.ntimes, self.ntotal, 1), dtype='int32')
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -1164,7 +1164,7 @@ class RealConvHeatFluxArray(ScalarObject):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         self.element_node = zeros((self.nelements, 2), dtype='int32')
 
         #[free_conv, free_conv_k]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 2), dtype='float32')
 
     def build_dataframe(self):
         # TODO: fix me
@@ -1347,7 +1347,7 @@ class RealChbdyHeatFluxArray(ScalarObject):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         self.element_type = empty(self.nelements, dtype='|U8')
 
         #[fapplied, free_conv, force_conv, frad, ftotal]
-        self.data = zeros((self.ntimes, self.ntotal, 5), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 5), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
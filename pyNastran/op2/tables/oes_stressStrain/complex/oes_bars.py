@@ -75,7 +75,7 @@ class ComplexBarArray(OES_Object):
             raise RuntimeError(msg)
 
         #[s1a, s2a, s3a, s4a, axial, s2a, s2b, s2c, s2d]
-        self.data = zeros((self.ntimes, self.ntotal, 9), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 9), 'complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -76,7 +76,7 @@ class ComplexBeamArray(OES_Object):
             raise RuntimeError(msg)
 
         #[sxc, sxd, sxe, sxf]
-        self.data = zeros((self.ntimes, self.ntotal, 4), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 4), 'complex64')
 
     def finalize(self):
         #enode_sum = self.element_node.sum(axis=1)
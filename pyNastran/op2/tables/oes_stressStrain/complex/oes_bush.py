@@ -60,7 +60,7 @@ class ComplexCBushArray(OES_Object):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[tx, ty, tz, rx, ry, rz]
-        self.data = zeros((self.ntimes, self.nelements, 6), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 6), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -58,7 +58,7 @@ class ComplexCBush1DArray(OES_Object):
         self.element = np.zeros(self.nelements, dtype='int32')
 
         #[tx, ty, tz, rx, ry, rz]
-        self.data = np.zeros((self.ntimes, self.nelements, 6), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 6), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
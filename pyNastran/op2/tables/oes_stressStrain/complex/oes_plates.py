@@ -78,7 +78,7 @@ class ComplexTriaxStressArray(OES_Object):
 
         self.fiber_curvature = zeros(self.ntotal, 'float32')
         # [oxx, oyy, txy]
-        self.data = zeros((self.ntimes, self.ntotal, 3), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 3), 'complex64')
 
     def get_stats(self, short=False):
         if not self.is_built:
@@ -203,7 +203,7 @@ class ComplexPlateArray(OES_Object):
 
         self.fiber_curvature = zeros(self.ntotal, 'float32')
         # [oxx, oyy, txy]
-        self.data = zeros((self.ntimes, self.ntotal, 3), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 3), 'complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
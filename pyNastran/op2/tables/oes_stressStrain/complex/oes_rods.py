@@ -59,7 +59,7 @@ class ComplexRodArray(OES_Object):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[axial, torsion]
-        self.data = zeros((self.ntimes, self.nelements, 2), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 2), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -85,7 +85,7 @@ class ComplexShearArray(OES_Object):
             raise RuntimeError(msg)
 
         # [max_shear, avg_shear]
-        self.data = np.zeros((self.ntimes, self.ntotal, 2), 'complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 2), 'complex64')
 
     def build_dataframe(self):
         headers = self.headers
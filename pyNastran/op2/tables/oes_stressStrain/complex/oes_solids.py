@@ -120,10 +120,10 @@ class ComplexSolidArray(OES_Object):
 
         if self.result_flag == 0:
             # [oxx, oyy, ozz, txy, tyz, txz]
-            self.data = zeros((self.ntimes, self.ntotal, 6), 'complex64')
+            self.data = self._zeros_data((self.ntimes, self.ntotal, 6), 'complex64')
         else:
             # oxx
-            self.data = zeros((self.ntimes, self.ntotal, 1), 'complex64')
+            self.data = self._zeros_data((self.ntimes, self.ntotal, 1), 'complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
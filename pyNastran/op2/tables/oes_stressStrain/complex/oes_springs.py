@@ -66,7 +66,7 @@ class ComplexSpringDamperArray(OES_Object):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[spring_stress]
-        self.data = zeros((self.ntimes, self.ntotal, 1), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 1), dtype='complex64')
 
     def build_dataframe(self):
         headers = self.get_headers()
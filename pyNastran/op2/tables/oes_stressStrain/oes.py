@@ -1765,7 +1765,7 @@ class OES(OP2Common):
                     self.log.error(msg)
                     raise
                 #self.obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_result_object()
 
             else:  # not vectorized
                 auto_return = True
@@ -1804,7 +1804,7 @@ class OES(OP2Common):
                     self.log.error(msg)
                     raise
                 #self.obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_result_object()
 
             else:  # not vectorized
                 auto_return = True
@@ -2147,7 +2147,6 @@ class OES(OP2Common):
         slot = getattr(self, result_name)
 
         if self.format_code == 1 and self.num_wide == 111:  # real
-            # TODO: vectorize
             ntotal = 444 # 44 + 10*40  (11 nodes)
 
             if self.is_stress:
@@ -2167,8 +2166,34 @@ class OES(OP2Common):
             nnodes = 10  # 11-1
             ntotal = self.num_wide * 4
             nelements = ndata // ntotal
-            if self.use_vector and is_vectorized and 0:
-                raise NotImplementedError('CBEAM-2-real not vectorized')
+            if self.use_vector and is_vectorized:
+                n = nelements * 4 * self.num_wide
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 11
+
+                # chop off eid
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
+                floats2 = floats.reshape(nelements * 11, 10)
+
+                obj._times[obj.itime] = dt
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 111)
+                    eids = ints[:, 0] // 10
+                    eids2 = array([eids] * 11, dtype='int32').T.ravel()
+
+                    ints2 = ints[:, 1:].reshape(nelements * 11, 10)
+
+                    nids = ints2[:, 0]
+                    assert eids.min() > 0, eids.min()
+                    obj.element_node[itotal:itotal2, 0] = eids2
+                    obj.element_node[itotal:itotal2, 1] = nids
+
+                #  0    1   2    3    4    5    6     7     8    9
+                # grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc
+                obj.xxb[itotal:itotal2] = floats2[:, 1]
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
                 n1 = 44
                 n2 = 40
@@ -3715,7 +3740,6 @@ class OES(OP2Common):
                         ex1, ey1, ez1, exy1)
                     n += ntotal
         elif self.format_code == 1 and self.num_wide == 25 and self.element_type in [88, 90]:
-            # TODO: vectorize
             #     ELEMENT      FIBER                        STRESSES/ TOTAL STRAINS                     EQUIVALENT    EFF. STRAIN     EFF. CREEP
             #        ID      DISTANCE           X              Y             Z               XY           STRESS    PLASTIC/NLELAST     STRAIN
             # 0       721  -7.500000E+00   5.262707E+02   2.589492E+02   0.000000E+00  -2.014457E-14   4.557830E+02   5.240113E-02   0.0
@@ -3737,9 +3761,7 @@ class OES(OP2Common):
                 self._data_factor = 2
                 return nelements * self.num_wide * 4, None, None
 
-            #return nelements * self.num_wide * 4
             obj = self.obj
-            is_vectorized = False
             if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
 
@@ -3748,29 +3770,22 @@ class OES(OP2Common):
                 itotal = obj.itotal
                 itotal2 = itotal + nelements * 2
                 obj._times[obj.itime] = dt
-                #print('ielement=%s:%s' % (ielement, ielement2))
-                #print('itotal=%s:%s' % (itotal, itotal2))
 
                 if obj.itime == 0:
-                    try:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 25)
-                    except ValueError:
-                        values = fromstring(data, dtype=self.idtype)
-
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 25)
                     eids = ints[:, 0] // 10
-                    #eids2 = vstack([eids, eids]).T.ravel()
-                    #print(eids.tolist())
-                    #sss
-                    obj.element[ielement:ielement2] = eids  # 150
-                     #print(obj.element_node[:10, :])
-                    #aaa
+                    obj.element[ielement:ielement2] = eids
 
+                # 2 fibers per element
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 25)[:, 1:]
-
-                #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
-                #floats[:, 1] = 0
-                obj.data[obj.itime, itotal:itotal2, :] = floats.reshape(nelements * 2, 12).copy()
-                #obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
+                floats = floats.reshape(nelements * 2, 12).copy()
+
+                #[fiber_distance, oxx, oyy, ozz, txy, es, eps, ecs, exx, eyy, ezz, exy]
+                # fiber_distance, ozz, ezz are undefined (NaN) for some elements
+                fd_sz_ez = floats[:, [0, 3, 10]]
+                fd_sz_ez[np.isnan(fd_sz_ez)] = 0.
+                floats[:, [0, 3, 10]] = fd_sz_ez
+                obj.data[obj.itime, itotal:itotal2, :] = floats
                 obj.ielement = ielement2
                 obj.itotal = itotal2
             else:
@@ -3870,16 +3885,23 @@ class OES(OP2Common):
                 iend = istart + nelements
                 obj._times[obj.itime] = dt
 
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
+                eids = ints[:, 0] // 10
                 if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11).copy()
-                    eids = ints[:, 0] // 10
                     nids = ints[:, 1]
                     obj.element_layer[istart:iend, 0] = eids
                     obj.element_layer[istart:iend, 1] = nids
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                 #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 2:].copy()
+                obj.data[obj.itime, istart:iend, :] = floats[:, 2:]
+
+                # a new element starts wherever the element id changes
+                eid_old = getattr(self, 'eid_old', 0)
+                is_new_eid = eids != np.hstack([eid_old, eids[:-1]])
+                obj.itotal = iend
+                obj.ielement += int(is_new_eid.sum())
+                self.eid_old = int(eids[-1])
             else:
                 struct1 = Struct(self._endian + b'ii9f') # 11
                 eid_old = 0
@@ -111,7 +111,7 @@ class HyperelasticQuadArray(OES_Object):
 
 
         #[oxx, oyy, txy, angle, majorp, minorp]
-        self.data = np.zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     #def build_dataframe(self):
         #headers = self.get_headers()
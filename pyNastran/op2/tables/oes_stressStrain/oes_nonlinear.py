@@ -118,7 +118,7 @@ class RealNonlinearPlateArray(OES_Object):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[fiber_dist, oxx, oyy, ozz, txy, es, eps, ecs, exx, eyy, ezz, etxy]
-        self.data = zeros((self.ntimes, self.ntotal, 12), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 12), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()[1:]
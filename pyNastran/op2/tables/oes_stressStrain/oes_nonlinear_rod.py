@@ -78,7 +78,7 @@ class RealNonlinearRodArray(OES_Object): # 89-CRODNL, 92-CONRODNL
 
         #[axial_stress, equiv_stress, total_strain, effective_plastic_creep_strain,
         # effective_creep_strain, linear_torsional_stress]
-        self.data = zeros((self.ntimes, self.nelements, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 6), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
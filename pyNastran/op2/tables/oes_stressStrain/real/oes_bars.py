@@ -88,7 +88,7 @@ class RealBarArray(OES_Object):
 
         #[s1a, s2a, s3a, s4a, axial, smaxa, smina, MS_tension,
         # s1b, s2b, s3b, s4b,        sminb, sminb, MS_compression]
-        self.data = zeros((self.ntimes, self.ntotal, 15), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 15), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
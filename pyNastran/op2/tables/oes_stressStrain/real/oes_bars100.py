@@ -91,7 +91,7 @@ class RealBar10NodesArray(OES_Object):
         self.element = zeros(self.ntotal, dtype='int32')
 
         #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
-        self.data = zeros((self.ntimes, self.ntotal, 9), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 9), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
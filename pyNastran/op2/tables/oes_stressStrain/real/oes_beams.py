@@ -95,7 +95,7 @@ class RealBeamArray(OES_Object):
         # sxc, sxd, sxe, sxf
         # smax, smin, MSt, MSc
         self.xxb = zeros(self.ntotal, dtype='float32')
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def finalize(self):
         sd = self.data[0, :, 0].real
@@ -368,7 +368,7 @@ class RealNonlinearBeamArray(OES_Object):
         #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
         #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
         #self.xxb = zeros(self.ntotal, dtype='float32')
-        self.data = zeros((self.ntimes, self.ntotal, 5), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 5), dtype='float32')
 
     def get_stats(self, short=False):
         if not self.is_built:
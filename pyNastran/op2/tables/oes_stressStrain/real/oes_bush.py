@@ -75,7 +75,7 @@ class RealBushArray(OES_Object):
         self.element = zeros(self.ntotal, dtype='int32')
 
         # [tx, ty, tz, rx, ry, rz]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -89,7 +89,7 @@ class RealBush1DStressArray(OES_Object):
         self.is_failed = zeros((self.ntimes, self.ntotal, 1), dtype='int32')
 
         # [element_force, axial_displacement, axial_velocity, axial_stress, axial_strain, plastic_strain, is_failed]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -75,7 +75,7 @@ class NonlinearGapStressArray(OES_Object):
         self.element = zeros(self.ntotal, dtype='int32')
 
         # [comp_x, shear_y, shear_z, axial_u, shear_v, shear_w, slip_v, slip_w]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
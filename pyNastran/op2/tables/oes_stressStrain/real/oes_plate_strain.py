@@ -93,7 +93,7 @@ class RealCPLSTRNPlateArray(OES_Object):
         self.element = np.zeros(self.ntotal, dtype='int32')
 
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-        self.data = np.zeros((self.ntimes, self.ntotal, 5), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 5), dtype='float32')
 
     def __eq__(self, table):
         self._eq_header(table)
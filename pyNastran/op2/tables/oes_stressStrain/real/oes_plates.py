@@ -103,7 +103,7 @@ class RealPlateArray(OES_Object):
         self.element_node = np.zeros((self.ntotal, 2), dtype='int32')
 
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-        self.data = np.zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -76,7 +76,7 @@ class RealRodArray(OES_Object):
         self.element = zeros(nelements, dtype='int32')
 
         #[axial, torsion, SMa, SMt]
-        self.data = zeros((ntimes, nelements, 4), dtype='float32')
+        self.data = self._zeros_data((ntimes, nelements, 4), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -68,7 +68,7 @@ class RealShearArray(OES_Object):
         self.element = zeros(self.nelements, dtype='int32')
 
         # [max_shear, avg_shear, margin]
-        self.data = zeros((self.ntimes, self.ntotal, 3), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 3), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
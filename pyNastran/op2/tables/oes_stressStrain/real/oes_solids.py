@@ -87,9 +87,9 @@ class RealSolidArray(OES_Object):
         #self.element_node = zeros((self.ntotal, nnodes, 2), 'int32')
 
         #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovmShear]
-        self.data = zeros((self.ntimes, self.ntotal, 10), 'float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 10), 'float32')
         self.nnodes = self.element_node.shape[0] // self.nelements
-        #self.data = zeros((self.ntimes, self.nelements, nnodes+1, 10), 'float32')
+        #self.data = self._zeros_data((self.ntimes, self.nelements, nnodes+1, 10), 'float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -71,7 +71,7 @@ class RealSpringArray(OES_Object):
         self.element = zeros(nelements, dtype='int32')
 
         #[stress]
-        self.data = zeros((ntimes, nelements, 1), dtype='float32')
+        self.data = self._zeros_data((ntimes, nelements, 1), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -348,7 +348,7 @@ class RealNonlinearSpringStressArray(OES_Object):
         self.element = zeros(self.nelements, dtype='int32')
 
         #[force, stress]
-        self.data = zeros((self.ntimes, self.nelements, 2), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.nelements, 2), dtype='float32')
 
     def __eq__(self, table):
         self._eq_header(table)
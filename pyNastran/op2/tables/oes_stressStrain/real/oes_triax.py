@@ -73,7 +73,7 @@ class RealTriaxArray(OES_Object):
         self.element_node = zeros((self.ntotal, 2), dtype='int32')
 
         # [radial, azimuthal, axial, shear, omax, oms, ovm]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 7), dtype='float32')
 
     def build_dataframe(self):
         headers = self.get_headers()
@@ -0,0 +1,236 @@
+"""
+Defines:
+ - GridPointForceCuts(cuts, coords, nid_cd, icd_transform, xyz_cid0,
+                      consider_rxf=True)
+   - get_loads(gpforce, itimes=None)
+
+Sums the grid point forces of many cuts (e.g., the stations of a wing)
+for every time step at once.  A cut is the same as the inputs to
+``RealGridPointForcesArray.extract_interface_loads``:
+
+ - eids : the elements on one side of the cut
+ - nids : the nodes on the cut (None -> all the nodes of the elements,
+   which is a freebody)
+ - coord_out : the output coordinate system
+ - summation_point : the point to sum the moments about in the global
+   frame (None -> the origin)
+
+The node/element masks of each cut are found once, so the loads of the
+cuts are calculated with a sparse matrix multiplication, and the CD
+transforms of the nodes (including cylindrical and spherical systems)
+are calculated once:
+
+.. code-block:: python
+
+   nids_all, nids_transform, icd_transform = model.get_displacement_index()
+   xyz_cid0 = model.get_xyz_in_coord(cid=0)
+   nid_cd = np.array([[nid, node.Cd()] for nid, node in sorted(iteritems(model.nodes))])
+   cuts = [
+       (eids1, nids1, model.coords[0], [0., 0., 0.]),
+       (eids2, None, model.coords[10], [1., 0., 0.]),
+   ]
+   gpforce_cuts = GridPointForceCuts(cuts, model.coords, nid_cd, icd_transform, xyz_cid0)
+   for isubcase, gpforce in sorted(iteritems(model.grid_point_forces)):
+       # (ncuts, ntimes, 6) float ndarray
+       loads = gpforce_cuts.get_loads(gpforce)
+
+"""
+from __future__ import print_function
+
+import numpy as np
+import scipy.sparse
+
+from pyNastran.op2.result_transforms import get_cd_transforms
+
+
+class GridPointForceCuts(object):
+    """the sum of the grid point forces of a series of cuts"""
+    def __init__(self, cuts, coords, nid_cd, icd_transform, xyz_cid0, consider_rxf=True):
+        """
+        Creates the cuts
+
+        Parameters
+        ----------
+        cuts : List[(eids, nids, coord_out, summation_point)]
+            eids : (Ne, ) int ndarray
+                all the elements to consider
+            nids : (Nn, ) int ndarray / None
+                all the nodes to consider; None -> the nodes of the elements
+            coord_out : CORDx()
+                the output coordinate system
+            summation_point : (3, ) float ndarray / None
+                the summation point in the global frame; None -> [0., 0., 0.]
+        coords : dict[int] = CORDx
+            all the coordinate systems
+        nid_cd : (M, 2) int ndarray
+            the (BDF.point_ids, cd) array
+        icd_transform : dict[cd] = (Mi, ) int ndarray
+            the mapping for nid_cd; None -> use the cd of nid_cd
+        xyz_cid0 : (M, 3) float ndarray
+            the grid locations in coordinate system 0 (in the order of nid_cd)
+        consider_rxf : bool; default=True
+            considers the r x F term
+
+        """
+        nid_cd = np.asarray(nid_cd)
+        self.nids = nid_cd[:, 0]
+        self.isort = np.argsort(self.nids)
+        self.xyz_cid0 = np.asarray(xyz_cid0, dtype='float64')
+        self.consider_rxf = consider_rxf
+
+        # the rotation from the CD frame to the global frame of each node
+        self.cd_transforms = get_cd_transforms(coords, nid_cd, icd_transform, self.xyz_cid0)
+
+        ncuts = len(cuts)
+        self.cut_eids = []
+        self.cut_nids = []
+        self.beta_out = np.zeros((ncuts, 3, 3), dtype='float64')
+        self.summation_points = np.zeros((ncuts, 3), dtype='float64')
+        for icut, (eids, nids, coord_out, summation_point) in enumerate(cuts):
+            self.cut_eids.append(np.unique(eids))
+            self.cut_nids.append(None if nids is None else np.unique(nids))
+            self.beta_out[icut, :, :] = coord_out.beta()
+            if summation_point is not None:
+                self.summation_points[icut, :] = summation_point
+
+        # the masks of a node_element layout (the rows can change with
+        # the time step)
+        self._plans = {}
+
+    @property
+    def ncuts(self):
+        """the number of cuts"""
+        return len(self.cut_eids)
+
+    def get_loads(self, gpforce, itimes=None):
+        """
+        Gets the loads of the cuts
+
+        Parameters
+        ----------
+        gpforce : RealGridPointForcesArray
+            the grid point forces
+        itimes : List[int]; default=None -> all
+            the time steps
+
+        Returns
+        -------
+        loads : (ncuts, ntimes, 6) float ndarray
+            the [fx, fy, fz, mx, my, mz] of each cut in the coord_out
+            frame; the moments are about the summation point
+
+        """
+        data = gpforce.data
+        node_element = gpforce.node_element
+        if itimes is None:
+            itimes = np.arange(data.shape[0])
+        itimes = np.asarray(itimes)
+        ntimes = len(itimes)
+        loads = np.zeros((self.ncuts, ntimes, 6), dtype='float64')
+
+        if node_element.ndim == 2:
+            groups = [(node_element, np.arange(ntimes))]
+        else:
+            groups = _group_times(node_element, itimes)
+
+        for node_elementi, jtimes in groups:
+            selection, irows, cd_transforms, xyz_cid0 = self._get_plan(node_elementi)
+            if len(irows) == 0:
+                continue
+            datai = data[itimes[jtimes], :, :][:, irows, :].astype('float64')
+            loads[:, jtimes, :] = self._sum_loads(
+                datai, selection, cd_transforms, xyz_cid0)
+        return loads
+
+    def _sum_loads(self, data, selection, cd_transforms, xyz_cid0):
+        """sums the loads of the rows of the cuts for a set of time steps"""
+        ntimes, nrows = data.shape[:2]
+
+        # rotate the loads from the CD frame to the global frame and
+        # flip the sign to be consistent with Patran
+        force = -np.einsum('tni,nij->tnj', data[:, :, :3], cd_transforms)
+        moment = -np.einsum('tni,nij->tnj', data[:, :, 3:], cd_transforms)
+
+        def _sum(values):
+            """(ntimes, nrows, 3) -> (ncuts, ntimes, 3)"""
+            values = values.transpose(1, 0, 2).reshape(nrows, ntimes * 3)
+            return np.asarray(selection.dot(values)).reshape(self.ncuts, ntimes, 3)
+
+        force_sum = _sum(force)
+        moment_sum = _sum(moment)
+        if self.consider_rxf:
+            # sum(r x F) = sum(xyz x F) - summation_point x sum(F)
+            moment_sum += _sum(np.cross(xyz_cid0[np.newaxis, :, :], force))
+            moment_sum -= np.cross(self.summation_points[:, np.newaxis, :], force_sum)
+
+        loads = np.zeros((self.ncuts, ntimes, 6), dtype='float64')
+        loads[:, :, :3] = np.einsum('cij,ctj->cti', self.beta_out, force_sum)
+        loads[:, :, 3:] = np.einsum('cij,ctj->cti', self.beta_out, moment_sum)
+        return loads
+
+    def _get_plan(self, node_element):
+        """
+        Gets the selection matrix of the cuts and the transforms of the
+        rows of a node_element layout
+
+        Returns
+        -------
+        selection : (ncuts, nrows) scipy.sparse.csr_matrix
+            1.0 if the row is in the cut
+        irows : (nrows, ) int ndarray
+            the rows of the grid point forces that are in a cut
+        cd_transforms : (nrows, 3, 3) float ndarray
+            the CD to global transforms of the rows
+        xyz_cid0 : (nrows, 3) float ndarray
+            the locations of the nodes of the rows
+
+        """
+        key = node_element.tobytes()
+        if key in self._plans:
+            return self._plans[key]
+
+        gpforce_nids = node_element[:, 0]
+        gpforce_eids = node_element[:, 1]
+        icuts = []
+        jrows = []
+        for icut, (eids, nids) in enumerate(zip(self.cut_eids, self.cut_nids)):
+            is_in = np.in1d(gpforce_eids, eids)
+            if nids is not None:
+                is_in &= np.in1d(gpforce_nids, nids)
+            irowsi = np.where(is_in)[0]
+            icuts.append(np.full(len(irowsi), icut, dtype='int32'))
+            jrows.append(irowsi)
+        icuts = np.hstack(icuts)
+        jrows = np.hstack(jrows)
+
+        irows, jrows = np.unique(jrows, return_inverse=True)
+        selection = scipy.sparse.csr_matrix(
+            (np.ones(len(icuts), dtype='float64'), (icuts, jrows)),
+            shape=(self.ncuts, len(irows)))
+
+        # the index of the node of each row in nid_cd
+        row_nids = gpforce_nids[irows]
+        inodes = self.isort[np.searchsorted(self.nids, row_nids, sorter=self.isort)
+                            .clip(max=len(self.nids) - 1)]
+        is_missing = self.nids[inodes] != row_nids
+        if is_missing.any():
+            raise RuntimeError('nids=%s are not in nid_cd' % np.unique(row_nids[is_missing]))
+
+        plan = (selection, irows, self.cd_transforms[inodes], self.xyz_cid0[inodes])
+        self._plans[key] = plan
+        return plan
+
+
+def _group_times(node_element, itimes):
+    """groups the time steps with the same (nnodes, 2) node_element layout"""
+    groups = []
+    for jtime, itime in enumerate(itimes):
+        node_elementi = node_element[itime]
+        for node_elementj, jtimes in groups:
+            if np.array_equal(node_elementi, node_elementj):
+                jtimes.append(jtime)
+                break
+        else:
+            groups.append((node_elementi, [jtime]))
+    return [(node_elementi, np.array(jtimes)) for node_elementi, jtimes in groups]
+
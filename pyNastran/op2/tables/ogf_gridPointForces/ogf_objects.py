@@ -102,7 +102,7 @@ class RealGridPointForcesArray(ScalarObject):
             self.element_names = empty(self.ntotal, dtype='U8')
 
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         """
@@ -496,6 +496,52 @@ class RealGridPointForcesArray(ScalarObject):
             debug=debug, logger=logger)
         return force_out, moment_out, force_out_sum, moment_out_sum
 
+    def extract_cut_loads(self, cuts, coords, nid_cd, icd_transform, xyz_cid0,
+                          consider_rxf=True, itimes=None):
+        """
+        Extracts the Patran-style interface loads of many cuts for all
+        the time steps at once
+
+        Parameters
+        ----------
+        cuts : List[(eids, nids, coord_out, summation_point)]
+            eids : (Ne, ) int ndarray
+                all the elements to consider
+            nids : (Nn, ) int ndarray / None
+                all the nodes to consider; None -> the nodes of the
+                elements (a freebody)
+            coord_out : CORDx()
+                the output coordinate system
+            summation_point : (3, ) float ndarray / None
+                the summation point in the global frame; None -> [0., 0., 0.]
+        coords : dict[int] = CORDx
+            all the coordinate systems
+        nid_cd : (M, 2) int ndarray
+            the (BDF.point_ids, cd) array
+        icd_transform : dict[cd] = (Mi, ) int ndarray
+            the mapping for nid_cd
+        xyz_cid0 : (M, 3) ndarray
+            the grid locations in coordinate system 0
+        consider_rxf : bool; default=True
+            considers the r x F term
+        itimes : List[int]; default=None -> all
+            the time steps
+
+        Returns
+        -------
+        loads : (ncuts, ntimes, 6) float ndarray
+            the [fx, fy, fz, mx, my, mz] of each cut in the coord_out
+            frame; the moments are about the summation point
+
+        .. seealso:: GridPointForceCuts, which may be reused for the
+                     results of each subcase
+
+        """
+        from pyNastran.op2.tables.ogf_gridPointForces.cut_loads import GridPointForceCuts
+        gpforce_cuts = GridPointForceCuts(cuts, coords, nid_cd, icd_transform, xyz_cid0,
+                                          consider_rxf=consider_rxf)
+        return gpforce_cuts.get_loads(self, itimes=itimes)
+
     def find_centroid_of_load(self, f, m):
         """
         Mx = ry*Fz - rz*Fy
@@ -980,7 +1026,7 @@ class ComplexGridPointForcesArray(ScalarObject):
             self.node_element = zeros((self.ntotal, 2), dtype='int32')
             self.element_names = empty(self.ntotal, dtype='U8')
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='complex64')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 6), dtype='complex64')
 
     def build_dataframe(self):
         """
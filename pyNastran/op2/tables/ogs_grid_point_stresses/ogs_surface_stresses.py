@@ -48,7 +48,7 @@ class GridPointStressesArray(ScalarObject):
 
         self.node_element = np.zeros((self.ntotal, 2), dtype='int32')
         #oxx, oyy, txy, angle, major, minor, ovm
-        self.data = np.zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
         self.location = np.empty(self.ntotal, dtype='U8')
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
@@ -238,7 +238,7 @@ class GridPointStressesVolumeArray(ScalarObject):
 
         self.node = np.zeros(self.ntotal, dtype='int32')
         #oxx, oyy, txy, angle, major, minor, ovm
-        self.data = np.zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._zeros_data((self.ntimes, self.ntotal, 8), dtype='float32')
         self.location = np.empty(self.ntotal, dtype='U8')
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
@@ -27,7 +27,7 @@ class AppliedLoadsVectorArray(ScalarObject):
         self.eids = zeros(self.itotal, dtype='int32')
         self.sources = zeros(self.itotal, dtype='|S8')
         #[f1, f2, f3, m1, m2, m3]
-        self.data = zeros((self.ntimes, self.itotal, 6), dtype=self.data_type())
+        self.data = self._zeros_data((self.ntimes, self.itotal, 6), dtype=self.data_type())
 
     def get_stats(self, short=False):
         if not self.is_built:
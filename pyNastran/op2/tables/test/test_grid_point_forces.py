@@ -1,5 +1,6 @@
 from __future__ import print_function
 import os
+import copy
 import unittest
 
 from six import iteritems, StringIO
@@ -7,10 +8,13 @@ import numpy as np
 
 import pyNastran
 
-from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2 import OP2, read_op2
 from pyNastran.op2.op2_geom import read_op2_geom
 
+from pyNastran.bdf.bdf import CORD2R, CORD2C, CORD2S
 from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
+from pyNastran.op2.tables.ogf_gridPointForces.cut_loads import GridPointForceCuts
+from pyNastran.op2.result_transforms import get_cd_transforms, get_nodal_transform
 from pyNastran.utils.log import SimpleLogger
 
 test_path = pyNastran.__path__[0]
@@ -256,8 +260,7 @@ class TestGridPointForces(unittest.TestCase):
                 np.abs(total_moment_local_expected - total_moment_local))
             self.assertTrue(np.allclose(total_moment_local_expected, total_moment_local, atol=0.005), msg)
 
-    @unittest.expectedFailure
-    def test_broken_op2_solid_shell_bar_01_gpforce_radial_global_cd(self):
+    def test_op2_solid_shell_bar_01_gpforce_radial_global_cd(self):
         warning_log = SimpleLogger(level='warning')
         debug_log = SimpleLogger(level='debug')
         folder = os.path.join(model_path, 'sol_101_elements')
@@ -380,7 +383,7 @@ class TestGridPointForces(unittest.TestCase):
         op2_1 = read_op2_geom(op2_filename, xref=False, log=warning_log)
         op2_1.log = debug_log
 
-        print("disp_orig =\n", op2_1.displacements[1].data[0, :2, :])
+        #print("disp_orig =\n", op2_1.displacements[1].data[0, :2, :])
         #print("spc_orig =\n", op2_1.spc_forces[1].data[0, -3:, :])
         #print("gpf_orig =\n", op2_1.grid_point_forces[1].data[0, :2, :])
 
@@ -421,7 +424,7 @@ class TestGridPointForces(unittest.TestCase):
             #print('%10.4e %10.4e %10.4e' % tuple(line))
         #print(disp.data[0, :, :3])
 
-        print("disp_new =\n", op2_1.displacements[1].data[0, :2, :])
+        #print("disp_new =\n", op2_1.displacements[1].data[0, :2, :])
         #print("spc_new =\n", op2_1.spc_forces[1].data[0, -3:, :])
         #print("gpf_new =\n", op2_1.grid_point_forces[1].data[0, :2, :])
 
@@ -433,11 +436,10 @@ class TestGridPointForces(unittest.TestCase):
         op2_2.transform_gpforce_to_global(
             nids_all, nids_transform_2, icd_transform_2, op2_2.coords)
 
-        print("disp_goal =\n", op2_2.displacements[1].data[0, :2, :])
+        #print("disp_goal =\n", op2_2.displacements[1].data[0, :2, :])
         #print("spc_goal =\n", op2_2.spc_forces[1].data[0, -3:, :])
         #print("gpf_goal =\n", op2_2.grid_point_forces[1].data[0, :2, :])
 
-        return
         msg = 'displacements baseline=\n%s\ndisplacements xyz=\n%s' % (
             op2_1.displacements[1].data[0, :, :], op2_2.displacements[1].data[0, :, :])
         #print(msg)
@@ -447,12 +449,12 @@ class TestGridPointForces(unittest.TestCase):
             op2_1.grid_point_forces[1].data[0, :, :], op2_2.grid_point_forces[1].data[0, :, :])
         #print(msg)
 
-        assert op2_1.spc_forces[1].assert_equal(op2_2.spc_forces[1], atol=4.4341e-04), msg
-        assert op2_1.mpc_forces[1].assert_equal(op2_2.mpc_forces[1]), msg
-        assert op2_1.load_vectors[1].assert_equal(op2_2.load_vectors[1]), msg
+        # the radial op2 only has displacements and grid point forces
         assert op2_1.grid_point_forces[1].assert_equal(op2_2.grid_point_forces[1], atol=0.000123), msg
         #-----------------------------------------------------------------------
+        # the grid point forces are in the global frame now
         gpforce = op2_1.grid_point_forces[1]
+        nid_cd_global = np.column_stack([nid_cd[:, 0], np.zeros(len(nid_cd), dtype=nid_cd.dtype)])
         data = _get_gpforce_data()
         for i, datai in enumerate(data):
             eids, nids, cid, summation_point, total_force_local_expected, total_moment_local_expected = datai
@@ -461,7 +463,7 @@ class TestGridPointForces(unittest.TestCase):
             out = gpforce.extract_interface_loads(
                 nids, eids,
                 coord_out, op2_1.coords,
-                nid_cd, icd_transform_1,
+                nid_cd_global, icd_transform_2,
                 xyz_cid0, summation_point, itime=0, debug=False, logger=op2_1.log)
             total_force_global, total_moment_global, total_force_local, total_moment_local = out
 
@@ -481,6 +483,159 @@ class TestGridPointForces(unittest.TestCase):
                 np.abs(total_moment_local_expected - total_moment_local))
             self.assertTrue(np.allclose(total_moment_local_expected, total_moment_local, atol=0.005), msg)
 
+    def test_gpforce_cut_loads(self):
+        """the loads of many cuts are calculated at once"""
+        log = SimpleLogger(level='error')
+        folder = os.path.join(model_path, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        model, nid_cd, icd_transform, xyz_cid0 = _read_gpforce_model(op2_filename, log)
+        gpforce = model.grid_point_forces[1]
+
+        data = _get_gpforce_data()
+        cuts = [(eids, nids, model.coords[cid], summation_point)
+                for eids, nids, cid, summation_point, unused_force, unused_moment in data]
+        loads = gpforce.extract_cut_loads(cuts, model.coords, nid_cd, icd_transform, xyz_cid0)
+        self.assertEqual(loads.shape, (len(cuts), 1, 6))
+        for icut, datai in enumerate(data):
+            eids, nids, cid, summation_point, force_expected, moment_expected = datai
+            out = gpforce.extract_interface_loads(
+                nids, eids, model.coords[cid], model.coords, nid_cd, icd_transform,
+                xyz_cid0, summation_point, itime=0, debug=False, logger=log)
+            unused_force, unused_moment, force_sum, moment_sum = out
+            assert np.allclose(loads[icut, 0, :3], force_sum, atol=1e-3), icut
+            assert np.allclose(loads[icut, 0, 3:], moment_sum, atol=1e-3), icut
+            assert np.allclose(loads[icut, 0, :3], force_expected, atol=0.2), icut
+            assert np.allclose(loads[icut, 0, 3:], moment_expected, atol=0.005), icut
+
+        # the same model with rectangular and cylindrical CD systems
+        for op2_filename in ['static_solid_shell_bar_xyz.op2', 'static_solid_shell_bar_radial.op2']:
+            model2, nid_cd2, icd_transform2, xyz_cid02 = _read_gpforce_model(
+                os.path.join(folder, op2_filename), log)
+            assert set(nid_cd2[:, 1]) != {0}, op2_filename
+            gpforce_cuts = GridPointForceCuts(cuts, model2.coords, nid_cd2, icd_transform2, xyz_cid02)
+            loads2 = gpforce_cuts.get_loads(model2.grid_point_forces[1])
+            assert np.allclose(loads, loads2, atol=1e-3), op2_filename
+
+        # freebody
+        loads = gpforce.extract_cut_loads([([1], None, model.coords[0], None)],
+                                          model.coords, nid_cd, icd_transform, xyz_cid0,
+                                          consider_rxf=False)
+        force, moment = gpforce.extract_freebody_loads(
+            [1], model.coords[0], model.coords, nid_cd, icd_transform,
+            itime=0, debug=False, logger=log)
+        assert np.allclose(loads[0, 0, :3], force.sum(axis=0), atol=1e-3)
+        assert np.allclose(loads[0, 0, 3:], moment.sum(axis=0), atol=1e-3)
+
+    def test_gpforce_cut_loads_transient(self):
+        """the rows of the grid point forces change with the time step"""
+        log = SimpleLogger(level='error')
+        op2_filename = os.path.join(model_path, 'elements', 'time_elements.op2')
+        model, nid_cd, icd_transform, xyz_cid0 = _read_gpforce_model(op2_filename, log)
+        gpforce = model.grid_point_forces[1]
+        eids = np.array(sorted(model.elements))
+        nids = np.array(sorted(model.nodes))
+        cuts = [
+            (eids[:10], nids[:20], model.coords[0], [1., 2., 3.]),
+            (eids[5:], nids, model.coords[0], None),
+        ]
+        loads = gpforce.extract_cut_loads(cuts, model.coords, nid_cd, icd_transform, xyz_cid0)
+        self.assertEqual(loads.shape, (2, gpforce.ntimes, 6))
+        for itime in range(gpforce.ntimes):
+            # the loads are small differences of large float32 values
+            atol = 1e-5 * np.abs(gpforce.data[itime, :, :]).max() * np.abs(xyz_cid0).max()
+            for icut, (eidsi, nidsi, coord_out, summation_point) in enumerate(cuts):
+                out = gpforce.extract_interface_loads(
+                    nidsi, eidsi, coord_out, model.coords, nid_cd, icd_transform,
+                    xyz_cid0, summation_point, itime=itime, debug=False, logger=log)
+                loads_expected = np.hstack(out[2:])
+                assert np.allclose(loads[icut, itime, :], loads_expected, atol=atol), (
+                    icut, itime)
+
+        loads2 = gpforce.extract_cut_loads(cuts, model.coords, nid_cd, icd_transform, xyz_cid0,
+                                           itimes=[3, 1])
+        assert np.array_equal(loads2, loads[:, [3, 1], :])
+
+    def test_gpforce_cd_transforms(self):
+        """the R-theta-z and R-theta-phi axes depend on the location of the node"""
+        coords = {
+            0 : CORD2R(0),
+            1 : CORD2C(1, origin=[1., 0., 0.], zaxis=[1., 0., 1.], xzplane=[2., 0., 0.]),
+            2 : CORD2S(2, origin=[0., 0., 1.], zaxis=[0., 0., 2.], xzplane=[1., 0., 1.]),
+        }
+        for coord in coords.values():
+            coord.setup()
+        nid_cd = np.array([[1, 1], [2, 1], [3, 2], [4, 2], [5, 0]])
+        xyz_cid0 = np.array([
+            [2., 0., 5.],  # R=x
+            [1., 1., 0.],  # R=y; theta=-x
+            [1., 0., 1.],  # R=x; theta=-z; phi=y
+            [0., 0., 3.],  # R=z; theta=x; phi=y
+            [9., 9., 9.],
+        ])
+        cd_transforms = get_cd_transforms(coords, nid_cd, None, xyz_cid0)
+        expected = np.array([
+            [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]],
+            [[0., 1., 0.], [-1., 0., 0.], [0., 0., 1.]],
+            [[1., 0., 0.], [0., 0., -1.], [0., 1., 0.]],
+            [[0., 0., 1.], [1., 0., 0.], [0., 1., 0.]],
+            [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]],
+        ])
+        assert np.allclose(cd_transforms, expected), cd_transforms
+
+    def test_nodal_transform_radial(self):
+        """the cylindrical CD results are the same as the CD=0 results"""
+        log = SimpleLogger(level='error')
+        folder = os.path.join(model_path, 'sol_101_elements')
+        op2_filename1 = os.path.join(folder, 'static_solid_shell_bar_global_radial_cd.op2')
+        op2_1 = read_op2_geom(op2_filename1, log=log)
+        op2_1.cross_reference(xref_elements=False,
+                              xref_nodes_with_elements=False,
+                              xref_properties=False,
+                              xref_masses=False,
+                              xref_materials=False,
+                              xref_loads=False,
+                              xref_constraints=False,
+                              xref_aero=False,
+                              xref_sets=False,
+                              xref_optimization=False)
+        nodal_transform = get_nodal_transform(op2_1)
+        assert len(nodal_transform) > 0, nodal_transform
+
+        # the transform is reused for a subset of the nodes
+        disp = op2_1.displacements[1]
+        disp_subset = copy.copy(disp)
+        disp_subset.node_gridtype = disp.node_gridtype[::2, :]
+        disp_subset.data = disp.data[:, ::2, :].copy()
+        nodal_transform.transform_result(disp_subset)
+
+        op2_1.transform_results_to_global(nodal_transform)
+        assert np.allclose(disp_subset.data, disp.data[:, ::2, :])
+
+        op2_filename2 = os.path.join(folder, 'static_solid_shell_bar.op2')
+        op2_2 = read_op2(op2_filename2, log=log)
+        assert op2_1.displacements[1].assert_equal(op2_2.displacements[1])
+        assert op2_1.spc_forces[1].assert_equal(op2_2.spc_forces[1], atol=4.4341e-04)
+        assert op2_1.grid_point_forces[1].assert_equal(op2_2.grid_point_forces[1], atol=0.000123)
+
+def _read_gpforce_model(op2_filename, log):
+    """gets the model, the (nid, cd) array, icd_transform, and xyz_cid0"""
+    model = read_op2_geom(op2_filename, xref=False, log=log)
+    model.cross_reference(xref_elements=False,
+                          xref_nodes_with_elements=False,
+                          xref_properties=False,
+                          xref_masses=False,
+                          xref_materials=False,
+                          xref_loads=False,
+                          xref_constraints=False,
+                          xref_aero=False,
+                          xref_sets=False,
+                          xref_optimization=False)
+    unused_nids_all, unused_nids_transform, icd_transform = model.get_displacement_index()
+    nid_cd = np.array([[nid, node.Cd()] for nid, node in sorted(iteritems(model.nodes))])
+    xyz_cid0 = np.array([model.nodes[nid].get_position() for nid in nid_cd[:, 0]])
+    return model, nid_cd, icd_transform, xyz_cid0
+
+
 def _get_gpforce_data():
     data = [
         #eids, nids, cid, summation_point
@@ -0,0 +1,86 @@
+"""
+Times the load combinations of a RealPlateStressArray, which are
+calculated by a matrix multiplication (see ``OP2.get_load_combinations``),
+against a loop over the combinations.
+
+Usage
+-----
+python benchmark_load_combinations.py [ncombinations] [nsubcases] [nelements]
+"""
+from __future__ import print_function
+import os
+import sys
+import copy
+import time
+
+import numpy as np
+import scipy.sparse
+
+import pyNastran
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.load_combinations import (
+    get_load_combinations, iter_load_combinations, set_plate_principal)
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+
+def _get_results(nsubcases, nelements):
+    """creates nsubcases plate stress results with nelements rows"""
+    op2_filename = os.path.join(MODEL_PATH, 'elements', 'static_elements.op2')
+    model = read_op2(op2_filename, debug=False)
+    stress = model.cquad4_stress[1]
+    ntile = nelements // stress.data.shape[1] + 1
+    element_node = np.tile(stress.element_node, (ntile, 1))[:nelements]
+    data = np.tile(stress.data, (1, ntile, 1))[:, :nelements, :]
+
+    results = {}
+    for isubcase in range(1, nsubcases + 1):
+        obj = copy.copy(stress)
+        obj.element_node = element_node
+        obj.data = data * (1. + isubcase / float(nsubcases))
+        obj.isubcase = isubcase
+        results[isubcase] = obj
+    return results
+
+
+def _combine_loop(results, coefficients):
+    """combines the results one combination at a time"""
+    subcases = sorted(results)
+    for coefficientsi in coefficients:
+        data = results[subcases[0]].data.copy()
+        data[:, :, 1:4] = 0.
+        for isubcase, coefficient in zip(subcases, coefficientsi):
+            if coefficient:
+                data[:, :, 1:4] += coefficient * results[isubcase].data[:, :, 1:4]
+        set_plate_principal(data)
+
+
+def main():
+    """prints the time of the combinations"""
+    ncombinations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    nsubcases = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    nelements = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+    results = _get_results(nsubcases, nelements)
+    coefficients = scipy.sparse.random(ncombinations, nsubcases, density=0.2,
+                                       format='csr', random_state=0)
+
+    time0 = time.time()
+    _combine_loop(results, coefficients.toarray())
+    time1 = time.time()
+    for unused_combination_id, unused_obj in iter_load_combinations(
+            results, coefficients, chunk_size=100):
+        pass
+    time2 = time.time()
+    print('ncombinations=%s nsubcases=%s nelements=%s' % (
+        ncombinations, nsubcases, nelements))
+    print('loop:                   %.3f sec' % (time1 - time0))
+    print('iter_load_combinations: %.3f sec' % (time2 - time1))
+
+    time0 = time.time()
+    get_load_combinations(results, coefficients[:100, :])
+    print('get_load_combinations (100): %.3f sec' % (time.time() - time0))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
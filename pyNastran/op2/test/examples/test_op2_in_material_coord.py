@@ -9,7 +9,7 @@ from pyNastran.utils.log import get_logger
 from pyNastran.bdf.bdf import BDF
 from pyNastran.op2.op2 import OP2
 from pyNastran.op2.data_in_material_coord import (
-    data_in_material_coord,
+    data_in_material_coord, get_material_angles,
     get_eids_from_op2_vector, force_vectors, stress_vectors,
     strain_vectors)
 pkg_path = pyNastran.__path__[0]
@@ -109,6 +109,48 @@ class TestMaterialCoordReal(unittest.TestCase):
                     assert np.allclose(data[:, check], ref_result, rtol=RTOL, atol=ATOL)
             #print('OK')
 
+    def test_material_angles_in_place(self):
+        """the material angles are reused and the op2 is modified in place"""
+        log = get_logger(level='warning')
+        for folder, prefix, subcase in CASES:
+            bdf = BDF(debug=False, log=log)
+            basepath = os.path.join(pkg_path, 'op2', 'test', 'examples', folder)
+            bdf.read_bdf(os.path.join(basepath, prefix + '.bdf'))
+            op2_filename = os.path.join(basepath, prefix + '.op2')
+            op2 = OP2(debug=False, log=log)
+            op2.read_op2(op2_filename)
+            op2_new = data_in_material_coord(bdf, op2)
+
+            eids, thetarad = get_material_angles(bdf)
+            self.assertEqual(eids.tolist(), sorted(bdf.elements))
+            self.assertEqual(thetarad.shape, eids.shape)
+
+            op2_in_place = OP2(debug=False, log=log)
+            op2_in_place.read_op2(op2_filename)
+            op2_out = data_in_material_coord(bdf, op2_in_place, in_place=True,
+                                             material_angles=(eids, thetarad))
+            assert op2_out is op2_in_place
+            for vecname in force_vectors + stress_vectors + strain_vectors:
+                for isubcase, vector in getattr(op2_new, vecname).items():
+                    vector_in_place = getattr(op2_in_place, vecname)[isubcase]
+                    assert np.allclose(vector.data, vector_in_place.data)
+
+                    # the original op2 isn't modified
+                    vector_orig = getattr(op2, vecname)[isubcase]
+                    assert vector_orig.data is not vector.data
+
+            # the results (e.g., the composite results) aren't shared with
+            # the original op2
+            for table_type in op2.get_table_types():
+                results = getattr(op2, table_type, None)
+                if not isinstance(results, dict):
+                    continue
+                for key, result in results.items():
+                    result_new = getattr(op2_new, table_type)[key]
+                    assert result_new is not result, table_type
+                    if hasattr(result, 'element_node'):
+                        assert result_new.element_node is not result.element_node, table_type
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
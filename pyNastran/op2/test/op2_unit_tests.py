@@ -1,6 +1,11 @@
 from __future__ import print_function
 import os
+import gc
+import copy
+import shutil
+import tempfile
 import unittest
+from struct import pack
 from six import iteritems, PY3
 import numpy as np
 try:
@@ -22,10 +27,11 @@ import pyNastran
 from pyNastran.utils.log import get_logger
 
 from pyNastran.bdf.bdf import BDF
-from pyNastran.op2.op2 import OP2, FatalError, read_op2
+from pyNastran.op2.op2 import OP2, FatalError, read_op2, iter_op2_results
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
-from pyNastran.op2.test.test_op2 import run_op2
+from pyNastran.op2.op2_interface.op2_lazy import is_lazy
+from pyNastran.op2.test.test_op2 import run_op2, IS_HDF5
 
 from pyNastran.bdf.test.bdf_unit_tests import Tester
 #from pyNastran.op2.tables.oef_forces.oef_force_objects import (
@@ -410,6 +416,468 @@ class TestOP2(Tester):
         op2.write_f06(f06_filename)
         os.remove(f06_filename)
 
+    def test_op2_use_index(self):
+        """the indexed array filling pass gets the same results as the 2-pass reader"""
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'freq_solid_shell_bar.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            model1 = read_op2(op2_filename, debug=False)
+            model2 = read_op2(op2_filename, debug=False, use_index=True)
+            assert model1.op2_index is None
+            assert len(model2.op2_index.tables) > 0, model2.op2_index
+            assert model1.assert_op2_equal(model2), op2_filename
+            self.assertEqual(model1.get_op2_stats(), model2.get_op2_stats())
+
+        # subcase filtering works with the index
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'buckling_solid_shell_bar.op2')
+        model1 = read_op2(op2_filename, debug=False, subcases=[2])
+        model2 = read_op2(op2_filename, debug=False, subcases=[2], use_index=True)
+        assert model1.assert_op2_equal(model2), op2_filename
+
+    def test_op2_index_file(self):
+        """the sidecar index file is written and then used instead of the file scan"""
+        folder = os.path.join(MODEL_PATH, 'pload4')
+        op2_filename = os.path.join(folder, 'cquad4.op2')
+        index_filename = os.path.join(folder, 'cquad4.test_op2.op2idx')
+        if os.path.exists(index_filename):
+            os.remove(index_filename)
+
+        model1 = read_op2(op2_filename, debug=False)
+        model2 = read_op2(op2_filename, debug=False, index_filename=index_filename)
+        assert os.path.exists(index_filename), index_filename
+        model3 = read_op2(op2_filename, debug=False, index_filename=index_filename)
+        assert model1.assert_op2_equal(model2), op2_filename
+        assert model1.assert_op2_equal(model3), op2_filename
+        self.assertEqual(model2.op2_index.table_names, model3.op2_index.table_names)
+
+        oug_index = model3.op2_index.tables[model3.op2_index.table_names.index(b'OUGV1')]
+        self.assertEqual(oug_index.subcases, [1, 2, 3, 4, 5, 6, 7, 8])
+        table3_info = oug_index.get_table3_info()[0]
+        self.assertEqual(table3_info['isubcase'], 1)
+
+        # the index skips the table3/table4 records of the other subcases
+        model4 = read_op2(op2_filename, debug=False, subcases=[2])
+        model5 = read_op2(op2_filename, debug=False, subcases=[2], index_filename=index_filename)
+        assert model4.assert_op2_equal(model5), op2_filename
+        self.assertEqual(list(model5.displacements.keys()), [2])
+        os.remove(index_filename)
+
+    def test_op2_use_mmap(self):
+        """the memory-mapped reader gets the same results as the file reader"""
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'freq_solid_shell_bar.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            model1 = read_op2(op2_filename, debug=False)
+            model2 = read_op2(op2_filename, debug=False, use_mmap=True)
+            model3 = read_op2(op2_filename, debug=False, use_mmap=True, use_index=True)
+            assert model2._mmap_view is None
+            assert model1.assert_op2_equal(model2), op2_filename
+            assert model1.assert_op2_equal(model3), op2_filename
+
+    def test_op2_memmap_dir(self):
+        """the result data arrays are stored in memory-mapped files"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        memmap_dir = tempfile.mkdtemp()
+        model1 = read_op2(op2_filename, debug=False, log=log)
+        model2 = read_op2(op2_filename, debug=False, log=log, memmap_dir=memmap_dir)
+        try:
+            displacements = model2.displacements[1]
+            self.assertIsInstance(displacements.data, np.memmap)
+            self.assertIsInstance(model2.cquad4_stress[1].data, np.memmap)
+            assert np.array_equal(model1.displacements[1].data[-1, :, :3],
+                                  displacements.data[-1, :, :3])
+            assert model1.assert_op2_equal(model2), op2_filename
+            assert len(os.listdir(memmap_dir)) > 0
+
+            f06_filename = os.path.join(memmap_dir, 'transient_solid_shell_bar.test_op2.f06')
+            model2.write_f06(f06_filename)
+            if IS_PANDAS:
+                model2.build_dataframe()
+            if IS_HDF5:
+                h5_filename = os.path.join(memmap_dir, 'transient_solid_shell_bar.test_op2.h5')
+                model2.export_to_hdf5(h5_filename)
+                model3 = OP2(log=log)
+                model3.load_hdf5(h5_filename)
+                assert np.array_equal(model3.displacements[1].data, displacements.data)
+                assert np.array_equal(model3.cquad4_stress[1].data,
+                                      model2.cquad4_stress[1].data)
+
+            # the scratch files are deleted with the OP2
+            del model2, displacements
+            gc.collect()
+            self.assertEqual(
+                [fname for fname in os.listdir(memmap_dir) if fname.endswith('.dat')], [])
+
+            model2 = read_op2(op2_filename, debug=False, log=log, memmap_dir=memmap_dir)
+            model2.remove_memmap_files()
+            self.assertEqual(
+                [fname for fname in os.listdir(memmap_dir) if fname.endswith('.dat')], [])
+            del model2
+        finally:
+            shutil.rmtree(memmap_dir)
+
+    def test_op2_hdf5_partial(self):
+        """the HDF5 arrays are compressed and part of a result can be loaded"""
+        if not IS_HDF5:
+            return
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        h5_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.test_op2.h5')
+        model = read_op2(op2_filename, debug=False, log=log)
+        with self.assertRaises(ValueError):
+            model.export_to_hdf5(h5_filename, compression='zip')
+
+        for compression in [None, 'lzf', 'gzip']:
+            model.export_to_hdf5(h5_filename, compression=compression)
+            model2 = OP2(log=log)
+            model2.load_hdf5(h5_filename, result_names=['displacements', 'cquad4_stress'],
+                             itimes=[0, 3, -1], eid_range=(5, 10), nid_range=(1, 4))
+            self.assertEqual(len(model2.spc_forces), 0)
+
+            disp = model.displacements[1]
+            disp2 = model2.displacements[1]
+            inid = np.where(disp.node_gridtype[:, 0] <= 4)[0]
+            itimes = [0, 3, disp.ntimes - 1]
+            assert np.array_equal(disp2.data, disp.data[itimes, :, :][:, inid, :])
+            assert np.array_equal(disp2.node_gridtype, disp.node_gridtype[inid, :])
+            assert np.array_equal(disp2._times, disp._times[itimes])
+            self.assertEqual(disp2.ntimes, 3)
+
+            stress = model.cquad4_stress[1]
+            stress2 = model2.cquad4_stress[1]
+            eids = stress.element_node[:, 0]
+            ieid = np.where((eids >= 5) & (eids <= 10))[0]
+            itimes = [0, 3, stress.ntimes - 1]
+            assert np.array_equal(stress2.data, stress.data[itimes, :, :][:, ieid, :])
+            assert np.array_equal(stress2.element_node, stress.element_node[ieid, :])
+            self.assertEqual(stress2.ntotal, len(ieid))
+        os.remove(h5_filename)
+
+    def test_op2_nworkers(self):
+        """the result tables are read by a process pool"""
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'pload4', 'cquad4.op2'),
+            # the OUGV1 is written for each design cycle
+            os.path.join(MODEL_PATH, 'sol200', 'model_200.op2'),
+            # grid point forces for 2 subcases
+            os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            model1 = read_op2(op2_filename, debug=False)
+            model2 = read_op2(op2_filename, debug=False, nworkers=2)
+            assert model1.assert_op2_equal(model2), op2_filename
+            self.assertEqual(list(model1.displacements.keys()),
+                             list(model2.displacements.keys()))
+            self.assertEqual(list(model1.grid_point_forces.keys()),
+                             list(model2.grid_point_forces.keys()))
+            for key, gpforce1 in iteritems(model1.grid_point_forces):
+                gpforce2 = model2.grid_point_forces[key]
+                assert np.array_equal(gpforce1.data, gpforce2.data), op2_filename
+                assert np.array_equal(gpforce1.node_element, gpforce2.node_element), op2_filename
+
+        op2_filename = os.path.join(MODEL_PATH, 'pload4', 'cquad4.op2')
+        model1 = read_op2(op2_filename, debug=False, subcases=[2, 3])
+        model2 = read_op2(op2_filename, debug=False, subcases=[2, 3], nworkers=2)
+        assert model1.assert_op2_equal(model2), op2_filename
+        self.assertEqual(list(model2.displacements.keys()), [2, 3])
+
+    def test_op2_lazy(self):
+        """the result data is read the first time it's accessed"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model1 = read_op2(op2_filename, debug=False)
+        model2 = read_op2(op2_filename, debug=False, lazy=True)
+        self.assertEqual(sorted(model1.displacements.keys()), sorted(model2.displacements.keys()))
+
+        displacements = model2.displacements[1]
+        assert is_lazy(displacements)
+        assert is_lazy(model2.ctria3_stress[1])
+        assert np.array_equal(model1.displacements[1].data, displacements.data)
+        assert not is_lazy(displacements)
+        assert is_lazy(model2.ctria3_stress[1])
+
+        stress1 = model1.cquad4_stress[1]
+        stress2 = model2.cquad4_stress[1]
+        self.assertIsInstance(stress2, type(stress1))
+        assert np.array_equal(stress1.element_node, stress2.element_node)
+        assert np.array_equal(stress1.get_element_index([6]), stress2.get_element_index([6]))
+        assert not is_lazy(stress2)
+
+        # everything is loaded for the comparison
+        assert model1.assert_op2_equal(model2), op2_filename
+        with self.assertRaises(AttributeError):
+            stress2.fake_attribute
+
+    def test_op2_load_combinations(self):
+        """the results of the subcases are combined by a matrix multiplication"""
+        import scipy.sparse
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        model = read_op2(op2_filename, debug=False)
+        coefficients = scipy.sparse.csr_matrix([
+            [1.0, 0.0],
+            [1.5, 1.0],
+            [0.0, 2.0],
+        ])
+        for result_name in ['displacements', 'grid_point_forces',
+                            'cquad4_stress', 'ctria3_strain']:
+            results = model.get_load_combinations(
+                result_name, coefficients, subcases=[1, 2], combination_ids=[10, 20, 30])
+            self.assertEqual(list(results.keys()), [10, 20, 30])
+            obj1 = getattr(model, result_name)[1]
+            obj2 = getattr(model, result_name)[2]
+            obj = results[20]
+            self.assertIsInstance(obj, type(obj1))
+            self.assertEqual(obj.isubcase, 20)
+            self.assertEqual(obj1.isubcase, 1)
+            assert np.array_equal(obj._times, obj1._times)
+
+            icolumns = slice(1, 4) if 'stress' in result_name or 'strain' in result_name else slice(None)
+            expected = 1.5 * obj1.data[:, :, icolumns] + obj2.data[:, :, icolumns]
+            assert np.allclose(obj.data[:, :, icolumns], expected, rtol=1e-5, atol=1e-5)
+
+            # the derived columns are recalculated
+            atol = 1e-4 * np.abs(obj2.data).max(axis=(0, 1))
+            assert np.allclose(results[10].data, obj1.data, rtol=1e-3, atol=atol), result_name
+            if icolumns.start:
+                assert np.allclose(results[30].data[:, :, 0], obj2.data[:, :, 0])
+                assert np.allclose(results[30].data[:, :, 4:], [1., 2., 2., 2.] * obj2.data[:, :, 4:],
+                                   rtol=1e-3, atol=2 * atol[4:]), result_name
+                assert obj.data[:, :, 7].min() >= 0.
+
+            # streaming
+            for combination_id, obj in model.iter_load_combinations(
+                    result_name, coefficients.toarray(), subcases=[1, 2],
+                    combination_ids=[10, 20, 30], chunk_size=2):
+                assert np.array_equal(obj.data, results[combination_id].data)
+
+        with self.assertRaises(ValueError):
+            model.get_load_combinations('cquad4_stress', [[1.0, 2.0, 3.0]])
+        with self.assertRaises(NotImplementedError):
+            model.get_load_combinations('chexa_stress', [[1.0, 2.0]])
+
+    def test_op2_envelope(self):
+        """the max/min/abs max of the results over the subcases and time steps"""
+        from pyNastran.op2.result_envelope import ResultEnvelope
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        model = read_op2(op2_filename, debug=False)
+        for result_name in ['displacements', 'cquad4_stress', 'chexa_stress', 'cbar_stress',
+                            'crod_stress', 'cbar_force', 'cquad4_force', 'grid_point_forces']:
+            results = getattr(model, result_name)
+            envelope = model.get_envelope(result_name, subcases=[2, 1])
+            self.assertEqual(envelope.subcases, [2, 1])
+
+            # (nsubcases * ntimes, ntotal, ncolumns)
+            data = np.vstack([results[2].data, results[1].data])
+            ntimes = results[1].data.shape[0]
+            assert np.array_equal(envelope.max, data.max(axis=0)), result_name
+            assert np.array_equal(envelope.min, data.min(axis=0)), result_name
+            imax = data.argmax(axis=0)
+            assert np.array_equal(envelope.max_icase, imax // ntimes), result_name
+            assert np.array_equal(envelope.max_itime, imax % ntimes), result_name
+            imin = data.argmin(axis=0)
+            assert np.array_equal(envelope.get_subcases(envelope.min_icase),
+                                  np.array([2, 1])[imin // ntimes]), result_name
+
+            iabs_max = np.abs(data).argmax(axis=0)
+            irows, icolumns = np.indices(iabs_max.shape)
+            abs_max = data[iabs_max, irows, icolumns]
+            assert np.array_equal(np.abs(envelope.abs_max), np.abs(abs_max)), result_name
+            assert np.array_equal(
+                data[envelope.abs_max_icase * ntimes + envelope.abs_max_itime, irows, icolumns],
+                envelope.abs_max), result_name
+
+            # streaming
+            envelope2 = ResultEnvelope()
+            for isubcase in [2, 1]:
+                obj = results[isubcase]
+                for itime in range(ntimes):
+                    obj_time = copy.copy(obj)
+                    obj_time.data = obj.data[itime:itime+1, :, :]
+                    envelope2.add_result(obj_time, itime=itime)
+            assert np.array_equal(envelope2.max_icase, envelope.max_icase), result_name
+            assert np.array_equal(envelope2.min_itime, envelope.min_itime), result_name
+            assert np.array_equal(envelope2.abs_max, envelope.abs_max), result_name
+
+        with self.assertRaises(ValueError):
+            envelope.add_result(model.displacements[1])
+
+    def test_op2_iter_results(self):
+        """the results are read one time step at a time"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        model = read_op2(op2_filename, debug=False)
+        displacements = model.displacements[1]
+        stress = model.cquad4_stress[1]
+
+        itimes = []
+        for result_name, isubcase, itime, obj in iter_op2_results(
+                op2_filename, result_names=['displacements', 'stress'], debug=False):
+            self.assertEqual(isubcase, 1)
+            self.assertEqual(obj.data.shape[0], 1)
+            if result_name == 'displacements':
+                itimes.append(itime)
+                assert np.array_equal(displacements.data[itime], obj.data[0])
+                assert np.array_equal(displacements.node_gridtype, obj.node_gridtype)
+                self.assertEqual(displacements._times[itime], obj._times[0])
+            elif result_name == 'cquad4_stress':
+                assert np.array_equal(stress.data[itime], obj.data[0])
+            else:
+                assert 'stress' in result_name, result_name
+        self.assertEqual(itimes, list(range(displacements.ntimes)))
+
+        # grid point forces
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        model = read_op2(op2_filename, debug=False)
+        subcase_itimes = []
+        for result_name, isubcase, itime, obj in iter_op2_results(
+                op2_filename, result_names='grid_point_forces', debug=False):
+            if result_name != 'grid_point_forces':
+                # the element forces are also saved
+                continue
+            subcase_itimes.append((isubcase, itime))
+            gpforce = model.grid_point_forces[isubcase]
+            nrows = obj.data.shape[1]
+            assert np.array_equal(gpforce.data[itime, :nrows, :], obj.data[0])
+            assert np.array_equal(gpforce.node_element[itime, :nrows, :], obj.node_element[0])
+        self.assertEqual(subcase_itimes, [
+            (isubcase, itime) for isubcase, gpforce in sorted(iteritems(model.grid_point_forces))
+            for itime in range(gpforce.ntimes)])
+
+        # SORT2
+        op2_filename = os.path.join(MODEL_PATH, 'thermal', 'hd15901.op2')
+        model = read_op2(op2_filename, debug=False, combine=False)
+        temperatures = [obj for obj in model.temperatures.values() if not obj.is_sort1][0]
+        for result_name, unused_isubcase, itime, obj in iter_op2_results(
+                op2_filename, result_names='temperatures', debug=False):
+            if not obj.is_sort1:
+                self.assertEqual(itime, 0)
+                assert np.array_equal(temperatures.data, obj.data)
+
+    def test_op2_vectorized_vs_loop(self):
+        """the vectorized and the struct loop readers get the same results"""
+        op2_filenames_results = [
+            (os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2'),
+             ['cquad4_composite_stress', 'ctria3_composite_stress',
+              'cquad4_composite_strain', 'cbeam_stress',
+              'nonlinear_cquad4_stress', 'nonlinear_ctria3_stress']),
+            (os.path.join(MODEL_PATH, 'sol_101_elements', 'buckling_solid_shell_bar.op2'),
+             ['cquad4_composite_stress', 'ctria3_composite_stress', 'cbeam_stress']),
+            (os.path.join(MODEL_PATH, 'freq_sine', 'good_sine.op2'),
+             ['cbar_force', 'cbush_force']),
+            (os.path.join(MODEL_PATH, 'other', 'ofprand1.op2'),
+             ['cbend_force']),
+        ]
+        for op2_filename, result_names in op2_filenames_results:
+            model_vector = OP2(debug=False)
+            model_loop = OP2(debug=False)
+            model_loop.use_vector = False
+            model_vector.read_op2(op2_filename)
+            model_loop.read_op2(op2_filename)
+            assert model_vector == model_loop, op2_filename
+
+            for result_name in result_names:
+                results_vector = getattr(model_vector, result_name)
+                results_loop = getattr(model_loop, result_name)
+                assert len(results_vector) > 0, result_name
+                for key, result_vector in iteritems(results_vector):
+                    result_loop = results_loop[key]
+                    assert result_vector.itotal == result_loop.itotal, result_name
+                    with np.errstate(under='ignore'):
+                        assert np.allclose(result_vector.data, result_loop.data,
+                                           equal_nan=True), result_name
+                    for name in ['element', 'element_node', 'element_layer']:
+                        if hasattr(result_vector, name):
+                            assert np.array_equal(getattr(result_vector, name),
+                                                  getattr(result_loop, name)), result_name
+
+    def test_op2_vectorized_geom(self):
+        """the vectorized geometry gets the same cards as the card readers"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model1 = read_op2_geom(op2_filename, xref=False, debug=False)
+        model2 = read_op2_geom(op2_filename, xref=False, validate=False, debug=False,
+                               vectorized_geom=True)
+
+        grid = model2.card_arrays['GRID']
+        nnodes = len(model1.nodes)
+        assert grid['xyz'].shape == (nnodes, 3), grid['xyz'].shape
+        assert grid['nid'].tolist() == list(model1.nodes.keys())
+        assert model2.card_arrays['CQUAD4']['nodes'].shape[1] == 4
+        assert model2.card_arrays['CTRIA3']['nodes'].shape[1] == 3
+        assert len(model2.card_arrays['MAT1']['mid']) == len(model1.materials)
+
+        # the cards are built when they're accessed
+        assert len(model2.nodes) == nnodes
+        assert model2.nodes.nlazy == nnodes
+        nid = grid['nid'][0]
+        node = model2.nodes[nid]
+        assert model2.nodes.nlazy == nnodes - 1
+        assert np.array_equal(node.xyz, model1.nodes[nid].xyz)
+
+        # the PSHELLs of the PCOMPs have the same pids, so the PSHELLs
+        # are read card by card
+        assert 'PSHELL' not in model2.card_arrays, model2.card_arrays
+        for name in ['nodes', 'elements', 'properties', 'materials']:
+            cards1 = getattr(model1, name)
+            cards2 = getattr(model2, name)
+            assert list(cards1.keys()) == list(cards2.keys()), name
+            for key, card1 in sorted(iteritems(cards1)):
+                assert str(card1) == str(cards2[key]), name
+            if name != 'properties':
+                assert cards2.nlazy == 0, name
+        assert model1.card_count == model2.card_count
+        model2.validate()
+        model2.cross_reference()
+
+    def test_op2_vectorized_geom_duplicate_ids(self):
+        """a vectorized record with duplicate ids is read card by card"""
+        log = get_logger(log=None, level='error')
+        models = []
+        for vectorized_geom in [False, True]:
+            model = OP2Geom(debug=False, log=log)
+            model.vectorized_geom = vectorized_geom
+            model._uendian = '<'
+            model._endian = b'<'
+            model.fdtype = np.dtype('<f4')
+            model.idtype = np.dtype('<i4')
+
+            #(nid, cp, x1, x2, x3, cd, ps, seid); nid=2 is repeated
+            data = b''.join([
+                pack(b'<ii3f3i', 1, 0, 0., 0., 0., 0, 0, 0),
+                pack(b'<ii3f3i', 2, 0, 1., 0., 0., 0, 0, 0),
+                pack(b'<ii3f3i', 2, 0, 2., 0., 0., 0, 0, 0),
+            ])
+            assert model._read_grid(data, 0) == len(data)
+
+            #(pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4)
+            data1 = pack(b'<iififi4fi', 1, 1, 0.1, -1, 1., -1, 0.833, 0., -0.05, 0.05, -1)
+            data2 = pack(b'<iififi4fi', 1, 1, 0.2, -1, 1., -1, 0.833, 0., -0.1, 0.1, -1)
+            assert model._read_pshell(data1, 0) == len(data1)
+
+            # the pid is already in the model
+            assert model._read_pshell(data2, 0) == len(data2)
+            models.append(model)
+
+        model1, model2 = models
+        assert sorted(model2.nodes) == [1, 2], model2.nodes
+        assert np.allclose(model2.nodes[2].xyz, [2., 0., 0.]), model2.nodes[2].xyz
+        assert 'GRID' not in model2.card_arrays, model2.card_arrays
+        assert np.allclose(model2.properties[1].t, 0.2), model2.properties[1].t
+        assert len(model2.card_arrays['PSHELL']['pid']) == 1
+        for name in ['nodes', 'properties']:
+            cards1 = getattr(model1, name)
+            cards2 = getattr(model2, name)
+            for key, card1 in sorted(iteritems(cards1)):
+                assert str(card1) == str(cards2[key]), name
+        assert model1.card_count == model2.card_count
+
     def test_op2_solid_bending_01(self):
         folder = os.path.join(MODEL_PATH, 'solid_bending')
         op2_filename = os.path.join(folder, 'solid_bending.op2')
@@ -353,30 +353,14 @@ def abs_max_min_vector(values):
     # support lists/tuples
     values = np.asarray(values)
 
-    # find the [maxs,
-    #           mins]
-    # we organize it as [maxs, mins], which is why the note applies
-    # we could make both of the edge cases return -3.0, but if you're using
-    # this function it shouldn't matter
-    maxs_mins = np.array([values.max(axis=1), values.min(axis=1)])
+    maxs = values.max(axis=1)
+    mins = values.min(axis=1)
 
     # we figure out the absolute max/min for each row
-    abs_vals = np.abs(maxs_mins)
-    absolute_maxs = abs_vals.max(axis=0)
-
-    outs = np.zeros(absolute_maxs.shape[0], dtype=values.dtype)
-    for i, absolute_max in enumerate(absolute_maxs):
-        # find the location of the absolute max value
-        # 1.  we take the first value (the where[0]) to chop the return value
-        #     since there is no else conditional
-        # 2.  we take the first value (the where[0][0]) to only get the max
-        #     value if 2+ values are returned
-        j = np.where(absolute_max == abs_vals[:, i])[0][0]
-
-        # get the raw value from the absoluted value, so:
-        # value = npabs(raw_value)
-        outs[i] = maxs_mins[j, i]
-    return outs
+    # the max is used if abs(max) == abs(min), which is why the note applies
+    # we could make both of the edge cases return -3.0, but if you're using
+    # this function it shouldn't matter
+    return np.where(np.abs(maxs) >= np.abs(mins), maxs, mins)
 
 
 def abs_max_min(values, global_abs_max=True):